@@ -0,0 +1,445 @@
+"""End-to-end agent-loop benchmarks against a local mock LLM server.
+
+Usage:
+    python benchmarks/bench_agent_loop.py [--scenarios loop react session-save memory broadcast]
+        [--sizes small medium large] [--providers openai anthropic] [--iterations 50]
+        [--latency 0.0] [--json] [--output results.json] [--compare baseline.json]
+
+Scenarios:
+    loop          ``SwecliAgent.run_sync`` replaying scripted tool calls on a
+                  synthetic repo: per-iteration overhead (excluding the mock
+                  model's latency) and tool throughput, per provider format
+    react         The same script through the REPL's ``ReActExecutor``
+    session-save  ``SessionManager.save_session`` cost versus session length
+    memory        Traced memory growth over ``--memory-iterations`` (500) iterations
+    broadcast     Web UI WebSocket fan-out to many clients
+
+Results are a JSON list of ``{"scenario", "params", "metrics"}`` records.
+With ``--compare``, metrics that grew by more than ``--tolerance`` over the
+baseline file are reported and the script exits non-zero.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import json
+import logging
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from mock_llm_server import MockLLMServer, Script, ToolCall
+
+SIZES = {"small": 50, "medium": 500, "large": 3000}
+SCENARIOS = ["loop", "react", "session-save", "memory", "broadcast"]
+
+# Metrics where larger is worse; used by --compare
+LOWER_IS_BETTER = {
+    "iteration_ms",
+    "overhead_ms",
+    "framework_ms",
+    "tool_ms",
+    "save_ms",
+    "growth_kb_per_100",
+    "broadcast_us",
+    "delivery_ms",
+}
+
+_MODULE_TEMPLATE = '''"""Synthetic module {index}."""
+
+import os
+
+
+class Service{index}:
+    """Handles requests for area {index}."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+
+    def handle_request(self, payload: dict) -> dict:
+        self.calls += 1
+        return {{"name": self.name, "size": len(payload), "cwd": os.getcwd()}}
+
+
+def handle_{index}(payload: dict) -> dict:
+    """Entry point for area {index}."""
+    return Service{index}("svc-{index}").handle_request(payload)
+'''
+
+
+def make_repo(root: Path, files: int) -> Path:
+    """Write a synthetic Python repository with ``files`` modules in nested packages."""
+    for index in range(files):
+        package = root / "src" / f"pkg{index // 50}"
+        package.mkdir(parents=True, exist_ok=True)
+        (package / f"mod_{index}.py").write_text(_MODULE_TEMPLATE.format(index=index))
+    (root / "README.md").write_text("# Synthetic benchmark repository\n")
+    return root
+
+
+def module_path(index: int) -> str:
+    return f"src/pkg{index // 50}/mod_{index}.py"
+
+
+def loop_script(files: int, iterations: int, *, batched: bool = True) -> Script:
+    """Reads of different files interleaved with listing, search and a write."""
+    steps: list[list[ToolCall]] = []
+    for index in range(min(files, 12)):
+        steps.append([ToolCall("read_file", {"file_path": module_path(index * max(files // 12, 1))})])
+        if index % 3 == 0:
+            steps.append([ToolCall("list_files", {"path": f"src/pkg{index % max(files // 50, 1)}"})])
+        if index % 3 == 1:
+            steps.append([ToolCall("search", {"pattern": f"def handle_{index}\\b", "path": "src"})])
+        if index % 3 == 2:
+            steps.append([ToolCall("write_file", {"file_path": "scratch.txt", "content": f"step {index}\n"})])
+    if batched:
+        steps.append([ToolCall("read_file", {"file_path": module_path(i)}) for i in range(min(files, 3))])
+    return Script.cycle(steps, iterations)
+
+
+def _build_agent(server: MockLLMServer, repo: Path, provider: str) -> tuple[Any, Any]:
+    from swecli.core.agents.swecli_agent import SwecliAgent
+    from swecli.core.base.factories.tool_factory import ToolDependencies, ToolFactory
+    from swecli.core.context_engineering.tools.lazy import lazy_tools
+    from swecli.core.runtime import ModeManager
+
+    config = server.app_config()
+    registry = ToolFactory(ToolDependencies(**lazy_tools(config, repo))).create_registry(mcp_manager=None)
+    mode_manager = ModeManager()
+    agent = SwecliAgent(config, registry, mode_manager, repo)
+    agent._http_client = server.http_client(provider)
+    return agent, registry
+
+
+def _deps(agent: Any, repo: Path, session_dir: Path) -> Any:
+    from rich.console import Console
+
+    from swecli.core.context_engineering.history import SessionManager, UndoManager
+    from swecli.core.runtime.approval.policy import PolicyApprovalManager
+    from swecli.models.agent_deps import AgentDependencies
+
+    session_manager = SessionManager(session_dir)
+    session_manager.create_session(working_directory=str(repo))
+    return AgentDependencies(
+        mode_manager=agent.mode_manager,
+        approval_manager=PolicyApprovalManager("auto"),
+        undo_manager=UndoManager(50),
+        session_manager=session_manager,
+        working_dir=repo,
+        console=Console(file=io.StringIO()),
+        config=agent.config,
+    )
+
+
+def _tool_metrics(iterations: int) -> dict[str, Any]:
+    from swecli.core.runtime.monitoring.tracing import TOOL, get_tracer
+
+    rows = [row for row in get_tracer().stats(group_by_name=True) if row["span"].startswith(f"{TOOL}/")]
+    calls = sum(row["count"] for row in rows)
+    total_ms = sum(row["total_ms"] for row in rows)
+    return {
+        "tool_calls": calls,
+        "tool_ms": total_ms / max(iterations, 1),
+        "tools_per_s": calls / (total_ms / 1000) if total_ms else 0.0,
+        "tool_p95_ms": {row["span"].split("/", 1)[1]: row["p95_ms"] for row in rows},
+    }
+
+
+def _iteration_metrics(wall_s: float, server: MockLLMServer) -> dict[str, Any]:
+    requests = max(server.stats.requests, 1)
+    overhead_s = wall_s - server.stats.delay_s
+    return {
+        "requests": server.stats.requests,
+        "iteration_ms": wall_s * 1000 / requests,
+        "overhead_ms": overhead_s * 1000 / requests,
+        "request_kb": server.stats.bytes_in / requests / 1024,
+    }
+
+
+def bench_loop(size: str, provider: str, iterations: int, latency: float) -> dict[str, Any]:
+    from swecli.core.runtime.monitoring.tracing import get_tracer
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = make_repo(Path(tmp) / "repo", SIZES[size])
+        with MockLLMServer(loop_script(SIZES[size], iterations), latency=latency) as server:
+            agent, _ = _build_agent(server, repo, provider)
+            deps = _deps(agent, repo, Path(tmp) / "sessions")
+            get_tracer().clear()
+            start = time.perf_counter()
+            result = agent.run_sync("Review the services and record findings.", deps)
+            wall_s = time.perf_counter() - start
+            if not result["success"]:
+                raise RuntimeError(f"agent run failed: {result['content']}")
+            metrics = _iteration_metrics(wall_s, server)
+            metrics.update(_tool_metrics(server.stats.requests))
+            metrics["framework_ms"] = metrics["overhead_ms"] - metrics["tool_ms"]
+    return {"scenario": "loop", "params": {"size": size, "provider": provider, "iterations": iterations, "latency": latency}, "metrics": metrics}
+
+
+def bench_react(size: str, iterations: int, latency: float) -> dict[str, Any]:
+    from rich.console import Console
+
+    from swecli.core.runtime.monitoring.tracing import get_tracer
+    from swecli.repl.llm_caller import LLMCaller
+    from swecli.repl.react_executor import ReActExecutor
+    from swecli.repl.react_loop import ReActController
+    from swecli.repl.tool_executor import ToolExecutor
+    from swecli.ui_textual.formatters_internal.output_formatter import OutputFormatter
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = make_repo(Path(tmp) / "repo", SIZES[size])
+        with MockLLMServer(loop_script(SIZES[size], iterations), latency=latency) as server:
+            agent, registry = _build_agent(server, repo, "openai")
+            deps = _deps(agent, repo, Path(tmp) / "sessions")
+            console = Console(file=io.StringIO(), force_terminal=False)
+            executor = ReActExecutor(
+                console,
+                deps.session_manager,
+                agent.config,
+                agent.mode_manager,
+                LLMCaller(console),
+                ToolExecutor(console, OutputFormatter(console), agent.mode_manager, deps.session_manager),
+                ReActController(console),
+                lambda content: None,
+            )
+            messages = [
+                {"role": "system", "content": agent.system_prompt},
+                {"role": "user", "content": "Review the services and record findings."},
+            ]
+            get_tracer().clear()
+            start = time.perf_counter()
+            executor.execute_react_loop(
+                messages, agent, registry, deps.approval_manager, deps.undo_manager, messages[-1]["content"]
+            )
+            wall_s = time.perf_counter() - start
+            metrics = _iteration_metrics(wall_s, server)
+            metrics.update(_tool_metrics(server.stats.requests))
+            metrics["framework_ms"] = metrics["overhead_ms"] - metrics["tool_ms"]
+    return {"scenario": "react", "params": {"size": size, "iterations": iterations, "latency": latency}, "metrics": metrics}
+
+
+def bench_session_save(lengths: list[int], repeat: int = 5) -> list[dict[str, Any]]:
+    from swecli.core.context_engineering.history import SessionManager
+    from swecli.models.message import ChatMessage, Role
+    from swecli.models.message import ToolCall as ToolCallModel
+
+    results = []
+    body = _MODULE_TEMPLATE.format(index=0)
+    for length in lengths:
+        with tempfile.TemporaryDirectory() as tmp:
+            manager = SessionManager(Path(tmp))
+            session = manager.create_session(working_directory=tmp)
+            for index in range(length):
+                if index % 2 == 0:
+                    session.add_message(ChatMessage(role=Role.USER, content=f"question {index}"))
+                else:
+                    call = ToolCallModel(id=f"call_{index}", name="read_file", parameters={"file_path": "a.py"}, result=body)
+                    session.add_message(ChatMessage(role=Role.ASSISTANT, content="Reading.", tool_calls=[call]))
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                manager.save_session()
+                timings.append(time.perf_counter() - start)
+            size_kb = (Path(tmp) / f"{session.id}.json").stat().st_size / 1024
+        results.append(
+            {
+                "scenario": "session-save",
+                "params": {"messages": length},
+                "metrics": {"save_ms": min(timings) * 1000, "file_kb": size_kb},
+            }
+        )
+    return results
+
+
+def bench_memory(iterations: int, sample_every: int = 100) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = make_repo(Path(tmp) / "repo", SIZES["small"])
+        script = loop_script(SIZES["small"], iterations, batched=False)
+        with MockLLMServer(script) as server:
+            agent, _ = _build_agent(server, repo, "openai")
+            deps = _deps(agent, repo, Path(tmp) / "sessions")
+            samples: list[tuple[int, int]] = []
+
+            class Sampler:
+                def on_tool_call(self, name: str, args: Any) -> None:
+                    iteration = server.stats.requests
+                    if iteration % sample_every == 0 and (not samples or samples[-1][0] != iteration):
+                        samples.append((iteration, tracemalloc.get_traced_memory()[0]))
+
+            tracemalloc.start()
+            try:
+                start = time.perf_counter()
+                result = agent.run_sync("Review everything.", deps, ui_callback=Sampler())
+                wall_s = time.perf_counter() - start
+                samples.append((server.stats.requests, tracemalloc.get_traced_memory()[0]))
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            history_kb = len(json.dumps(result["messages"])) / 1024
+
+    first_iteration, first_bytes = samples[0]
+    last_iteration, last_bytes = samples[-1]
+    growth = (last_bytes - first_bytes) / 1024 / max(last_iteration - first_iteration, 1) * 100
+    return {
+        "scenario": "memory",
+        "params": {"iterations": iterations},
+        "metrics": {
+            "requests": server.stats.requests,
+            "iteration_ms": wall_s * 1000 / max(server.stats.requests, 1),
+            "growth_kb_per_100": growth,
+            "peak_mb": peak / 1024 / 1024,
+            "history_kb": history_kb,
+            "samples_kb": [[iteration, round(size / 1024, 1)] for iteration, size in samples],
+        },
+    }
+
+
+class _NullWebSocket:
+    def __init__(self) -> None:
+        self.received = 0
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_text(self, text: str) -> None:
+        self.received += 1
+
+    async def close(self, code: int = 1000) -> None:
+        return None
+
+
+def bench_broadcast(clients: list[int], messages: int = 2000) -> list[dict[str, Any]]:
+    from types import SimpleNamespace
+
+    from swecli.web import websocket as websocket_module
+    from swecli.web.websocket import WebSocketManager
+
+    # The manager registers clients with the web UI's global state; a stub is enough here
+    logging.getLogger("swecli.web").setLevel(logging.WARNING)
+    websocket_module.get_state = lambda: SimpleNamespace(add_ws_client=lambda ws: None, remove_ws_client=lambda ws: None)
+
+    async def run(count: int) -> dict[str, Any]:
+        manager = WebSocketManager(max_queue=messages + 1)
+        sockets = [_NullWebSocket() for _ in range(count)]
+        for socket in sockets:
+            await manager.connect(socket)
+        start = time.perf_counter()
+        for index in range(messages):
+            await manager.broadcast({"type": "tool_result", "data": {"index": index, "output": "x" * 200}})
+        queued = time.perf_counter()
+        for socket in sockets:
+            await manager.get_channel(socket).drain()
+        done = time.perf_counter()
+        delivered = sum(socket.received for socket in sockets)
+        for socket in sockets:
+            manager.disconnect(socket)
+        return {
+            "broadcast_us": (queued - start) * 1e6 / messages,
+            "delivery_ms": (done - start) * 1000,
+            "deliveries_per_s": delivered / (done - start),
+            "delivered": delivered,
+        }
+
+    return [
+        {"scenario": "broadcast", "params": {"clients": count, "messages": messages}, "metrics": asyncio.run(run(count))}
+        for count in clients
+    ]
+
+
+def compare(results: list[dict[str, Any]], baseline: list[dict[str, Any]], tolerance: float) -> list[str]:
+    """Describe metrics that regressed by more than ``tolerance`` against ``baseline``."""
+
+    def key(record: dict[str, Any]) -> str:
+        return json.dumps([record["scenario"], record["params"]], sort_keys=True)
+
+    previous = {key(record): record["metrics"] for record in baseline}
+    regressions = []
+    for record in results:
+        old = previous.get(key(record))
+        if old is None:
+            continue
+        for name, value in record["metrics"].items():
+            before = old.get(name)
+            if (
+                name in LOWER_IS_BETTER
+                and isinstance(before, (int, float))
+                and before > 0
+                and value > before * (1 + tolerance)
+            ):
+                regressions.append(f"{record['scenario']} {record['params']}: {name} {before:.3f} -> {value:.3f}")
+    return regressions
+
+
+def _format(record: dict[str, Any]) -> str:
+    params = " ".join(f"{name}={value}" for name, value in record["params"].items())
+    metrics = "  ".join(
+        f"{name} {value:.2f}" if isinstance(value, float) else f"{name} {value}"
+        for name, value in record["metrics"].items()
+        if not isinstance(value, (dict, list))
+    )
+    return f"{record['scenario']:<13} {params}\n{'':<13} {metrics}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--sizes", nargs="+", choices=list(SIZES), default=["small", "medium"])
+    parser.add_argument("--providers", nargs="+", choices=["openai", "anthropic"], default=["openai", "anthropic"])
+    parser.add_argument("--iterations", type=int, default=50, help="Model turns per loop/react run")
+    parser.add_argument("--memory-iterations", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.0, help="Mock model latency per request (seconds)")
+    parser.add_argument("--session-lengths", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable results")
+    parser.add_argument("--output", type=Path, help="Also write the JSON results to this file")
+    parser.add_argument("--compare", type=Path, help="Baseline results to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown for --compare")
+    args = parser.parse_args()
+
+    results: list[dict[str, Any]] = []
+    if "loop" in args.scenarios:
+        for size in args.sizes:
+            for provider in args.providers:
+                results.append(bench_loop(size, provider, args.iterations, args.latency))
+    if "react" in args.scenarios:
+        for size in args.sizes:
+            results.append(bench_react(size, args.iterations, args.latency))
+    if "session-save" in args.scenarios:
+        results.extend(bench_session_save(args.session_lengths))
+    if "memory" in args.scenarios:
+        results.append(bench_memory(args.memory_iterations))
+    if "broadcast" in args.scenarios:
+        results.extend(bench_broadcast(args.clients))
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for record in results:
+            print(_format(record))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(results, baseline.get("results", baseline), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
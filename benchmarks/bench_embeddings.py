@@ -0,0 +1,177 @@
+"""Benchmark and recall harness for playbook bullet embeddings.
+
+Usage:
+    python benchmarks/bench_embeddings.py [--bullets 200] [--repeat 5]
+    python benchmarks/bench_embeddings.py --recall [--remote text-embedding-3-small]
+
+The timing mode measures how long ``BulletSelector.select`` takes with the
+local embedder on a cold and a warm cache. The recall mode scores a small
+labelled set of (query, relevant bullets) pairs and reports recall@k for the
+local embedder, an optional remote model, and a random-vector baseline (what
+selection degraded to before, whenever the embedding API failed).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from typing import Callable, Sequence
+
+import numpy as np
+
+from swecli.core.context_engineering.memory.embeddings import generate_embeddings
+from swecli.core.context_engineering.memory.local_embedder import LocalEmbedder
+from swecli.core.context_engineering.memory.playbook import Bullet
+from swecli.core.context_engineering.memory.selector import BulletSelector
+
+BULLETS = [
+    "List the directory before reading files to confirm paths exist",
+    "Read a file before editing it so the old_content matches exactly",
+    "Run the test suite after every code change to catch regressions",
+    "Use search with a regex instead of reading every file in the repository",
+    "Prefer editing existing files over creating new ones",
+    "Check git status before committing to avoid staging unrelated files",
+    "Install missing Python dependencies with pip before running tests",
+    "Quote paths containing spaces when running shell commands",
+    "Use background processes for long-running dev servers",
+    "Kill stale server processes before restarting on the same port",
+    "Handle authentication failures by refreshing the API token",
+    "Read error tracebacks from the bottom to find the failing call",
+    "Add type annotations when introducing new public functions",
+    "Keep commit messages short and describe what changed",
+    "Fetch documentation URLs instead of guessing library APIs",
+    "Take a screenshot to verify UI changes in the browser",
+    "Split large refactors into small, reviewable edits",
+    "Use the AST search mode to find function definitions precisely",
+    "Write a failing unit test before fixing a reported bug",
+    "Check environment variables when a config value seems ignored",
+]
+
+# Query -> indices of relevant bullets.
+QUERIES = {
+    "fix the failing tests after my change": [2, 18],
+    "edit config.py to change the timeout": [1, 4],
+    "where is the function that parses arguments defined": [3, 17],
+    "the dev server on port 3000 won't start": [8, 9],
+    "commit my work": [5, 13],
+    "login keeps failing with 401 unauthorized": [10],
+    "ModuleNotFoundError when running pytest": [6, 2],
+    "the button looks wrong in the browser": [15],
+    "open the file in the docs folder": [0, 1],
+    "why is my setting from .env not applied": [19],
+}
+
+
+def _random_embedder(dim: int = 384, seed: int = 0) -> Callable[[Sequence[str]], np.ndarray]:
+    rng = random.Random(seed)
+
+    def embed(texts: Sequence[str]) -> np.ndarray:
+        return np.array([[rng.random() for _ in range(dim)] for _ in texts])
+
+    return embed
+
+
+def _remote_embedder(model: str) -> Callable[[Sequence[str]], np.ndarray]:
+    def embed(texts: Sequence[str]) -> np.ndarray:
+        return np.array(generate_embeddings(list(texts), model=model))
+
+    return embed
+
+
+def recall_at_k(embed: Callable[[Sequence[str]], np.ndarray], k: int) -> float:
+    """Mean fraction of relevant bullets ranked in the top ``k`` per query."""
+    bullet_vectors = embed(BULLETS)
+    bullet_vectors = bullet_vectors / (np.linalg.norm(bullet_vectors, axis=1, keepdims=True) + 1e-10)
+    scores = []
+    for query, relevant in QUERIES.items():
+        query_vector = embed([query])[0]
+        similarity = bullet_vectors @ (query_vector / (np.linalg.norm(query_vector) + 1e-10))
+        top = set(np.argsort(-similarity)[:k].tolist())
+        scores.append(len(top & set(relevant)) / len(relevant))
+    return float(np.mean(scores))
+
+
+def run_recall(remote: str | None, ks: Sequence[int]) -> dict[str, dict[int, float]]:
+    local = LocalEmbedder()
+    embedders = {
+        "local": local.embed_batch,
+        "random": _random_embedder(),
+    }
+    if remote:
+        embedders[remote] = _remote_embedder(remote)
+    return {name: {k: recall_at_k(embed, k) for k in ks} for name, embed in embedders.items()}
+
+
+def _bullets(count: int) -> list[Bullet]:
+    rng = random.Random(1)
+    return [
+        Bullet(id=f"b-{i:05d}", section="general", content=f"{rng.choice(BULLETS)} (variant {i})")
+        for i in range(count)
+    ]
+
+
+def run_timing(count: int, repeat: int) -> dict[str, float]:
+    bullets = _bullets(count)
+    query = "fix the failing tests after my change"
+
+    cold = float("inf")
+    warm = float("inf")
+    for _ in range(repeat):
+        selector = BulletSelector(embedding_model="local")
+        start = time.perf_counter()
+        selector.select(bullets, max_count=10, query=query)
+        cold = min(cold, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        selector.select(bullets, max_count=10, query=query)
+        warm = min(warm, time.perf_counter() - start)
+
+    embedder = LocalEmbedder()
+    start = time.perf_counter()
+    embedder.embed_batch([bullet.content for bullet in bullets])
+    per_text = (time.perf_counter() - start) / count
+
+    return {
+        "bullets": count,
+        "select_cold_ms": cold * 1000,
+        "select_warm_ms": warm * 1000,
+        "embed_per_text_us": per_text * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bullets", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--recall", action="store_true", help="Run the recall comparison instead of timing")
+    parser.add_argument("--remote", help="Remote embedding model to include in the recall comparison")
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable results")
+    args = parser.parse_args()
+
+    if args.recall:
+        results = run_recall(args.remote, ks=(1, 3, 5))
+        if args.json:
+            print(json.dumps(results, indent=2))
+            return
+        for name, by_k in results.items():
+            cells = "  ".join(f"recall@{k} {value:.2f}" for k, value in by_k.items())
+            print(f"{name:>24}  {cells}")
+        return
+
+    timings = [run_timing(count, args.repeat) for count in args.bullets]
+    if args.json:
+        print(json.dumps(timings, indent=2))
+        return
+    for result in timings:
+        print(
+            f"{result['bullets']:>6} bullets  "
+            f"select cold {result['select_cold_ms']:8.2f} ms  "
+            f"warm {result['select_warm_ms']:8.2f} ms  "
+            f"embed {result['embed_per_text_us']:7.1f} us/text"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Import-time budget for the ``swecli`` entry point, per command.
+
+Usage:
+    python benchmarks/bench_import_time.py [--commands version mcp-list] [--repeat 3] [--json]
+
+Runs each command in a fresh interpreter under ``python -X importtime`` and
+reports the total time spent importing modules, the heaviest top-level
+imports and the wall time. Exits non-zero if a command exceeds its import
+budget or loads a module it must not need (e.g. Textual for ``--version``),
+so it can be used as a regression check.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+
+# Stand-in for ``swecli -p``: everything the non-interactive path imports
+# before its first model request, without calling a model.
+_PROMPT_PATH = (
+    "import swecli.cli; "
+    "import swecli.core.runtime.services, swecli.core.runtime.approval; "
+    "import swecli.core.context_engineering.tools.registry; "
+    "import swecli.models.agent_deps"
+)
+
+
+@dataclass(frozen=True)
+class Command:
+    name: str
+    argv: tuple[str, ...]
+    budget_ms: float
+    forbidden: tuple[str, ...] = ()
+
+
+COMMANDS = [
+    Command("version", ("-m", "swecli.cli", "--version"), 60, ("textual", "fastmcp", "rich")),
+    Command("mcp-list", ("-m", "swecli.cli", "mcp", "list"), 250, ("textual", "fastmcp")),
+    Command("config-show", ("-m", "swecli.cli", "config", "show"), 150, ("textual", "fastmcp")),
+    Command("prompt", ("-c", _PROMPT_PATH), 600, ("textual", "fastmcp", "swecli.ui_textual")),
+]
+
+
+def _parse_importtime(stderr: str) -> tuple[float, list[tuple[str, float]], set[str]]:
+    """Total self time (ms), top-level imports by cumulative time, and module names."""
+    total_us = 0
+    top_level: list[tuple[str, float]] = []
+    modules: set[str] = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        total_us += int(self_us)
+        stripped = name.strip()
+        modules.add(stripped)
+        # Top-level entries are indented by exactly one space
+        if name.startswith(" ") and not name.startswith("  "):
+            top_level.append((stripped, int(cumulative_us) / 1000))
+    top_level.sort(key=lambda item: item[1], reverse=True)
+    return total_us / 1000, top_level, modules
+
+
+def run(command: Command, repeat: int) -> dict:
+    """Run ``command`` ``repeat`` times and keep the fastest run."""
+    best: dict | None = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", *command.argv],
+            capture_output=True,
+            text=True,
+            stdin=subprocess.DEVNULL,
+        )
+        wall_ms = (time.perf_counter() - start) * 1000
+        import_ms, top_level, modules = _parse_importtime(proc.stderr)
+        if best is None or import_ms < best["import_ms"]:
+            best = {
+                "command": command.name,
+                "import_ms": import_ms,
+                "wall_ms": wall_ms,
+                "budget_ms": command.budget_ms,
+                "heaviest": top_level[:5],
+                "forbidden_loaded": sorted(
+                    name for name in command.forbidden
+                    if name in modules
+                ),
+            }
+    best["ok"] = best["import_ms"] <= command.budget_ms and not best["forbidden_loaded"]
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--commands",
+        nargs="+",
+        choices=[command.name for command in COMMANDS],
+        default=[command.name for command in COMMANDS],
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per command (fastest is kept)")
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable results")
+    args = parser.parse_args()
+
+    results = [run(command, args.repeat) for command in COMMANDS if command.name in args.commands]
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            status = "ok" if result["ok"] else "OVER BUDGET"
+            print(
+                f"{result['command']:<12} imports {result['import_ms']:7.1f} ms "
+                f"(budget {result['budget_ms']:.0f})  wall {result['wall_ms']:7.1f} ms  {status}"
+            )
+            if result["forbidden_loaded"]:
+                print(f"{'':<12} loaded: {', '.join(result['forbidden_loaded'])}")
+            heaviest = ", ".join(f"{name} {ms:.0f}ms" for name, ms in result["heaviest"][:3])
+            print(f"{'':<12} heaviest: {heaviest}")
+    sys.exit(0 if all(result["ok"] for result in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark the line diff engine against difflib on large files.
+
+Usage:
+    python benchmarks/bench_line_diff.py [--lines 20000] [--repeat 3]
+
+Compares the old ``Diff`` behaviour (``difflib.unified_diff`` run twice, once
+for stats and once for the text) with the single-pass engine, both with and
+without the edit window hint that ``EditTool`` supplies.
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import json
+import random
+import time
+from typing import Callable
+
+from swecli.core.context_engineering.tools.implementations.diff_preview import Diff
+from swecli.core.context_engineering.tools.implementations.line_diff import edit_span
+
+
+def _generated_file(lines: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return "".join(
+        f"export const item_{i} = {{ id: {i}, weight: {rng.randint(0, 9999)} }};\n"
+        for i in range(lines)
+    )
+
+
+def _legacy(original: str, modified: str) -> None:
+    a = original.splitlines(keepends=True)
+    b = modified.splitlines(keepends=True)
+    stats = list(difflib.unified_diff(a, b, lineterm=""))
+    sum(1 for line in stats if line.startswith("+") and not line.startswith("+++"))
+    "\n".join(difflib.unified_diff(a, b, "a/f", "b/f", lineterm="", n=3))
+
+
+def _engine(original: str, modified: str, span=None) -> None:
+    diff = Diff("f", original, modified, span=span)
+    diff.get_stats()
+    diff.generate_unified_diff()
+
+
+def _time(fn: Callable[[], None], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(lines: int, repeat: int) -> dict[str, float]:
+    original = _generated_file(lines)
+    old = f"export const item_{lines // 2} = "
+    offset = original.find(old)
+    end = original.find("\n", offset) + 1
+    old_block = original[offset:end]
+    new_block = "// edited\n" + old_block.replace("weight", "mass")
+    modified = original[:offset] + new_block + original[end:]
+    span = edit_span(original, modified, offset, len(old_block), len(new_block))
+
+    return {
+        "lines": lines,
+        "difflib_seconds": _time(lambda: _legacy(original, modified), repeat),
+        "engine_seconds": _time(lambda: _engine(original, modified), repeat),
+        "engine_with_span_seconds": _time(lambda: _engine(original, modified, span), repeat),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, nargs="+", default=[2000, 20000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable results")
+    args = parser.parse_args()
+
+    results = [run(lines, args.repeat) for lines in args.lines]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for result in results:
+        speedup = result["difflib_seconds"] / max(result["engine_with_span_seconds"], 1e-9)
+        print(
+            f"{result['lines']:>7} lines  "
+            f"difflib {result['difflib_seconds'] * 1000:9.2f} ms  "
+            f"engine {result['engine_seconds'] * 1000:8.2f} ms  "
+            f"engine+span {result['engine_with_span_seconds'] * 1000:8.2f} ms  "
+            f"({speedup:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
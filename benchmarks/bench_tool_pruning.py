@@ -0,0 +1,113 @@
+"""Measure per-request tool payload size with and without schema pruning.
+
+Usage:
+    python benchmarks/bench_tool_pruning.py [--servers 0 3 6] [--tools-per-server 12]
+
+Builds the normal-mode tool set with synthetic MCP servers attached, runs a
+few representative queries through ``ToolSelector`` and reports the estimated
+tool-schema tokens sent per request (full set versus pruned selection), plus
+the selection latency.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from unittest.mock import MagicMock
+
+from swecli.core.agents.components import ToolSchemaBuilder
+from swecli.core.agents.components.tool_selector import ToolSelector
+
+SERVERS = ["github", "jira", "postgres", "slack", "sentry", "figma", "notion", "linear"]
+VERBS = ["list", "get", "create", "update", "delete", "search", "comment on", "assign", "close", "export", "import", "sync"]
+NOUNS = {
+    "github": "pull requests and issues",
+    "jira": "tickets and sprints",
+    "postgres": "database tables and rows",
+    "slack": "channels and messages",
+    "sentry": "error events and releases",
+    "figma": "design files and frames",
+    "notion": "pages and databases",
+    "linear": "issues and cycles",
+}
+
+QUERIES = [
+    "fix the failing test in parser.py",
+    "list the open pull requests on github that touch the parser",
+    "take a screenshot of localhost:3000 after the change",
+    "rename the function parse_args to parse_cli everywhere",
+    "why is the login endpoint slow? check recent sentry errors",
+]
+
+
+def _mcp_tools(servers: int, tools_per_server: int) -> list[dict]:
+    tools = []
+    for server in SERVERS[:servers]:
+        for verb in VERBS[:tools_per_server]:
+            name = f"mcp__{server}__{verb.replace(' ', '_')}_{NOUNS[server].split()[0]}"
+            tools.append(
+                {
+                    "name": name,
+                    "description": f"{verb.capitalize()} {NOUNS[server]} in {server}. " * 3,
+                    "input_schema": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "string", "description": f"Identifier of the {server} object"},
+                            "query": {"type": "string", "description": "Free-text filter"},
+                            "limit": {"type": "integer", "description": "Maximum results"},
+                        },
+                    },
+                }
+            )
+    return tools
+
+
+def run(servers: int, tools_per_server: int) -> dict:
+    registry = MagicMock(spec=["mcp_manager", "_subagent_manager"])
+    registry._subagent_manager = None
+    registry.mcp_manager = MagicMock()
+    registry.mcp_manager.get_all_tools.return_value = _mcp_tools(servers, tools_per_server)
+    tools = ToolSchemaBuilder(registry).build()
+
+    selector = ToolSelector(tools)
+    sent = []
+    start = time.perf_counter()
+    for query in QUERIES:
+        selected = selector.select([{"role": "user", "content": query}])
+        sent.append(selected.token_count)
+    elapsed = (time.perf_counter() - start) / len(QUERIES)
+
+    return {
+        "servers": servers,
+        "tools": len(tools),
+        "full_tokens": tools.token_count,
+        "pruned_tokens_mean": sum(sent) / len(sent),
+        "saved_ratio": 1 - (sum(sent) / len(sent)) / tools.token_count,
+        "select_ms": elapsed * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--servers", type=int, nargs="+", default=[0, 3, 6])
+    parser.add_argument("--tools-per-server", type=int, default=12)
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable results")
+    args = parser.parse_args()
+
+    results = [run(count, args.tools_per_server) for count in args.servers]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for result in results:
+        print(
+            f"{result['servers']:>2} MCP servers  {result['tools']:>3} tools  "
+            f"full ~{result['full_tokens']:>6} tok  "
+            f"pruned ~{result['pruned_tokens_mean']:>8.0f} tok  "
+            f"saved {result['saved_ratio']:5.1%}  "
+            f"select {result['select_ms']:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""Local chat-completions server that replays scripted tool calls.
+
+Used by the agent-loop benchmarks in place of a real provider. It speaks
+both the OpenAI-compatible ``/v1/chat/completions`` format and Anthropic's
+``/v1/messages`` format. It answers each request with the next step of a
+``Script``, after a configurable delay.
+
+The server keeps no per-conversation state. The step to answer with is the
+number of assistant messages since the last real user message, so
+concurrent conversations replay the same script independently.
+
+Example:
+    script = Script.cycle([[ToolCall("read_file", {"file_path": "a.py"})]], iterations=10)
+    with MockLLMServer(script, latency=0.02) as server:
+        config = server.app_config()
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class ToolCall:
+    """One scripted tool call."""
+
+    name: str
+    arguments: dict[str, Any]
+
+
+@dataclass
+class Script:
+    """Replies for one conversation: ``iterations`` tool-call steps, then ``final_text``.
+
+    Step ``i`` issues ``steps[i % len(steps)]``, so a short list of steps can
+    drive an arbitrarily long loop.
+    """
+
+    steps: list[list[ToolCall]]
+    iterations: int
+    final_text: str = "Done."
+    thinking_text: str = "Looking at the code."
+
+    @classmethod
+    def cycle(cls, steps: Sequence[Sequence[ToolCall]], iterations: int, final_text: str = "Done.") -> "Script":
+        return cls([list(step) for step in steps], iterations, final_text)
+
+    def reply(self, step: int) -> tuple[str, list[ToolCall]]:
+        """Text and tool calls for the 0-based ``step``."""
+        if step >= self.iterations or not self.steps:
+            return self.final_text, []
+        return self.thinking_text, self.steps[step % len(self.steps)]
+
+
+def conversation_step(messages: list[dict[str, Any]]) -> int:
+    """Assistant turns since the last real user message (tool results don't count)."""
+    step = 0
+    for message in reversed(messages):
+        role = message.get("role")
+        if role == "assistant":
+            step += 1
+        elif role == "user" and not _is_tool_result(message.get("content")):
+            break
+    return step
+
+
+def _is_tool_result(content: Any) -> bool:
+    return isinstance(content, list) and bool(content) and all(
+        isinstance(block, dict) and block.get("type") == "tool_result" for block in content
+    )
+
+
+@dataclass
+class ServerStats:
+    """Counters for requests the server has answered."""
+
+    requests: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    delay_s: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, bytes_in: int, bytes_out: int, delay_s: float) -> None:
+        with self._lock:
+            self.requests += 1
+            self.bytes_in += bytes_in
+            self.bytes_out += bytes_out
+            self.delay_s += delay_s
+
+
+class MockLLMServer:
+    """Threaded HTTP server answering chat requests from a ``Script``."""
+
+    def __init__(
+        self,
+        script: Script,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+    ) -> None:
+        """Initialize the server (call ``start`` or use it as a context manager).
+
+        Args:
+            script: Replies to replay
+            latency: Seconds to wait before answering each request
+            jitter: Extra uniformly random delay, as a fraction of ``latency``
+            seed: Seed for the jitter, so runs are repeatable
+            host: Interface to bind; the port is picked by the OS
+        """
+        self.script = script
+        self.latency = latency
+        self.jitter = jitter
+        self.stats = ServerStats()
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._httpd = ThreadingHTTPServer((host, 0), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockLLMServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-llm", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "MockLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def app_config(self, **overrides: Any) -> Any:
+        """``AppConfig`` for an OpenAI-compatible provider pointed at this server."""
+        from swecli.models.config import AppConfig
+
+        values = {
+            "model_provider": "openai",
+            "model": "mock-model",
+            "api_key": "mock-key",
+            "api_base_url": f"{self.url}/v1",
+            "auto_save_interval": 1_000_000,
+        }
+        values.update(overrides)
+        return AppConfig(**values)
+
+    def http_client(self, provider: str = "openai") -> Any:
+        """Agent HTTP client for ``provider`` (``"openai"`` or ``"anthropic"``) pointed at this server."""
+        if provider == "anthropic":
+            from swecli.core.agents.components.anthropic_adapter import AnthropicAdapter
+
+            return AnthropicAdapter("mock-key", api_url=f"{self.url}/v1/messages")
+        from swecli.core.agents.components.http_client import AgentHttpClient
+
+        return AgentHttpClient(f"{self.url}/v1/chat/completions", {"Authorization": "Bearer mock-key"})
+
+    # --- Request handling ----------------------------------------------------
+
+    def _delay(self) -> float:
+        if not self.latency:
+            return 0.0
+        with self._random_lock:
+            extra = self._random.random() * self.jitter
+        return self.latency * (1 + extra)
+
+    def _respond(self, path: str, request: dict[str, Any]) -> dict[str, Any]:
+        messages = request.get("messages") or []
+        text, calls = self.script.reply(conversation_step(messages))
+        prompt_tokens = sum(len(str(message.get("content") or "")) for message in messages) // 4
+        completion_tokens = max(len(text) // 4, 1) + 20 * len(calls)
+        call_ids = [f"call_{next(self._ids)}" for _ in calls]
+
+        if path.endswith("/messages"):
+            content: list[dict[str, Any]] = [{"type": "text", "text": text}]
+            content += [
+                {"type": "tool_use", "id": call_id, "name": call.name, "input": call.arguments}
+                for call_id, call in zip(call_ids, calls)
+            ]
+            return {
+                "id": f"msg_{next(self._ids)}",
+                "type": "message",
+                "role": "assistant",
+                "model": request.get("model", "mock-model"),
+                "content": content,
+                "stop_reason": "tool_use" if calls else "end_turn",
+                "usage": {"input_tokens": prompt_tokens, "output_tokens": completion_tokens},
+            }
+
+        message: dict[str, Any] = {"role": "assistant", "content": text}
+        if calls:
+            message["tool_calls"] = [
+                {
+                    "id": call_id,
+                    "type": "function",
+                    "function": {"name": call.name, "arguments": json.dumps(call.arguments)},
+                }
+                for call_id, call in zip(call_ids, calls)
+            ]
+        return {
+            "id": f"chatcmpl-{next(self._ids)}",
+            "object": "chat.completion",
+            "model": request.get("model", "mock-model"),
+            "choices": [{"index": 0, "message": message, "finish_reason": "tool_calls" if calls else "stop"}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are separate writes; without this, delayed ACKs add ~40 ms per request
+            disable_nagle_algorithm = True
+
+            def do_POST(self) -> None:  # noqa: N802 - http.server naming
+                if not self.path.endswith(("/chat/completions", "/messages")):
+                    self.send_error(404)
+                    return
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                delay = server._delay()
+                if delay:
+                    time.sleep(delay)
+                payload = json.dumps(server._respond(self.path, json.loads(body))).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+                server.stats.add(len(body), len(payload), delay)
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                pass
+
+        return Handler
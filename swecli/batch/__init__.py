@@ -0,0 +1,21 @@
+"""Headless batch mode for running many prompts concurrently."""
+
+from swecli.batch.runner import (
+    BatchRunner,
+    BatchSummary,
+    BatchTask,
+    BatchTaskError,
+    finished_task_ids,
+    load_tasks,
+    record_exchange,
+)
+
+__all__ = [
+    "BatchRunner",
+    "BatchSummary",
+    "BatchTask",
+    "BatchTaskError",
+    "finished_task_ids",
+    "load_tasks",
+    "record_exchange",
+]
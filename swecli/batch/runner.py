@@ -0,0 +1,316 @@
+"""Headless batch execution of many independent agent tasks.
+
+``swecli batch tasks.jsonl`` reads one task per line::
+
+    {"id": "fix-1", "prompt": "fix the failing test", "working_dir": "repos/a", "approval": "safe"}
+
+Each task runs in its own working directory, session and approval policy,
+on a pool of worker threads. The tasks share the process-wide HTTP
+connection pool and model catalog. One result record per task is appended
+to the output JSONL as soon as the task finishes. Tasks that already have a
+record in the output file are skipped, so an interrupted batch resumes where
+it stopped.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from swecli.core.runtime.approval.policy import APPROVAL_POLICIES
+
+DEFAULT_WORKERS = 4
+
+
+class BatchTaskError(ValueError):
+    """Raised for a malformed line in a batch task file."""
+
+
+@dataclass
+class BatchTask:
+    """One prompt to run headlessly."""
+
+    id: str
+    prompt: str
+    working_dir: Path
+    approval: str = "safe"
+    allow_commands: list[str] = field(default_factory=list)
+    max_iterations: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], *, line: int, base_dir: Path) -> "BatchTask":
+        """Build a task from one JSONL record.
+
+        Args:
+            data: Parsed record
+            line: 1-based line number, used for the default id and errors
+            base_dir: Directory relative ``working_dir`` values resolve against
+        """
+        prompt = data.get("prompt")
+        if not isinstance(prompt, str) or not prompt.strip():
+            raise BatchTaskError(f"line {line}: 'prompt' must be a non-empty string")
+        approval = data.get("approval", "safe")
+        if approval not in APPROVAL_POLICIES:
+            raise BatchTaskError(f"line {line}: unknown approval policy '{approval}'")
+        working_dir = Path(data.get("working_dir") or ".").expanduser()
+        if not working_dir.is_absolute():
+            working_dir = base_dir / working_dir
+        max_iterations = data.get("max_iterations")
+        return cls(
+            id=str(data.get("id") or f"task-{line}"),
+            prompt=prompt,
+            working_dir=working_dir.resolve(),
+            approval=approval,
+            allow_commands=list(data.get("allow_commands") or []),
+            max_iterations=int(max_iterations) if max_iterations is not None else None,
+        )
+
+
+def load_tasks(path: Path, base_dir: Optional[Path] = None) -> list[BatchTask]:
+    """Parse a task file; blank lines and ``#`` comments are ignored.
+
+    Raises:
+        BatchTaskError: For invalid JSON, missing prompts or duplicate ids
+    """
+    base_dir = base_dir or path.parent
+    tasks: list[BatchTask] = []
+    seen: set[str] = set()
+    with path.open(encoding="utf-8") as handle:
+        for line_no, raw in enumerate(handle, start=1):
+            raw = raw.strip()
+            if not raw or raw.startswith("#"):
+                continue
+            try:
+                data = json.loads(raw)
+            except json.JSONDecodeError as exc:
+                raise BatchTaskError(f"line {line_no}: invalid JSON ({exc.msg})") from exc
+            if not isinstance(data, dict):
+                raise BatchTaskError(f"line {line_no}: expected a JSON object")
+            task = BatchTask.from_dict(data, line=line_no, base_dir=base_dir)
+            if task.id in seen:
+                raise BatchTaskError(f"line {line_no}: duplicate task id '{task.id}'")
+            seen.add(task.id)
+            tasks.append(task)
+    return tasks
+
+
+def finished_task_ids(output_path: Path, *, retry_failed: bool = False) -> set[str]:
+    """Ids that already have a result in ``output_path`` (successful ones only if ``retry_failed``)."""
+    finished: set[str] = set()
+    if not output_path.exists():
+        return finished
+    with output_path.open(encoding="utf-8") as handle:
+        for raw in handle:
+            try:
+                record = json.loads(raw)
+            except json.JSONDecodeError:
+                # A line cut short by an interrupted run; that task runs again
+                continue
+            if retry_failed and record.get("status") != "ok":
+                continue
+            if "id" in record:
+                finished.add(str(record["id"]))
+    return finished
+
+
+def record_exchange(session_manager: Any, config: Any, prompt: str, result: dict[str, Any]) -> str:
+    """Append a prompt and the agent's reply to the current session and save it.
+
+    Returns:
+        The reply text
+    """
+    from swecli.models.message import ChatMessage, Role
+
+    session_manager.add_message(ChatMessage(role=Role.USER, content=prompt), config.auto_save_interval)
+
+    assistant_content = result.get("content", "") or ""
+    raw_assistant_content = assistant_content
+    for msg in reversed(result.get("messages") or []):
+        if msg.get("role") == "assistant":
+            raw_assistant_content = msg.get("content", raw_assistant_content)
+            break
+
+    metadata = {}
+    if raw_assistant_content is not None:
+        metadata["raw_content"] = raw_assistant_content
+
+    session_manager.add_message(
+        ChatMessage(role=Role.ASSISTANT, content=assistant_content, metadata=metadata),
+        config.auto_save_interval,
+    )
+    session_manager.save_session()
+    return assistant_content
+
+
+@dataclass
+class BatchSummary:
+    """Counts for one ``BatchRunner.run`` call."""
+
+    total: int = 0
+    skipped: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    duration_s: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.failed == 0
+
+
+class BatchRunner:
+    """Runs ``BatchTask`` s concurrently and streams results to a JSONL file."""
+
+    def __init__(
+        self,
+        tasks: Iterable[BatchTask],
+        output_path: Path,
+        *,
+        workers: int = DEFAULT_WORKERS,
+        resume: bool = True,
+        retry_failed: bool = False,
+        on_result: Optional[Callable[[dict[str, Any]], None]] = None,
+    ) -> None:
+        """Initialize the runner.
+
+        Args:
+            tasks: Tasks to run, in submission order
+            output_path: Result JSONL (appended to)
+            workers: Maximum tasks running at once
+            resume: Skip tasks that already have a record in ``output_path``
+            retry_failed: When resuming, run previously failed tasks again
+            on_result: Called with each result record (from worker threads)
+        """
+        self.tasks = list(tasks)
+        self.output_path = output_path
+        self.workers = max(workers, 1)
+        self.resume = resume
+        self.retry_failed = retry_failed
+        self.on_result = on_result
+        self._write_lock = threading.Lock()
+
+    def run(self) -> BatchSummary:
+        """Run every pending task; returns once all have finished."""
+        from swecli.config import get_model_registry
+        from swecli.core.agents.components.http_client import configure_connection_pool
+
+        summary = BatchSummary(total=len(self.tasks))
+        done = finished_task_ids(self.output_path, retry_failed=self.retry_failed) if self.resume else set()
+        pending = [task for task in self.tasks if task.id not in done]
+        summary.skipped = summary.total - len(pending)
+        if not pending:
+            return summary
+
+        # Shared by every task: one connection pool sized for the workers, one catalog
+        configure_connection_pool(self.workers)
+        get_model_registry()
+
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        start = time.perf_counter()
+        with self.output_path.open("a", encoding="utf-8") as output:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="swecli-batch") as pool:
+                futures = [pool.submit(self.run_task, task) for task in pending]
+                for future in as_completed(futures):
+                    record = future.result()
+                    with self._write_lock:
+                        output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                        output.flush()
+                    if record["status"] == "ok":
+                        summary.succeeded += 1
+                    else:
+                        summary.failed += 1
+                    if self.on_result is not None:
+                        self.on_result(record)
+        summary.duration_s = time.perf_counter() - start
+        return summary
+
+    def run_task(self, task: BatchTask) -> dict[str, Any]:
+        """Run one task in isolation and return its result record (never raises)."""
+        started_at = datetime.now(timezone.utc).isoformat()
+        start = time.perf_counter()
+        record: dict[str, Any] = {
+            "id": task.id,
+            "status": "error",
+            "working_dir": str(task.working_dir),
+            "started_at": started_at,
+        }
+        try:
+            record.update(self._execute(task))
+        except Exception as exc:  # noqa: BLE001 - one task's failure must not stop the batch
+            record["error"] = f"{type(exc).__name__}: {exc}"
+        record["duration_s"] = round(time.perf_counter() - start, 3)
+        return record
+
+    def _execute(self, task: BatchTask) -> dict[str, Any]:
+        from rich.console import Console
+
+        from swecli.core.context_engineering.history import SessionManager, UndoManager
+        from swecli.core.context_engineering.tools.lazy import lazy_tools
+        from swecli.core.runtime import ConfigManager, ModeManager
+        from swecli.core.runtime.approval.policy import PolicyApprovalManager
+        from swecli.core.runtime.services import RuntimeService
+        from swecli.models.agent_deps import AgentDependencies
+
+        if not task.working_dir.is_dir():
+            raise FileNotFoundError(f"working directory does not exist: {task.working_dir}")
+
+        config_manager = ConfigManager(task.working_dir)
+        config = config_manager.load_config()
+        config_manager.ensure_directories()
+
+        session_manager = SessionManager(Path(config.session_dir).expanduser())
+        session = session_manager.create_session(working_directory=str(task.working_dir))
+
+        mode_manager = ModeManager()
+        approval_manager = PolicyApprovalManager(task.approval, task.allow_commands)
+        runtime_service = RuntimeService(config_manager, mode_manager)
+        suite = runtime_service.build_suite(**lazy_tools(config, task.working_dir), mcp_manager=None)
+        agent = suite.agents.normal
+
+        deps = AgentDependencies(
+            mode_manager=mode_manager,
+            approval_manager=approval_manager,
+            undo_manager=UndoManager(config.max_undo_history),
+            session_manager=session_manager,
+            working_dir=task.working_dir,
+            console=Console(quiet=True),
+            config=config,
+        )
+        result = agent.run_sync(
+            task.prompt,
+            deps,
+            message_history=session.to_api_messages(),
+            max_iterations=task.max_iterations,
+        )
+
+        messages = result.get("messages") or []
+        outcome: dict[str, Any] = {
+            "session_id": session.id,
+            "model": config.model,
+            "usage": result.get("usage") or {},
+            "tool_calls": sum(len(msg.get("tool_calls") or []) for msg in messages if msg.get("role") == "assistant"),
+            "denied_commands": approval_manager.denied,
+        }
+        if result.get("success"):
+            outcome["status"] = "ok"
+            outcome["content"] = record_exchange(session_manager, config, task.prompt, result)
+        else:
+            outcome["error"] = result.get("content") or result.get("error") or "Unknown error"
+        return outcome
+
+
+__all__ = [
+    "BatchRunner",
+    "BatchSummary",
+    "BatchTask",
+    "BatchTaskError",
+    "DEFAULT_WORKERS",
+    "finished_task_ids",
+    "load_tasks",
+    "record_exchange",
+]
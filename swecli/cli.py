@@ -1,29 +1,23 @@
-"""Command-line interface entry point for SWE-CLI."""
+"""Command-line interface entry point for SWE-CLI.
+
+Subcommands import what they need inside their handlers: ``--version``,
+``config`` and ``mcp`` must not pay for the Textual UI, the agent runtime or
+the tool implementations. ``benchmarks/bench_import_time.py`` enforces an
+import-time budget per command.
+"""
+
+from __future__ import annotations
 
 import argparse
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from rich.console import Console
-
-from swecli.core.runtime.approval import ApprovalManager
-from swecli.core.runtime import ConfigManager, ModeManager
-from swecli.core.context_engineering.history import SessionManager, UndoManager
-from swecli.core.runtime.services import RuntimeService
-from swecli.models.agent_deps import AgentDependencies
-from swecli.models.message import ChatMessage, Role
-from swecli.ui_textual.runner import launch_textual_cli
-from swecli.setup import run_setup_wizard
-from swecli.setup.wizard import config_exists
-from swecli.core.context_engineering.tools.implementations import (
-    BashTool,
-    EditTool,
-    FileOperations,
-    VLMTool,
-    WebFetchTool,
-    WebScreenshotTool,
-    WriteTool,
-)
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from swecli.core.context_engineering.history import SessionManager
+    from swecli.core.runtime import ConfigManager
 
 
 def main() -> None:
@@ -40,6 +34,7 @@ Examples:
   swecli run ui                   # Start web UI (backend + frontend) and open browser
   swecli -p "create hello.py"     # Non-interactive mode
   swecli -r abc123                # Resume session
+  swecli batch tasks.jsonl -j 8   # Run many prompts headlessly
   swecli mcp list                 # List MCP servers
   swecli mcp add myserver uvx mcp-server-example
         """
@@ -192,6 +187,43 @@ Examples:
     )
     mcp_disable.add_argument("name", help="Name of the server to disable")
 
+    # Batch subcommand
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Run many prompts headlessly from a JSONL file",
+        description=(
+            "Run independent agent tasks concurrently. Each line of the task file is a JSON "
+            'object such as {"id": "t1", "prompt": "...", "working_dir": "repo", "approval": "safe"}. '
+            "Results are appended to the output JSONL as tasks finish; re-running the same "
+            "command skips tasks that already have a result."
+        ),
+    )
+    batch_parser.add_argument("tasks", help="Task file (JSONL)")
+    batch_parser.add_argument(
+        "--output",
+        "-o",
+        metavar="PATH",
+        help="Result file (JSONL, default: <tasks>.results.jsonl)",
+    )
+    batch_parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=4,
+        metavar="N",
+        help="Maximum tasks running at once (default: 4)",
+    )
+    batch_parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Run every task even if the output already has its result",
+    )
+    batch_parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="When resuming, run tasks whose previous result was an error again",
+    )
+
     # Run subcommand
     run_parser = subparsers.add_parser(
         "run",
@@ -231,11 +263,23 @@ Examples:
         _handle_mcp_command(args)
         return
 
+    # Handle batch runs
+    if args.command == "batch":
+        _handle_batch_command(args)
+        return
+
     # Handle run commands
     if args.command == "run":
         _handle_run_command(args)
         return
 
+    from rich.console import Console
+
+    from swecli.core.runtime import ConfigManager
+    from swecli.core.context_engineering.history import SessionManager
+    from swecli.setup import run_setup_wizard
+    from swecli.setup.wizard import config_exists
+
     console = Console()
 
     # Run setup wizard if config doesn't exist
@@ -321,6 +365,8 @@ Examples:
             _run_non_interactive(config_manager, session_manager, args.prompt)
             return
 
+        from swecli.ui_textual.runner import launch_textual_cli
+
         launch_textual_cli(
             working_dir=working_dir,
             resume_session=resume_id,
@@ -397,7 +443,8 @@ def _handle_config_command(args) -> None:
         args: Parsed command-line arguments
     """
     import json
-    from pathlib import Path
+
+    from rich.console import Console
 
     console = Console()
 
@@ -406,6 +453,8 @@ def _handle_config_command(args) -> None:
         sys.exit(1)
 
     if args.config_command == "setup":
+        from swecli.setup import run_setup_wizard
+
         # Run setup wizard (can be used to reconfigure)
         if not run_setup_wizard():
             console.print("[yellow]Setup cancelled.[/yellow]")
@@ -460,9 +509,11 @@ def _handle_mcp_command(args) -> None:
     Args:
         args: Parsed command-line arguments
     """
-    from swecli.core.context_engineering.mcp.manager import MCPManager
+    from rich.console import Console
     from rich.table import Table
 
+    from swecli.core.context_engineering.mcp.manager import MCPManager
+
     console = Console()
     mcp_manager = MCPManager()
 
@@ -571,6 +622,62 @@ def _handle_mcp_command(args) -> None:
         sys.exit(1)
 
 
+def _handle_batch_command(args) -> None:
+    """Handle the batch subcommand.
+
+    Args:
+        args: Parsed command-line arguments
+    """
+    from rich.console import Console
+
+    from swecli.batch import BatchRunner, BatchTaskError, load_tasks
+
+    console = Console()
+    tasks_path = Path(args.tasks).expanduser()
+    if not tasks_path.exists():
+        console.print(f"[red]Error: Task file not found: {tasks_path}[/red]")
+        sys.exit(1)
+
+    try:
+        tasks = load_tasks(tasks_path, base_dir=Path.cwd())
+    except BatchTaskError as e:
+        console.print(f"[red]Error in {tasks_path}: {e}[/red]")
+        sys.exit(1)
+
+    output_path = (
+        Path(args.output).expanduser()
+        if args.output
+        else tasks_path.with_name(f"{tasks_path.stem}.results.jsonl")
+    )
+
+    def _report(record: dict) -> None:
+        if record["status"] == "ok":
+            console.print(f"[green]✓[/green] {record['id']} ({record['duration_s']:.1f}s)")
+        else:
+            console.print(f"[red]✗[/red] {record['id']}: {record.get('error', 'failed')}")
+
+    runner = BatchRunner(
+        tasks,
+        output_path,
+        workers=args.workers,
+        resume=not args.no_resume,
+        retry_failed=args.retry_failed,
+        on_result=_report,
+    )
+    try:
+        summary = runner.run()
+    except KeyboardInterrupt:
+        console.print(f"\n[yellow]Interrupted. Re-run to resume; results so far are in {output_path}[/yellow]")
+        sys.exit(130)
+
+    console.print(
+        f"{summary.succeeded} succeeded, {summary.failed} failed, {summary.skipped} already done "
+        f"({summary.duration_s:.1f}s). Results: {output_path}"
+    )
+    if not summary.ok:
+        sys.exit(1)
+
+
 def _handle_run_command(args) -> None:
     """Handle run subcommands.
 
@@ -579,7 +686,8 @@ def _handle_run_command(args) -> None:
     """
     import webbrowser
     import time
-    from pathlib import Path
+
+    from rich.console import Console
 
     console = Console()
 
@@ -695,31 +803,39 @@ def _run_non_interactive(
         session_manager: Session manager
         prompt: User prompt to execute
     """
+    from rich.console import Console
+
+    from swecli.batch.runner import record_exchange
+    from swecli.core.context_engineering.history import UndoManager
+    from swecli.core.context_engineering.tools.lazy import lazy_tools
+    from swecli.core.runtime import ModeManager
+    from swecli.core.runtime.approval import ApprovalManager
+    from swecli.core.runtime.services import RuntimeService
+    from swecli.models.agent_deps import AgentDependencies
+
     console = Console()
     config = config_manager.get_config()
     mode_manager = ModeManager()
     approval_manager = ApprovalManager(console)
     undo_manager = UndoManager(config.max_undo_history)
 
-    file_ops = FileOperations(config, config_manager.working_dir)
-    write_tool = WriteTool(config, config_manager.working_dir)
-    edit_tool = EditTool(config, config_manager.working_dir)
-    bash_tool = BashTool(config, config_manager.working_dir)
-    web_fetch_tool = WebFetchTool(config, config_manager.working_dir)
-    vlm_tool = VLMTool(config, config_manager.working_dir)
-    web_screenshot_tool = WebScreenshotTool(config, config_manager.working_dir)
+    # Tools are constructed (and their modules imported) on first use
+    tools = lazy_tools(
+        config,
+        config_manager.working_dir,
+        names=[
+            "file_ops",
+            "write_tool",
+            "edit_tool",
+            "bash_tool",
+            "web_fetch_tool",
+            "vlm_tool",
+            "web_screenshot_tool",
+        ],
+    )
 
     runtime_service = RuntimeService(config_manager, mode_manager)
-    runtime_suite = runtime_service.build_suite(
-        file_ops=file_ops,
-        write_tool=write_tool,
-        edit_tool=edit_tool,
-        bash_tool=bash_tool,
-        web_fetch_tool=web_fetch_tool,
-        vlm_tool=vlm_tool,
-        web_screenshot_tool=web_screenshot_tool,
-        mcp_manager=None,
-    )
+    runtime_suite = runtime_service.build_suite(**tools, mcp_manager=None)
 
     agent = runtime_suite.agents.normal
 
@@ -752,29 +868,7 @@ def _run_non_interactive(
         console.print(f"[red]Error: {error}[/red]")
         sys.exit(1)
 
-    user_msg = ChatMessage(role=Role.USER, content=prompt)
-    session_manager.add_message(user_msg, config.auto_save_interval)
-
-    assistant_content = result.get("content", "") or ""
-    raw_assistant_content = assistant_content
-    history = result.get("messages") or []
-    for msg in reversed(history):
-        if msg.get("role") == "assistant":
-            raw_assistant_content = msg.get("content", raw_assistant_content)
-            break
-
-    metadata = {}
-    if raw_assistant_content is not None:
-        metadata["raw_content"] = raw_assistant_content
-
-    assistant_msg = ChatMessage(
-        role=Role.ASSISTANT,
-        content=assistant_content,
-        metadata=metadata,
-    )
-    session_manager.add_message(assistant_msg, config.auto_save_interval)
-    session_manager.save_session()
-
+    assistant_content = record_exchange(session_manager, config, prompt, result)
     console.print(assistant_content)
 
 
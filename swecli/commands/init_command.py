@@ -145,5 +145,23 @@ class InitCommandHandler:
         template = load_prompt("init_analysis")
 
         # Replace path placeholder
-        return template.replace("{path}", str(path))
+        prompt = template.replace("{path}", str(path))
+
+        overview = self._precomputed_overview(path)
+        if overview:
+            prompt += (
+                "\n\n**Precomputed overview** (from a local scan that honours .gitignore; "
+                "use it instead of re-listing the tree):\n\n" + overview
+            )
+        return prompt
+
+    @staticmethod
+    def _precomputed_overview(path: Path) -> str | None:
+        """Summary of file counts, structure, key files and dependencies, or None if unavailable."""
+        from swecli.core.context_engineering.retrieval.indexer import CodebaseIndexer
+
+        try:
+            return CodebaseIndexer(path).generate_index()
+        except Exception:  # noqa: BLE001 - the agent can still explore on its own
+            return None
 
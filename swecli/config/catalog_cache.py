@@ -0,0 +1,98 @@
+"""Pre-converted cache of the Models.dev catalog.
+
+Converting the raw Models.dev JSON (thousands of models) into ``ProviderInfo``
+and ``ModelInfo`` records is the slow part of building the model registry
+after the download itself. ``CatalogCache`` stores the converted providers
+together with a model-id index as a pickle next to the raw JSON cache, so a
+warm start only unpickles ready-made records.
+
+The pickle lives in the user's own cache directory and is only ever written
+by SWE-CLI. A file that fails to load or was written by another cache
+version is ignored and rebuilt.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+_LOG = logging.getLogger(__name__)
+
+# Bump when ModelInfo/ProviderInfo or the conversion rules change
+CATALOG_CACHE_VERSION = 1
+CATALOG_CACHE_FILENAME = "models.dev.index.pickle"
+
+
+def catalog_source() -> str:
+    """Identify where the catalog comes from, so an override invalidates the cache."""
+    override = os.getenv("SWECLI_MODELS_DEV_PATH")
+    if not override:
+        return "models.dev"
+    path = Path(override).expanduser()
+    try:
+        return f"{path}:{path.stat().st_mtime_ns}"
+    except OSError:
+        return str(path)
+
+
+@dataclass
+class CatalogSnapshot:
+    """Converted Models.dev providers plus a model-id index."""
+
+    providers: Dict[str, Any]
+    # model id -> (provider_id, model_key), first occurrence wins
+    index: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+    source: str = "models.dev"
+    built_at: float = field(default_factory=time.time)
+
+    def age(self) -> float:
+        return time.time() - self.built_at
+
+
+class CatalogCache:
+    """Pickle file holding the last converted ``CatalogSnapshot``."""
+
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the cache file (default: ``~/.swecli/cache``)
+        """
+        self.cache_dir = cache_dir or Path.home() / ".swecli" / "cache"
+        self.path = self.cache_dir / CATALOG_CACHE_FILENAME
+
+    def load(self) -> Optional[CatalogSnapshot]:
+        """Return the cached snapshot, or None if missing or unreadable."""
+        try:
+            with self.path.open("rb") as handle:
+                payload = pickle.load(handle)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:  # noqa: BLE001 - any corrupt cache is rebuilt
+            _LOG.debug("Ignoring unreadable model catalog cache %s: %s", self.path, exc)
+            return None
+        if not isinstance(payload, dict) or payload.get("version") != CATALOG_CACHE_VERSION:
+            return None
+        snapshot = payload.get("snapshot")
+        return snapshot if isinstance(snapshot, CatalogSnapshot) else None
+
+    def save(self, snapshot: CatalogSnapshot) -> None:
+        """Write ``snapshot`` atomically; failures only disable caching."""
+        payload = {"version": CATALOG_CACHE_VERSION, "snapshot": snapshot}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".models.", suffix=".tmp")
+            with os.fdopen(fd, "wb") as handle:
+                pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path)
+        except Exception as exc:  # noqa: BLE001 - cache is best-effort
+            _LOG.debug("Unable to write model catalog cache %s: %s", self.path, exc)
+
+
+__all__ = ["CATALOG_CACHE_VERSION", "CatalogCache", "CatalogSnapshot", "catalog_source"]
@@ -4,16 +4,21 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from .models_dev_loader import load_models_dev_catalog
+from .catalog_cache import CatalogCache, CatalogSnapshot, catalog_source
+from .models_dev_loader import DEFAULT_CACHE_TTL, load_models_dev_catalog
 
 _LOG = logging.getLogger(__name__)
 
+# Longest a lookup waits for the first catalog load before reporting a miss
+CATALOG_WAIT_TIMEOUT = 10.0
 
-@dataclass
+
+@dataclass(slots=True)
 class ModelInfo:
     """Information about a specific model."""
 
@@ -45,7 +50,7 @@ class ModelInfo:
         return f"${self.pricing_input:.2f} in / ${self.pricing_output:.2f} out {self.pricing_unit}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderInfo:
     """Information about a provider."""
 
@@ -73,19 +78,43 @@ class ProviderInfo:
 
 
 class ModelRegistry:
-    """Registry for managing model and provider configurations."""
+    """Registry for managing model and provider configurations.
+
+    Bundled provider files are loaded synchronously. The Models.dev catalog is
+    merged from a pre-converted cache when one exists and refreshed in a
+    background thread when the cache is missing or stale, so construction
+    never waits on the network.
+    """
 
-    def __init__(self, providers_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        providers_dir: Optional[Path] = None,
+        *,
+        catalog_cache_dir: Optional[Path] = None,
+        background: bool = True,
+    ):
         """Initialize model registry.
 
         Args:
             providers_dir: Path to providers directory containing JSON files
+            catalog_cache_dir: Directory for the converted Models.dev cache
+            background: Refresh the Models.dev catalog in a background thread
+                (False refreshes synchronously when needed)
         """
         if providers_dir is None:
             providers_dir = Path(__file__).parent / "providers"
 
         self.providers_dir = providers_dir
         self.providers: Dict[str, ProviderInfo] = {}
+        # model id -> (provider_id, model_key)
+        self._model_index: Dict[str, Tuple[str, str]] = {}
+        self._local_providers: Dict[str, ProviderInfo] = {}
+        self._local_index: Dict[str, Tuple[str, str]] = {}
+        self._catalog_cache = CatalogCache(catalog_cache_dir)
+        self._catalog_ready = threading.Event()
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._background = background
         self._load_config()
 
     def _load_config(self) -> None:
@@ -96,6 +125,8 @@ class ModelRegistry:
             legacy_config = self.providers_dir.parent / "models.json"
             if legacy_config.exists():
                 self._load_legacy_config(legacy_config)
+            self._set_local_providers(self.providers)
+            self._catalog_ready.set()
             return
 
         for provider_file in self.providers_dir.glob("*.json"):
@@ -129,23 +160,77 @@ class ModelRegistry:
                 models=models,
             )
 
+        self._set_local_providers(self.providers)
         self._augment_with_models_dev()
 
+    def _set_local_providers(self, providers: Dict[str, ProviderInfo]) -> None:
+        self._local_providers = dict(providers)
+        self._local_index = _index_models(self._local_providers)
+        self._model_index = dict(self._local_index)
+
     def _augment_with_models_dev(self) -> None:
-        """Merge providers/models from the Models.dev catalog."""
+        """Merge providers/models from the Models.dev catalog.
+
+        A cached snapshot from the same source is merged immediately (stale
+        while revalidate); a missing or stale snapshot triggers a refresh.
+        """
+        snapshot = self._catalog_cache.load()
+        if snapshot is not None and snapshot.source == catalog_source():
+            self._merge_catalog(snapshot)
+            self._catalog_ready.set()
+            if snapshot.age() <= DEFAULT_CACHE_TTL:
+                return
+        self.refresh_catalog(wait=not self._background)
+
+    def refresh_catalog(self, wait: bool = False) -> None:
+        """Reload the Models.dev catalog and rebuild the converted cache.
 
-        catalog = load_models_dev_catalog()
-        if not catalog:
+        Args:
+            wait: Refresh in the calling thread instead of a background thread
+        """
+        if wait:
+            self._refresh_catalog()
             return
+        with self._refresh_lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_catalog,
+                name="swecli-model-catalog",
+                daemon=True,
+            )
+            self._refresh_thread.start()
 
-        existing = set(self.providers.keys())
-        existing_names = {info.name.lower(): pid for pid, info in self.providers.items() if info.name}
+    def wait_for_catalog(self, timeout: Optional[float] = None) -> bool:
+        """Block until the first Models.dev load has finished.
+
+        Returns:
+            True if the catalog load has finished
+        """
+        return self._catalog_ready.wait(timeout)
+
+    def _refresh_catalog(self) -> None:
+        try:
+            catalog = load_models_dev_catalog()
+            if catalog:
+                snapshot = self._build_snapshot(catalog)
+                self._catalog_cache.save(snapshot)
+                self._merge_catalog(snapshot)
+        except Exception as exc:  # noqa: BLE001 - the catalog is optional
+            _LOG.warning("Failed to load Models.dev catalog: %s", exc)
+        finally:
+            self._catalog_ready.set()
+
+    def _build_snapshot(self, catalog: Dict[str, Any]) -> CatalogSnapshot:
+        """Convert the raw Models.dev catalog into provider records and an index."""
+        providers: Dict[str, ProviderInfo] = {}
+        seen_names: set[str] = set()
 
         for provider_id, provider_data in catalog.items():
             provider_name = provider_data.get("name") or provider_id.title()
             provider_name_lower = provider_name.lower()
 
-            if provider_id in existing or provider_name_lower in existing_names:
+            if provider_id in providers or provider_name_lower in seen_names:
                 continue
 
             models_block = provider_data.get("models") or {}
@@ -181,7 +266,7 @@ class ModelRegistry:
             api_key_env = env_vars[0] if env_vars else ""
             api_base_url = provider_data.get("api") or ""
 
-            self.providers[provider_id] = ProviderInfo(
+            providers[provider_id] = ProviderInfo(
                 id=provider_id,
                 name=provider_name,
                 description=description,
@@ -189,10 +274,33 @@ class ModelRegistry:
                 api_base_url=api_base_url,
                 models=converted_models,
             )
-            existing.add(provider_id)
-            existing_names[provider_name.lower()] = provider_id
+            seen_names.add(provider_name_lower)
             _LOG.debug("Loaded %s models from Models.dev provider %s", len(converted_models), provider_id)
 
+        return CatalogSnapshot(providers=providers, index=_index_models(providers), source=catalog_source())
+
+    def _merge_catalog(self, snapshot: CatalogSnapshot) -> None:
+        """Combine the bundled providers with a catalog snapshot.
+
+        Bundled providers win over catalog providers with the same id or name.
+        The merged maps are built aside and swapped in, so readers on other
+        threads never see a partially merged registry.
+        """
+        providers = dict(self._local_providers)
+        local_names = {info.name.lower() for info in providers.values() if info.name}
+        for provider_id, info in snapshot.providers.items():
+            if provider_id in providers or info.name.lower() in local_names:
+                continue
+            providers[provider_id] = info
+
+        index = dict(self._local_index)
+        for model_id, (provider_id, model_key) in snapshot.index.items():
+            if model_id not in index and providers.get(provider_id) is snapshot.providers[provider_id]:
+                index[model_id] = (provider_id, model_key)
+
+        self._model_index = index
+        self.providers = providers
+
     def _convert_models_dev_model(
         self,
         *,
@@ -302,9 +410,19 @@ class ModelRegistry:
                 models=models,
             )
 
+    def _catalog_pending(self) -> bool:
+        """Wait (bounded) for a first catalog load still in flight; True if one was."""
+        if self._catalog_ready.is_set():
+            return False
+        self._catalog_ready.wait(CATALOG_WAIT_TIMEOUT)
+        return True
+
     def get_provider(self, provider_id: str) -> Optional[ProviderInfo]:
         """Get provider information by ID."""
-        return self.providers.get(provider_id)
+        provider = self.providers.get(provider_id)
+        if provider is None and self._catalog_pending():
+            provider = self.providers.get(provider_id)
+        return provider
 
     def list_providers(self) -> List[ProviderInfo]:
         """List all available providers."""
@@ -323,11 +441,21 @@ class ModelRegistry:
         Returns:
             Tuple of (provider_id, model_key, ModelInfo) or None
         """
-        for provider_id, provider in self.providers.items():
-            for model_key, model in provider.models.items():
-                if model.id == model_id:
-                    return (provider_id, model_key, model)
-        return None
+        result = self._lookup_model_id(model_id)
+        if result is None and self._catalog_pending():
+            result = self._lookup_model_id(model_id)
+        return result
+
+    def _lookup_model_id(self, model_id: str) -> Optional[tuple[str, str, ModelInfo]]:
+        location = self._model_index.get(model_id)
+        if location is None:
+            return None
+        provider_id, model_key = location
+        provider = self.providers.get(provider_id)
+        model = provider.models.get(model_key) if provider else None
+        if model is None:
+            return None
+        return (provider_id, model_key, model)
 
     def list_all_models(
         self,
@@ -357,6 +485,15 @@ class ModelRegistry:
         return sorted(models, key=lambda x: x[1].pricing_output)
 
 
+def _index_models(providers: Dict[str, ProviderInfo]) -> Dict[str, Tuple[str, str]]:
+    """Map each model id to its first (provider_id, model_key) location."""
+    index: Dict[str, Tuple[str, str]] = {}
+    for provider_id, provider in providers.items():
+        for model_key, model in provider.models.items():
+            index.setdefault(model.id, (provider_id, model_key))
+    return index
+
+
 # Global registry instance
 _registry: Optional[ModelRegistry] = None
 
@@ -1,7 +1,9 @@
 """Supporting components used by agent implementations."""
 
 from .api_configuration import resolve_api_config, create_http_client
+from .compile_cache import CompileCache, CompiledPrompt, CompiledTools, get_compile_cache
 from .http_client import AgentHttpClient, HttpResult
+from .llm_scheduler import LLMScheduler, Priority, get_llm_scheduler, llm_priority
 from .plan_parser import ParsedPlan, parse_plan, extract_plan_from_response
 from .response_processing import ResponseCleaner
 from .system_prompt import PlanningPromptBuilder, SystemPromptBuilder
@@ -9,15 +11,23 @@ from .tool_schema_builder import ToolSchemaBuilder, PlanningToolSchemaBuilder
 
 __all__ = [
     "AgentHttpClient",
+    "CompileCache",
+    "CompiledPrompt",
+    "CompiledTools",
     "HttpResult",
+    "LLMScheduler",
     "ParsedPlan",
     "PlanningPromptBuilder",
     "PlanningToolSchemaBuilder",
+    "Priority",
     "ResponseCleaner",
     "SystemPromptBuilder",
     "ToolSchemaBuilder",
     "create_http_client",
     "extract_plan_from_response",
+    "get_compile_cache",
+    "get_llm_scheduler",
+    "llm_priority",
     "parse_plan",
     "resolve_api_config",
 ]
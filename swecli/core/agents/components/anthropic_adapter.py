@@ -1,7 +1,16 @@
 """Anthropic API adapter for handling Anthropic-specific request/response formats."""
 
 from typing import Any, Dict, List, Optional
-import requests
+
+from swecli.core.agents.components.compile_cache import CompiledTools, encode_request_body
+from swecli.core.agents.components.http_client import (
+    HttpResult,
+    interrupt_check,
+    scheduler_lane,
+    shared_session,
+)
+from swecli.core.agents.components.llm_scheduler import get_llm_scheduler
+from swecli.core.runtime.monitoring.tracing import LLM, get_tracer
 
 
 class AnthropicAdapter:
@@ -15,6 +24,8 @@ class AnthropicAdapter:
             "x-api-key": api_key,
             "anthropic-version": "2023-06-01",
         }
+        # Last converted compiled schema set: (source, converted)
+        self._converted_tools: Optional[tuple[CompiledTools, CompiledTools]] = None
 
     def convert_request(self, openai_payload: Dict[str, Any]) -> Dict[str, Any]:
         """Convert OpenAI-style payload to Anthropic format.
@@ -70,7 +81,20 @@ class AnthropicAdapter:
         return anthropic_payload
 
     def _convert_tools(self, openai_tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Convert OpenAI tool format to Anthropic format."""
+        """Convert OpenAI tool format to Anthropic format.
+
+        Compiled schema sets are converted once and reused while unchanged.
+        """
+        if isinstance(openai_tools, CompiledTools):
+            cached = self._converted_tools
+            if cached is None or cached[0] is not openai_tools:
+                cached = (openai_tools, CompiledTools(self._convert_tool_list(openai_tools)))
+                self._converted_tools = cached
+            return cached[1]
+        return self._convert_tool_list(openai_tools)
+
+    @staticmethod
+    def _convert_tool_list(openai_tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         anthropic_tools = []
         for tool in openai_tools:
             if tool.get("type") == "function":
@@ -175,18 +199,54 @@ class AnthropicAdapter:
         """Make a request to Anthropic API.
 
         Converts the payload and response to match OpenAI format for compatibility.
+        The request goes through the shared LLM scheduler, which waits for
+        rate-limit budget and retries rate limits and transient failures.
         """
+        model = payload.get("model")
+        with get_tracer().span("messages", LLM, model=model) as span:
+            try:
+                # Convert OpenAI-style payload to Anthropic format
+                body = encode_request_body(self.convert_request(payload))
+            except Exception as exc:
+                result = HttpResult(success=False, error=str(exc), exception=exc)
+            else:
+                result = get_llm_scheduler().submit(
+                    scheduler_lane(self.api_url, model),
+                    lambda: self._post(body),
+                    estimated_tokens=len(body) // 4,
+                    cancelled=interrupt_check(task_monitor),
+                )
+            result.span = span
+            if result.attempts > 1:
+                span.set(attempts=result.attempts)
+            if result.response is not None:
+                response = result.response
+                span.set(status=response.status_code, ttfb_ms=round(response.elapsed.total_seconds() * 1000, 3))
+                if response.status_code == 200:
+                    result = self._convert_result(result)
+            if result.error:
+                span.set(error=result.error)
+        return result
+
+    def _post(self, body: bytes) -> HttpResult:
+        try:
+            # Make request with extended timeout for long LLM responses
+            # (connect_timeout=10s, read_timeout=300s)
+            response = shared_session().post(
+                self.api_url,
+                headers=self.headers,
+                data=body,
+                timeout=(10, 300),
+            )
+            # Non-200 responses are returned as-is for error handling
+            return HttpResult(success=True, response=response)
+        except Exception as exc:
+            return HttpResult(success=False, error=str(exc), exception=exc)
+
+    def _convert_result(self, result: HttpResult) -> HttpResult:
         from dataclasses import dataclass
-        from typing import Union
         import json
 
-        @dataclass
-        class HttpResult:
-            success: bool
-            response: Union[requests.Response, None] = None
-            error: Union[str, None] = None
-            interrupted: bool = False
-
         @dataclass
         class MockResponse:
             """Mock response object that mimics requests.Response for compatibility."""
@@ -198,34 +258,16 @@ class AnthropicAdapter:
                 return self._json_data
 
         try:
-            # Convert OpenAI-style payload to Anthropic format
-            anthropic_payload = self.convert_request(payload)
-
-            # Make request with extended timeout for long LLM responses
-            # (connect_timeout=10s, read_timeout=300s)
-            response = requests.post(
-                self.api_url,
-                headers=self.headers,
-                json=anthropic_payload,
-                timeout=(10, 300),
-            )
-
-            if response.status_code != 200:
-                # Return actual response for error handling
-                return HttpResult(success=True, response=response)
-
             # Convert Anthropic response to OpenAI format
-            anthropic_data = response.json()
+            anthropic_data = result.response.json()
             openai_data = self.convert_response(anthropic_data)
-
-            # Create mock response with converted data
-            mock_response = MockResponse(
-                status_code=200,
-                _json_data=openai_data,
-                text=json.dumps(openai_data)
-            )
-
-            return HttpResult(success=True, response=mock_response)
-
         except Exception as exc:
-            return HttpResult(success=False, error=str(exc))
+            return HttpResult(success=False, error=str(exc), span=result.span, attempts=result.attempts, exception=exc)
+
+        # Create mock response with converted data
+        mock_response = MockResponse(
+            status_code=200,
+            _json_data=openai_data,
+            text=json.dumps(openai_data)
+        )
+        return HttpResult(success=True, response=mock_response, span=result.span, attempts=result.attempts)
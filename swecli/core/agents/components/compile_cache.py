@@ -0,0 +1,218 @@
+"""Compilation cache for agent tool schemas and system prompts.
+
+Every agent build used to deep-copy the built-in tool schema table, re-derive
+the subagent and MCP schemas, re-read ``main_system_prompt.txt`` from disk and
+re-render its subagent and MCP sections -- once for the main agent, once per
+registered subagent, and again for planning agents and web queries. The output
+depends only on a handful of inputs, so it is compiled once per configuration
+fingerprint (mode, subagent set, MCP tool list hash, working dir) and then
+served from memory.
+
+Compiled schemas are frozen, so one agent cannot mutate a copy that another
+agent shares, and carry their JSON encoding and a token estimate so a request
+body never re-serializes them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterable, Optional, TypeVar
+
+from swecli.core.agents.prompts import get_prompt_path
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ENTRIES = 64
+
+# Rough estimate used across the codebase: 4 chars per token
+_CHARS_PER_TOKEN = 4
+
+
+class FrozenDict(dict):
+    """Read-only ``dict`` (still a ``dict`` so ``json`` and ``isinstance`` work)."""
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("compiled tool schemas are read-only; use thaw() for a mutable copy")
+
+    __setitem__ = __delitem__ = _readonly  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore[assignment]
+    __ior__ = _readonly  # type: ignore[assignment]
+
+    def __copy__(self) -> dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Any:
+        return thaw(self)
+
+    def __reduce__(self) -> Any:
+        return (FrozenDict, (dict(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to ``FrozenDict`` and lists to tuples."""
+    if isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively convert frozen containers back to plain dicts and lists."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of ``text``."""
+    return len(text) // _CHARS_PER_TOKEN
+
+
+class CompiledTools(tuple):
+    """Frozen tool schemas with their JSON encoding and token estimate.
+
+    Behaves like the list of schemas it replaces (iteration, ``len``,
+    indexing); ``deepcopy`` returns a plain mutable list.
+    """
+
+    json_bytes: bytes
+    token_count: int
+    names: frozenset[str]
+
+    def __new__(cls, schemas: Iterable[dict[str, Any]]) -> "CompiledTools":
+        compiled = super().__new__(cls, (freeze(schema) for schema in schemas))
+        encoded = json.dumps(compiled, separators=(",", ":"), ensure_ascii=False)
+        compiled.json_bytes = encoded.encode("utf-8")
+        compiled.token_count = estimate_tokens(encoded)
+        compiled.names = frozenset(schema.get("function", schema).get("name") for schema in compiled)
+        return compiled
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> list[dict[str, Any]]:
+        return thaw(self)
+
+    def __reduce__(self) -> Any:
+        return (CompiledTools, (thaw(self),))
+
+
+@dataclass(frozen=True)
+class CompiledPrompt:
+    """A rendered system prompt and its token estimate."""
+
+    text: str
+    token_count: int
+
+    @classmethod
+    def from_text(cls, text: str) -> "CompiledPrompt":
+        return cls(text=text, token_count=estimate_tokens(text))
+
+
+class CompileCache:
+    """Thread-safe LRU map from configuration fingerprint to compiled artifact."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Number of fingerprints kept before evicting the oldest
+        """
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compile(self, key: Hashable, compile_fn: Callable[[], T]) -> T:
+        """Return the artifact for ``key``, compiling it on first use."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        # Compile outside the lock; a concurrent duplicate compile is harmless.
+        artifact = compile_fn()
+        with self._lock:
+            self._entries[key] = artifact
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return artifact
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_CACHE = CompileCache()
+
+
+def get_compile_cache() -> CompileCache:
+    """Return the process-wide compile cache."""
+    return _CACHE
+
+
+def fingerprint(mode: str, tool_registry: Any, working_dir: Any = None) -> tuple[Hashable, ...]:
+    """Configuration fingerprint: (mode, subagent set, MCP tool list hash, working dir)."""
+    return (
+        mode,
+        _subagent_signature(tool_registry),
+        _mcp_signature(tool_registry),
+        str(working_dir) if working_dir else None,
+    )
+
+
+def prompt_version(prompt_name: str) -> Optional[tuple[int, int]]:
+    """Modification stamp of a prompt file, so edits on disk recompile."""
+    try:
+        stat = get_prompt_path(prompt_name).stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _subagent_signature(tool_registry: Any) -> Optional[tuple[tuple[str, str], ...]]:
+    manager = getattr(tool_registry, "_subagent_manager", None) if tool_registry else None
+    if not manager:
+        return None
+    descriptions = manager.get_descriptions()
+    return tuple((str(name), str(descriptions.get(name, ""))) for name in manager.get_available_types())
+
+
+def _mcp_signature(tool_registry: Any) -> Optional[str]:
+    mcp_manager = getattr(tool_registry, "mcp_manager", None) if tool_registry else None
+    if not mcp_manager:
+        return None
+    tools = mcp_manager.get_all_tools()
+    encoded = json.dumps(tools, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def encode_request_body(payload: dict[str, Any]) -> bytes:
+    """JSON-encode a chat request, reusing the pre-serialized tool schemas.
+
+    Equivalent to ``json.dumps(payload)``; when ``payload["tools"]`` is a
+    ``CompiledTools`` its cached bytes are spliced in instead of re-encoding
+    the full schema table on every request.
+    """
+    tools = payload.get("tools")
+    if not isinstance(tools, CompiledTools):
+        return json.dumps(payload).encode("utf-8")
+    rest = {key: value for key, value in payload.items() if key != "tools"}
+    head = json.dumps(rest).encode("utf-8")
+    if head == b"{}":
+        return b'{"tools":' + tools.json_bytes + b"}"
+    return head[:-1] + b', "tools": ' + tools.json_bytes + b"}"
@@ -4,9 +4,49 @@ from __future__ import annotations
 
 import threading
 from dataclasses import dataclass
-from typing import Union, Any
+from typing import Callable, Union, Any
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from swecli.core.agents.components.compile_cache import encode_request_body
+from swecli.core.agents.components.llm_scheduler import get_llm_scheduler
+from swecli.core.runtime.monitoring.tracing import LLM, Span, get_tracer
+
+DEFAULT_POOL_SIZE = 10
+
+_pool_lock = threading.Lock()
+_shared_session: Union[requests.Session, None] = None
+_pool_size = DEFAULT_POOL_SIZE
+
+
+def shared_session() -> requests.Session:
+    """Process-wide session, so every agent reuses the same keep-alive connections."""
+    global _shared_session
+    if _shared_session is None:
+        with _pool_lock:
+            if _shared_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=_pool_size, pool_maxsize=_pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _shared_session = session
+    return _shared_session
+
+
+def configure_connection_pool(max_connections: int) -> None:
+    """Size the shared pool for ``max_connections`` concurrent requests per host.
+
+    Call before concurrent use (e.g. when starting batch workers); an existing
+    session is replaced, which only drops its idle connections.
+    """
+    global _shared_session, _pool_size
+    with _pool_lock:
+        _pool_size = max(max_connections, 1)
+        previous, _shared_session = _shared_session, None
+    if previous is not None:
+        previous.close()
 
 
 @dataclass
@@ -17,6 +57,37 @@ class HttpResult:
     response: Union[requests.Response, None] = None
     error: Union[str, None] = None
     interrupted: bool = False
+    span: Union[Span, None] = None
+    # Attempts made, including retries by the LLM scheduler
+    attempts: int = 1
+    exception: Union[BaseException, None] = None
+
+    def record_usage(self, usage: Union[dict[str, Any], None]) -> None:
+        """Attach the response's token counts to the request's trace span."""
+        if self.span is None or not usage:
+            return
+        self.span.set(
+            **{
+                key: int(usage.get(key) or 0)
+                for key in ("prompt_tokens", "completion_tokens", "total_tokens")
+            }
+        )
+
+
+def interrupt_check(task_monitor: Union[Any, None]) -> Union[Callable[[], bool], None]:
+    """Callable reporting whether ``task_monitor`` asked to stop (None without a monitor)."""
+    if task_monitor is None:
+        return None
+    if hasattr(task_monitor, "should_interrupt"):
+        return task_monitor.should_interrupt
+    if hasattr(task_monitor, "is_interrupted"):
+        return task_monitor.is_interrupted
+    return None
+
+
+def scheduler_lane(api_url: str, model: Union[str, None]) -> tuple[str, str]:
+    """LLM scheduler lane for a request: provider host and model."""
+    return urlparse(api_url).netloc or api_url, model or ""
 
 
 class AgentHttpClient:
@@ -29,25 +100,54 @@ class AgentHttpClient:
 
     def __init__(self, api_url: str, headers: dict[str, str]) -> None:
         self._api_url = api_url
-        self._headers = headers
+        self._headers = {"Content-Type": "application/json", **headers}
 
     def post_json(self, payload: dict[str, Any], *, task_monitor: Union[Any, None] = None) -> HttpResult:
-        """Execute a POST request while honoring interrupt signals."""
+        """Execute a POST request while honoring interrupt signals.
+
+        The request goes through the shared LLM scheduler, which waits for
+        rate-limit budget and retries rate limits and transient failures.
+        """
+        # Encode once; compiled tool schemas contribute pre-serialized bytes
+        body = encode_request_body(payload)
+        model = payload.get("model")
+        with get_tracer().span("chat.completions", LLM, model=model, request_bytes=len(body)) as span:
+            result = get_llm_scheduler().submit(
+                scheduler_lane(self._api_url, model),
+                lambda: self._post(body, task_monitor),
+                estimated_tokens=len(body) // 4,
+                cancelled=interrupt_check(task_monitor),
+            )
+            result.span = span
+            response = result.response
+            if result.attempts > 1:
+                span.set(attempts=result.attempts)
+            if response is not None:
+                # Responses are not streamed, so time-to-headers is the closest to time-to-first-token
+                span.set(status=response.status_code, ttfb_ms=round(response.elapsed.total_seconds() * 1000, 3))
+            elif result.error:
+                span.set(error=result.error, interrupted=result.interrupted)
+        return result
+
+    def _post(self, body: bytes, task_monitor: Union[Any, None]) -> HttpResult:
+
         # Fast path when no monitor is provided
         if task_monitor is None:
             try:
-                response = requests.post(
+                response = shared_session().post(
                     self._api_url,
                     headers=self._headers,
-                    json=payload,
+                    data=body,
                     timeout=self.TIMEOUT,
                 )
                 return HttpResult(success=True, response=response)
             except Exception as exc:  # pragma: no cover - propagation handled by caller
-                return HttpResult(success=False, error=str(exc))
+                return HttpResult(success=False, error=str(exc), exception=exc)
 
-        # Interrupt-aware execution path
-        session = requests.Session()
+        # Interrupt-aware execution path. The request keeps using the shared
+        # pool; on interrupt it is abandoned and its connection goes back to
+        # the pool once the server answers, instead of closing a new session.
+        session = shared_session()
         response_container: dict[str, Any] = {"response": None, "error": None}
 
         def make_request() -> None:
@@ -55,7 +155,7 @@ class AgentHttpClient:
                 response_container["response"] = session.post(
                     self._api_url,
                     headers=self._headers,
-                    json=payload,
+                    data=body,
                     timeout=self.TIMEOUT,
                 )
             except Exception as exc:  # pragma: no cover - captured for caller
@@ -64,20 +164,14 @@ class AgentHttpClient:
         request_thread = threading.Thread(target=make_request, daemon=True)
         request_thread.start()
 
+        should_interrupt = interrupt_check(task_monitor)
         while request_thread.is_alive():
-            should_interrupt = False
-            if task_monitor is not None:
-                if hasattr(task_monitor, "should_interrupt"):
-                    should_interrupt = task_monitor.should_interrupt()
-                elif hasattr(task_monitor, "is_interrupted"):
-                    should_interrupt = task_monitor.is_interrupted()
-
-            if should_interrupt:
-                session.close()
+            if should_interrupt is not None and should_interrupt():
                 return HttpResult(success=False, error="Interrupted by user", interrupted=True)
             request_thread.join(timeout=0.1)
 
         if response_container["error"]:
-            return HttpResult(success=False, error=str(response_container["error"]))
+            error = response_container["error"]
+            return HttpResult(success=False, error=str(error), exception=error)
 
         return HttpResult(success=True, response=response_container["response"])
@@ -0,0 +1,471 @@
+"""Process-wide scheduling of LLM requests.
+
+Every chat request goes through ``LLMScheduler.submit``. The scheduler:
+
+- holds requests back while a provider/model lane is out of request or token
+  budget. Budgets are token buckets learned from the provider's rate-limit
+  response headers (OpenAI ``x-ratelimit-*``, Anthropic
+  ``anthropic-ratelimit-*``) or set with ``configure_limits``.
+- admits waiting requests by priority: interactive turns before subagents,
+  and subagents before background learning.
+- retries 429, 5xx and connection failures with jittered exponential backoff.
+  A ``Retry-After`` header pauses the whole lane, not just one request.
+- records how long each request waited for admission, as ``queue`` spans in
+  the tracer and in ``metrics()``.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import heapq
+import itertools
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from typing import Any, Callable, Iterator, Mapping, Optional
+
+import requests
+
+from swecli.core.runtime.monitoring.tracing import QUEUE, get_tracer, percentile
+
+
+class Priority(IntEnum):
+    """Admission order when requests wait for the same lane (lower goes first)."""
+
+    INTERACTIVE = 0
+    SUBAGENT = 1
+    BACKGROUND = 2
+
+
+_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar("swecli_llm_priority", default=Priority.INTERACTIVE)
+
+
+@contextmanager
+def llm_priority(priority: Priority) -> Iterator[None]:
+    """Run LLM requests made inside the block (on this thread) at ``priority``."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to back off between attempts."""
+
+    max_retries: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    retry_statuses: frozenset[int] = frozenset({408, 429, 500, 502, 503, 504, 529})
+
+    def backoff(self, attempt: int, rng: random.Random) -> float:
+        """Full-jitter exponential delay before retry number ``attempt`` (0-based)."""
+        return rng.uniform(0, min(self.max_delay, self.base_delay * (2**attempt)))
+
+
+RETRYABLE_EXCEPTIONS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    ConnectionResetError,
+)
+
+
+class TokenBucket:
+    """Budget of ``capacity`` units refilled continuously at ``rate`` units per second."""
+
+    def __init__(self, capacity: float, rate: float, now: float) -> None:
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = capacity
+        self._updated = now
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` units are available (0 if they are now)."""
+        self._refill(now)
+        # A request larger than the whole bucket only waits for a full bucket
+        needed = min(amount, self.capacity) - self.tokens
+        if needed <= 0:
+            return 0.0
+        return needed / self.rate if self.rate > 0 else float("inf")
+
+    def take(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.tokens -= amount
+
+    def observe(self, limit: float, remaining: float, now: float) -> None:
+        """Adopt the provider's view of the budget (per-minute limits)."""
+        self.capacity = limit
+        self.rate = limit / 60
+        self.tokens = remaining
+        self._updated = now
+
+
+@dataclass
+class RateLimitInfo:
+    """Rate-limit state reported by one response."""
+
+    requests_limit: Optional[int] = None
+    requests_remaining: Optional[int] = None
+    requests_reset: Optional[float] = None
+    tokens_limit: Optional[int] = None
+    tokens_remaining: Optional[int] = None
+    tokens_reset: Optional[float] = None
+    retry_after: Optional[float] = None
+
+
+def _duration(value: str) -> Optional[float]:
+    """Parse ``"1s"``, ``"6m0s"``, ``"250ms"``, ``"2"`` into seconds."""
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    total, number = 0.0, ""
+    index = 0
+    while index < len(value):
+        char = value[index]
+        if char.isdigit() or char == ".":
+            number += char
+        elif value.startswith("ms", index):
+            total += float(number or 0) / 1000
+            number = ""
+            index += 1
+        elif char in "hms":
+            total += float(number or 0) * {"h": 3600, "m": 60, "s": 1}[char]
+            number = ""
+        else:
+            return None
+        index += 1
+    return total
+
+
+def _seconds_until(value: str) -> Optional[float]:
+    """Seconds until an RFC 3339 or HTTP date, or a relative duration."""
+    relative = _duration(value)
+    if relative is not None:
+        return relative
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            moment = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max((moment - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _int(headers: Mapping[str, str], name: str) -> Optional[int]:
+    value = headers.get(name)
+    try:
+        return int(float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def parse_rate_limit_headers(headers: Mapping[str, str]) -> RateLimitInfo:
+    """Read OpenAI- or Anthropic-style rate-limit headers (``headers`` is case-insensitive)."""
+    info = RateLimitInfo()
+    for kind in ("requests", "tokens"):
+        for limit, remaining, reset in (
+            (f"x-ratelimit-limit-{kind}", f"x-ratelimit-remaining-{kind}", f"x-ratelimit-reset-{kind}"),
+            (f"anthropic-ratelimit-{kind}-limit", f"anthropic-ratelimit-{kind}-remaining", f"anthropic-ratelimit-{kind}-reset"),
+        ):
+            if headers.get(limit) is None:
+                continue
+            setattr(info, f"{kind}_limit", _int(headers, limit))
+            setattr(info, f"{kind}_remaining", _int(headers, remaining))
+            reset_value = headers.get(reset)
+            setattr(info, f"{kind}_reset", _seconds_until(reset_value) if reset_value else None)
+            break
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms is not None:
+        try:
+            info.retry_after = float(retry_after_ms) / 1000
+        except ValueError:
+            pass
+    if info.retry_after is None and headers.get("retry-after"):
+        info.retry_after = _seconds_until(headers["retry-after"])
+    return info
+
+
+@dataclass
+class _Lane:
+    """Queue and budgets for one provider/model."""
+
+    requests: Optional[TokenBucket] = None
+    tokens: Optional[TokenBucket] = None
+    blocked_until: float = 0.0
+    waiters: list[tuple[int, int]] = field(default_factory=list)
+
+    def wait_time(self, estimated_tokens: int, now: float) -> float:
+        wait = max(self.blocked_until - now, 0.0)
+        if self.requests is not None:
+            wait = max(wait, self.requests.wait_time(1, now))
+        if self.tokens is not None and estimated_tokens:
+            wait = max(wait, self.tokens.wait_time(estimated_tokens, now))
+        return wait
+
+    def take(self, estimated_tokens: int, now: float) -> None:
+        if self.requests is not None:
+            self.requests.take(1, now)
+        if self.tokens is not None:
+            self.tokens.take(estimated_tokens, now)
+
+    def observe(self, info: RateLimitInfo, now: float) -> None:
+        for name, limit, remaining, reset in (
+            ("requests", info.requests_limit, info.requests_remaining, info.requests_reset),
+            ("tokens", info.tokens_limit, info.tokens_remaining, info.tokens_reset),
+        ):
+            if not limit or remaining is None:
+                continue
+            bucket = getattr(self, name)
+            if bucket is None:
+                bucket = TokenBucket(limit, limit / 60, now)
+                setattr(self, name, bucket)
+            bucket.observe(limit, remaining, now)
+            if remaining <= 0 and reset:
+                self.blocked_until = max(self.blocked_until, now + reset)
+
+
+class LLMScheduler:
+    """Admission control and retries for LLM requests, shared by every agent in the process."""
+
+    # How often a waiting request re-checks cancellation
+    POLL_INTERVAL = 0.1
+
+    def __init__(
+        self,
+        policy: Optional[RetryPolicy] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            policy: Retry behaviour (defaults to ``RetryPolicy()``)
+            clock: Monotonic clock in seconds (tests substitute a fake)
+            seed: Seed for backoff jitter
+        """
+        self.policy = policy or RetryPolicy()
+        self._clock = clock
+        self._rng = random.Random(seed)
+        self._condition = threading.Condition()
+        self._lanes: dict[tuple[str, str], _Lane] = {}
+        self._sequence = itertools.count()
+        self._waits: dict[Priority, deque[float]] = {priority: deque(maxlen=1000) for priority in Priority}
+        self._counters = {"requests": 0, "retries": 0, "rate_limited": 0, "failures": 0}
+
+    def configure_limits(
+        self,
+        key: tuple[str, str],
+        *,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+    ) -> None:
+        """Set budgets for a lane before the provider has reported any."""
+        now = self._clock()
+        with self._condition:
+            lane = self._lanes.setdefault(key, _Lane())
+            if requests_per_minute:
+                lane.requests = TokenBucket(requests_per_minute, requests_per_minute / 60, now)
+            if tokens_per_minute:
+                lane.tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60, now)
+
+    def submit(
+        self,
+        key: tuple[str, str],
+        send: Callable[[], Any],
+        *,
+        estimated_tokens: int = 0,
+        priority: Optional[Priority] = None,
+        cancelled: Optional[Callable[[], bool]] = None,
+    ) -> Any:
+        """Run ``send`` once admitted, retrying transient failures.
+
+        Args:
+            key: ``(provider host, model)`` lane
+            send: Performs one attempt and returns an ``HttpResult``
+            estimated_tokens: Tokens the request is expected to consume
+            priority: Admission priority (defaults to ``current_priority()``)
+            cancelled: Returns True once the caller no longer wants the result
+
+        Returns:
+            The last attempt's ``HttpResult``. ``attempts`` on it counts tries;
+            it is an interrupted result if ``cancelled`` fired while waiting.
+        """
+        from swecli.core.agents.components.http_client import HttpResult
+
+        priority = current_priority() if priority is None else priority
+        attempt = 0
+        while True:
+            if not self._admit(key, priority, estimated_tokens, cancelled):
+                return HttpResult(success=False, error="Interrupted by user", interrupted=True, attempts=attempt)
+
+            result = send()
+            result.attempts = attempt + 1
+            delay = self._retry_delay(key, result, attempt)
+            if delay is None:
+                if not result.success or (result.response is not None and result.response.status_code >= 400):
+                    self._count("failures")
+                return result
+
+            self._count("retries")
+            attempt += 1
+            if not self._sleep(delay, cancelled):
+                return HttpResult(success=False, error="Interrupted by user", interrupted=True, attempts=attempt)
+
+    def metrics(self) -> dict[str, Any]:
+        """Counters and admission wait percentiles per priority."""
+        with self._condition:
+            waits = {priority: sorted(values) for priority, values in self._waits.items()}
+            result: dict[str, Any] = dict(self._counters)
+            result["lanes"] = {
+                f"{host}/{model}": {
+                    "waiting": len(lane.waiters),
+                    "requests_per_minute": lane.requests.capacity if lane.requests else None,
+                    "tokens_per_minute": lane.tokens.capacity if lane.tokens else None,
+                }
+                for (host, model), lane in self._lanes.items()
+            }
+        result["wait_ms"] = {
+            priority.name.lower(): {
+                "count": len(values),
+                "p50": round(percentile(values, 0.50) * 1000, 3),
+                "p95": round(percentile(values, 0.95) * 1000, 3),
+                "max": round(values[-1] * 1000, 3) if values else 0.0,
+            }
+            for priority, values in waits.items()
+        }
+        return result
+
+    # --- Internals -----------------------------------------------------------
+
+    def _count(self, name: str) -> None:
+        with self._condition:
+            self._counters[name] += 1
+
+    def _admit(
+        self,
+        key: tuple[str, str],
+        priority: Priority,
+        estimated_tokens: int,
+        cancelled: Optional[Callable[[], bool]],
+    ) -> bool:
+        start_ns = time.perf_counter_ns()
+        start = self._clock()
+        ticket = (int(priority), next(self._sequence))
+        with self._condition:
+            lane = self._lanes.setdefault(key, _Lane())
+            heapq.heappush(lane.waiters, ticket)
+            try:
+                while True:
+                    if cancelled is not None and cancelled():
+                        return False
+                    now = self._clock()
+                    timeout = self.POLL_INTERVAL
+                    if lane.waiters[0] == ticket:
+                        wait = lane.wait_time(estimated_tokens, now)
+                        if wait <= 0:
+                            lane.take(estimated_tokens, now)
+                            self._counters["requests"] += 1
+                            self._waits[priority].append(now - start)
+                            break
+                        timeout = min(wait, timeout)
+                    self._condition.wait(timeout)
+            finally:
+                lane.waiters.remove(ticket)
+                heapq.heapify(lane.waiters)
+                self._condition.notify_all()
+        get_tracer().record(
+            "llm_admission", QUEUE, start_ns, time.perf_counter_ns(), lane=f"{key[0]}/{key[1]}", priority=priority.name.lower()
+        )
+        return True
+
+    def _retry_delay(self, key: tuple[str, str], result: Any, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying ``result``, or None if it is final."""
+        response = result.response
+        info = parse_rate_limit_headers(response.headers) if response is not None and hasattr(response, "headers") else None
+        now = self._clock()
+        if info is not None:
+            with self._condition:
+                self._lanes.setdefault(key, _Lane()).observe(info, now)
+
+        if result.interrupted or attempt >= self.policy.max_retries:
+            return None
+        if response is None:
+            if not isinstance(getattr(result, "exception", None), RETRYABLE_EXCEPTIONS):
+                return None
+            return self.policy.backoff(attempt, self._rng)
+        if response.status_code not in self.policy.retry_statuses:
+            return None
+
+        delay = self.policy.backoff(attempt, self._rng)
+        if info is not None and info.retry_after is not None:
+            delay = max(delay, info.retry_after)
+        if response.status_code == 429:
+            self._count("rate_limited")
+            # The whole lane is over budget, not just this request
+            with self._condition:
+                lane = self._lanes[key]
+                lane.blocked_until = max(lane.blocked_until, now + delay)
+                self._condition.notify_all()
+        return delay
+
+    def _sleep(self, delay: float, cancelled: Optional[Callable[[], bool]]) -> bool:
+        """Wait ``delay`` seconds; False if cancelled meanwhile."""
+        deadline = time.monotonic() + delay
+        while True:
+            if cancelled is not None and cancelled():
+                return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            time.sleep(min(remaining, self.POLL_INTERVAL))
+
+
+_scheduler_lock = threading.Lock()
+_scheduler: Optional[LLMScheduler] = None
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """Process-wide scheduler shared by all agents, subagents and web sessions."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = LLMScheduler()
+    return _scheduler
+
+
+__all__ = [
+    "LLMScheduler",
+    "Priority",
+    "RateLimitInfo",
+    "RetryPolicy",
+    "TokenBucket",
+    "current_priority",
+    "get_llm_scheduler",
+    "llm_priority",
+    "parse_rate_limit_headers",
+]
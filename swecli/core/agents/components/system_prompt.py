@@ -4,6 +4,12 @@ from __future__ import annotations
 
 from typing import Any, Sequence, Union
 
+from swecli.core.agents.components.compile_cache import (
+    CompiledPrompt,
+    fingerprint,
+    get_compile_cache,
+    prompt_version,
+)
 from swecli.core.agents.prompts import load_prompt
 
 
@@ -16,6 +22,17 @@ class SystemPromptBuilder:
 
     def build(self) -> str:
         """Return the formatted system prompt string."""
+        return self.compile().text
+
+    def compile(self) -> CompiledPrompt:
+        """Return the cached prompt for the current configuration fingerprint."""
+        key = (
+            *fingerprint("normal-prompt", self._tool_registry, self._working_dir),
+            prompt_version("main_system_prompt"),
+        )
+        return get_compile_cache().get_or_compile(key, lambda: CompiledPrompt.from_text(self._render()))
+
+    def _render(self) -> str:
         # Load base prompt from file
         prompt = load_prompt("main_system_prompt")
 
@@ -86,6 +103,17 @@ class PlanningPromptBuilder:
 
     def build(self) -> str:
         """Return the planning prompt with working directory context."""
+        return self.compile().text
+
+    def compile(self) -> CompiledPrompt:
+        """Return the cached prompt for the current working directory."""
+        key = (
+            *fingerprint("plan-prompt", None, self._working_dir),
+            prompt_version("planner_system_prompt"),
+        )
+        return get_compile_cache().get_or_compile(key, lambda: CompiledPrompt.from_text(self._render()))
+
+    def _render(self) -> str:
         prompt = load_prompt("planner_system_prompt")
 
         # Add working directory context
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import Any, Sequence, Union
 
+from swecli.core.agents.components.compile_cache import (
+    CompiledTools,
+    fingerprint,
+    get_compile_cache,
+)
+
 
 # Read-only tools allowed in PLAN mode for codebase exploration
 PLANNING_TOOLS = {
@@ -21,6 +26,7 @@ PLANNING_TOOLS = {
     "find_referencing_symbols",
     # Subagent spawning (subagents handle their own restrictions)
     "spawn_subagent",
+    "spawn_subagents",
 }
 
 
@@ -30,32 +36,44 @@ class ToolSchemaBuilder:
     def __init__(self, tool_registry: Union[Any, None]) -> None:
         self._tool_registry = tool_registry
 
-    def build(self) -> list[dict[str, Any]]:
-        """Return tool schema definitions including MCP and task tool extensions."""
-        schemas: list[dict[str, Any]] = deepcopy(_BUILTIN_TOOL_SCHEMAS)
+    def build(self) -> CompiledTools:
+        """Return tool schema definitions including MCP and task tool extensions.
+
+        The result is compiled once per configuration fingerprint and shared;
+        it is read-only (``deepcopy`` it for a mutable list).
+        """
+        key = fingerprint("normal-tools", self._tool_registry)
+        return get_compile_cache().get_or_compile(key, self._compile)
+
+    def _compile(self) -> CompiledTools:
+        schemas: list[dict[str, Any]] = list(_BUILTIN_TOOL_SCHEMAS)
 
-        # Add task tool schema if subagent manager is configured
-        task_schema = self._build_task_schema()
-        if task_schema:
-            schemas.append(task_schema)
+        # Add task tool schemas if subagent manager is configured
+        schemas.extend(self._build_task_schemas())
 
         # Add MCP tool schemas
         mcp_schemas = self._build_mcp_schemas()
         if mcp_schemas:
             schemas.extend(mcp_schemas)
-        return schemas
+        return CompiledTools(schemas)
 
-    def _build_task_schema(self) -> dict[str, Any] | None:
-        """Build task tool schema with available subagent types."""
+    def _build_task_schemas(self) -> list[dict[str, Any]]:
+        """Build single and parallel task tool schemas with available subagent types."""
         if not self._tool_registry:
-            return None
+            return []
 
         subagent_manager = getattr(self._tool_registry, "_subagent_manager", None)
         if not subagent_manager:
-            return None
+            return []
 
-        from swecli.core.agents.subagents.task_tool import create_task_tool_schema
-        return create_task_tool_schema(subagent_manager)
+        from swecli.core.agents.subagents.task_tool import (
+            create_batch_task_tool_schema,
+            create_task_tool_schema,
+        )
+        return [
+            create_task_tool_schema(subagent_manager),
+            create_batch_task_tool_schema(subagent_manager),
+        ]
 
     def _build_mcp_schemas(self) -> Sequence[dict[str, Any]]:
         if not self._tool_registry or not getattr(self._tool_registry, "mcp_manager", None):
@@ -86,13 +104,17 @@ class PlanningToolSchemaBuilder:
     def __init__(self, tool_registry: Union[Any, None] = None) -> None:
         self._tool_registry = tool_registry
 
-    def build(self) -> list[dict[str, Any]]:
+    def build(self) -> CompiledTools:
         """Return only read-only tool schemas for planning mode."""
-        return [
-            deepcopy(schema)
+        return get_compile_cache().get_or_compile(("plan-tools",), self._compile)
+
+    @staticmethod
+    def _compile() -> CompiledTools:
+        return CompiledTools(
+            schema
             for schema in _BUILTIN_TOOL_SCHEMAS
             if schema["function"]["name"] in PLANNING_TOOLS
-        ]
+        )
 
 
 _BUILTIN_TOOL_SCHEMAS: list[dict[str, Any]] = [
@@ -156,14 +178,30 @@ _BUILTIN_TOOL_SCHEMAS: list[dict[str, Any]] = [
         "type": "function",
         "function": {
             "name": "read_file",
-            "description": "Read the contents of a file. Use this when you need to see what's in a file before editing it or to answer questions about file contents.",
+            "description": "Read the contents of a file. Use this when you need to see what's in a file before editing it or to answer questions about file contents. Output is capped at about 100 KB; large files come back with the middle elided and a footer naming the offset (or byte_offset) to pass for the next page.",
             "parameters": {
                 "type": "object",
                 "properties": {
                     "file_path": {
                         "type": "string",
                         "description": "The path to the file to read",
-                    }
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "description": "1-indexed line to start reading from (default: 1)",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of lines to return (default: as many as fit in the output budget)",
+                    },
+                    "byte_offset": {
+                        "type": "integer",
+                        "description": "Read raw bytes starting at this offset instead of whole lines. Use for minified files with very long lines.",
+                    },
+                    "max_bytes": {
+                        "type": "integer",
+                        "description": "Output budget in bytes (default: 100000)",
+                    },
                 },
                 "required": ["file_path"],
             },
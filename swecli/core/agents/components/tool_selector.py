@@ -0,0 +1,341 @@
+"""Per-request tool schema selection.
+
+Sending every tool schema on every ReAct step costs thousands of input tokens
+once a few MCP servers are connected. ``ToolSelector`` sends a compact core
+toolset plus:
+
+- deferred tools whose name/description matches a user query of the
+  conversation (offline hashed n-gram embeddings, see ``local_embedder``),
+- tools already called earlier in the conversation, and
+- tools or groups the model asked for through the ``load_tools`` meta-tool.
+
+Everything is derived from the message list, so the selection needs no
+per-conversation state and forks/subagents can share one selector. Because
+messages are only ever appended, a conversation's tool set only grows: a new
+query can add schemas but never removes one, so the cached prompt prefix is
+invalidated only when a tool is actually added.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Iterable, Mapping, Optional, Sequence
+
+import numpy as np
+
+from swecli.core.agents.components.compile_cache import CompiledTools
+
+LOAD_TOOLS_NAME = "load_tools"
+
+# Always sent: file editing, shell, todos and subagents
+CORE_TOOLS = frozenset(
+    {
+        "write_file",
+        "edit_file",
+        "read_file",
+        "list_files",
+        "search",
+        "run_command",
+        "list_processes",
+        "get_process_output",
+        "kill_process",
+        "write_todos",
+        "update_todo",
+        "complete_todo",
+        "list_todos",
+        "spawn_subagent",
+        "spawn_subagents",
+    }
+)
+
+# Built-in deferred tools, loadable as a group through load_tools
+TOOL_GROUPS: dict[str, tuple[str, ...]] = {
+    "web": ("fetch_url",),
+    "browser": (
+        "open_browser",
+        "capture_screenshot",
+        "list_screenshots",
+        "clear_screenshots",
+        "analyze_image",
+        "capture_web_screenshot",
+        "list_web_screenshots",
+        "clear_web_screenshots",
+    ),
+    "symbols": (
+        "find_symbol",
+        "find_referencing_symbols",
+        "insert_before_symbol",
+        "insert_after_symbol",
+        "replace_symbol_body",
+        "rename_symbol",
+    ),
+}
+
+DEFAULT_MAX_RELEVANT = 6
+DEFAULT_MIN_SCORE = 0.15
+
+_URL = re.compile(r"https?://")
+_MAX_SELECTIONS = 32
+_MAX_MEMOIZED_QUERIES = 256
+_SELECTORS: "OrderedDict[bytes, ToolSelector]" = OrderedDict()
+_SELECTORS_LOCK = threading.Lock()
+
+
+def tool_group(name: str) -> str:
+    """Group a deferred tool belongs to (``mcp__<server>`` for MCP tools)."""
+    if name.startswith("mcp__"):
+        server = name[len("mcp__"):].split("__", 1)[0]
+        return f"mcp__{server}"
+    for group, members in TOOL_GROUPS.items():
+        if name in members:
+            return group
+    return "other"
+
+
+class ToolSelector:
+    """Choose the tool schemas sent with each request."""
+
+    def __init__(
+        self,
+        tools: CompiledTools,
+        *,
+        core: Iterable[str] = CORE_TOOLS,
+        max_relevant: int = DEFAULT_MAX_RELEVANT,
+        min_score: float = DEFAULT_MIN_SCORE,
+    ) -> None:
+        """Initialize the selector.
+
+        Args:
+            tools: Full compiled tool set of the agent
+            core: Tool names that are always sent
+            max_relevant: Maximum deferred tools added for query relevance
+            min_score: Minimum cosine similarity for a query match
+        """
+        from swecli.core.context_engineering.memory.local_embedder import get_local_embedder
+
+        self.tools = tools
+        self.max_relevant = max_relevant
+        self.min_score = min_score
+        core = frozenset(core)
+        self._order = [schema["function"]["name"] for schema in tools]
+        self._schemas = {schema["function"]["name"]: schema for schema in tools}
+        self._core = frozenset(name for name in self._order if name in core)
+        self._deferred = [name for name in self._order if name not in core]
+        self._groups: dict[str, list[str]] = {}
+        for name in self._deferred:
+            self._groups.setdefault(tool_group(name), []).append(name)
+
+        self._embedder = get_local_embedder()
+        self._vectors = self._embedder.embed_batch(
+            [self._describe(self._schemas[name]) for name in self._deferred]
+        )
+        self._selections: OrderedDict[frozenset[str], CompiledTools] = OrderedDict()
+        self._relevant_memo: OrderedDict[str, tuple[str, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.full_tokens = 0
+        self.sent_tokens = 0
+
+    @classmethod
+    def for_tools(cls, tools: CompiledTools) -> "ToolSelector":
+        """Return the shared selector for ``tools`` (keyed by content)."""
+        key = hashlib.blake2b(tools.json_bytes, digest_size=16).digest()
+        with _SELECTORS_LOCK:
+            selector = _SELECTORS.get(key)
+            if selector is not None:
+                _SELECTORS.move_to_end(key)
+                return selector
+        selector = cls(tools)
+        with _SELECTORS_LOCK:
+            _SELECTORS[key] = selector
+            while len(_SELECTORS) > 8:
+                _SELECTORS.popitem(last=False)
+        return selector
+
+    def select(self, messages: Sequence[Mapping[str, Any]]) -> CompiledTools:
+        """Return the tool schemas to send with a request for ``messages``."""
+        if not self._deferred:
+            return self.tools
+
+        active = set(self._core)
+        for query in _user_texts(messages):
+            active.update(self._memoized_relevant_tools(query))
+        used, requested = _history_tools(messages)
+        active.update(name for name in used if name in self._schemas)
+        for item in requested:
+            active.update(self.expand(item))
+
+        selected = self._compile(frozenset(active))
+        with self._lock:
+            self.requests += 1
+            self.full_tokens += self.tools.token_count
+            self.sent_tokens += selected.token_count
+        return selected
+
+    def relevant_tools(self, query: str) -> list[str]:
+        """Deferred tools whose name/description matches ``query``."""
+        if not query.strip():
+            return []
+        relevant: list[str] = []
+        if _URL.search(query):
+            relevant.extend(name for name in TOOL_GROUPS["web"] if name in self._schemas)
+        scores = self._vectors @ self._embedder.embed(query)
+        for index in np.argsort(-scores)[: self.max_relevant]:
+            if scores[index] < self.min_score:
+                break
+            relevant.append(self._deferred[index])
+        return relevant
+
+    def expand(self, item: str) -> list[str]:
+        """Tool names for a ``load_tools`` entry (a group or a tool name)."""
+        if item in self._groups:
+            return list(self._groups[item])
+        if item in self._schemas:
+            return [item]
+        return []
+
+    def savings(self) -> dict[str, Any]:
+        """Token estimates of full versus pruned tool payloads so far."""
+        with self._lock:
+            saved = self.full_tokens - self.sent_tokens
+            return {
+                "requests": self.requests,
+                "full_tokens": self.full_tokens,
+                "sent_tokens": self.sent_tokens,
+                "saved_tokens": saved,
+                "saved_ratio": saved / self.full_tokens if self.full_tokens else 0.0,
+            }
+
+    def _memoized_relevant_tools(self, query: str) -> tuple[str, ...]:
+        with self._lock:
+            cached = self._relevant_memo.get(query)
+            if cached is not None:
+                self._relevant_memo.move_to_end(query)
+                return cached
+        relevant = tuple(self.relevant_tools(query))
+        with self._lock:
+            self._relevant_memo[query] = relevant
+            while len(self._relevant_memo) > _MAX_MEMOIZED_QUERIES:
+                self._relevant_memo.popitem(last=False)
+        return relevant
+
+    def _compile(self, active: frozenset[str]) -> CompiledTools:
+        with self._lock:
+            cached = self._selections.get(active)
+            if cached is not None:
+                self._selections.move_to_end(active)
+                return cached
+
+        schemas = [self._schemas[name] for name in self._order if name in active]
+        remaining = [name for name in self._deferred if name not in active]
+        if remaining:
+            schemas.append(self._load_tools_schema(remaining))
+        compiled = CompiledTools(schemas)
+
+        with self._lock:
+            self._selections[active] = compiled
+            while len(self._selections) > _MAX_SELECTIONS:
+                self._selections.popitem(last=False)
+        return compiled
+
+    def _load_tools_schema(self, remaining: list[str]) -> dict[str, Any]:
+        by_group: dict[str, list[str]] = {}
+        for name in remaining:
+            by_group.setdefault(tool_group(name), []).append(name)
+        listing = "\n".join(f"- {group}: {', '.join(names)}" for group, names in by_group.items())
+        return {
+            "type": "function",
+            "function": {
+                "name": LOAD_TOOLS_NAME,
+                "description": (
+                    "Load tools that are not in your current tool list. Loaded tools are "
+                    "available from your next step on. Deferred tools by group:\n" + listing
+                ),
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "names": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Group names and/or tool names to load",
+                        },
+                    },
+                    "required": ["names"],
+                },
+            },
+        }
+
+    @staticmethod
+    def _describe(schema: Mapping[str, Any]) -> str:
+        function = schema["function"]
+        name = function["name"].rsplit("__", 1)[-1].replace("_", " ")
+        return f"{name} {name} {function.get('description') or ''}"
+
+
+def _user_texts(messages: Sequence[Mapping[str, Any]]) -> list[str]:
+    """Text of every user message, oldest first."""
+    texts: list[str] = []
+    for message in messages:
+        if message.get("role") != "user":
+            continue
+        content = message.get("content")
+        if isinstance(content, str):
+            texts.append(content)
+        elif isinstance(content, list):
+            texts.append(" ".join(part.get("text", "") for part in content if isinstance(part, dict)))
+    return texts
+
+
+def _history_tools(messages: Sequence[Mapping[str, Any]]) -> tuple[set[str], list[str]]:
+    """Tool names called so far, and entries requested through load_tools."""
+    used: set[str] = set()
+    requested: list[str] = []
+    for message in messages:
+        if message.get("role") != "assistant":
+            continue
+        for call in message.get("tool_calls") or []:
+            function = call.get("function") or {}
+            name = function.get("name")
+            if name != LOAD_TOOLS_NAME:
+                used.add(name)
+                continue
+            requested.extend(parse_load_tools_arguments(function.get("arguments")))
+    return used, requested
+
+
+def parse_load_tools_arguments(arguments: Any) -> list[str]:
+    """Names passed to ``load_tools`` (raw JSON string or parsed dict)."""
+    if isinstance(arguments, str):
+        try:
+            arguments = json.loads(arguments)
+        except json.JSONDecodeError:
+            return []
+    if not isinstance(arguments, dict):
+        return []
+    names = arguments.get("names") or []
+    if isinstance(names, str):
+        names = [names]
+    return [str(name) for name in names]
+
+
+def select_request_tools(
+    tools: CompiledTools,
+    messages: Sequence[Mapping[str, Any]],
+    config: Any = None,
+) -> CompiledTools:
+    """Tools to send for ``messages``: pruned when ``config.tool_schema_pruning`` is on."""
+    if getattr(config, "tool_schema_pruning", False) is not True or not isinstance(tools, CompiledTools):
+        return tools
+    return ToolSelector.for_tools(tools).select(messages)
+
+
+def get_tool_selector(tools: Any) -> Optional[ToolSelector]:
+    """Shared selector for ``tools``, or None if they are not compiled."""
+    if not isinstance(tools, CompiledTools):
+        return None
+    return ToolSelector.for_tools(tools)
@@ -74,6 +74,7 @@ class PlanningAgent(BaseAgent):
             }
 
         response_data = response.json()
+        result.record_usage(response_data.get("usage"))
         choice = response_data["choices"][0]
         message_data = choice["message"]
 
@@ -142,6 +143,7 @@ class PlanningAgent(BaseAgent):
                 }
 
             response_data = response.json()
+            result.record_usage(response_data.get("usage"))
             choice = response_data["choices"][0]
             message_data = choice["message"]
 
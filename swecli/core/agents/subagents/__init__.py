@@ -2,7 +2,12 @@
 
 from .specs import SubAgentSpec, CompiledSubAgent
 from .manager import SubAgentManager
-from .task_tool import create_task_tool_schema, TASK_TOOL_NAME
+from .task_tool import (
+    BATCH_TASK_TOOL_NAME,
+    TASK_TOOL_NAME,
+    create_batch_task_tool_schema,
+    create_task_tool_schema,
+)
 from .agents import ALL_SUBAGENTS
 
 __all__ = [
@@ -10,6 +15,8 @@ __all__ = [
     "CompiledSubAgent",
     "SubAgentManager",
     "create_task_tool_schema",
+    "create_batch_task_tool_schema",
     "TASK_TOOL_NAME",
+    "BATCH_TASK_TOOL_NAME",
     "ALL_SUBAGENTS",
 ]
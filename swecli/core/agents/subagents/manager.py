@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
+from swecli.core.agents.components.llm_scheduler import Priority, llm_priority
 from swecli.models.config import AppConfig
 
 from .specs import CompiledSubAgent, SubAgentSpec
@@ -175,9 +179,6 @@ class SubAgentManager:
                 "content": "",
             }
 
-        compiled = self._agents[name]
-        agent = compiled["agent"]
-
         # Create nested callback wrapper if parent callback provided
         nested_callback = None
         if ui_callback is not None:
@@ -188,18 +189,112 @@ class SubAgentManager:
                 depth=1,
             )
 
+        return self._run_subagent(self._agents[name]["agent"], task, deps, nested_callback)
+
+    def _run_subagent(
+        self,
+        agent: Any,
+        task: str,
+        deps: SubAgentDeps,
+        nested_callback: Any,
+    ) -> dict[str, Any]:
+        """Run one task on ``agent`` with an isolated message history.
+
+        Its LLM requests queue behind the interactive agent's when rate limited.
+        """
+
         # Execute with isolated context (fresh message history)
         # max_iterations=None allows unlimited iterations - subagent runs until natural completion
-        result = agent.run_sync(
-            message=task,
-            deps=deps,
-            message_history=None,  # Fresh context for subagent
-            ui_callback=nested_callback,
-            max_iterations=None,  # Unlimited - run until natural completion
-        )
+        with llm_priority(Priority.SUBAGENT):
+            result = agent.run_sync(
+                message=task,
+                deps=deps,
+                message_history=None,  # Fresh context for subagent
+                ui_callback=nested_callback,
+                max_iterations=None,  # Unlimited - run until natural completion
+            )
 
         return result
 
+    @staticmethod
+    def _fresh_agent(compiled: CompiledSubAgent) -> Any:
+        """Per-run agent instance so concurrent runs never share mutable state."""
+        agent = compiled["agent"]
+        fork = getattr(agent, "fork", None)
+        return fork() if callable(fork) else agent
+
+    def execute_batch(
+        self,
+        tasks: list[tuple[str, str]],
+        deps: SubAgentDeps,
+        ui_callback: Any = None,
+        max_concurrency: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Execute independent subagent tasks concurrently.
+
+        Each task runs on its own agent instance in a thread pool of at most
+        ``max_concurrency`` workers (default ``config.max_parallel_subagents``).
+        Nested tool output is buffered per task and replayed as one block when
+        the task finishes.
+
+        Args:
+            tasks: List of (subagent_name, task_description) tuples
+            deps: Dependencies for tool execution
+            ui_callback: Optional UI callback for displaying tool calls
+            max_concurrency: Maximum subagents running at once
+
+        Returns:
+            One result dict per task, in the order of ``tasks``
+        """
+        results: list[dict[str, Any] | None] = [None] * len(tasks)
+        runnable: list[int] = []
+        for index, (name, _task) in enumerate(tasks):
+            if name in self._agents:
+                runnable.append(index)
+            else:
+                available = ", ".join(self._agents.keys())
+                results[index] = {
+                    "success": False,
+                    "error": f"Unknown subagent type '{name}'. Available: {available}",
+                    "content": "",
+                }
+
+        limit = max_concurrency or getattr(self._config, "max_parallel_subagents", 4)
+        limit = max(1, min(limit, len(runnable) or 1))
+        batch_deps = SubAgentDeps(
+            mode_manager=deps.mode_manager,
+            approval_manager=_SerializedApprovals.wrap(deps.approval_manager),
+            undo_manager=deps.undo_manager,
+        )
+        replay_lock = threading.Lock()
+
+        def run(index: int) -> dict[str, Any]:
+            name, task = tasks[index]
+            callback = None
+            if ui_callback is not None:
+                from swecli.ui_textual.nested_callback import GroupedNestedUICallback
+                callback = GroupedNestedUICallback(
+                    parent_callback=ui_callback,
+                    parent_context=f"{name} #{index + 1}",
+                    depth=1,
+                    replay_lock=replay_lock,
+                )
+            try:
+                agent = self._fresh_agent(self._agents[name])
+                return self._run_subagent(agent, task, batch_deps, callback)
+            except Exception as exc:  # noqa: BLE001 - one failed task must not sink the batch
+                return {"success": False, "error": str(exc), "content": ""}
+            finally:
+                if callback is not None:
+                    callback.flush()
+
+        with ThreadPoolExecutor(max_workers=limit, thread_name_prefix="swecli-subagent") as pool:
+            futures = {pool.submit(run, index): index for index in runnable}
+            for future in futures:
+                results[futures[future]] = future.result()
+
+        return [result for result in results if result is not None]
+
     async def execute_subagent_async(
         self,
         name: str,
@@ -240,8 +335,40 @@ class SubAgentManager:
         Returns:
             List of results from each subagent
         """
-        coroutines = [
-            self.execute_subagent_async(name, task, deps, ui_callback)
-            for name, task in tasks
-        ]
-        return await asyncio.gather(*coroutines)
+        return await asyncio.to_thread(self.execute_batch, tasks, deps, ui_callback)
+
+
+class _SerializedApprovals:
+    """Approval manager proxy that lets one parallel subagent prompt at a time."""
+
+    def __init__(self, inner: Any) -> None:
+        self._inner = inner
+        self._lock = threading.Lock()
+
+    @classmethod
+    def wrap(cls, inner: Any) -> Any:
+        if inner is None or not hasattr(inner, "request_approval"):
+            return inner
+        return cls(inner)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+
+    def request_approval(self, *args: Any, **kwargs: Any) -> Any:
+        self._lock.acquire()
+        try:
+            result = self._inner.request_approval(*args, **kwargs)
+        except BaseException:
+            self._lock.release()
+            raise
+        if not inspect.isawaitable(result):
+            self._lock.release()
+            return result
+
+        async def finish() -> Any:
+            try:
+                return await result
+            finally:
+                self._lock.release()
+
+        return finish()
@@ -8,6 +8,7 @@ if TYPE_CHECKING:
     from .manager import SubAgentManager
 
 TASK_TOOL_NAME = "spawn_subagent"
+BATCH_TASK_TOOL_NAME = "spawn_subagents"
 
 TASK_TOOL_DESCRIPTION = """Spawn an ephemeral subagent to handle complex, multi-step tasks with isolated context.
 
@@ -29,7 +30,27 @@ TASK_TOOL_DESCRIPTION = """Spawn an ephemeral subagent to handle complex, multi-
 1. Each subagent runs with fresh context - provide all necessary information in the description
 2. The subagent returns a single result - you won't see intermediate steps
 3. Use specific, detailed task descriptions for best results
-4. Multiple spawn_subagent calls can run in parallel for independent work"""
+4. For several independent tasks, use spawn_subagents to run them in parallel"""
+
+BATCH_TASK_TOOL_DESCRIPTION = """Run several independent subagent tasks in parallel and return all results.
+
+Use this instead of repeated spawn_subagent calls when the tasks do not depend on
+each other (e.g. "explore these 6 modules"): they run concurrently, so the batch
+takes about as long as the slowest task. Each subagent gets a fresh, isolated
+context; results come back in the order the tasks were given.
+
+Do not batch tasks that edit the same files or depend on each other's output.
+
+## Available Subagent Types
+{subagent_descriptions}"""
+
+
+def _subagent_descriptions(manager: "SubAgentManager") -> str:
+    descriptions = manager.get_descriptions()
+    return "\n".join(
+        f"- **{name}**: {descriptions.get(name, 'No description')}"
+        for name in manager.get_available_types()
+    )
 
 
 def create_task_tool_schema(manager: "SubAgentManager") -> dict[str, Any]:
@@ -82,6 +103,60 @@ def create_task_tool_schema(manager: "SubAgentManager") -> dict[str, Any]:
     }
 
 
+def create_batch_task_tool_schema(manager: "SubAgentManager") -> dict[str, Any]:
+    """Create the schema for the parallel ``spawn_subagents`` tool.
+
+    Args:
+        manager: The SubAgentManager with registered subagents
+
+    Returns:
+        OpenAI-compatible tool schema dict
+    """
+    return {
+        "type": "function",
+        "function": {
+            "name": BATCH_TASK_TOOL_NAME,
+            "description": BATCH_TASK_TOOL_DESCRIPTION.format(
+                subagent_descriptions=_subagent_descriptions(manager)
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "tasks": {
+                        "type": "array",
+                        "description": "Independent tasks to run concurrently",
+                        "minItems": 1,
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "description": {
+                                    "type": "string",
+                                    "description": (
+                                        "Detailed task description, including all context "
+                                        "the subagent needs"
+                                    ),
+                                },
+                                "subagent_type": {
+                                    "type": "string",
+                                    "description": "Type of subagent to use for this task",
+                                    "enum": manager.get_available_types(),
+                                },
+                            },
+                            "required": ["description", "subagent_type"],
+                        },
+                    },
+                    "max_concurrency": {
+                        "type": "integer",
+                        "description": "Maximum subagents running at once (defaults to the configured limit)",
+                        "minimum": 1,
+                    },
+                },
+                "required": ["tasks"],
+            },
+        },
+    }
+
+
 def format_task_result(result: dict[str, Any], subagent_type: str) -> str:
     """Format the task result for display.
 
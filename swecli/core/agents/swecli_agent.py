@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from contextlib import nullcontext
 from typing import Any, Optional
 
 from swecli.core.base.abstract import BaseAgent
@@ -12,9 +13,18 @@ from swecli.core.agents.components import (
     ToolSchemaBuilder,
     create_http_client,
 )
+from swecli.core.agents.components.tool_selector import select_request_tools
 from swecli.models.config import AppConfig
 
 
+def _accumulate_usage(totals: dict[str, int], usage: Optional[dict]) -> None:
+    """Add one response's token usage to the running totals."""
+    if not usage:
+        return
+    for key in totals:
+        totals[key] += int(usage.get(key) or 0)
+
+
 class WebInterruptMonitor:
     """Monitor for checking web interrupt requests."""
 
@@ -41,6 +51,27 @@ class SwecliAgent(BaseAgent):
         self._working_dir = working_dir
         super().__init__(config, tool_registry, mode_manager)
 
+    def fork(self) -> "SwecliAgent":
+        """Return a fresh instance for one independent run.
+
+        The fork shares the stateless HTTP client, the prompt and the tool
+        schemas with this agent, but none of its per-run attributes, so forks
+        can run concurrently without rebuilding prompts or schemas.
+        """
+        clone = object.__new__(type(self))
+        clone.config = self.config
+        clone.tool_registry = self.tool_registry
+        clone.mode_manager = self.mode_manager
+        clone.system_prompt = self.system_prompt
+        clone.tool_schemas = self.tool_schemas
+        clone._http_client = self._http_client
+        clone._response_cleaner = self._response_cleaner
+        clone._working_dir = self._working_dir
+        for name in ("_subagent_system_prompt", "web_state"):
+            if hasattr(self, name):
+                setattr(clone, name, getattr(self, name))
+        return clone
+
     def build_system_prompt(self) -> str:
         return SystemPromptBuilder(self.tool_registry, self._working_dir).build()
 
@@ -51,7 +82,7 @@ class SwecliAgent(BaseAgent):
         payload = {
             "model": self.config.model,
             "messages": messages,
-            "tools": self.tool_schemas,
+            "tools": select_request_tools(self.tool_schemas, messages, self.config),
             "tool_choice": "auto",
             "temperature": self.config.temperature,
             "max_tokens": self.config.max_tokens,
@@ -73,6 +104,7 @@ class SwecliAgent(BaseAgent):
             }
 
         response_data = response.json()
+        result.record_usage(response_data.get("usage"))
         choice = response_data["choices"][0]
         message_data = choice["message"]
 
@@ -108,7 +140,13 @@ class SwecliAgent(BaseAgent):
 
         messages.append({"role": "user", "content": message})
 
+        # Subagents share the registry; only a top-level run starts a new turn
+        is_subagent = getattr(self, "_subagent_system_prompt", None) is not None
+        if not is_subagent and hasattr(self.tool_registry, "begin_turn"):
+            self.tool_registry.begin_turn()
+
         iteration = 0
+        usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
         while True:
             iteration += 1
 
@@ -118,6 +156,7 @@ class SwecliAgent(BaseAgent):
                     "content": "Max iterations reached without completion",
                     "messages": messages,
                     "success": False,
+                    "usage": usage,
                 }
             # Check for interrupt request (for web UI)
             if hasattr(self, 'web_state') and self.web_state.is_interrupt_requested():
@@ -126,13 +165,14 @@ class SwecliAgent(BaseAgent):
                     "content": "Task interrupted by user",
                     "messages": messages,
                     "success": False,
+                    "usage": usage,
                     "interrupted": True,
                 }
 
             payload = {
                 "model": self.config.model,
                 "messages": messages,
-                "tools": self.tool_schemas,
+                "tools": select_request_tools(self.tool_schemas, messages, self.config),
                 "tool_choice": "auto",
                 "temperature": self.config.temperature,
                 "max_tokens": self.config.max_tokens,
@@ -142,13 +182,19 @@ class SwecliAgent(BaseAgent):
             if hasattr(self, 'web_state'):
                 monitor = WebInterruptMonitor(self.web_state)
 
-            result = self._http_client.post_json(payload, task_monitor=monitor)
+            # Subagents read fresh, so only a top-level run benefits from prefetching
+            prefetch = nullcontext()
+            if self.config.speculative_prefetch and not is_subagent and hasattr(self.tool_registry, "speculate"):
+                prefetch = self.tool_registry.speculate(message, messages, monitor)
+            with prefetch:
+                result = self._http_client.post_json(payload, task_monitor=monitor)
             if not result.success or result.response is None:
                 error_msg = result.error or "Unknown error"
                 return {
                     "content": error_msg,
                     "messages": messages,
                     "success": False,
+                    "usage": usage,
                 }
 
             response = result.response
@@ -158,9 +204,12 @@ class SwecliAgent(BaseAgent):
                     "content": error_msg,
                     "messages": messages,
                     "success": False,
+                    "usage": usage,
                 }
 
             response_data = response.json()
+            result.record_usage(response_data.get("usage"))
+            _accumulate_usage(usage, response_data.get("usage"))
             choice = response_data["choices"][0]
             message_data = choice["message"]
 
@@ -180,8 +229,13 @@ class SwecliAgent(BaseAgent):
                     "content": cleaned_content or "",
                     "messages": messages,
                     "success": True,
+                    "usage": usage,
                 }
 
+            # Start independent MCP calls concurrently; results are consumed in order below
+            if hasattr(self.tool_registry, "prefetch_tool_calls"):
+                self.tool_registry.prefetch_tool_calls(message_data["tool_calls"])
+
             for tool_call in message_data["tool_calls"]:
                 tool_name = tool_call["function"]["name"]
                 tool_args = json.loads(tool_call["function"]["arguments"])
@@ -190,9 +244,6 @@ class SwecliAgent(BaseAgent):
                 if ui_callback and hasattr(ui_callback, "on_tool_call"):
                     ui_callback.on_tool_call(tool_name, tool_args)
 
-                # Check if this is a subagent (has overridden system prompt)
-                is_subagent = hasattr(self, "_subagent_system_prompt") and self._subagent_system_prompt is not None
-
                 result = self.tool_registry.execute_tool(
                     tool_name,
                     tool_args,
@@ -4,9 +4,11 @@ Manages session state and undo/redo functionality.
 """
 
 from swecli.core.context_engineering.history.session_manager import SessionManager
+from swecli.core.context_engineering.history.snapshot_store import SnapshotStore
 from swecli.core.context_engineering.history.undo_manager import UndoManager
 
 __all__ = [
     "SessionManager",
+    "SnapshotStore",
     "UndoManager",
 ]
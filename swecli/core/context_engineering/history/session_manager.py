@@ -4,6 +4,7 @@ import json
 from pathlib import Path
 from typing import Optional, Union
 
+from swecli.core.runtime.monitoring.tracing import SESSION, get_tracer
 from swecli.models.message import ChatMessage
 from swecli.models.session import Session, SessionMetadata
 
@@ -79,8 +80,9 @@ class SessionManager:
 
         session_file = self.session_dir / f"{session.id}.json"
 
-        with open(session_file, "w") as f:
-            json.dump(session.model_dump(), f, indent=2, default=str)
+        with get_tracer().span("save_session", SESSION, messages=len(session.messages)):
+            with open(session_file, "w") as f:
+                json.dump(session.model_dump(), f, indent=2, default=str)
 
     def add_message(self, message: ChatMessage, auto_save_interval: int = 5) -> None:
         """Add a message to the current session and auto-save if needed.
@@ -0,0 +1,294 @@
+"""Content-addressed snapshot store backing file undo.
+
+Snapshots are zlib-compressed blobs keyed by their SHA-256, so identical
+content is stored once. Large files can keep older versions as reverse deltas
+against the next version; once a delta chain reaches ``KEYFRAME_INTERVAL``
+versions the next one is kept in full, so every version stays restorable. The
+store evicts least-recently-used blobs once it grows past its byte budget.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Optional
+
+_FULL = b"F"
+_DELTA = b"D"
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_DELTA_THRESHOLD = 64 * 1024
+MAX_DELTA_CHAIN = 32
+# Deltas allowed in a row before a version is kept in full
+KEYFRAME_INTERVAL = 16
+# Seconds between index writes; pending updates are flushed at exit
+INDEX_SAVE_INTERVAL = 2.0
+
+
+class SnapshotNotFoundError(KeyError):
+    """Raised when a snapshot was never stored or has been evicted."""
+
+
+class SnapshotStore:
+    """Deduplicating, size-bounded blob store under ``~/.swecli/undo/<session>``."""
+
+    def __init__(
+        self,
+        root: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        delta_threshold: int = DEFAULT_DELTA_THRESHOLD,
+    ):
+        """Initialize the store.
+
+        Args:
+            root: Directory holding ``objects/`` and ``index.json``
+            max_bytes: Compressed size budget before LRU eviction kicks in
+            delta_threshold: Raw size above which older versions become reverse deltas
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.delta_threshold = delta_threshold
+        self._objects = self.root / "objects"
+        self._index_path = self.root / "index.json"
+        self._lock = threading.RLock()
+        self._index: dict[str, dict[str, Any]] = self._load_index()
+        self._dirty = False
+        self._saved_at = 0.0
+        atexit.register(self.flush)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    @staticmethod
+    def digest(content: bytes) -> str:
+        """Return the key a blob with ``content`` is stored under."""
+        return hashlib.sha256(content).hexdigest()
+
+    def put(self, content: bytes) -> str:
+        """Store ``content`` (if new) and return its digest."""
+        digest = self.digest(content)
+        with self._lock:
+            entry = self._index.get(digest)
+            if entry is not None:
+                entry["atime"] = time.time()
+                self._save_index()
+            else:
+                self._write_blob(digest, _FULL + content, raw_size=len(content), base=None)
+                self._evict()
+                self._save_index()
+        return digest
+
+    def put_version(self, previous: bytes, current: bytes) -> tuple[str, str]:
+        """Store two consecutive versions of a file.
+
+        ``current`` is kept in full. For large files, ``previous`` is rewritten
+        as a reverse delta against ``current`` when that is smaller.
+
+        Returns:
+            ``(previous_digest, current_digest)``
+        """
+        current_digest = self.put(current)
+        previous_digest = self.put(previous)
+        if previous_digest != current_digest and len(previous) >= self.delta_threshold:
+            with self._lock:
+                if self._rebase(previous_digest, previous, current_digest, current):
+                    self._save_index()
+        return previous_digest, current_digest
+
+    def get(self, digest: str) -> bytes:
+        """Return the content stored under ``digest``.
+
+        Raises:
+            SnapshotNotFoundError: If the blob (or a delta base) is missing
+        """
+        with self._lock:
+            content = self._materialize(digest, depth=0)
+            self._index[digest]["atime"] = time.time()
+            self._save_index()
+            return content
+
+    def flush(self) -> None:
+        """Write pending index updates to disk."""
+        with self._lock:
+            if self._dirty and self.root.exists():
+                self._save_index(force=True)
+
+    def __contains__(self, digest: object) -> bool:
+        with self._lock:
+            return digest in self._index
+
+    def total_bytes(self) -> int:
+        """Compressed bytes currently on disk."""
+        with self._lock:
+            return sum(entry["size"] for entry in self._index.values())
+
+    def clear(self) -> None:
+        """Remove every blob in the store."""
+        with self._lock:
+            self._index.clear()
+            self._dirty = False
+            shutil.rmtree(self.root, ignore_errors=True)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _blob_path(self, digest: str) -> Path:
+        return self._objects / digest[:2] / digest[2:]
+
+    def _load_index(self) -> dict[str, dict[str, Any]]:
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, force: bool = False) -> None:
+        """Write the index at most once per ``INDEX_SAVE_INTERVAL`` unless forced.
+
+        Blobs are written immediately; a crash before the next save only
+        loses index entries, and the in-memory undo history referring to them
+        is gone with the process anyway.
+        """
+        self._dirty = True
+        now = time.monotonic()
+        if not force and now - self._saved_at < INDEX_SAVE_INTERVAL:
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self._index_path)
+        self._dirty = False
+        self._saved_at = now
+
+    def _write_blob(self, digest: str, payload: bytes, raw_size: int, base: Optional[str]) -> None:
+        compressed = zlib.compress(payload, 6)
+        path = self._blob_path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(compressed)
+        os.replace(tmp_path, path)
+        self._index[digest] = {
+            "size": len(compressed),
+            "raw": raw_size,
+            "base": base,
+            "atime": time.time(),
+        }
+
+    def _materialize(self, digest: str, depth: int) -> bytes:
+        entry = self._index.get(digest)
+        if entry is None or depth > MAX_DELTA_CHAIN:
+            raise SnapshotNotFoundError(digest)
+        try:
+            payload = zlib.decompress(self._blob_path(digest).read_bytes())
+        except (OSError, zlib.error) as exc:
+            self._index.pop(digest, None)
+            raise SnapshotNotFoundError(digest) from exc
+
+        kind, body = payload[:1], payload[1:]
+        if kind == _FULL:
+            return body
+        base = self._materialize(entry["base"], depth + 1)
+        return _apply_delta(base, body)
+
+    def _rebase(self, digest: str, content: bytes, base_digest: str, base: bytes) -> bool:
+        """Rewrite ``digest`` as a delta against ``base_digest`` if that saves space.
+
+        ``chain`` on an entry counts the deltas that resolve through it. A
+        version whose delta would make some chain longer than
+        ``KEYFRAME_INTERVAL`` stays a full keyframe instead.
+        """
+        entry = self._index.get(digest)
+        if entry is None or entry.get("base") is not None:
+            return False
+        if self._chain_contains(base_digest, digest):
+            return False
+        bases = self._bases(base_digest)
+        chain = entry.get("chain", 0) + 1
+        if chain + len(bases) - 1 > KEYFRAME_INTERVAL:
+            return False
+        delta = _encode_delta(base, content)
+        if len(delta) * 2 >= len(content):
+            return False
+        self._write_blob(digest, _DELTA + delta, raw_size=len(content), base=base_digest)
+        self._index[digest]["chain"] = chain - 1
+        for offset, key in enumerate(bases):
+            self._index[key]["chain"] = max(self._index[key].get("chain", 0), chain + offset)
+        return True
+
+    def _bases(self, start: str) -> list[str]:
+        """``start`` followed by the blobs its delta chain resolves through."""
+        bases: list[str] = []
+        current: Optional[str] = start
+        while current is not None and current in self._index and len(bases) <= MAX_DELTA_CHAIN:
+            bases.append(current)
+            current = self._index[current].get("base")
+        return bases
+
+    def _chain_contains(self, start: str, target: str) -> bool:
+        current: Optional[str] = start
+        for _ in range(MAX_DELTA_CHAIN + 1):
+            if current is None:
+                return False
+            if current == target:
+                return True
+            current = (self._index.get(current) or {}).get("base")
+        return True
+
+    def _evict(self) -> None:
+        """Drop least-recently-used blobs (and anything delta-encoded on them)."""
+        total = sum(entry["size"] for entry in self._index.values())
+        if total <= self.max_bytes:
+            return
+        for digest in sorted(self._index, key=lambda key: self._index[key]["atime"]):
+            if total <= self.max_bytes:
+                break
+            total -= self._remove_with_dependents(digest)
+
+    def _remove_with_dependents(self, digest: str) -> int:
+        entry = self._index.pop(digest, None)
+        if entry is None:
+            return 0
+        freed = entry["size"]
+        try:
+            self._blob_path(digest).unlink()
+        except OSError:
+            pass
+        for dependent in [key for key, value in self._index.items() if value.get("base") == digest]:
+            freed += self._remove_with_dependents(dependent)
+        return freed
+
+
+def _encode_delta(base: bytes, target: bytes) -> bytes:
+    """Encode ``target`` as line copies from ``base`` plus inserted text."""
+    from swecli.core.context_engineering.tools.implementations.line_diff import compute_opcodes
+
+    base_lines = base.splitlines(keepends=True)
+    target_lines = target.splitlines(keepends=True)
+    ops: list[Any] = []
+    for tag, i1, i2, j1, j2 in compute_opcodes(base_lines, target_lines):
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append(b"".join(target_lines[j1:j2]).decode("latin-1"))
+    return json.dumps(ops, separators=(",", ":")).encode("utf-8")
+
+
+def _apply_delta(base: bytes, delta: bytes) -> bytes:
+    base_lines = base.splitlines(keepends=True)
+    parts: list[bytes] = []
+    for op in json.loads(delta.decode("utf-8")):
+        if isinstance(op, str):
+            parts.append(op.encode("latin-1"))
+        else:
+            parts.extend(base_lines[op[0]:op[1]])
+    return b"".join(parts)
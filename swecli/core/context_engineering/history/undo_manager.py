@@ -1,11 +1,22 @@
 """Undo system for rolling back operations."""
 
+import atexit
 import shutil
+import time
+import uuid
 from pathlib import Path
 from typing import Optional
 
+from swecli.core.context_engineering.history.snapshot_store import (
+    SnapshotNotFoundError,
+    SnapshotStore,
+)
 from swecli.models.operation import Operation, OperationType
 
+# Snapshot directories untouched for this long are left over from crashed
+# processes and are removed when a new store is opened
+STALE_STORE_SECONDS = 7 * 24 * 3600
+
 
 class UndoResult:
     """Result of an undo operation."""
@@ -29,16 +40,65 @@ class UndoResult:
 
 
 class UndoManager:
-    """Manager for undoing operations."""
+    """Manager for undoing operations.
+
+    File contents before each edit are captured in a content-addressed
+    :class:`SnapshotStore` (``before_snapshot`` in the operation parameters),
+    so any number of edits to the same file can be walked back.
+    """
 
-    def __init__(self, max_history: int = 50):
+    def __init__(
+        self,
+        max_history: int = 50,
+        session_id: Optional[str] = None,
+        store_root: Optional[Path] = None,
+    ):
         """Initialize undo manager.
 
         Args:
             max_history: Maximum number of operations to track
+            session_id: Name of the snapshot directory. When omitted a random
+                name is used and the directory is removed at exit, since the
+                in-memory history that refers to it does not outlive the process.
+            store_root: Parent directory for snapshots (default: ~/.swecli/undo)
         """
         self.max_history = max_history
         self.history: list[Operation] = []
+        self._owns_store = session_id is None
+        self.session_id = session_id or uuid.uuid4().hex[:12]
+        self.store_root = Path(store_root) if store_root else Path.home() / ".swecli" / "undo"
+        self._snapshots: Optional[SnapshotStore] = None
+
+    @property
+    def snapshots(self) -> SnapshotStore:
+        """Snapshot store for this session, created on first use."""
+        if self._snapshots is None:
+            self._remove_stale_stores()
+            self._snapshots = SnapshotStore(self.store_root / self.session_id)
+            atexit.register(self.close)
+        return self._snapshots
+
+    def close(self) -> None:
+        """Delete a randomly named snapshot store, or flush a named one."""
+        if self._snapshots is None:
+            return
+        if self._owns_store:
+            self._snapshots.clear()
+        else:
+            self._snapshots.flush()
+
+    def _remove_stale_stores(self) -> None:
+        cutoff = time.time() - STALE_STORE_SECONDS
+        try:
+            stores = [path for path in self.store_root.iterdir() if path.is_dir()]
+        except OSError:
+            return
+        for path in stores:
+            try:
+                if path.name != self.session_id and path.stat().st_mtime < cutoff:
+                    shutil.rmtree(path, ignore_errors=True)
+            except OSError:
+                continue
 
     def record_operation(self, operation: Operation) -> None:
         """Record an operation for potential undo.
@@ -97,6 +157,62 @@ class UndoManager:
                 error=f"Undo failed: {str(e)}",
             )
 
+    def undo_file(self, file_path: str, steps: int = 1) -> UndoResult:
+        """Walk a file back through its last ``steps`` recorded edits/writes.
+
+        Args:
+            file_path: Target path as recorded on the operations
+            steps: Number of operations on that file to roll back (at least 1)
+
+        Returns:
+            UndoResult for the oldest operation rolled back
+        """
+        if steps < 1:
+            return UndoResult(
+                success=False,
+                operation_id="",
+                error=f"steps must be at least 1 (got {steps})",
+            )
+        target = str(Path(file_path))
+        matches = [
+            op for op in self.history
+            if str(Path(op.target)) == target
+            and op.type in (OperationType.FILE_EDIT, OperationType.FILE_WRITE)
+        ]
+        if not matches:
+            return UndoResult(
+                success=False,
+                operation_id="",
+                error=f"No recorded changes for {file_path}",
+            )
+
+        result = UndoResult(success=False, operation_id="", error="Nothing undone")
+        for operation in reversed(matches[-steps:]):
+            result = self.undo_operation(operation)
+            if not result.success:
+                return result
+            self.history.remove(operation)
+        return result
+
+    def _restore_snapshot(self, operation: Operation, digest: str) -> UndoResult:
+        """Write the content stored under ``digest`` back to the operation target."""
+        try:
+            content = self.snapshots.get(digest)
+        except SnapshotNotFoundError:
+            return UndoResult(
+                success=False,
+                operation_id=operation.id,
+                error="Snapshot no longer available (evicted from undo store)",
+            )
+
+        file_path = Path(operation.target)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(content)
+        return UndoResult(
+            success=True,
+            operation_id=operation.id,
+        )
+
     def _undo_file_write(self, operation: Operation) -> UndoResult:
         """Undo a file write operation.
 
@@ -106,6 +222,8 @@ class UndoManager:
         Returns:
             UndoResult
         """
+        # write_file only creates new files (it refuses existing ones), so
+        # undoing a write always means deleting the file
         file_path = Path(operation.target)
 
         # Delete the created file
@@ -131,6 +249,11 @@ class UndoManager:
         Returns:
             UndoResult
         """
+        before = operation.parameters.get("before_snapshot")
+        if before:
+            return self._restore_snapshot(operation, before)
+
+        # Legacy operations recorded with a sidecar backup file
         file_path = Path(operation.target)
         backup_path = operation.parameters.get("backup_path")
 
@@ -206,8 +329,10 @@ class UndoManager:
         return list(reversed(self.history[-limit:]))
 
     def clear_history(self) -> None:
-        """Clear all operation history."""
+        """Clear all operation history and its snapshots."""
         self.history.clear()
+        if self._snapshots is not None:
+            self._snapshots.clear()
 
     def get_history_size(self) -> int:
         """Get number of operations in history."""
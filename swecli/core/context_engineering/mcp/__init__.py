@@ -1,6 +1,25 @@
-"""Model Context Protocol integration for SWE-CLI."""
+"""Model Context Protocol integration for SWE-CLI.
+
+``MCPManager`` pulls in the MCP client stack, so it is imported on first
+access; the config models stay cheap to import.
+"""
+
+from importlib import import_module
+from typing import Dict, Tuple
 
-from swecli.core.context_engineering.mcp.manager import MCPManager
 from swecli.core.context_engineering.mcp.models import MCPServerConfig, MCPConfig
 
 __all__ = ["MCPManager", "MCPServerConfig", "MCPConfig"]
+
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "MCPManager": ("swecli.core.context_engineering.mcp.manager", "MCPManager"),
+}
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'swecli.core.context_engineering.mcp' has no attribute '{name}'")
+    module_path, attr_name = _EXPORTS[name]
+    attr = getattr(import_module(module_path), attr_name)
+    globals()[name] = attr
+    return attr
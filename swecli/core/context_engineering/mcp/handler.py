@@ -2,7 +2,24 @@
 
 from __future__ import annotations
 
-from typing import Any
+import json
+import threading
+from concurrent.futures import Future
+from typing import Any, Optional
+
+from swecli.core.context_engineering.mcp.models import DEFAULT_STARTUP_TIMEOUT
+
+
+def _split_tool_name(tool_name: str) -> Optional[tuple[str, str]]:
+    """(server_name, mcp_tool_name) of an ``mcp__<server>__<tool>`` name."""
+    parts = tool_name.split("__")
+    if len(parts) < 3:
+        return None
+    return parts[1], "__".join(parts[2:])
+
+
+def _call_key(tool_name: str, args: dict[str, Any]) -> str:
+    return f"{tool_name}:{json.dumps(args, sort_keys=True, default=str)}"
 
 
 class McpToolHandler:
@@ -10,6 +27,68 @@ class McpToolHandler:
 
     def __init__(self, mcp_manager: Any) -> None:
         self._mcp_manager = mcp_manager
+        # Calls started ahead of time by prefetch(), consumed by execute().
+        # Per thread: each ReAct loop (main agent, parallel subagents) runs on
+        # its own thread and only consumes the calls it prefetched.
+        self._local = threading.local()
+
+    def _pending(self) -> dict[str, list[Future]]:
+        pending = getattr(self._local, "inflight", None)
+        if pending is None:
+            pending = self._local.inflight = {}
+        return pending
+
+    def prefetch(self, calls: list[tuple[str, dict[str, Any]]]) -> int:
+        """Start the leading read-only MCP calls of one turn concurrently.
+
+        Only tools the server annotated ``readOnlyHint`` are started early,
+        and only up to the first call that is not one: anything with side
+        effects, and every call after it, runs in order (after approval)
+        through ``execute``. ``execute`` returns the result of a matching
+        in-flight call instead of issuing it again, so callers keep their
+        sequential execute/display loop while the reads overlap.
+
+        Args:
+            calls: (tool_name, arguments) pairs, in the order they will execute
+
+        Returns:
+            Number of calls started
+        """
+        # Calls left over from an interrupted batch are never consumed
+        self._pending().clear()
+        if not self._mcp_manager or not hasattr(self._mcp_manager, "submit_tool_calls"):
+            return 0
+        ready = []
+        for tool_name, args in calls:
+            split = _split_tool_name(tool_name)
+            if (
+                split is None
+                or not self._mcp_manager.is_connected(split[0])
+                or not self._mcp_manager.is_read_only_tool(*split)
+            ):
+                break
+            ready.append((tool_name, args, split))
+        if len(ready) < 2:
+            return 0
+
+        futures = self._mcp_manager.submit_tool_calls(
+            [(server_name, mcp_tool_name, args) for _, args, (server_name, mcp_tool_name) in ready]
+        )
+        inflight = self._pending()
+        for (tool_name, args, _), future in zip(ready, futures):
+            inflight.setdefault(_call_key(tool_name, args), []).append(future)
+        return len(futures)
+
+    def _take_inflight(self, tool_name: str, args: dict[str, Any]) -> Optional[Future]:
+        key = _call_key(tool_name, args)
+        inflight = self._pending()
+        pending = inflight.get(key)
+        if not pending:
+            return None
+        future = pending.pop(0)
+        if not pending:
+            del inflight[key]
+        return future
 
     def execute(self, tool_name: str, args: dict[str, Any]) -> dict[str, Any]:
         if not self._mcp_manager:
@@ -19,18 +98,28 @@ class McpToolHandler:
                 "output": None,
             }
 
-        parts = tool_name.split("__")
-        if len(parts) < 3:
+        split = _split_tool_name(tool_name)
+        if split is None:
             return {
                 "success": False,
                 "error": f"Invalid MCP tool name format: {tool_name}",
                 "output": None,
             }
 
-        server_name = parts[1]
-        mcp_tool_name = "__".join(parts[2:])
+        server_name, mcp_tool_name = split
+
+        future = self._take_inflight(tool_name, args)
+        if future is not None:
+            try:
+                return future.result()
+            except Exception as exc:  # noqa: BLE001
+                return {
+                    "success": False,
+                    "error": f"MCP tool execution failed: {exc}",
+                    "output": None,
+                }
 
-        if not self._mcp_manager.is_connected(server_name):
+        if not self._mcp_manager.is_connected(server_name) and not self._wait_for_startup(server_name):
             return {
                 "success": False,
                 "error": f"MCP server '{server_name}' is not connected",
@@ -45,3 +134,10 @@ class McpToolHandler:
                 "error": f"MCP tool execution failed: {exc}",
                 "output": None,
             }
+
+    def _wait_for_startup(self, server_name: str) -> bool:
+        """Wait for a server that is still starting; True once it is connected."""
+        is_starting = getattr(self._mcp_manager, "is_starting", None)
+        if not callable(is_starting) or not is_starting(server_name):
+            return False
+        return self._mcp_manager.wait_until_ready(server_name, timeout=DEFAULT_STARTUP_TIMEOUT)
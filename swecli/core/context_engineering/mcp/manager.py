@@ -3,18 +3,9 @@
 import asyncio
 import os
 import threading
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
-
-from fastmcp import Client
-from fastmcp.client.transports import (
-    NpxStdioTransport,
-    NodeStdioTransport,
-    PythonStdioTransport,
-    UvStdioTransport,
-    UvxStdioTransport,
-    StdioTransport,
-)
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
 
 from swecli.core.context_engineering.mcp.config import (
     load_config,
@@ -23,42 +14,74 @@ from swecli.core.context_engineering.mcp.config import (
     merge_configs,
     prepare_server_config,
 )
-from swecli.core.context_engineering.mcp.models import MCPConfig, MCPServerConfig
+from swecli.core.context_engineering.mcp.models import DEFAULT_CALL_TIMEOUT, MCPConfig, MCPServerConfig
+from swecli.core.context_engineering.mcp.results import aggregate_result
+from swecli.core.context_engineering.mcp.schema_cache import MCPSchemaCache
+
+if TYPE_CHECKING:
+    # fastmcp is imported when the first server connects, so config-only use
+    # (``swecli mcp list``/``add``/...) does not load the MCP client stack.
+    from fastmcp import Client
 
 
 class _SuppressStderr:
-    """Context manager to temporarily suppress stderr output at the file descriptor level."""
+    """Context manager to temporarily suppress stderr output at the file descriptor level.
+
+    Reference counted: servers start concurrently, so stderr is redirected by
+    the first active block and restored only when the last one exits.
+    """
+
+    _lock = threading.Lock()
+    _depth = 0
+    _old_stderr_fd: Optional[int] = None
+    _devnull_fd: Optional[int] = None
 
     def __enter__(self):
-        # Save the original stderr file descriptor
-        self.old_stderr_fd = os.dup(2)
-        # Open /dev/null
-        self.devnull_fd = os.open(os.devnull, os.O_WRONLY)
-        # Redirect stderr (fd 2) to /dev/null
-        os.dup2(self.devnull_fd, 2)
+        cls = type(self)
+        with cls._lock:
+            if cls._depth == 0:
+                # Save the original stderr file descriptor
+                cls._old_stderr_fd = os.dup(2)
+                # Open /dev/null
+                cls._devnull_fd = os.open(os.devnull, os.O_WRONLY)
+                # Redirect stderr (fd 2) to /dev/null
+                os.dup2(cls._devnull_fd, 2)
+            cls._depth += 1
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        # Restore stderr
-        os.dup2(self.old_stderr_fd, 2)
-        # Close file descriptors
-        os.close(self.old_stderr_fd)
-        os.close(self.devnull_fd)
+        cls = type(self)
+        with cls._lock:
+            cls._depth -= 1
+            if cls._depth == 0:
+                # Restore stderr
+                os.dup2(cls._old_stderr_fd, 2)
+                # Close file descriptors
+                os.close(cls._old_stderr_fd)
+                os.close(cls._devnull_fd)
+                cls._old_stderr_fd = cls._devnull_fd = None
         return False
 
 
 class MCPManager:
     """Manages MCP server connections and tool execution."""
 
-    def __init__(self, working_dir: Optional[Path] = None):
+    def __init__(self, working_dir: Optional[Path] = None, schema_cache: Optional[MCPSchemaCache] = None):
         """Initialize MCP manager.
 
         Args:
             working_dir: Working directory for project-level config
+            schema_cache: Store for discovered tool schemas (default: ~/.swecli/cache)
         """
         self.working_dir = working_dir or Path.cwd()
-        self.clients: Dict[str, Client] = {}  # server_name -> Client instance
+        self.clients: Dict[str, "Client"] = {}  # server_name -> Client instance
         self.server_tools: Dict[str, List[Dict]] = {}  # server_name -> list of tool schemas
+        self.schema_cache = schema_cache or MCPSchemaCache()
+        # server_name -> event set when its start-up finished (either way)
+        self._starting: Dict[str, threading.Event] = {}
+        # server_name -> tool schemas from the disk cache, served while starting
+        self._cached_tools: Dict[str, List[Dict]] = {}
+        self._state_lock = threading.Lock()
         self._config: Optional[MCPConfig] = None
         self._event_loop = None  # Shared event loop for all MCP operations
         self._loop_thread = None  # Background thread running the event loop
@@ -75,6 +98,15 @@ class MCPManager:
         Returns:
             Transport object for fastmcp Client
         """
+        from fastmcp.client.transports import (
+            NpxStdioTransport,
+            NodeStdioTransport,
+            PythonStdioTransport,
+            UvStdioTransport,
+            UvxStdioTransport,
+            StdioTransport,
+        )
+
         # Map command types to transport classes
         if command == "npx":
             # For npx, first arg should be package name
@@ -203,6 +235,7 @@ class MCPManager:
         # Prepare config (expand env vars)
         prepared_config = prepare_server_config(server_config)
 
+        client = None
         try:
             # Suppress stderr during connection to hide MCP server logs
             with _SuppressStderr():
@@ -214,21 +247,43 @@ class MCPManager:
                 )
 
                 # Create FastMCP client
+                from fastmcp import Client
+
                 client = Client(transport)
                 await client.__aenter__()
 
-            # Store client (outside stderr suppression)
-            self.clients[server_name] = client
-
-            # Discover tools
-            await self._discover_tools(server_name)
-
-            return True
-
+            # Discover tools before registering the client, so a start-up
+            # timeout or cancellation never leaves a half-started server behind
+            await self._discover_tools(server_name, client)
+        except asyncio.CancelledError:
+            await self._close_client(server_name, client)
+            raise
         except Exception as e:
+            await self._close_client(server_name, client)
             print(f"Error connecting to MCP server '{server_name}': {e}")
             return False
 
+        self.clients[server_name] = client
+        if server_name in self.server_tools:
+            self.schema_cache.put(
+                server_name,
+                server_config,
+                self.server_tools[server_name],
+                version=self._server_version(client),
+            )
+        return True
+
+    async def _close_client(self, server_name: str, client: Optional["Client"]) -> None:
+        """Shut down a client that failed to start; it was never registered."""
+        self.server_tools.pop(server_name, None)
+        if client is None:
+            return
+        try:
+            with _SuppressStderr():
+                await client.__aexit__(None, None, None)
+        except Exception:  # pragma: no cover - best effort, the server may be half started
+            pass
+
     async def _disconnect_internal(self, server_name: str) -> None:
         """Internal coroutine that disconnects an MCP server."""
         if server_name in self.clients:
@@ -250,17 +305,18 @@ class MCPManager:
         for server_name in server_names:
             await self._disconnect_internal(server_name)
 
-    async def _discover_tools(self, server_name: str) -> None:
+    async def _discover_tools(self, server_name: str, client: Optional["Client"] = None) -> None:
         """Discover tools from an MCP server.
 
         Args:
             server_name: Name of the server
+            client: Connected client (default: the registered one)
         """
-        if server_name not in self.clients:
+        if client is None:
+            client = self.clients.get(server_name)
+        if client is None:
             return
 
-        client = self.clients[server_name]
-
         try:
             # List tools from the server
             tools = await client.list_tools()
@@ -268,12 +324,15 @@ class MCPManager:
             # Convert to our format
             tool_schemas = []
             for tool in tools:
+                annotations = getattr(tool, "annotations", None)
                 tool_schema = {
                     "name": f"mcp__{server_name}__{tool.name}",
                     "description": tool.description or f"Tool from {server_name} MCP server",
                     "input_schema": tool.inputSchema if hasattr(tool, "inputSchema") else {},
                     "mcp_server": server_name,
                     "mcp_tool_name": tool.name,
+                    # Read-only tools may run concurrently with other calls to the server
+                    "read_only": bool(getattr(annotations, "readOnlyHint", False)),
                 }
                 tool_schemas.append(tool_schema)
 
@@ -283,17 +342,97 @@ class MCPManager:
             print(f"Error discovering tools from '{server_name}': {e}")
             self.server_tools[server_name] = []
 
-    async def _connect_enabled_servers_internal(self) -> Dict[str, bool]:
-        """Internal coroutine that connects to all enabled servers."""
+    @staticmethod
+    def _server_version(client: "Client") -> Optional[str]:
+        """Version the server reported during initialization, if available."""
+        result = getattr(client, "initialize_result", None)
+        info = getattr(result, "serverInfo", None)
+        version = getattr(info, "version", None)
+        return str(version) if version else None
+
+    def _auto_start_servers(self) -> List[str]:
+        config = self.get_config()
+        return [
+            name
+            for name, server_config in config.mcp_servers.items()
+            if server_config.enabled and server_config.auto_start
+        ]
+
+    def begin_startup(self, server_names: Optional[List[str]] = None) -> None:
+        """Mark servers as starting and expose their cached tool schemas.
+
+        Until a server finishes starting, ``get_all_tools`` returns the schemas
+        cached from its previous run so the agent prompt can be built early.
+
+        Args:
+            server_names: Servers about to start (default: enabled auto-start servers)
+        """
         config = self.get_config()
-        results = {}
+        if server_names is None:
+            server_names = self._auto_start_servers()
+        with self._state_lock:
+            for server_name in server_names:
+                if server_name in self.clients or server_name in self._starting:
+                    continue
+                self._starting[server_name] = threading.Event()
+                cached = self.schema_cache.get(server_name, config.mcp_servers[server_name])
+                if cached:
+                    self._cached_tools[server_name] = cached
+
+    def _finish_startup(self, server_name: str) -> None:
+        with self._state_lock:
+            self._cached_tools.pop(server_name, None)
+            event = self._starting.pop(server_name, None)
+        if event is not None:
+            event.set()
+
+    def is_starting(self, server_name: str) -> bool:
+        """Whether ``server_name`` is still starting up."""
+        with self._state_lock:
+            return server_name in self._starting
+
+    def wait_until_ready(self, server_name: str, timeout: Optional[float] = None) -> bool:
+        """Block until a starting server is up (or failed); True if connected."""
+        with self._state_lock:
+            event = self._starting.get(server_name)
+        if event is not None:
+            event.wait(timeout)
+        return self.is_connected(server_name)
+
+    async def _start_server(
+        self,
+        server_name: str,
+        on_server_ready: Optional[Callable[[str, bool], None]] = None,
+    ) -> bool:
+        """Connect one server within its start-up timeout and report readiness."""
+        server_config = self.get_config().mcp_servers[server_name]
+        timeout = server_config.startup_timeout or None
+        try:
+            success = await asyncio.wait_for(self._connect_internal(server_name), timeout)
+        except asyncio.TimeoutError:
+            print(f"Error connecting to MCP server '{server_name}': timed out after {timeout:g}s")
+            success = False
+        finally:
+            self._finish_startup(server_name)
 
-        for server_name, server_config in config.mcp_servers.items():
-            if server_config.enabled and server_config.auto_start:
-                success = await self._connect_internal(server_name)
-                results[server_name] = success
+        if on_server_ready is not None:
+            try:
+                on_server_ready(server_name, success)
+            except Exception:  # pragma: no cover - callbacks must not break start-up
+                pass
+        return success
 
-        return results
+    async def _connect_enabled_servers_internal(
+        self,
+        on_server_ready: Optional[Callable[[str, bool], None]] = None,
+    ) -> Dict[str, bool]:
+        """Internal coroutine that connects to all enabled servers concurrently."""
+        server_names = self._auto_start_servers()
+        self.begin_startup(server_names)
+        outcomes = await asyncio.gather(
+            *(self._start_server(name, on_server_ready) for name in server_names)
+        )
+        return dict(zip(server_names, outcomes))
 
     # Synchronous wrappers that use the shared event loop
 
@@ -320,30 +459,48 @@ class MCPManager:
         """Disconnect from all MCP servers (synchronous wrapper)."""
         self._run_coroutine_threadsafe(self._disconnect_all_internal())
 
-    def connect_enabled_servers_sync(self) -> Dict[str, bool]:
+    def connect_enabled_servers_sync(
+        self,
+        on_server_ready: Optional[Callable[[str, bool], None]] = None,
+    ) -> Dict[str, bool]:
         """Connect to all enabled servers (synchronous wrapper).
 
+        Args:
+            on_server_ready: Optional callback invoked with (server_name, success)
+                as each server finishes starting
+
         Returns:
             Dict mapping server names to connection success status
         """
-        return self._run_coroutine_threadsafe(self._connect_enabled_servers_internal())
+        # Each server is bounded by its own start-up timeout
+        return self._run_coroutine_threadsafe(
+            self._connect_enabled_servers_internal(on_server_ready),
+            timeout=None,
+        )
 
     def connect_enabled_servers_background(
         self,
         on_complete: Optional[Callable[[Dict[str, bool]], None]] = None,
+        on_server_ready: Optional[Callable[[str, bool], None]] = None,
     ):
         """Schedule enabled server connections without blocking.
 
+        Servers are marked as starting before this returns, so cached tool
+        schemas are visible through ``get_all_tools`` immediately.
+
         Args:
             on_complete: Optional callback invoked with results dict when done.
                 Receives `None` if the connection attempt fails.
+            on_server_ready: Optional callback invoked with (server_name, success)
+                as each server finishes starting.
 
         Returns:
             Future representing the in-flight connection task.
         """
         self._ensure_event_loop()
+        self.begin_startup()
         future = asyncio.run_coroutine_threadsafe(
-            self._connect_enabled_servers_internal(),
+            self._connect_enabled_servers_internal(on_server_ready),
             self._event_loop,
         )
 
@@ -372,18 +529,94 @@ class MCPManager:
         Returns:
             Tool execution result
         """
+        # The call itself is bounded by the server's call_timeout
         return self._run_coroutine_threadsafe(
-            self._call_tool_internal(server_name, tool_name, arguments)
+            self._call_tool_internal(server_name, tool_name, arguments),
+            timeout=None,
         )
 
+    def submit_tool_calls(self, calls: Sequence[Tuple[str, str, Dict]]) -> List[Future]:
+        """Start several MCP tool calls without waiting for them.
+
+        All calls are in flight on the shared event loop at once, except that
+        calls to the same server which are not annotated read-only run in the
+        order given, so dependent side effects keep their order.
+
+        Args:
+            calls: (server_name, tool_name, arguments) tuples
+
+        Returns:
+            One future per call, resolving to the tool execution result
+        """
+        self._ensure_event_loop()
+        futures: List[Future] = []
+        last_write: Dict[str, Future] = {}
+        for server_name, tool_name, arguments in calls:
+            read_only = self.is_read_only_tool(server_name, tool_name)
+            previous = None if read_only else last_write.get(server_name)
+            future = asyncio.run_coroutine_threadsafe(
+                self._call_tool_after(previous, server_name, tool_name, arguments),
+                self._event_loop,
+            )
+            if not read_only:
+                last_write[server_name] = future
+            futures.append(future)
+        return futures
+
+    def call_tools_sync(self, calls: Sequence[Tuple[str, str, Dict]]) -> List[Dict]:
+        """Execute several MCP tool calls concurrently and gather their results.
+
+        Args:
+            calls: (server_name, tool_name, arguments) tuples
+
+        Returns:
+            Tool execution results, in the order of ``calls``
+        """
+        return [future.result() for future in self.submit_tool_calls(calls)]
+
+    def is_read_only_tool(self, server_name: str, tool_name: str) -> bool:
+        """Whether the server annotated ``tool_name`` as read-only."""
+        for tool in self.server_tools.get(server_name, []):
+            if tool.get("mcp_tool_name") == tool_name:
+                return bool(tool.get("read_only"))
+        return False
+
+    def _call_timeout(self, server_name: str) -> Optional[float]:
+        server_config = self.get_config().mcp_servers.get(server_name)
+        timeout = server_config.call_timeout if server_config else DEFAULT_CALL_TIMEOUT
+        return timeout or None
+
+    async def _call_tool_after(
+        self,
+        previous: Optional[Future],
+        server_name: str,
+        tool_name: str,
+        arguments: Dict,
+    ) -> Dict:
+        if previous is not None:
+            try:
+                await asyncio.wrap_future(previous)
+            except Exception:  # noqa: BLE001 - ordering only, the result is reported elsewhere
+                pass
+        return await self._call_tool_internal(server_name, tool_name, arguments)
+
     def get_all_tools(self) -> List[Dict]:
         """Get all tools from all connected servers.
 
+        Servers that are still starting contribute the schemas cached from
+        their previous run.
+
         Returns:
             List of tool schemas
         """
         all_tools = []
-        for server_name, tools in self.server_tools.items():
+        for server_name, tools in list(self.server_tools.items()):
+            all_tools.extend(tools)
+        with self._state_lock:
+            pending = [
+                tools for name, tools in self._cached_tools.items() if name not in self.server_tools
+            ]
+        for tools in pending:
             all_tools.extend(tools)
         return all_tools
 
@@ -407,21 +640,24 @@ class MCPManager:
             }
 
         client = self.clients[server_name]
+        timeout = self._call_timeout(server_name)
 
         try:
-            result = await client.call_tool(tool_name, arguments)
+            result = await asyncio.wait_for(client.call_tool(tool_name, arguments), timeout)
 
-            # Extract text content from result
-            if hasattr(result, "content") and result.content:
-                content = result.content[0].text if result.content else ""
-            else:
-                content = str(result)
+            # Render every content block, spilling oversized output to a file
+            content = aggregate_result(result, label=f"{server_name}-{tool_name}")
 
             return {
                 "success": True,
                 "output": content,
             }
 
+        except asyncio.TimeoutError:
+            return {
+                "success": False,
+                "error": f"Tool execution failed: timed out after {timeout:g}s",
+            }
         except Exception as e:
             return {
                 "success": False,
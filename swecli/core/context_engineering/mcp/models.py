@@ -3,6 +3,9 @@
 from typing import Dict
 from pydantic import BaseModel, ConfigDict, Field
 
+DEFAULT_STARTUP_TIMEOUT = 60.0  # Seconds a server may take to start and list its tools
+DEFAULT_CALL_TIMEOUT = 30.0  # Seconds a single tool call may take
+
 
 class MCPServerConfig(BaseModel):
     """Configuration for a single MCP server."""
@@ -13,6 +16,12 @@ class MCPServerConfig(BaseModel):
     enabled: bool = Field(default=True, description="Whether the server is enabled")
     auto_start: bool = Field(default=True, description="Auto-start when SWE-CLI launches")
     transport: str = Field(default="stdio", description="Transport type (stdio, sse, http)")
+    startup_timeout: float = Field(
+        default=DEFAULT_STARTUP_TIMEOUT, description="Seconds allowed to start the server and list its tools (0 = no limit)"
+    )
+    call_timeout: float = Field(
+        default=DEFAULT_CALL_TIMEOUT, description="Seconds allowed for one tool call (0 = no limit)"
+    )
 
 
 class MCPConfig(BaseModel):
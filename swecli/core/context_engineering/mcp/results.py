@@ -0,0 +1,198 @@
+"""Aggregation of MCP tool results into tool output text.
+
+MCP tools return a list of content blocks (text, images, embedded resources,
+links) and optionally structured content. ``ResultAggregator`` renders every
+block, not just the first one, and bounds memory and context use. Once the
+rendered output grows past ``max_chars`` the full text is streamed to a spill
+file; the tool output keeps the first ``max_chars`` characters plus the path,
+so the agent can page through the rest with ``read_file``.
+
+Spill files of one process live in their own directory, removed at exit.
+Directories left behind by crashed processes are swept once they are older
+than ``STALE_SPILL_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import IO, Any, Iterable, Optional
+
+DEFAULT_MAX_RESULT_CHARS = 50_000
+# Spill directories untouched for this long belong to crashed processes
+STALE_SPILL_SECONDS = 24 * 3600
+
+_spill_dir: Optional[Path] = None
+_spill_dir_lock = threading.Lock()
+
+
+def get_spill_root() -> Path:
+    """Parent of every session's spill directory."""
+    return Path(tempfile.gettempdir()) / "swecli-mcp-results"
+
+
+def get_spill_dir() -> Path:
+    """Directory receiving this session's oversized MCP results."""
+    global _spill_dir
+    with _spill_dir_lock:
+        if _spill_dir is None:
+            _remove_stale_spills(get_spill_root())
+            _spill_dir = get_spill_root() / f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+            atexit.register(remove_spill_dir)
+        return _spill_dir
+
+
+def remove_spill_dir() -> None:
+    """Delete this session's spill files."""
+    global _spill_dir
+    with _spill_dir_lock:
+        if _spill_dir is not None:
+            shutil.rmtree(_spill_dir, ignore_errors=True)
+            _spill_dir = None
+
+
+def _remove_stale_spills(root: Path) -> None:
+    cutoff = time.time() - STALE_SPILL_SECONDS
+    try:
+        entries = list(root.iterdir())
+    except OSError:
+        return
+    for path in entries:
+        try:
+            if path.stat().st_mtime >= cutoff:
+                continue
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink()
+        except OSError:
+            continue
+
+
+class ResultAggregator:
+    """Size-bounded accumulator for MCP content blocks."""
+
+    def __init__(
+        self,
+        max_chars: int = DEFAULT_MAX_RESULT_CHARS,
+        spill_dir: Optional[Path] = None,
+        label: str = "mcp",
+    ) -> None:
+        """Initialize the aggregator.
+
+        Args:
+            max_chars: Characters kept in the tool output
+            spill_dir: Directory for the full output once it exceeds ``max_chars``
+            label: Prefix of the spill file name (e.g. the tool name)
+        """
+        self.max_chars = max_chars
+        self.spill_dir = spill_dir or get_spill_dir()
+        self.label = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in label)[:60]
+        self._head: list[str] = []
+        self._head_chars = 0
+        self._total_chars = 0
+        self._parts = 0
+        self._spill: Optional[IO[str]] = None
+        self.spill_path: Optional[Path] = None
+
+    def add_text(self, text: str) -> None:
+        """Append one rendered block."""
+        if self._parts:
+            text = "\n" + text
+        self._parts += 1
+        self._total_chars += len(text)
+
+        if self._spill is None and self._head_chars + len(text) > self.max_chars:
+            self._open_spill()
+        if self._spill is not None:
+            self._spill.write(text)
+
+        room = self.max_chars - self._head_chars
+        if room > 0:
+            kept = text[:room]
+            self._head.append(kept)
+            self._head_chars += len(kept)
+
+    def add(self, block: Any) -> None:
+        """Append an MCP content block (text, image, audio, resource, link)."""
+        self.add_text(render_block(block))
+
+    def extend(self, blocks: Iterable[Any]) -> None:
+        for block in blocks:
+            self.add(block)
+
+    def finish(self) -> str:
+        """Return the tool output text and close the spill file."""
+        head = "".join(self._head)
+        if self._spill is None:
+            return head
+        self._spill.close()
+        self._spill = None
+        return (
+            f"{head}\n\n[Result truncated: showing {self._head_chars:,} of {self._total_chars:,} characters. "
+            f"Full result saved to {self.spill_path}; use read_file to view the rest.]"
+        )
+
+    @property
+    def total_chars(self) -> int:
+        return self._total_chars
+
+    def _open_spill(self) -> None:
+        try:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            fd, path = tempfile.mkstemp(dir=self.spill_dir, prefix=f"{self.label}-", suffix=".txt")
+            self._spill = os.fdopen(fd, "w", encoding="utf-8")
+        except OSError:
+            # No spill location: the output is still bounded, just without the tail.
+            self._spill = open(os.devnull, "w", encoding="utf-8")
+            self.spill_path = None
+            return
+        self.spill_path = Path(path)
+        self._spill.write("".join(self._head))
+
+
+def render_block(block: Any) -> str:
+    """Text form of one MCP content block."""
+    kind = getattr(block, "type", None)
+    if kind == "text":
+        return getattr(block, "text", "")
+    if kind in ("image", "audio"):
+        data = getattr(block, "data", "") or ""
+        mime = getattr(block, "mimeType", None) or kind
+        return f"[{kind} content: {mime}, ~{len(data) * 3 // 4:,} bytes]"
+    if kind == "resource":
+        resource = getattr(block, "resource", None)
+        text = getattr(resource, "text", None)
+        if text is not None:
+            return text
+        uri = getattr(resource, "uri", "")
+        mime = getattr(resource, "mimeType", None) or "binary"
+        return f"[embedded resource {uri} ({mime})]"
+    if kind == "resource_link":
+        name = getattr(block, "name", None) or ""
+        return f"[resource link: {getattr(block, 'uri', '')}{f' ({name})' if name else ''}]"
+    if isinstance(block, str):
+        return block
+    return str(block)
+
+
+def aggregate_result(result: Any, max_chars: int = DEFAULT_MAX_RESULT_CHARS, label: str = "mcp") -> str:
+    """Render a ``call_tool`` result (all content blocks, or its structured content)."""
+    aggregator = ResultAggregator(max_chars=max_chars, label=label)
+    content = getattr(result, "content", None)
+    if content:
+        aggregator.extend(content)
+    else:
+        structured = getattr(result, "structured_content", None)
+        if structured is not None:
+            aggregator.add_text(json.dumps(structured, indent=2, default=str))
+        elif content is None:
+            aggregator.add_text(str(result))
+    return aggregator.finish()
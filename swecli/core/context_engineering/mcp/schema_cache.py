@@ -0,0 +1,124 @@
+"""On-disk cache of tool schemas discovered from MCP servers.
+
+Starting an MCP server (often through ``npx``/``uvx``) takes seconds, but the
+tools it exposes rarely change between runs. Caching the discovered schemas
+lets the agent prompt and tool list be built right away; the live schemas
+replace the cached ones as soon as each server finishes starting.
+
+Entries are keyed by server name and a fingerprint of the launch command,
+arguments, environment and the version the server reported, so changing any
+of them (including a pinned package version in ``args``) discards the stale
+entry. Before a server is up its version is unknown; lookups then use the
+version recorded with the entry, and the entry is replaced once the live
+server reports a different one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from swecli.core.context_engineering.mcp.models import MCPServerConfig
+
+
+def get_schema_cache_path() -> Path:
+    """Default location of the schema cache file."""
+    return Path.home() / ".swecli" / "cache" / "mcp_tools.json"
+
+
+def server_fingerprint(server_config: MCPServerConfig, version: Optional[str] = None) -> str:
+    """Stable hash of everything that determines which tools a server exposes."""
+    payload = json.dumps(
+        {
+            "command": server_config.command,
+            "args": list(server_config.args),
+            "env": dict(sorted(server_config.env.items())),
+            "transport": server_config.transport,
+            "version": version,
+        },
+        sort_keys=True,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class MCPSchemaCache:
+    """JSON file mapping server name -> {fingerprint, version, tools}."""
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: Cache file (default: ~/.swecli/cache/mcp_tools.json)
+        """
+        self.path = Path(path) if path else get_schema_cache_path()
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def get(
+        self,
+        server_name: str,
+        server_config: MCPServerConfig,
+        version: Optional[str] = None,
+    ) -> Optional[List[Dict]]:
+        """Cached tools for ``server_name``, or None if missing or stale.
+
+        Args:
+            server_name: Name of the server
+            server_config: Current launch configuration
+            version: Version the running server reported; None before it is
+                up, in which case the version stored with the entry is assumed
+        """
+        with self._lock:
+            entry = self._load().get(server_name)
+        if not entry:
+            return None
+        if version is None:
+            version = entry.get("version")
+        if entry.get("fingerprint") != server_fingerprint(server_config, version):
+            return None
+        return entry.get("tools")
+
+    def put(
+        self,
+        server_name: str,
+        server_config: MCPServerConfig,
+        tools: List[Dict],
+        version: Optional[str] = None,
+    ) -> None:
+        """Store freshly discovered ``tools`` for ``server_name``."""
+        entry = {
+            "fingerprint": server_fingerprint(server_config, version),
+            "version": version,
+            "tools": tools,
+        }
+        with self._lock:
+            entries = self._load()
+            if entries.get(server_name) == entry:
+                return
+            entries[server_name] = entry
+            self._save(entries)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._entries = {}
+            if not isinstance(self._entries, dict):
+                self._entries = {}
+        return self._entries
+
+    def _save(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".mcp_tools.", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(entries, handle)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass
@@ -9,6 +9,7 @@ ACE Components:
     - Reflector: Analyzes execution outcomes (LLM-powered)
     - Curator: Evolves playbook through delta operations
     - Delta operations: ADD, UPDATE, TAG, REMOVE mutations
+    - LearningWorker: Runs reflection and curation off the interactive path
 
 Based on: Agentic Context Engine (ACE)
 Paper: https://arxiv.org/abs/2510.04618
@@ -25,6 +26,7 @@ from swecli.core.context_engineering.memory.roles import (
     ReflectorOutput,
     CuratorOutput,
 )
+from swecli.core.context_engineering.memory.learning_worker import LearningRecord, LearningWorker
 
 # Legacy imports for backwards compatibility (deprecated)
 from swecli.core.context_engineering.memory.playbook import SessionPlaybook, Strategy
@@ -41,6 +43,8 @@ __all__ = [
     "CuratorOutput",
     "DeltaOperation",
     "DeltaBatch",
+    "LearningRecord",
+    "LearningWorker",
     # Legacy (deprecated, for backwards compatibility)
     "SessionPlaybook",
     "Strategy",
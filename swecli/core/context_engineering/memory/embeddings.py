@@ -10,10 +10,12 @@ import hashlib
 import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import numpy as np
 
+from .local_embedder import get_local_embedder, is_local_model
+
 
 @dataclass
 class EmbeddingMetadata:
@@ -347,32 +349,42 @@ def generate_embeddings(
 
     Returns:
         Single embedding vector or list of vectors
+
+    Raises:
+        Exception: If the embedding API is unavailable or the call fails.
+            Callers fall back to the local embedder rather than scoring noise.
     """
-    try:
-        from any_llm import embedding
+    if is_local_model(model):
+        return get_local_embedder(model)(texts, model)
 
-        # Call any-llm embedding API
-        response = embedding(
-            model=model,
-            inputs=texts,
-            provider=provider,
-        )
+    from any_llm import embedding
+
+    # Call any-llm embedding API
+    response = embedding(
+        model=model,
+        inputs=texts,
+        provider=provider,
+    )
+
+    # Extract embedding vectors from response
+    if isinstance(texts, str):
+        # Single text
+        return response.data[0].embedding
+    else:
+        # Multiple texts
+        return [item.embedding for item in response.data]
+
+
+def get_embedding_generator(model: str) -> Callable[..., Any]:
+    """Return the generator for ``model`` (local embedder or remote API).
+
+    Args:
+        model: Embedding model name; ``"local"`` selects the offline backend
+
+    Returns:
+        Callable taking ``(texts, model)`` as expected by ``EmbeddingCache``
+    """
+    if is_local_model(model):
+        return get_local_embedder(model)
+    return generate_embeddings
 
-        # Extract embedding vectors from response
-        if isinstance(texts, str):
-            # Single text
-            return response.data[0].embedding
-        else:
-            # Multiple texts
-            return [item.embedding for item in response.data]
-
-    except Exception as e:
-        # Fallback: return random embeddings for testing
-        # In production, this should raise the error
-        import random
-        dim = 1536  # OpenAI embedding dimension
-
-        if isinstance(texts, str):
-            return [random.random() for _ in range(dim)]
-        else:
-            return [[random.random() for _ in range(dim)] for _ in texts]
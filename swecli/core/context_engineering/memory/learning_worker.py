@@ -0,0 +1,309 @@
+"""Background ACE learning pipeline.
+
+Reflection and curation each cost an LLM round-trip (plus JSON retries), so
+running them inline delays the user's next query. ``LearningWorker`` accepts
+``LearningRecord`` objects without blocking and processes them on a daemon
+thread. Records that pile up while an LLM call is in flight are reflected on
+together, so a burst of turns costs one Reflector call and one Curator call
+instead of two per turn.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+from swecli.core.agents.components.llm_scheduler import Priority, llm_priority
+from swecli.core.context_engineering.memory.roles import (
+    AgentResponse,
+    Curator,
+    CuratorOutput,
+    Reflector,
+    ReflectorOutput,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PENDING = 32
+DEFAULT_BATCH_SIZE = 4
+
+_OUTCOME_SEVERITY = {"success": 0, "partial": 1, "error": 2}
+
+
+@dataclass
+class LearningRecord:
+    """One round of tool execution to learn from."""
+
+    session: Any  # Session whose playbook receives the deltas
+    query: str
+    agent_response: AgentResponse
+    feedback: str
+    outcome: str = "success"
+    merged: int = 1  # Number of rounds folded into this record
+
+    def absorb(self, other: "LearningRecord") -> None:
+        """Fold a later round of the same query into this record."""
+        self.agent_response = AgentResponse(
+            content=other.agent_response.content or self.agent_response.content,
+            reasoning=other.agent_response.reasoning or self.agent_response.reasoning,
+            tool_calls=list(self.agent_response.tool_calls) + list(other.agent_response.tool_calls),
+        )
+        self.feedback = f"{self.feedback}\n{other.feedback}"
+        if _OUTCOME_SEVERITY.get(other.outcome, 0) > _OUTCOME_SEVERITY.get(self.outcome, 0):
+            self.outcome = other.outcome
+        self.merged += other.merged
+
+
+class LearningWorker:
+    """Bounded queue plus daemon thread that evolves session playbooks."""
+
+    def __init__(
+        self,
+        reflector: Reflector,
+        curator: Curator,
+        *,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        debug_log_path: Optional[str] = None,
+    ) -> None:
+        """Initialize the worker (the thread starts on first submit).
+
+        Args:
+            reflector: ACE Reflector used for batched reflections
+            curator: ACE Curator turning reflections into deltas
+            max_pending: Queue bound; beyond it records are merged or dropped
+            batch_size: Maximum records reflected on in one LLM call
+            debug_log_path: Optional file receiving playbook evolution logs
+        """
+        self.reflector = reflector
+        self.curator = curator
+        self.max_pending = max(1, max_pending)
+        self.batch_size = max(1, batch_size)
+        self.debug_log_path = debug_log_path
+
+        self._pending: deque[LearningRecord] = deque()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._busy = False
+        self._closed = False
+        self._batches = 0
+
+        self.dropped = 0
+        self.merged = 0
+        self.processed = 0
+
+    # ------------------------------------------------------------------
+    # Producer side (interactive thread)
+    # ------------------------------------------------------------------
+    def submit(self, record: LearningRecord) -> bool:
+        """Queue ``record`` for learning without blocking.
+
+        When the queue is full the record is merged into a pending record for
+        the same query if there is one; otherwise the oldest pending record is
+        dropped to make room.
+
+        Returns:
+            False if the worker is closed, True otherwise
+        """
+        with self._condition:
+            if self._closed:
+                return False
+            if len(self._pending) >= self.max_pending:
+                target = self._find_mergeable(record)
+                if target is not None:
+                    target.absorb(record)
+                    self.merged += 1
+                    return True
+                self._pending.popleft()
+                self.dropped += 1
+            self._pending.append(record)
+            self._ensure_thread()
+            self._condition.notify()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued record has been processed.
+
+        Returns:
+            True if the queue drained within ``timeout``
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._busy, timeout=timeout
+            )
+
+    def close(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop accepting records, finish pending work (up to ``timeout``)."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    @property
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    # ------------------------------------------------------------------
+    # Consumer side (worker thread)
+    # ------------------------------------------------------------------
+    def _find_mergeable(self, record: LearningRecord) -> Optional[LearningRecord]:
+        for queued in reversed(self._pending):
+            if queued.session is record.session and queued.query == record.query:
+                return queued
+        return None
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="swecli-ace-learning", daemon=True
+            )
+            self._thread.start()
+
+    def _next_batch(self) -> Optional[list[LearningRecord]]:
+        with self._condition:
+            self._busy = False
+            self._condition.notify_all()
+            self._condition.wait_for(lambda: self._pending or self._closed)
+            if not self._pending:
+                return None
+            first = self._pending.popleft()
+            batch = [first]
+            while (
+                self._pending
+                and len(batch) < self.batch_size
+                and self._pending[0].session is first.session
+            ):
+                batch.append(self._pending.popleft())
+            self._busy = True
+            return batch
+
+    def _run(self) -> None:
+        # Reflection never delays an interactive turn waiting on the same rate limit
+        with llm_priority(Priority.BACKGROUND):
+            self._drain()
+
+    def _drain(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                self._learn(batch)
+            except Exception as exc:  # noqa: BLE001 - learning must never crash the app
+                logger.debug("ACE learning failed: %s", exc)
+                self._log_error(exc)
+            finally:
+                self.processed += len(batch)
+
+    def _learn(self, batch: list[LearningRecord]) -> None:
+        session = batch[0].session
+        question, agent_response, feedback = _combine(batch)
+        playbook = session.get_playbook()
+
+        reflection = self.reflector.reflect(
+            question=question,
+            agent_response=agent_response,
+            playbook=playbook,
+            ground_truth=None,
+            feedback=feedback,
+        )
+
+        self._batches += 1
+        curator_output = self.curator.curate(
+            reflection=reflection,
+            playbook=playbook,
+            question_context=question,
+            progress=f"Batch #{self._batches} ({len(batch)} turns)",
+        )
+
+        # This thread is the only playbook writer. Readers on the interactive
+        # thread call get_playbook(), which builds a fresh Playbook from
+        # session.playbook; update_playbook() swaps in a new dict, so they see
+        # either the old or the new playbook, never a partial update.
+        playbook = session.get_playbook()
+        for bullet_tag in reflection.bullet_tags:
+            try:
+                playbook.tag_bullet(bullet_tag.id, bullet_tag.tag)
+            except (ValueError, KeyError):
+                continue
+        bullets_before = len(playbook.bullets())
+        playbook.apply_delta(curator_output.delta)
+        bullets_after = len(playbook.bullets())
+        session.update_playbook(playbook)
+
+        if bullets_after != bullets_before or curator_output.delta.operations:
+            self._log_evolution(batch, reflection, curator_output, bullets_before, bullets_after)
+
+    # ------------------------------------------------------------------
+    # Debug logging
+    # ------------------------------------------------------------------
+    def _log_evolution(
+        self,
+        batch: list[LearningRecord],
+        reflection: ReflectorOutput,
+        curator_output: CuratorOutput,
+        bullets_before: int,
+        bullets_after: int,
+    ) -> None:
+        if not self.debug_log_path:
+            return
+        os.makedirs(os.path.dirname(self.debug_log_path), exist_ok=True)
+        with open(self.debug_log_path, "a", encoding="utf-8") as log:
+            timestamp = datetime.now().isoformat()
+            log.write(f"\n{'=' * 60}\n")
+            log.write(f"🧠 ACE PLAYBOOK EVOLUTION - {timestamp}\n")
+            log.write(f"{'=' * 60}\n")
+            for record in batch:
+                log.write(f"Query: {record.query}\n")
+                log.write(f"Outcome: {record.outcome}\n")
+            log.write(f"Bullets: {bullets_before} -> {bullets_after}\n")
+            log.write(f"Delta Operations: {len(curator_output.delta.operations)}\n")
+            for op in curator_output.delta.operations:
+                log.write(f"  - {op.type}: {op.section} - {op.content[:80] if op.content else op.bullet_id}\n")
+            log.write(f"Reflection Key Insight: {reflection.key_insight}\n")
+            log.write(f"Curator Reasoning: {curator_output.delta.reasoning[:200]}\n")
+
+    def _log_error(self, exc: Exception) -> None:
+        if not self.debug_log_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.debug_log_path), exist_ok=True)
+            with open(self.debug_log_path, "a", encoding="utf-8") as log:
+                log.write(f"\n{'!' * 60}\n")
+                log.write(f"❌ ACE ERROR: {str(exc)}\n")
+                log.write("".join(traceback.format_exception(type(exc), exc, exc.__traceback__)))
+        except OSError:
+            pass
+
+
+def _combine(batch: list[LearningRecord]) -> tuple[str, AgentResponse, str]:
+    """Build one Reflector input covering every record in ``batch``."""
+    if len(batch) == 1:
+        record = batch[0]
+        return record.query, record.agent_response, record.feedback
+
+    questions = []
+    responses = []
+    feedback = []
+    tool_calls: list[dict] = []
+    for index, record in enumerate(batch, start=1):
+        questions.append(f"Turn {index}: {record.query}")
+        if record.agent_response.content:
+            responses.append(f"Turn {index}: {record.agent_response.content[:1000 // len(batch)]}")
+        feedback.append(f"### Turn {index}\n{record.feedback}")
+        tool_calls.extend(record.agent_response.tool_calls)
+
+    return (
+        "\n".join(questions),
+        AgentResponse(content="\n".join(responses), tool_calls=tool_calls),
+        "\n\n".join(feedback),
+    )
@@ -0,0 +1,120 @@
+"""Offline embedding backend for playbook bullet selection.
+
+``LocalEmbedder`` turns text into dense vectors without any network access:
+word unigrams, word bigrams and character trigrams are hashed into a sparse
+feature space and projected onto ``dim`` dimensions with a fixed random
+{-1, +1} matrix. The projection matrix is never materialized: a feature's row
+is derived from its hash, so identical input always yields the identical
+vector (the sparse random projection of Achlioptas, i.e. signed feature
+hashing).
+
+Playbook bullets are short, so lexical overlap is a good relevance signal, and
+embedding a bullet takes microseconds instead of an API round-trip.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+LOCAL_EMBEDDING_MODEL = "local"
+DEFAULT_DIM = 384
+
+# Relative weights of the three feature families.
+_WORD_WEIGHT = 1.0
+_BIGRAM_WEIGHT = 0.5
+_CHAR_WEIGHT = 0.25
+
+# camelCase / snake_case aware word splitter.
+_WORD = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in into is it its of on or "
+    "so that the this to was were when where which while will with".split()
+)
+
+
+def is_local_model(model: Optional[str]) -> bool:
+    """Whether ``model`` names the offline embedder (``"local"`` or ``"local-<dim>"``)."""
+    return bool(model) and (model == LOCAL_EMBEDDING_MODEL or model.startswith(f"{LOCAL_EMBEDDING_MODEL}-"))
+
+
+@lru_cache(maxsize=65536)
+def _bucket(feature: str, dim: int) -> tuple[int, float]:
+    """Column and sign of ``feature`` in the implicit projection matrix."""
+    value = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+    return value % dim, (1.0 if value >> 63 else -1.0)
+
+
+def _words(text: str) -> List[str]:
+    return [word.lower() for word in _WORD.findall(text) if word.lower() not in _STOPWORDS]
+
+
+def _stem(word: str) -> str:
+    """Very light suffix stripping so "reading"/"reads"/"read" share a feature."""
+    for suffix in ("ing", "ies", "ed", "es", "s"):
+        if len(word) > len(suffix) + 2 and word.endswith(suffix):
+            return word[: -len(suffix)]
+    return word
+
+
+class LocalEmbedder:
+    """Deterministic hashed n-gram embedder."""
+
+    def __init__(self, dim: int = DEFAULT_DIM):
+        """Initialize the embedder.
+
+        Args:
+            dim: Output dimensionality
+        """
+        self.dim = dim
+
+    def features(self, text: str) -> dict[str, float]:
+        """Weighted sparse features of ``text`` (sublinear term frequency)."""
+        counts: dict[str, float] = {}
+        words = [_stem(word) for word in _words(text)]
+        for word in words:
+            counts[f"w:{word}"] = counts.get(f"w:{word}", 0.0) + _WORD_WEIGHT
+            padded = f"<{word}>"
+            for i in range(len(padded) - 2):
+                gram = f"c:{padded[i:i + 3]}"
+                counts[gram] = counts.get(gram, 0.0) + _CHAR_WEIGHT
+        for left, right in zip(words, words[1:]):
+            gram = f"b:{left} {right}"
+            counts[gram] = counts.get(gram, 0.0) + _BIGRAM_WEIGHT
+        return {feature: float(np.log1p(weight)) for feature, weight in counts.items()}
+
+    def embed(self, text: str) -> np.ndarray:
+        """L2-normalized embedding of ``text`` (all zeros for empty input)."""
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for feature, weight in self.features(text).items():
+            column, sign = _bucket(feature, self.dim)
+            vector[column] += sign * weight
+        norm = float(np.linalg.norm(vector))
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    def embed_batch(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed ``texts`` into an ``(len(texts), dim)`` matrix."""
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            matrix[row] = self.embed(text)
+        return matrix
+
+    def __call__(self, texts: str | List[str], model: Optional[str] = None) -> List[float] | List[List[float]]:
+        """Generator interface used by ``EmbeddingCache.get_or_generate``."""
+        if isinstance(texts, str):
+            return self.embed(texts).tolist()
+        return self.embed_batch(texts).tolist()
+
+
+@lru_cache(maxsize=8)
+def get_local_embedder(model: str = LOCAL_EMBEDDING_MODEL) -> LocalEmbedder:
+    """Return the shared embedder for ``"local"`` or ``"local-<dim>"``."""
+    _, _, suffix = model.partition("-")
+    dim = int(suffix) if suffix.isdigit() else DEFAULT_DIM
+    return LocalEmbedder(dim=dim)
@@ -285,7 +285,7 @@ class Playbook:
             >>> playbook.as_context(query="fix authentication bug", max_strategies=20)
             Returns top 20 most relevant bullets for authentication debugging
         """
-        from .selector import BulletSelector
+        from .selector import get_bullet_selector
 
         # Get all bullets
         all_bullets = self.bullets()
@@ -299,7 +299,7 @@ class Playbook:
             return self.as_prompt()
 
         # Select top-K bullets
-        selector = BulletSelector(
+        selector = get_bullet_selector(
             weights=weights,
             embedding_model=embedding_model,
             cache_file=cache_file,
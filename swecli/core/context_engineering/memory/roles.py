@@ -139,21 +139,21 @@ Return your response as a JSON object with these fields:
 - suggested_strategies: List of new strategies that should be added to the playbook
 
 Example response:
-{
+{{
     "reasoning": "The agent attempted to read a file without checking if it exists first...",
     "error_identification": "File read operation failed due to missing existence check",
     "root_cause_analysis": "Agent followed pattern of direct file access without validation",
     "correct_approach": "Always verify file existence before reading or writing",
     "key_insight": "File operations require validation steps to prevent errors",
     "bullet_tags": [
-        {"id": "fil-00001", "tag": "harmful"},
-        {"id": "fil-00003", "tag": "helpful"}
+        {{"id": "fil-00001", "tag": "harmful"}},
+        {{"id": "fil-00003", "tag": "helpful"}}
     ],
     "suggested_strategies": [
         "Always check file existence before read operations",
         "Use try-catch blocks for file operations"
     ]
-}"""
+}}"""
 
     def __init__(
         self,
@@ -288,26 +288,26 @@ Operations can be:
 - REMOVE: Delete bullet (requires bullet_id)
 
 Example response:
-{
+{{
     "reasoning": "Based on the reflection, we need to add a file validation strategy...",
     "operations": [
-        {
+        {{
             "type": "ADD",
             "section": "file_operations",
             "content": "Always verify file existence before reading or writing"
-        },
-        {
+        }},
+        {{
             "type": "TAG",
             "bullet_id": "fil-00001",
-            "metadata": {"helpful": 1}
-        },
-        {
+            "metadata": {{"helpful": 1}}
+        }},
+        {{
             "type": "TAG",
             "bullet_id": "fil-00002",
-            "metadata": {"harmful": 1}
-        }
+            "metadata": {{"harmful": 1}}
+        }}
     ]
-}"""
+}}"""
 
     def __init__(
         self,
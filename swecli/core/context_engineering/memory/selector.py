@@ -8,9 +8,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
-
-from .embeddings import EmbeddingCache, cosine_similarity, generate_embeddings
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from .embeddings import (
+    EmbeddingCache,
+    batch_cosine_similarity,
+    cosine_similarity,
+    get_embedding_generator,
+)
+from .local_embedder import LOCAL_EMBEDDING_MODEL, get_local_embedder, is_local_model
 from .playbook import Bullet
 
 
@@ -45,8 +52,10 @@ class BulletSelector:
                 - effectiveness: Weight for helpful/harmful ratio (default: 0.5)
                 - recency: Weight for recent usage (default: 0.3)
                 - semantic: Weight for semantic similarity (default: 0.2)
-            embedding_model: Model to use for embeddings
-            cache_file: Optional path to cache file for persistence
+            embedding_model: Model to use for embeddings ("local" for the
+                offline hashed n-gram embedder)
+            cache_file: Optional path to cache file for persistence (ignored
+                for the local embedder, which is cheaper to recompute than load)
         """
         self.weights = weights or {
             "effectiveness": 0.5,
@@ -54,11 +63,16 @@ class BulletSelector:
             "semantic": 0.2,
         }
         self.embedding_model = embedding_model
-        self.cache_file = cache_file
+        self.cache_file = None if is_local_model(embedding_model) else cache_file
+
+        # Model actually used for this selector; switches to the local
+        # embedder if the remote API turns out to be unreachable.
+        self._active_model = embedding_model
+        self._generator = get_embedding_generator(embedding_model)
 
         # Try to load cache from disk if cache_file provided
-        if cache_file:
-            loaded_cache = EmbeddingCache.load_from_file(cache_file)
+        if self.cache_file:
+            loaded_cache = EmbeddingCache.load_from_file(self.cache_file)
             if loaded_cache:
                 self.embedding_cache = loaded_cache
             else:
@@ -87,12 +101,21 @@ class BulletSelector:
             if len(bullets) <= max_count:
                 return bullets
 
-            # Optimization: Batch-generate embeddings if semantic scoring is needed
+            # Optimization: Batch-generate embeddings and score similarity as
+            # one matrix product if semantic scoring is needed
+            semantic_scores: Optional[List[float]] = None
             if query and self.weights["semantic"] > 0:
                 self._batch_generate_embeddings(query, bullets)
+                semantic_scores = self._batch_semantic_scores(query, bullets)
 
             # Score all bullets
-            scored_bullets = [self._score_bullet(bullet, query) for bullet in bullets]
+            if semantic_scores is not None:
+                scored_bullets = [
+                    self._score_bullet(bullet, query, semantic=score)
+                    for bullet, score in zip(bullets, semantic_scores)
+                ]
+            else:
+                scored_bullets = [self._score_bullet(bullet, query) for bullet in bullets]
 
             # Sort by score (descending)
             scored_bullets.sort(key=lambda x: x.score, reverse=True)
@@ -124,13 +147,13 @@ class BulletSelector:
         text_indices = {}  # Map text to original index
 
         # Check if query needs embedding
-        if self.embedding_cache.get(query) is None:
+        if self.embedding_cache.get(query, self._active_model) is None:
             texts_to_generate.append(query)
             text_indices[query] = len(texts_to_generate) - 1
 
         # Check which bullets need embeddings
         for bullet in bullets:
-            if self.embedding_cache.get(bullet.content) is None:
+            if self.embedding_cache.get(bullet.content, self._active_model) is None:
                 texts_to_generate.append(bullet.content)
                 text_indices[bullet.content] = len(texts_to_generate) - 1
 
@@ -140,24 +163,38 @@ class BulletSelector:
 
         # Batch generate embeddings
         try:
-            embeddings = self.embedding_cache.batch_get_or_generate(
+            self.embedding_cache.batch_get_or_generate(
                 texts=texts_to_generate,
-                generator=generate_embeddings,
+                model=self._active_model,
+                generator=self._generator,
             )
-
             # Note: batch_get_or_generate automatically caches the results
-            # So we don't need to manually cache them here
         except Exception:
-            # If batch generation fails, fallback to individual generation
-            # This will happen naturally when _semantic_score is called
-            pass
+            # Remote API unavailable: score the whole selection locally
+            # instead of retrying the network once per bullet.
+            if self._use_local_fallback():
+                self._batch_generate_embeddings(query, bullets)
+
+    def _use_local_fallback(self) -> bool:
+        """Switch to the offline embedder; returns False if already using it."""
+        if is_local_model(self._active_model):
+            return False
+        self._active_model = LOCAL_EMBEDDING_MODEL
+        self._generator = get_local_embedder(LOCAL_EMBEDDING_MODEL)
+        return True
 
-    def _score_bullet(self, bullet: Bullet, query: Optional[str] = None) -> ScoredBullet:
+    def _score_bullet(
+        self,
+        bullet: Bullet,
+        query: Optional[str] = None,
+        semantic: Optional[float] = None,
+    ) -> ScoredBullet:
         """Calculate relevance score for a single bullet.
 
         Args:
             bullet: Bullet to score
             query: User query for semantic matching
+            semantic: Precomputed semantic score (skips the per-bullet lookup)
 
         Returns:
             ScoredBullet with score and breakdown
@@ -173,9 +210,10 @@ class BulletSelector:
         breakdown["recency"] = recency
 
         # Semantic score (query-to-bullet similarity)
-        semantic = 0.0
-        if query and self.weights["semantic"] > 0:
-            semantic = self._semantic_score(query, bullet)
+        if semantic is None:
+            semantic = 0.0
+            if query and self.weights["semantic"] > 0:
+                semantic = self._semantic_score(query, bullet)
         breakdown["semantic"] = semantic
 
         # Calculate weighted final score
@@ -266,28 +304,44 @@ class BulletSelector:
         """
         try:
             # Get or generate embeddings using cache
-            query_embedding = self.embedding_cache.get_or_generate(
-                text=query,
-                generator=generate_embeddings,
-            )
-            bullet_embedding = self.embedding_cache.get_or_generate(
-                text=bullet.content,
-                generator=generate_embeddings,
-            )
+            query_embedding = self._embed(query)
+            bullet_embedding = self._embed(bullet.content)
+        except Exception:
+            if not self._use_local_fallback():
+                return 0.5
+            query_embedding = self._embed(query)
+            bullet_embedding = self._embed(bullet.content)
 
+        try:
             # Calculate cosine similarity
             similarity = cosine_similarity(query_embedding, bullet_embedding)
+        except Exception:
+            # Mismatched vectors (e.g. from different models): neutral score
+            return 0.5
 
-            # Normalize from [-1, 1] to [0, 1] range
-            # -1 (opposite) → 0.0, 0 (orthogonal) → 0.5, 1 (identical) → 1.0
-            normalized_score = (similarity + 1.0) / 2.0
-
-            return normalized_score
+        # Normalize from [-1, 1] to [0, 1] range
+        # -1 (opposite) → 0.0, 0 (orthogonal) → 0.5, 1 (identical) → 1.0
+        return (similarity + 1.0) / 2.0
 
+    def _batch_semantic_scores(self, query: str, bullets: List[Bullet]) -> Optional[List[float]]:
+        """Normalized semantic scores for all bullets, or None if any embedding is missing."""
+        query_embedding = self.embedding_cache.get(query, self._active_model)
+        vectors = [self.embedding_cache.get(bullet.content, self._active_model) for bullet in bullets]
+        if query_embedding is None or any(vector is None for vector in vectors):
+            return None
+        try:
+            similarities = batch_cosine_similarity(query_embedding, vectors)
         except Exception:
-            # If embedding generation fails, return neutral score
-            # This allows the selector to continue using effectiveness + recency
-            return 0.5
+            return None
+        return [(similarity + 1.0) / 2.0 for similarity in similarities]
+
+    def _embed(self, text: str) -> List[float]:
+        """Embed ``text`` with the active model, using the cache."""
+        return self.embedding_cache.get_or_generate(
+            text=text,
+            model=self._active_model,
+            generator=self._generator,
+        )
 
     def get_selection_stats(self, bullets: List[Bullet], selected: List[Bullet]) -> Dict[str, any]:
         """Get statistics about the selection process.
@@ -317,3 +371,37 @@ class BulletSelector:
             "score_improvement": avg_selected_score - avg_all_score,
         }
 
+
+def get_bullet_selector(
+    weights: Optional[Dict[str, float]] = None,
+    embedding_model: str = "text-embedding-3-small",
+    cache_file: Optional[str] = None,
+) -> BulletSelector:
+    """Return the shared selector for this configuration.
+
+    Reusing one selector keeps its embedding cache warm across queries
+    instead of reloading ``cache_file`` for every prompt.
+
+    Args:
+        weights: Scoring weights (see ``BulletSelector``)
+        embedding_model: Model to use for embeddings
+        cache_file: Optional path to cache file for persistence
+
+    Returns:
+        The ``BulletSelector`` shared by every caller with the same arguments
+    """
+    weight_items = tuple(sorted(weights.items())) if weights else None
+    return _shared_selector(weight_items, embedding_model, cache_file)
+
+
+@lru_cache(maxsize=8)
+def _shared_selector(
+    weight_items: Optional[Tuple[Tuple[str, float], ...]],
+    embedding_model: str,
+    cache_file: Optional[str],
+) -> BulletSelector:
+    return BulletSelector(
+        weights=dict(weight_items) if weight_items else None,
+        embedding_model=embedding_model,
+        cache_file=cache_file,
+    )
@@ -3,6 +3,11 @@
 Provides codebase indexing, context retrieval, and token monitoring.
 """
 
+from swecli.core.context_engineering.retrieval.batch_search import (
+    FileNameIndex,
+    find_files_containing,
+    get_filename_index,
+)
 from swecli.core.context_engineering.retrieval.indexer import CodebaseIndexer
 from swecli.core.context_engineering.retrieval.retriever import ContextRetriever, EntityExtractor
 from swecli.core.context_engineering.retrieval.token_monitor import ContextTokenMonitor
@@ -12,4 +17,7 @@ __all__ = [
     "ContextRetriever",
     "EntityExtractor",
     "ContextTokenMonitor",
+    "FileNameIndex",
+    "find_files_containing",
+    "get_filename_index",
 ]
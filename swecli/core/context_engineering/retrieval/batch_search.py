@@ -0,0 +1,281 @@
+"""Batched file search for context retrieval.
+
+``ContextRetriever`` needs two kinds of lookups per prompt: which files
+contain each extracted identifier, and where each mentioned file name lives.
+Both are done here in one pass each, instead of one repository scan per
+entity:
+
+- ``find_files_containing`` runs a single ``rg`` process with one ``-e`` per
+  pattern to find the matching lines, and attributes each line to every
+  pattern it contains. Without ripgrep it walks the tree once (honouring
+  ``.gitignore`` files, as ripgrep does) and matches all patterns with one
+  compiled alternation. Overlapping occurrences (``getUser`` and
+  ``UserManager`` in ``getUserManager``) are all reported.
+- ``get_filename_index`` builds a basename -> paths index once per workspace
+  and shares it between retrievers until it goes stale.
+
+Every call takes a ``deadline`` (``time.monotonic()`` seconds) and returns
+what it found so far when the deadline passes.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from swecli.core.context_engineering.tools.implementations.file_ops import DEFAULT_SEARCH_EXCLUDES
+from swecli.core.utils.ignore_rules import get_ignore_engine
+
+# Directories never worth scanning for context
+SKIPPED_DIRS = frozenset(name for name in DEFAULT_SEARCH_EXCLUDES if "*" not in name) | {
+    "__pycache__",
+    ".venv",
+    "venv",
+    ".tox",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+}
+
+MAX_SCAN_FILE_BYTES = 1024 * 1024
+# Seconds a shared file-name index is reused before it is rebuilt
+INDEX_MAX_AGE = 30.0
+
+
+def iter_files(root: Path, deadline: Optional[float] = None) -> Iterator[Path]:
+    """Files under ``root`` that are not gitignored or in ``SKIPPED_DIRS``, until ``deadline``."""
+    engine = get_ignore_engine(root, SKIPPED_DIRS)
+    stack = [(str(root), "")]
+    while stack:
+        if deadline is not None and time.monotonic() > deadline:
+            return
+        directory, relative = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                children = sorted(entries, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        subdirectories = []
+        for entry in children:
+            child = f"{relative}/{entry.name}" if relative else entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if not engine.skip_dir(child):
+                        subdirectories.append((entry.path, child))
+                elif entry.is_file() and not engine.is_ignored(child, is_dir=False):
+                    yield Path(entry.path)
+            except OSError:
+                continue
+        stack.extend(reversed(subdirectories))
+
+
+class FileNameIndex:
+    """Basename -> paths index of a workspace, built with one walk."""
+
+    def __init__(self, root: Path, deadline: Optional[float] = None) -> None:
+        """Build the index.
+
+        Args:
+            root: Workspace root
+            deadline: Stop walking at this ``time.monotonic()`` value; the
+                index is then marked incomplete
+        """
+        self.root = Path(root)
+        self.built_at = time.monotonic()
+        self._paths: dict[str, list[Path]] = {}
+        walked_to_end = True
+        for path in iter_files(self.root, deadline):
+            self._paths.setdefault(path.name, []).append(path)
+        if deadline is not None and time.monotonic() > deadline:
+            walked_to_end = False
+        self.complete = walked_to_end
+
+    def find(self, mention: str) -> Optional[Path]:
+        """Best file for a mentioned name or partial path (``"utils/io.py"``).
+
+        Candidates whose path ends with the whole mention win over ones that
+        only share the file name; ties go to the shallowest path.
+        """
+        mention_parts = Path(mention).parts
+        candidates = self._paths.get(Path(mention).name)
+        if not candidates:
+            return None
+        return min(
+            candidates,
+            key=lambda path: (path.parts[-len(mention_parts):] != mention_parts, len(path.parts), str(path)),
+        )
+
+
+_index_lock = threading.Lock()
+_indexes: dict[Path, FileNameIndex] = {}
+
+
+def get_filename_index(root: Path, deadline: Optional[float] = None, max_age: float = INDEX_MAX_AGE) -> FileNameIndex:
+    """Shared file-name index for ``root``, rebuilt when stale or incomplete."""
+    root = Path(root).resolve()
+    with _index_lock:
+        index = _indexes.get(root)
+        if index is not None and index.complete and time.monotonic() - index.built_at <= max_age:
+            return index
+    index = FileNameIndex(root, deadline)
+    with _index_lock:
+        _indexes[root] = index
+    return index
+
+
+class LiteralMatcher:
+    """Finds which of many literal patterns occur in a text, in one scan."""
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns = sorted({pattern for pattern in patterns if pattern}, key=len, reverse=True)
+        # A zero-width lookahead matches at every position, so occurrences that
+        # overlap ("getUser" and "UserManager" in "getUserManager") are all
+        # seen. Longest first, so at one position "UserManager" wins over
+        # "User", which it implies anyway.
+        self._regex = (
+            re.compile("(?=(" + "|".join(map(re.escape, self.patterns)) + "))") if self.patterns else None
+        )
+        # A match for one pattern is also a match for every pattern it contains
+        self._implied = {
+            pattern: [other for other in self.patterns if other in pattern] for pattern in self.patterns
+        }
+
+    def expand(self, matched: str) -> list[str]:
+        """Patterns satisfied by one reported match."""
+        return self._implied.get(matched, [])
+
+    def search(self, text: str) -> set[str]:
+        found: set[str] = set()
+        if self._regex is None:
+            return found
+        for match in self._regex.finditer(text):
+            found.update(self._implied[match.group(1)])
+            if len(found) == len(self.patterns):
+                break
+        return found
+
+
+def find_files_containing(
+    root: Path,
+    patterns: Iterable[str],
+    limit: int = 5,
+    deadline: Optional[float] = None,
+) -> dict[str, list[str]]:
+    """Up to ``limit`` files containing each literal pattern, from one scan.
+
+    Args:
+        root: Directory to search
+        patterns: Literal strings (identifiers extracted from a prompt)
+        limit: Files kept per pattern
+        deadline: ``time.monotonic()`` value after which the scan stops
+
+    Returns:
+        Mapping of each pattern to the paths of files containing it
+    """
+    matcher = LiteralMatcher(patterns)
+    results: dict[str, list[str]] = {pattern: [] for pattern in matcher.patterns}
+    if not matcher.patterns:
+        return results
+
+    ripgrep = shutil.which("rg")
+    if ripgrep:
+        try:
+            _search_with_ripgrep(ripgrep, Path(root), matcher, results, limit, deadline)
+            return results
+        except OSError:
+            pass
+    _search_in_process(Path(root), matcher, results, limit, deadline)
+    return results
+
+
+def _add(results: dict[str, list[str]], patterns: Iterable[str], path: str, limit: int) -> bool:
+    """Record ``path`` for ``patterns``; True once every pattern has ``limit`` files."""
+    for pattern in patterns:
+        paths = results[pattern]
+        if len(paths) < limit and path not in paths:
+            paths.append(path)
+    return all(len(paths) >= limit for paths in results.values())
+
+
+def _search_with_ripgrep(
+    ripgrep: str,
+    root: Path,
+    matcher: LiteralMatcher,
+    results: dict[str, list[str]],
+    limit: int,
+    deadline: Optional[float],
+) -> None:
+    command = [
+        ripgrep,
+        "--fixed-strings",
+        "--no-line-number",
+        "--with-filename",
+        "--null",
+        "--no-messages",
+        "--color",
+        "never",
+        "--max-filesize",
+        str(MAX_SCAN_FILE_BYTES),
+    ]
+    for pattern in matcher.patterns:
+        command += ["-e", pattern]
+    command += ["--", str(root)]
+
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    timer = None
+    if deadline is not None:
+        timer = threading.Timer(max(deadline - time.monotonic(), 0.0), process.kill)
+        timer.daemon = True
+        timer.start()
+    try:
+        assert process.stdout is not None
+        # rg reports matching lines; --only-matching would drop overlapping
+        # occurrences, so each line is re-scanned for every pattern it holds
+        for raw in process.stdout:
+            path, _, line = raw.rstrip(b"\n").partition(b"\0")
+            patterns = matcher.search(line.decode("utf-8", errors="replace"))
+            if patterns and _add(results, patterns, path.decode("utf-8", errors="replace"), limit):
+                break
+    finally:
+        if timer is not None:
+            timer.cancel()
+        if process.poll() is None:
+            process.kill()
+        process.stdout.close()
+        process.wait()
+
+
+def _search_in_process(
+    root: Path,
+    matcher: LiteralMatcher,
+    results: dict[str, list[str]],
+    limit: int,
+    deadline: Optional[float],
+) -> None:
+    for path in iter_files(root, deadline):
+        try:
+            if path.stat().st_size > MAX_SCAN_FILE_BYTES:
+                continue
+            data = path.read_bytes()
+        except OSError:
+            continue
+        if b"\0" in data[:1024]:
+            continue  # binary
+        found = matcher.search(data.decode("utf-8", errors="replace"))
+        if found and _add(results, found, str(path), limit):
+            return
+
+
+__all__ = [
+    "FileNameIndex",
+    "LiteralMatcher",
+    "find_files_containing",
+    "get_filename_index",
+    "iter_files",
+]
@@ -1,55 +1,234 @@
-"""Codebase indexer for generating concise OPENCLI.md summaries."""
+"""Codebase indexer for generating concise OPENCLI.md summaries.
+
+All sections come from one ``os.scandir`` traversal that honours nested
+``.gitignore`` files and skips dependency and cache directories. Directory
+listings are cached by directory mtime, so a repeated index only re-lists
+directories that gained or lost entries, and each section is rebuilt only
+when its inputs changed.
+"""
 
 from __future__ import annotations
 
+import fnmatch
+import hashlib
 import json
-import subprocess
+import os
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
+
+from swecli.core.utils.ignore_rules import get_ignore_engine
 
+from .batch_search import SKIPPED_DIRS
 from .token_monitor import ContextTokenMonitor
 
+KEY_FILE_PATTERNS = {
+    "Main": ["main.py", "index.js", "app.py", "server.py", "__init__.py"],
+    "Config": ["setup.py", "package.json", "pyproject.toml", "requirements.txt", "Dockerfile"],
+    "Tests": ["test_*.py", "*_test.py", "tests/", "spec/"],
+    "Docs": ["README.md", "CHANGELOG.md", "docs/"],
+}
+KEY_FILES_PER_CATEGORY = 5
+
+STRUCTURE_DEPTH = 2
+STRUCTURE_MAX_CHARS = 1500
+STRUCTURE_MAX_LINES = 30
+
+DEPENDENCY_FILES = ("requirements.txt", "package.json")
+# Memoized token counts kept per workspace before the memo is reset
+MAX_MEMOIZED_COUNTS = 4096
+README_NAMES = ("README.md", "README.rst", "README.txt", "README")
+
+
+@dataclass
+class _Listing:
+    """Cached contents of one directory."""
+
+    mtime_ns: int
+    files: List[str]
+    dirs: List[str]
+
+
+@dataclass
+class _Tree:
+    """What one traversal found (ignored entries already removed)."""
+
+    file_count: int = 0
+    # Relative directory path ("" for the root) -> (subdirectories, files), sorted
+    children: Dict[str, tuple[List[str], List[str]]] = field(default_factory=dict)
+    key_files: Dict[str, List[List[str]]] = field(default_factory=dict)
+    # Digest of every visited directory's mtime and the ignore rules' generation;
+    # changes when any listing or .gitignore changes
+    signature: str = ""
+
+
+@dataclass
+class _IndexCache:
+    listings: Dict[str, _Listing] = field(default_factory=dict)
+    sections: Dict[str, tuple[str, str]] = field(default_factory=dict)
+    tokens: Dict[str, int] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+_cache_lock = threading.Lock()
+_caches: Dict[Path, _IndexCache] = {}
+
+
+def _cache_for(root: Path) -> _IndexCache:
+    with _cache_lock:
+        return _caches.setdefault(root, _IndexCache())
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
 
 class CodebaseIndexer:
     """Generate concise codebase summaries for context."""
 
-    def __init__(self, working_dir: Optional[Path] = None) -> None:
-        self.working_dir = Path(working_dir or Path.cwd())
-        self.token_monitor = ContextTokenMonitor()
+    def __init__(
+        self,
+        working_dir: Optional[Path] = None,
+        token_counter: Optional[Callable[[str], int]] = None,
+    ) -> None:
+        """Initialize the indexer.
+
+        Args:
+            working_dir: Root of the codebase (defaults to the current directory)
+            token_counter: Counts tokens in a string (defaults to tiktoken via
+                ``ContextTokenMonitor``, loaded on first use)
+        """
+        self.working_dir = Path(working_dir or Path.cwd()).resolve()
+        self._token_counter = token_counter
+        self._token_monitor: Optional[ContextTokenMonitor] = None
         self.target_tokens = 3000
+        self._cache = _cache_for(self.working_dir)
+
+    @property
+    def token_monitor(self) -> ContextTokenMonitor:
+        if self._token_monitor is None:
+            self._token_monitor = ContextTokenMonitor()
+        return self._token_monitor
+
+    def count_tokens(self, text: str) -> int:
+        """Tokens in ``text``, memoized because sections repeat across runs."""
+        digest = hashlib.blake2b(text.encode("utf-8", errors="replace"), digest_size=16).hexdigest()
+        cached = self._cache.tokens.get(digest)
+        if cached is None:
+            counter = self._token_counter or self.token_monitor.count_tokens
+            cached = counter(text)
+            if len(self._cache.tokens) >= MAX_MEMOIZED_COUNTS:
+                self._cache.tokens.clear()
+            self._cache.tokens[digest] = cached
+        return cached
 
     def generate_index(self, max_tokens: int = 3000) -> str:
-        sections = []
-        sections.append(f"# {self.working_dir.name}\n")
-        sections.append(self._generate_overview())
-        sections.append(self._generate_structure())
-        sections.append(self._generate_key_files())
+        with self._cache.lock:
+            tree = self._walk()
+            sections = [
+                f"# {self.working_dir.name}\n",
+                self._section("overview", self._overview_key(tree), lambda: self._generate_overview(tree)),
+                self._section("structure", tree.signature, lambda: self._generate_structure(tree)),
+                self._section("key_files", tree.signature, lambda: self._generate_key_files(tree)),
+            ]
+            deps = self._section("dependencies", self._files_key(DEPENDENCY_FILES), self._generate_dependencies)
+            if deps:
+                sections.append(deps)
+            return self._fit(sections, max_tokens)
 
-        deps = self._generate_dependencies()
-        if deps:
-            sections.append(deps)
+    # --- Traversal -----------------------------------------------------------
 
-        content = "\n\n".join(sections)
-        tokens = self.token_monitor.count_tokens(content)
-        if tokens > max_tokens:
-            content = self._compress_content(content, max_tokens)
+    def _listing(self, directory: Path) -> Optional[_Listing]:
+        """Directory contents, re-listed only when the directory's mtime changed."""
+        key = str(directory)
+        mtime = _mtime_ns(directory)
+        if mtime is None:
+            self._cache.listings.pop(key, None)
+            return None
+        listing = self._cache.listings.get(key)
+        if listing is None or listing.mtime_ns != mtime:
+            files: List[str] = []
+            dirs: List[str] = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            (dirs if entry.is_dir(follow_symlinks=False) else files).append(entry.name)
+                        except OSError:
+                            continue
+            except OSError:
+                return None
+            listing = _Listing(mtime, sorted(files), sorted(dirs))
+            self._cache.listings[key] = listing
+        return listing
+
+    def _walk(self) -> _Tree:
+        tree = _Tree(key_files={category: [[] for _ in patterns] for category, patterns in KEY_FILE_PATTERNS.items()})
+        engine = get_ignore_engine(self.working_dir, SKIPPED_DIRS)
+        # An edited .gitignore does not touch its directory's mtime, so always re-check
+        engine.trie.revalidate(interval=0)
+        signature = hashlib.blake2b(digest_size=16)
+        signature.update(f"{engine.trie.generation}\n".encode())
+        seen: set[str] = set()
+        stack = [""]
+        while stack:
+            relative = stack.pop()
+            directory = self.working_dir / relative if relative else self.working_dir
+            listing = self._listing(directory)
+            if listing is None:
+                continue
+            seen.add(str(directory))
+            signature.update(f"{relative}\0{listing.mtime_ns}\n".encode())
+
+            dirs = [name for name in listing.dirs if not engine.skip_dir(_join(relative, name))]
+            files = [name for name in listing.files if not engine.is_ignored(_join(relative, name), is_dir=False)]
+            tree.children[relative] = (dirs, files)
+            tree.file_count += len(files)
+            self._collect_key_files(tree, relative, dirs, files)
+            stack.extend(_join(relative, name) for name in reversed(dirs))
+
+        # Forget listings of directories that were removed or are now ignored
+        for key in [key for key in self._cache.listings if key not in seen]:
+            del self._cache.listings[key]
+        tree.signature = signature.hexdigest()
+        return tree
+
+    @staticmethod
+    def _collect_key_files(tree: _Tree, relative: str, dirs: List[str], files: List[str]) -> None:
+        for category, patterns in KEY_FILE_PATTERNS.items():
+            for slot, pattern in enumerate(patterns):
+                found = tree.key_files[category][slot]
+                if len(found) >= KEY_FILES_PER_CATEGORY:
+                    continue
+                if pattern.endswith("/"):
+                    names = [name for name in dirs if name == pattern[:-1]]
+                else:
+                    names = fnmatch.filter(files, pattern)
+                found.extend(_join(relative, name) for name in names[: KEY_FILES_PER_CATEGORY - len(found)])
+
+    # --- Sections ------------------------------------------------------------
+
+    def _section(self, name: str, key: str, build: Callable[[], Optional[str]]) -> Optional[str]:
+        cached = self._cache.sections.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1] or None
+        content = build()
+        self._cache.sections[name] = (key, content or "")
         return content
 
-    def _generate_overview(self) -> str:
-        lines = ["## Overview\n"]
-        try:
-            result = subprocess.run(
-                ["find", ".", "-type", "f"],
-                capture_output=True,
-                text=True,
-                cwd=self.working_dir,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                file_count = len(result.stdout.strip().split("\n"))
-                lines.append(f"**Total Files:** {file_count}")
-        except Exception:
-            pass
+    def _files_key(self, names: tuple[str, ...]) -> str:
+        return "|".join(f"{name}:{_mtime_ns(self.working_dir / name)}" for name in names)
+
+    def _overview_key(self, tree: _Tree) -> str:
+        # File count and project type come from the root listing and the tree
+        return f"{tree.signature}|{self._files_key(README_NAMES)}"
+
+    def _generate_overview(self, tree: _Tree) -> str:
+        lines = ["## Overview\n", f"**Total Files:** {tree.file_count}"]
 
         readme_path = self._find_readme()
         if readme_path:
@@ -64,52 +243,38 @@ class CodebaseIndexer:
 
         return "\n".join(lines)
 
-    def _generate_structure(self) -> str:
-        lines = ["## Structure\n", "```"]
-        try:
-            result = subprocess.run(
-                [
-                    "tree",
-                    "-L",
-                    "2",
-                    "-I",
-                    "node_modules|__pycache__|.git|venv|build|dist",
-                ],
-                capture_output=True,
-                text=True,
-                cwd=self.working_dir,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                tree_output = result.stdout.strip()
-                if len(tree_output) > 1500:
-                    tree_output = "\n".join(tree_output.split("\n")[:30]) + "\n... (truncated)"
-                lines.append(tree_output)
-            else:
-                lines.append(self._basic_structure())
-        except FileNotFoundError:
-            lines.append(self._basic_structure())
-        except Exception:
-            lines.append("(Unable to generate structure)")
-
-        lines.append("```")
-        return "\n".join(lines)
+    def _generate_structure(self, tree: _Tree) -> str:
+        lines = ["."]
+        directory_count = file_count = 0
 
-    def _generate_key_files(self) -> str:
-        lines = ["## Key Files\n"]
-        key_patterns = {
-            "Main": ["main.py", "index.js", "app.py", "server.py", "__init__.py"],
-            "Config": ["setup.py", "package.json", "pyproject.toml", "requirements.txt", "Dockerfile"],
-            "Tests": ["test_*.py", "*_test.py", "tests/", "spec/"],
-            "Docs": ["README.md", "CHANGELOG.md", "docs/"],
-        }
+        def render(relative: str, prefix: str, depth: int) -> None:
+            nonlocal directory_count, file_count
+            dirs, files = tree.children.get(relative, ([], []))
+            entries = sorted([(name, True) for name in dirs] + [(name, False) for name in files])
+            for index, (name, is_dir) in enumerate(entries):
+                last = index == len(entries) - 1
+                lines.append(f"{prefix}{'└── ' if last else '├── '}{name}")
+                if is_dir:
+                    directory_count += 1
+                    if depth < STRUCTURE_DEPTH:
+                        render(_join(relative, name), prefix + ("    " if last else "│   "), depth + 1)
+                else:
+                    file_count += 1
 
-        for category, patterns in key_patterns.items():
-            found = self._find_files(patterns)
+        render("", "", 1)
+        lines.append(f"\n{directory_count} directories, {file_count} files")
+        structure = "\n".join(lines)
+        if len(structure) > STRUCTURE_MAX_CHARS:
+            structure = "\n".join(lines[:STRUCTURE_MAX_LINES]) + "\n... (truncated)"
+        return "\n".join(["## Structure\n", "```", structure, "```"])
+
+    def _generate_key_files(self, tree: _Tree) -> str:
+        lines = ["## Key Files\n"]
+        for category, slots in tree.key_files.items():
+            found = [path for slot in slots for path in slot]
             if found:
                 lines.append(f"\n### {category}")
-                for f in found[:5]:
-                    rel_path = f.relative_to(self.working_dir)
+                for rel_path in found[:KEY_FILES_PER_CATEGORY]:
                     lines.append(f"- `{rel_path}`")
 
         return "\n".join(lines)
@@ -150,7 +315,7 @@ class CodebaseIndexer:
         return "\n".join(lines)
 
     def _find_readme(self) -> Optional[Path]:
-        for pattern in ["README.md", "README.rst", "README.txt", "README"]:
+        for pattern in README_NAMES:
             readme = self.working_dir / pattern
             if readme.exists():
                 return readme
@@ -178,36 +343,33 @@ class CodebaseIndexer:
                 return project_type
         return None
 
-    def _find_files(self, patterns: List[str]) -> List[Path]:
-        matches: List[Path] = []
-        for pattern in patterns:
-            matches.extend(self.working_dir.glob(f"**/{pattern}"))
-        return matches
-
-    def _basic_structure(self) -> str:
-        try:
-            result = subprocess.run(
-                ["ls", "-R"],
-                capture_output=True,
-                text=True,
-                cwd=self.working_dir,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                output = result.stdout.strip()
-                if len(output) > 1200:
-                    output = "\n".join(output.split("\n")[:40]) + "\n... (truncated)"
-                return output
-        except Exception:
-            pass
-        return "(Unable to generate structure)"
+    # --- Token budget --------------------------------------------------------
+
+    def _fit(self, sections: List[str], max_tokens: int) -> str:
+        content = "\n\n".join(sections)
+        if self.count_tokens(content) <= max_tokens:
+            return content
+        return self._compress_content(content, max_tokens)
 
     def _compress_content(self, content: str, max_tokens: int) -> str:
-        paragraphs = content.split("\n\n")
+        """Keep whole paragraphs up to and including the one that reaches ``max_tokens``.
+
+        Paragraph counts are summed (plus the separator) instead of
+        re-tokenizing the growing prefix, which was quadratic.
+        """
+        separator_tokens = self.count_tokens("\n\n")
         compressed: List[str] = []
-        for paragraph in paragraphs:
+        tokens = 0
+        for paragraph in content.split("\n\n"):
+            if compressed:
+                tokens += separator_tokens
             compressed.append(paragraph)
-            tokens = self.token_monitor.count_tokens("\n\n".join(compressed))
+            tokens += self.count_tokens(paragraph)
             if tokens >= max_tokens:
                 break
         return "\n\n".join(compressed)
+
+
+def _join(relative: str, name: str) -> str:
+    return f"{relative}/{name}" if relative else name
+
@@ -3,10 +3,16 @@
 from __future__ import annotations
 
 import re
+import time
 
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from swecli.core.context_engineering.retrieval.batch_search import find_files_containing, get_filename_index
+
+# Seconds retrieve_context may spend on file lookups and content search
+DEFAULT_TIME_BUDGET = 2.0
+
 
 class EntityExtractor:
     """Extract entities (files, functions, classes) from user input."""
@@ -54,7 +60,9 @@ class EntityExtractor:
     PATTERNS = {
         "file_path": r"\b[\w\-_./]+\.(?:" + "|".join(FILE_EXTENSIONS) + r")\b",
         "function": r"\b(?:[a-z_][a-z0-9_]*|[a-z][a-zA-Z0-9]*)\s*\(",
-        "class": r"\b[A-Z][a-zA-Z0-9]*(?:Error|Exception|Manager|Service|Handler|Controller|Model|View|Component)?\b",
+        # CamelCase with at least two capitals and a lowercase letter: "UserManager",
+        # "HTTPClient"; plain capitalized words ("Please", "The") are prose, not classes
+        "class": r"\b(?=[A-Za-z0-9]*[a-z])[A-Z][a-z0-9]*[A-Z][A-Za-z0-9]*\b",
         "variable": r"\b(?:var|let|const|self|this)\s+([a-z_][a-z0-9_]*)\b",
         "action": r"\b(fix|debug|implement|create|add|remove|delete|update|modify|refactor|test|check|verify|optimize)\b",
     }
@@ -92,11 +100,13 @@ class EntityExtractor:
 class ContextRetriever:
     """Retrieve relevant context based on user intent."""
 
-    def __init__(self, working_dir: Optional[Path] = None) -> None:
+    def __init__(self, working_dir: Optional[Path] = None, time_budget: float = DEFAULT_TIME_BUDGET) -> None:
         self.working_dir = Path(working_dir or Path.cwd())
         self.extractor = EntityExtractor()
+        self.time_budget = time_budget
 
     def retrieve_context(self, user_input: str, max_files: int = 10) -> Dict[str, Any]:
+        deadline = time.monotonic() + self.time_budget
         entities = self.extractor.extract_entities(user_input)
         context: Dict[str, Any] = {
             "entities": entities,
@@ -106,7 +116,7 @@ class ContextRetriever:
         }
 
         for file_path in entities["files"]:
-            resolved = self._resolve_file_path(file_path)
+            resolved = self._resolve_file_path(file_path, deadline)
             if resolved:
                 context["files_found"].append(
                     {
@@ -116,10 +126,11 @@ class ContextRetriever:
                     }
                 )
 
+        # One scan for every entity instead of one per entity
         search_terms = entities["functions"] + entities["classes"]
+        matches = find_files_containing(self.working_dir, search_terms, limit=5, deadline=deadline)
         for term in search_terms:
-            matches = self._grep_pattern(term, limit=5)
-            for match in matches:
+            for match in matches.get(term, []):
                 if match not in [f["path"] for f in context["files_found"]]:
                     context["files_found"].append(
                         {
@@ -136,43 +147,13 @@ class ContextRetriever:
             context["suggestions"].append("Consider checking similar implementations")
 
         context["files_found"] = context["files_found"][:max_files]
+        context["budget_exhausted"] = time.monotonic() > deadline
         return context
 
-    def _resolve_file_path(self, file_path: str) -> Optional[Path]:
+    def _resolve_file_path(self, file_path: str, deadline: Optional[float] = None) -> Optional[Path]:
         path = self.working_dir / file_path
         if path.exists():
             return path
 
-        # Use native python traversal instead of subprocess find
-        target_name = Path(file_path).name
-        try:
-            for item in self.working_dir.rglob(target_name):
-                if item.is_file():
-                    return item
-        except Exception:
-            pass
-
-        return None
-
-    def _grep_pattern(self, pattern: str, limit: int = 5) -> List[str]:
-        try:
-            result = subprocess.run(
-                ["rg", "-l", pattern, str(self.working_dir)],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode != 0:
-                result = subprocess.run(
-                    ["grep", "-r", "-l", pattern, str(self.working_dir)],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-
-            if result.returncode == 0:
-                matches = [line.strip() for line in result.stdout.strip().split("\n") if line]
-                return matches[:limit]
-        except Exception:
-            pass
-        return []
+        # Look the name up in the shared index instead of walking the tree per mention
+        return get_filename_index(self.working_dir, deadline).find(file_path)
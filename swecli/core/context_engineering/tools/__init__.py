@@ -5,40 +5,20 @@ This package contains:
 - handlers/: High-level handlers that wrap implementations and add orchestration logic
 - registry.py: ToolRegistry that dispatches tool calls to handlers
 - context.py: ToolExecutionContext for passing dependencies to handlers
+
+Exports are resolved on first access so that CLI subcommands which never run
+a tool do not pay for importing every implementation.
 """
 
-from .context import ToolExecutionContext
-from .registry import ToolRegistry
-
-# Re-export implementations for convenience
-from .implementations import (
-    BaseTool,
-    BashTool,
-    Diff,
-    DiffPreview,
-    EditTool,
-    FileOperations,
-    OpenBrowserTool,
-    VLMTool,
-    WebFetchTool,
-    WebScreenshotTool,
-    WriteTool,
-)
-
-# Re-export handlers for convenience
-from .handlers import (
-    FileToolHandler,
-    ProcessToolHandler,
-    ScreenshotToolHandler,
-    TodoHandler,
-    TodoItem,
-    WebToolHandler,
-)
+from importlib import import_module
+from typing import Dict, Tuple
 
 __all__ = [
     # Core
     "ToolExecutionContext",
     "ToolRegistry",
+    "LazyTool",
+    "lazy_tools",
     # Implementations
     "BaseTool",
     "BashTool",
@@ -59,3 +39,39 @@ __all__ = [
     "TodoItem",
     "WebToolHandler",
 ]
+
+_IMPLEMENTATIONS = "swecli.core.context_engineering.tools.implementations"
+_HANDLERS = "swecli.core.context_engineering.tools.handlers"
+
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "ToolExecutionContext": ("swecli.core.context_engineering.tools.context", "ToolExecutionContext"),
+    "ToolRegistry": ("swecli.core.context_engineering.tools.registry", "ToolRegistry"),
+    "LazyTool": ("swecli.core.context_engineering.tools.lazy", "LazyTool"),
+    "lazy_tools": ("swecli.core.context_engineering.tools.lazy", "lazy_tools"),
+    "BaseTool": (_IMPLEMENTATIONS, "BaseTool"),
+    "BashTool": (_IMPLEMENTATIONS, "BashTool"),
+    "Diff": (_IMPLEMENTATIONS, "Diff"),
+    "DiffPreview": (_IMPLEMENTATIONS, "DiffPreview"),
+    "EditTool": (_IMPLEMENTATIONS, "EditTool"),
+    "FileOperations": (_IMPLEMENTATIONS, "FileOperations"),
+    "OpenBrowserTool": (_IMPLEMENTATIONS, "OpenBrowserTool"),
+    "VLMTool": (_IMPLEMENTATIONS, "VLMTool"),
+    "WebFetchTool": (_IMPLEMENTATIONS, "WebFetchTool"),
+    "WebScreenshotTool": (_IMPLEMENTATIONS, "WebScreenshotTool"),
+    "WriteTool": (_IMPLEMENTATIONS, "WriteTool"),
+    "FileToolHandler": (_HANDLERS, "FileToolHandler"),
+    "ProcessToolHandler": (_HANDLERS, "ProcessToolHandler"),
+    "ScreenshotToolHandler": (_HANDLERS, "ScreenshotToolHandler"),
+    "TodoHandler": (_HANDLERS, "TodoHandler"),
+    "TodoItem": (_HANDLERS, "TodoItem"),
+    "WebToolHandler": (_HANDLERS, "WebToolHandler"),
+}
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'swecli.core.context_engineering.tools' has no attribute '{name}'")
+    module_path, attr_name = _EXPORTS[name]
+    attr = getattr(import_module(module_path), attr_name)
+    globals()[name] = attr
+    return attr
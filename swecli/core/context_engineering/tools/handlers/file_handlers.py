@@ -8,7 +8,9 @@ from pathlib import Path
 from typing import Union, Any
 
 from swecli.core.context_engineering.tools.context import ToolExecutionContext
+from swecli.core.context_engineering.tools.implementations.paged_reader import describe_page
 from swecli.core.context_engineering.tools.path_utils import sanitize_path
+from swecli.core.runtime.monitoring.tracing import APPROVAL, get_tracer
 from swecli.models.operation import Operation, OperationType
 
 
@@ -56,6 +58,7 @@ class FileToolHandler:
 
         if write_result.success:
             if context.undo_manager:
+                operation.target = write_result.file_path
                 context.undo_manager.record_operation(operation)
 
             # Track file change in session
@@ -129,10 +132,14 @@ class FileToolHandler:
             new_content,
             match_all=match_all,
             backup=True,
+            snapshot_store=context.undo_manager.snapshots if context.undo_manager else None,
         )
 
         if edit_result.success:
             if context.undo_manager:
+                operation.target = edit_result.file_path
+                operation.parameters["before_snapshot"] = edit_result.before_snapshot
+                operation.parameters["after_snapshot"] = edit_result.after_snapshot
                 context.undo_manager.record_operation(operation)
 
             # Track file change in session
@@ -172,11 +179,29 @@ class FileToolHandler:
 
         file_path = sanitize_path(args["file_path"])
         try:
-            content = self._file_ops.read_file(file_path)
-            return {"success": True, "output": content, "error": None}
+            page = self._file_ops.read_file_page(
+                file_path,
+                offset=args.get("offset"),
+                limit=args.get("limit"),
+                byte_offset=args.get("byte_offset"),
+                max_bytes=args.get("max_bytes"),
+            )
         except Exception as exc:  # noqa: BLE001
             return {"success": False, "error": str(exc), "output": None}
 
+        output = page.content
+        footer = describe_page(page)
+        if footer:
+            output = f"{output.rstrip(chr(10))}\n\n{footer}"
+        return {
+            "success": True,
+            "output": output,
+            "error": None,
+            "total_lines": page.total_lines,
+            "next_offset": page.next_offset,
+            "next_byte_offset": page.next_byte_offset,
+        }
+
     def list_files(self, args: dict[str, Any]) -> dict[str, Any]:
         if not self._file_ops:
             return {"success": False, "error": "FileOperations not available"}
@@ -345,19 +370,20 @@ class FileToolHandler:
         try:
             asyncio.get_running_loop()
         except RuntimeError:
-            # Check if request_approval already returned a result (WebApprovalManager) or needs to be awaited
-            approval_result = approval_manager.request_approval(
-                operation=operation,
-                preview=preview,
-                **extra_kwargs,
-            )
+            with get_tracer().span(operation.type.value, APPROVAL, target=operation.target) as span:
+                # Check if request_approval already returned a result (WebApprovalManager) or needs to be awaited
+                approval_result = approval_manager.request_approval(
+                    operation=operation,
+                    preview=preview,
+                    **extra_kwargs,
+                )
 
-            # If it's already a result object, use it directly
-            if hasattr(approval_result, 'approved'):
-                return approval_result
-            else:
-                # If it's a coroutine, run it
-                return asyncio.run(approval_result)
+                # If it's already a result object, use it directly
+                if not hasattr(approval_result, 'approved'):
+                    # If it's a coroutine, run it
+                    approval_result = asyncio.run(approval_result)
+                span.set(approved=bool(approval_result.approved))
+            return approval_result
 
         operation.approved = True
         return None
@@ -8,6 +8,7 @@ from datetime import datetime
 from typing import Any
 
 from swecli.core.context_engineering.tools.context import ToolExecutionContext
+from swecli.core.runtime.monitoring.tracing import APPROVAL, get_tracer
 from swecli.models.operation import Operation, OperationType
 
 
@@ -183,21 +184,23 @@ class ProcessToolHandler:
         try:
             asyncio.get_running_loop()
         except RuntimeError:
-            # Check if request_approval already returned a result (WebApprovalManager) or needs to be awaited
-            approval_result = approval_manager.request_approval(
-                operation=operation,
-                preview=preview,
-                command=command,
-                working_dir=working_dir,
-                force_prompt=True,
-            )
-
-            # If it's already a result object, use it directly
-            if hasattr(approval_result, 'approved'):
-                result = approval_result
-            else:
-                # If it's a coroutine, run it
-                result = asyncio.run(approval_result)
+            with get_tracer().span(operation.type.value, APPROVAL, target=command) as span:
+                # Check if request_approval already returned a result (WebApprovalManager) or needs to be awaited
+                approval_result = approval_manager.request_approval(
+                    operation=operation,
+                    preview=preview,
+                    command=command,
+                    working_dir=working_dir,
+                    force_prompt=True,
+                )
+
+                # If it's already a result object, use it directly
+                if hasattr(approval_result, 'approved'):
+                    result = approval_result
+                else:
+                    # If it's a coroutine, run it
+                    result = asyncio.run(approval_result)
+                span.set(approved=bool(result.approved))
 
             if not result.approved:
                 return False
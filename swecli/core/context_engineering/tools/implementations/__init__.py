@@ -1,15 +1,11 @@
-"""Tool implementations for SWE-CLI."""
+"""Tool implementations for SWE-CLI.
 
-from swecli.core.context_engineering.tools.implementations.base import BaseTool
-from swecli.core.context_engineering.tools.implementations.bash_tool import BashTool
-from swecli.core.context_engineering.tools.implementations.diff_preview import Diff, DiffPreview
-from swecli.core.context_engineering.tools.implementations.edit_tool import EditTool
-from swecli.core.context_engineering.tools.implementations.file_ops import FileOperations
-from swecli.core.context_engineering.tools.implementations.open_browser_tool import OpenBrowserTool
-from swecli.core.context_engineering.tools.implementations.vlm_tool import VLMTool
-from swecli.core.context_engineering.tools.implementations.web_fetch_tool import WebFetchTool
-from swecli.core.context_engineering.tools.implementations.web_screenshot_tool import WebScreenshotTool
-from swecli.core.context_engineering.tools.implementations.write_tool import WriteTool
+Each implementation is imported on first access, so code that only needs one
+tool (or none, like most CLI subcommands) does not import them all.
+"""
+
+from importlib import import_module
+from typing import Dict, Tuple
 
 __all__ = [
     "BaseTool",
@@ -24,3 +20,28 @@ __all__ = [
     "WebScreenshotTool",
     "WriteTool",
 ]
+
+_PACKAGE = "swecli.core.context_engineering.tools.implementations"
+
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "BaseTool": (f"{_PACKAGE}.base", "BaseTool"),
+    "BashTool": (f"{_PACKAGE}.bash_tool", "BashTool"),
+    "Diff": (f"{_PACKAGE}.diff_preview", "Diff"),
+    "DiffPreview": (f"{_PACKAGE}.diff_preview", "DiffPreview"),
+    "EditTool": (f"{_PACKAGE}.edit_tool", "EditTool"),
+    "FileOperations": (f"{_PACKAGE}.file_ops", "FileOperations"),
+    "OpenBrowserTool": (f"{_PACKAGE}.open_browser_tool", "OpenBrowserTool"),
+    "VLMTool": (f"{_PACKAGE}.vlm_tool", "VLMTool"),
+    "WebFetchTool": (f"{_PACKAGE}.web_fetch_tool", "WebFetchTool"),
+    "WebScreenshotTool": (f"{_PACKAGE}.web_screenshot_tool", "WebScreenshotTool"),
+    "WriteTool": (f"{_PACKAGE}.write_tool", "WriteTool"),
+}
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module '{_PACKAGE}' has no attribute '{name}'")
+    module_path, attr_name = _EXPORTS[name]
+    attr = getattr(import_module(module_path), attr_name)
+    globals()[name] = attr
+    return attr
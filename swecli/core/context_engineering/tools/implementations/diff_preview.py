@@ -1,15 +1,26 @@
 """Diff preview system for showing file changes."""
 
-import difflib
 from typing import Optional
 
 from rich.console import Console
 from rich.syntax import Syntax
 from rich.panel import Panel
 
+from swecli.core.context_engineering.tools.implementations.line_diff import (
+    EditSpan,
+    Opcode,
+    compute_opcodes,
+    opcode_stats,
+    unified_diff_lines,
+)
+
 
 class Diff:
-    """Represents a diff between two file versions."""
+    """Represents a diff between two file versions.
+
+    Opcodes are computed once by the line diff engine and shared by
+    ``get_stats`` and ``generate_unified_diff``.
+    """
 
     def __init__(
         self,
@@ -18,6 +29,7 @@ class Diff:
         modified: str,
         original_lines: Optional[list[str]] = None,
         modified_lines: Optional[list[str]] = None,
+        span: Optional[EditSpan] = None,
     ):
         """Initialize diff.
 
@@ -27,12 +39,21 @@ class Diff:
             modified: Modified content
             original_lines: Original lines (computed if not provided)
             modified_lines: Modified lines (computed if not provided)
+            span: Line window known to contain every change (see ``edit_span``)
         """
         self.file_path = file_path
         self.original = original
         self.modified = modified
         self.original_lines = original_lines or original.splitlines(keepends=True)
         self.modified_lines = modified_lines or modified.splitlines(keepends=True)
+        self.span = span
+        self._opcodes: Optional[list[Opcode]] = None
+
+    def get_opcodes(self) -> list[Opcode]:
+        """Return difflib-style opcodes, computing them on first use."""
+        if self._opcodes is None:
+            self._opcodes = compute_opcodes(self.original_lines, self.modified_lines, self.span)
+        return self._opcodes
 
     def generate_unified_diff(self, context_lines: int = 3) -> str:
         """Generate unified diff format.
@@ -43,13 +64,14 @@ class Diff:
         Returns:
             Unified diff string
         """
-        diff = difflib.unified_diff(
+        diff = unified_diff_lines(
             self.original_lines,
             self.modified_lines,
+            self.get_opcodes(),
             fromfile=f"a/{self.file_path}",
             tofile=f"b/{self.file_path}",
+            context_lines=context_lines,
             lineterm="",
-            n=context_lines,
         )
         return "\n".join(diff)
 
@@ -59,20 +81,7 @@ class Diff:
         Returns:
             Dict with lines_added, lines_removed, lines_changed
         """
-        diff = list(
-            difflib.unified_diff(
-                self.original_lines, self.modified_lines, lineterm=""
-            )
-        )
-
-        added = sum(1 for line in diff if line.startswith("+") and not line.startswith("+++"))
-        removed = sum(1 for line in diff if line.startswith("-") and not line.startswith("---"))
-
-        return {
-            "lines_added": added,
-            "lines_removed": removed,
-            "lines_changed": added + removed,
-        }
+        return opcode_stats(self.get_opcodes())
 
 
 class DiffPreview:
@@ -87,7 +96,11 @@ class DiffPreview:
         self.console = console or Console()
 
     def generate_diff(
-        self, file_path: str, original: str, modified: str
+        self,
+        file_path: str,
+        original: str,
+        modified: str,
+        span: Optional[EditSpan] = None,
     ) -> Diff:
         """Generate a diff object.
 
@@ -95,11 +108,12 @@ class DiffPreview:
             file_path: Path to file
             original: Original content
             modified: Modified content
+            span: Line window known to contain every change
 
         Returns:
             Diff object
         """
-        return Diff(file_path, original, modified)
+        return Diff(file_path, original, modified, span=span)
 
     def render_diff(
         self,
@@ -172,6 +186,7 @@ class DiffPreview:
         original: str,
         modified: str,
         syntax_highlight: bool = True,
+        span: Optional[EditSpan] = None,
     ) -> None:
         """Preview an edit operation.
 
@@ -180,6 +195,7 @@ class DiffPreview:
             original: Original content
             modified: Modified content
             syntax_highlight: Whether to syntax highlight
+            span: Line window known to contain every change
         """
-        diff = self.generate_diff(file_path, original, modified)
+        diff = self.generate_diff(file_path, original, modified, span=span)
         self.display_diff(diff, syntax_highlight=syntax_highlight)
@@ -1,13 +1,13 @@
 """Tool for editing existing files."""
 
-import shutil
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from swecli.models.config import AppConfig
 from swecli.models.operation import EditResult, Operation
 from swecli.core.context_engineering.tools.implementations.base import BaseTool
 from swecli.core.context_engineering.tools.implementations.diff_preview import DiffPreview, Diff
+from swecli.core.context_engineering.tools.implementations.line_diff import edit_span
 
 
 class EditTool(BaseTool):
@@ -104,6 +104,7 @@ class EditTool(BaseTool):
         dry_run: bool = False,
         backup: bool = True,
         operation: Optional[Operation] = None,
+        snapshot_store: Optional[Any] = None,
     ) -> EditResult:
         """Edit file by replacing old_content with new_content.
 
@@ -113,8 +114,9 @@ class EditTool(BaseTool):
             new_content: New content to insert
             match_all: Replace all occurrences (default: first only)
             dry_run: If True, don't actually modify file
-            backup: Create backup before editing
+            backup: Snapshot the file into ``snapshot_store`` before editing
             operation: Operation object for tracking
+            snapshot_store: Undo ``SnapshotStore`` receiving before/after content
 
         Returns:
             EditResult with operation details
@@ -193,13 +195,16 @@ class EditTool(BaseTool):
                 )
 
             # Perform replacement
+            span = None
             if match_all:
                 modified = original.replace(old_content, new_content)
             else:
-                modified = original.replace(old_content, new_content, 1)
+                offset = original.find(old_content)
+                modified = original[:offset] + new_content + original[offset + len(old_content):]
+                span = edit_span(original, modified, offset, len(old_content), len(new_content))
 
-            # Calculate diff statistics and textual diff
-            diff = Diff(str(path), original, modified)
+            # Calculate diff statistics and textual diff (one pass over the edit window)
+            diff = Diff(str(path), original, modified, span=span)
             stats = diff.get_stats()
             diff_text = diff.generate_unified_diff(context_lines=3)
 
@@ -218,11 +223,13 @@ class EditTool(BaseTool):
             if operation:
                 operation.mark_executing()
 
-            # Create backup if requested
-            backup_path = None
-            if backup and self.config.operation.backup_before_edit:
-                backup_path = str(path) + ".bak"
-                shutil.copy2(path, backup_path)
+            # Snapshot both versions into the undo store
+            before_snapshot = after_snapshot = None
+            if backup and snapshot_store is not None and self.config.operation.backup_before_edit:
+                before_snapshot, after_snapshot = snapshot_store.put_version(
+                    path.read_bytes(),
+                    modified.encode("utf-8"),
+                )
 
             # Write modified content
             with open(path, "w", encoding="utf-8") as f:
@@ -237,7 +244,8 @@ class EditTool(BaseTool):
                 file_path=str(path),
                 lines_added=stats["lines_added"],
                 lines_removed=stats["lines_removed"],
-                backup_path=backup_path,
+                before_snapshot=before_snapshot,
+                after_snapshot=after_snapshot,
                 diff=diff_text,
                 operation_id=operation.id if operation else None,
             )
@@ -383,10 +391,15 @@ class EditTool(BaseTool):
             original = f.read()
 
         # Generate modified
-        modified = original.replace(old_content, new_content, 1)
+        offset = original.find(old_content)
+        if offset < 0:
+            modified, span = original, None
+        else:
+            modified = original[:offset] + new_content + original[offset + len(old_content):]
+            span = edit_span(original, modified, offset, len(old_content), len(new_content))
 
         # Display diff
-        self.diff_preview.preview_edit(str(path), original, modified)
+        self.diff_preview.preview_edit(str(path), original, modified, span=span)
 
     def _resolve_path(self, path: str) -> Path:
         """Resolve a path relative to working directory.
@@ -6,6 +6,12 @@ from pathlib import Path
 from typing import Optional
 
 from swecli.models.config import AppConfig
+from swecli.core.utils.ignore_rules import IgnoreEngine, get_ignore_engine
+from swecli.core.context_engineering.tools.implementations.paged_reader import (
+    FilePage,
+    get_line_index,
+    read_page,
+)
 
 # Default directories/patterns to exclude from search
 # Covers 20+ programming languages and ecosystems
@@ -141,19 +147,23 @@ class FileOperations:
         self.config = config
         self.working_dir = working_dir
 
+    def _ignore_engine(self) -> IgnoreEngine:
+        """Shared ignore rules (.gitignore files plus default excludes) of the working directory."""
+        return get_ignore_engine(self.working_dir, DEFAULT_SEARCH_EXCLUDES)
+
     def _is_excluded_path(self, file_path: str) -> bool:
-        """Check if path contains any excluded directory or matches excluded patterns."""
+        """Check if a file is gitignored, inside an excluded directory or matches excluded patterns."""
+        engine = self._ignore_engine()
         path_obj = Path(file_path)
-        path_parts = path_obj.parts
-
-        for exclude in DEFAULT_SEARCH_EXCLUDES:
-            if exclude.startswith("*"):
-                # Glob pattern like *.min.js
-                if path_obj.match(exclude):
-                    return True
-            elif exclude in path_parts:
-                return True
-        return False
+        if path_obj.is_absolute():
+            for root in (Path(self.working_dir), engine.root):
+                if path_obj.is_relative_to(root):
+                    path_obj = path_obj.relative_to(root)
+                    break
+            else:
+                # Outside the workspace only the default excludes apply
+                return any(engine.is_excluded_name(part) for part in path_obj.parts)
+        return engine.is_ignored(path_obj, is_dir=False)
 
     def read_file(self, file_path: str, line_start: Optional[int] = None,
                   line_end: Optional[int] = None) -> str:
@@ -180,14 +190,56 @@ class FileOperations:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {path}")
 
+        if line_start is not None or line_end is not None:
+            # Slice the requested lines via the cached line index instead of
+            # materialising every line of the file.
+            index = get_line_index(path)
+            start = min(max(0, (line_start - 1) if line_start else 0), index.total_lines)
+            end = min(index.total_lines, line_end) if line_end else index.total_lines
+            if end <= start:
+                return ""
+            with open(path, "rb") as f:
+                f.seek(index.offsets[start])
+                data = f.read(index.offsets[end] - index.offsets[start])
+            return data.decode("utf-8", errors="ignore")
+
         with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            if line_start is not None or line_end is not None:
-                lines = f.readlines()
-                start = (line_start - 1) if line_start else 0
-                end = line_end if line_end else len(lines)
-                return "".join(lines[start:end])
             return f.read()
 
+    def read_file_page(
+        self,
+        file_path: str,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+        byte_offset: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> FilePage:
+        """Read one bounded page of a file.
+
+        Args:
+            file_path: Path to the file (relative or absolute)
+            offset: 1-indexed first line to return
+            limit: Maximum number of lines to return
+            byte_offset: Page by raw bytes from this offset instead of by lines
+            max_bytes: Output byte budget (defaults to ``DEFAULT_MAX_READ_BYTES``)
+
+        Returns:
+            FilePage with the content and a cursor for the next page
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            PermissionError: If file read is not permitted
+        """
+        path = self._resolve_path(file_path)
+
+        if not self.config.permissions.file_read.is_allowed(str(path)):
+            raise PermissionError(f"Reading {path} is not permitted")
+
+        if not path.is_file():
+            raise FileNotFoundError(f"File not found: {path}")
+
+        return read_page(path, offset=offset, limit=limit, byte_offset=byte_offset, max_bytes=max_bytes)
+
     def glob_files(
         self,
         pattern: str,
@@ -0,0 +1,274 @@
+"""Single-pass line diff engine used by edit previews and diff statistics.
+
+The engine interns lines to integers, trims the common prefix and suffix (or
+starts from a known edit window), and runs Myers' O(ND) algorithm on what is
+left. Opcodes use the same ``(tag, i1, i2, j1, j2)`` shape as
+``difflib.SequenceMatcher.get_opcodes`` so statistics and unified output can
+both be derived from one opcode stream.
+"""
+
+from __future__ import annotations
+
+import difflib
+from typing import Iterator, Optional, Sequence
+
+Opcode = tuple[str, int, int, int, int]
+EditSpan = tuple[int, int, int, int]
+
+# Beyond this many edits inside the window Myers' trace gets expensive; the
+# remaining window is handed to difflib over interned integers instead.
+MAX_MYERS_COST = 2000
+
+
+def edit_span(
+    original: str,
+    modified: str,
+    offset: int,
+    old_length: int,
+    new_length: int,
+) -> EditSpan:
+    """Line window touched by replacing ``original[offset:offset + old_length]``.
+
+    Lines outside the returned ``(a_start, a_end, b_start, b_end)`` window are
+    identical in both versions, so only the window needs diffing.
+
+    Args:
+        original: Content before the edit
+        modified: Content after the edit
+        offset: Character offset where the replacement starts
+        old_length: Length of the replaced text
+        new_length: Length of the inserted text
+    """
+    start = original.count("\n", 0, offset)
+    a_end = start + original.count("\n", offset, offset + old_length) + 1
+    b_end = start + modified.count("\n", offset, offset + new_length) + 1
+    return (start, a_end, start, b_end)
+
+
+def compute_opcodes(
+    a: Sequence[str],
+    b: Sequence[str],
+    span: Optional[EditSpan] = None,
+) -> list[Opcode]:
+    """Compute difflib-style opcodes turning ``a`` into ``b``.
+
+    Args:
+        a: Original lines
+        b: Modified lines
+        span: Optional window known to contain every change (see ``edit_span``)
+
+    Returns:
+        List of ``(tag, i1, i2, j1, j2)`` tuples covering both sequences
+    """
+    n, m = len(a), len(b)
+    a_lo, a_hi, b_lo, b_hi = 0, n, 0, m
+
+    if span is not None:
+        s_a_lo, s_a_hi, s_b_lo, s_b_hi = span
+        s_a_hi, s_b_hi = min(s_a_hi, n), min(s_b_hi, m)
+        # Only trust the window if the untouched tails line up.
+        if 0 <= s_a_lo == s_b_lo <= min(s_a_hi, s_b_hi) and n - s_a_hi == m - s_b_hi:
+            a_lo, a_hi, b_lo, b_hi = s_a_lo, s_a_hi, s_b_lo, s_b_hi
+
+    while a_lo < a_hi and b_lo < b_hi and a[a_lo] == b[b_lo]:
+        a_lo += 1
+        b_lo += 1
+    while a_hi > a_lo and b_hi > b_lo and a[a_hi - 1] == b[b_hi - 1]:
+        a_hi -= 1
+        b_hi -= 1
+
+    opcodes: list[Opcode] = []
+    if a_lo > 0:
+        opcodes.append(("equal", 0, a_lo, 0, b_lo))
+    opcodes.extend(_diff_window(a, b, a_lo, a_hi, b_lo, b_hi))
+    if a_hi < n:
+        opcodes.append(("equal", a_hi, n, b_hi, m))
+    return _merge_adjacent(opcodes)
+
+
+def _diff_window(
+    a: Sequence[str],
+    b: Sequence[str],
+    a_lo: int,
+    a_hi: int,
+    b_lo: int,
+    b_hi: int,
+) -> list[Opcode]:
+    """Diff ``a[a_lo:a_hi]`` against ``b[b_lo:b_hi]`` (no common prefix/suffix)."""
+    if a_lo == a_hi and b_lo == b_hi:
+        return []
+    if a_lo == a_hi:
+        return [("insert", a_lo, a_lo, b_lo, b_hi)]
+    if b_lo == b_hi:
+        return [("delete", a_lo, a_hi, b_lo, b_lo)]
+
+    # Intern lines to small ints so comparisons are pointer-cheap.
+    interned: dict[str, int] = {}
+    a_ids = [interned.setdefault(line, len(interned)) for line in a[a_lo:a_hi]]
+    b_ids = [interned.setdefault(line, len(interned)) for line in b[b_lo:b_hi]]
+
+    window = _myers(a_ids, b_ids, MAX_MYERS_COST)
+    if window is None:
+        matcher = difflib.SequenceMatcher(None, a_ids, b_ids, autojunk=False)
+        window = matcher.get_opcodes()
+
+    return [
+        (tag, i1 + a_lo, i2 + a_lo, j1 + b_lo, j2 + b_lo)
+        for tag, i1, i2, j1, j2 in window
+    ]
+
+
+def _myers(a: list[int], b: list[int], max_cost: int) -> Optional[list[Opcode]]:
+    """Shortest edit script via Myers' greedy algorithm, or None if too costly."""
+    n, m = len(a), len(b)
+    v = {1: 0}
+    trace: list[dict[int, int]] = []
+
+    for d in range(min(n + m, max_cost) + 1):
+        trace.append(dict(v))
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]
+            else:
+                x = v[k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= n and y >= m:
+                return _opcodes_from_trace(trace, n, m)
+    return None
+
+
+def _opcodes_from_trace(trace: list[dict[int, int]], n: int, m: int) -> list[Opcode]:
+    """Walk the Myers trace backwards and emit opcodes in forward order."""
+    steps: list[Opcode] = []
+    x, y = n, m
+    for d in range(len(trace) - 1, 0, -1):
+        v = trace[d]
+        k = x - y
+        if k == -d or (k != d and v[k - 1] < v[k + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v[prev_k]
+        prev_y = prev_x - prev_k
+
+        if prev_k == k + 1:
+            mid_x, mid_y = prev_x, prev_y + 1
+            edit = ("insert", prev_x, prev_x, prev_y, mid_y)
+        else:
+            mid_x, mid_y = prev_x + 1, prev_y
+            edit = ("delete", prev_x, mid_x, prev_y, prev_y)
+
+        if x > mid_x:
+            steps.append(("equal", mid_x, x, mid_y, y))
+        steps.append(edit)
+        x, y = prev_x, prev_y
+
+    if x > 0:
+        steps.append(("equal", 0, x, 0, y))
+
+    steps.reverse()
+    return _merge_adjacent(steps)
+
+
+def _merge_adjacent(opcodes: list[Opcode]) -> list[Opcode]:
+    """Merge contiguous runs and fold delete/insert pairs into ``replace``."""
+    merged: list[Opcode] = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if i1 == i2 and j1 == j2:
+            continue
+        if merged:
+            p_tag, p_i1, p_i2, p_j1, p_j2 = merged[-1]
+            if p_tag == tag or (p_tag != "equal" and tag != "equal"):
+                new_tag = tag if p_tag == tag else "replace"
+                merged[-1] = (new_tag, p_i1, i2, p_j1, j2)
+                continue
+        merged.append((tag, i1, i2, j1, j2))
+    return merged
+
+
+def group_opcodes(opcodes: list[Opcode], context_lines: int = 3) -> Iterator[list[Opcode]]:
+    """Group opcodes into hunks with ``context_lines`` of context (as difflib does)."""
+    codes = list(opcodes) or [("equal", 0, 1, 0, 1)]
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = (tag, max(i1, i2 - context_lines), i2, max(j1, j2 - context_lines), j2)
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = (tag, i1, min(i2, i1 + context_lines), j1, min(j2, j1 + context_lines))
+
+    span = context_lines + context_lines
+    group: list[Opcode] = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > span:
+            group.append((tag, i1, min(i2, i1 + context_lines), j1, min(j2, j1 + context_lines)))
+            yield group
+            group = []
+            i1, j1 = max(i1, i2 - context_lines), max(j1, j2 - context_lines)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+
+def _format_range(start: int, stop: int) -> str:
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def unified_diff_lines(
+    a: Sequence[str],
+    b: Sequence[str],
+    opcodes: list[Opcode],
+    fromfile: str = "",
+    tofile: str = "",
+    context_lines: int = 3,
+    lineterm: str = "\n",
+) -> Iterator[str]:
+    """Yield unified diff lines from precomputed opcodes (difflib-compatible output)."""
+    started = False
+    for group in group_opcodes(opcodes, context_lines):
+        if not started:
+            started = True
+            yield f"--- {fromfile}{lineterm}"
+            yield f"+++ {tofile}{lineterm}"
+
+        first, last = group[0], group[-1]
+        file1_range = _format_range(first[1], last[2])
+        file2_range = _format_range(first[3], last[4])
+        yield f"@@ -{file1_range} +{file2_range} @@{lineterm}"
+
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                for line in a[i1:i2]:
+                    yield " " + line
+                continue
+            if tag in ("replace", "delete"):
+                for line in a[i1:i2]:
+                    yield "-" + line
+            if tag in ("replace", "insert"):
+                for line in b[j1:j2]:
+                    yield "+" + line
+
+
+def opcode_stats(opcodes: list[Opcode]) -> dict[str, int]:
+    """Count added and removed lines from an opcode stream."""
+    added = 0
+    removed = 0
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag in ("replace", "delete"):
+            removed += i2 - i1
+        if tag in ("replace", "insert"):
+            added += j2 - j1
+    return {
+        "lines_added": added,
+        "lines_removed": removed,
+        "lines_changed": added + removed,
+    }
@@ -0,0 +1,266 @@
+"""Paged file reads backed by a memory-mapped line-offset index.
+
+Line offsets are computed once per ``(path, mtime, size)`` by scanning an
+``mmap`` of the file and kept in a small LRU cache, so reading lines
+40,000-40,200 of a 50 MB log only touches those bytes. Every page is bounded
+by a byte budget; when a whole-file read would exceed it, the middle of the
+file is elided and the caller gets a cursor for the next page.
+"""
+
+from __future__ import annotations
+
+import mmap
+import re
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_MAX_READ_BYTES = 100_000
+INDEX_CACHE_SIZE = 32
+
+_NEWLINE = re.compile(rb"\n")
+_SCAN_CHUNK = 4 * 1024 * 1024
+
+
+class LineIndex:
+    """Byte offsets of every line start in a file (plus the end-of-file offset)."""
+
+    def __init__(self, offsets: array, size: int):
+        self.offsets = offsets
+        self.size = size
+
+    @property
+    def total_lines(self) -> int:
+        return len(self.offsets) - 1
+
+    def line_at(self, byte_offset: int) -> int:
+        """0-based line containing ``byte_offset``."""
+        return max(0, bisect_right(self.offsets, byte_offset) - 1)
+
+    @classmethod
+    def build(cls, path: Path) -> "LineIndex":
+        size = path.stat().st_size
+        offsets = array("q", [0])
+        if size == 0:
+            return cls(array("q", [0]), 0)
+
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for chunk_start in range(0, size, _SCAN_CHUNK):
+                chunk = mm[chunk_start:chunk_start + _SCAN_CHUNK]
+                offsets.extend(chunk_start + m.end() for m in _NEWLINE.finditer(chunk))
+
+        # The final entry is always EOF so line i spans offsets[i]:offsets[i + 1].
+        if offsets[-1] != size:
+            offsets.append(size)
+        return cls(offsets, size)
+
+
+_index_cache: "OrderedDict[tuple[str, int, int], LineIndex]" = OrderedDict()
+_index_lock = threading.Lock()
+
+
+def get_line_index(path: Path) -> LineIndex:
+    """Return the cached line index for ``path``, rebuilding it if the file changed."""
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    with _index_lock:
+        index = _index_cache.get(key)
+        if index is not None:
+            _index_cache.move_to_end(key)
+            return index
+
+    index = LineIndex.build(path)
+    with _index_lock:
+        _index_cache[key] = index
+        _index_cache.move_to_end(key)
+        while len(_index_cache) > INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    return index
+
+
+@dataclass
+class FilePage:
+    """One bounded page of a file read."""
+
+    content: str
+    start_line: int  # 1-indexed, inclusive
+    end_line: int  # 1-indexed, inclusive (0 for an empty page)
+    total_lines: int
+    total_bytes: int
+    next_offset: Optional[int] = None  # Line to pass as ``offset`` for the next page
+    next_byte_offset: Optional[int] = None  # Byte cursor when paging inside long lines
+    elided_lines: int = 0
+
+    @property
+    def is_complete(self) -> bool:
+        return self.next_offset is None and self.next_byte_offset is None and not self.elided_lines
+
+
+def read_page(
+    path: Path,
+    offset: Optional[int] = None,
+    limit: Optional[int] = None,
+    byte_offset: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+) -> FilePage:
+    """Read a page of ``path`` by lines (``offset``/``limit``) or by bytes.
+
+    Args:
+        path: Resolved file path
+        offset: 1-indexed first line (default 1)
+        limit: Maximum number of lines; when omitted (or not positive) the
+            whole remainder is requested and head/tail elision applies if it
+            exceeds the budget
+        byte_offset: Read raw bytes from here instead of whole lines
+        max_bytes: Output byte budget (default ``DEFAULT_MAX_READ_BYTES``)
+
+    Raises:
+        ValueError: If ``offset`` or ``byte_offset`` is past the end of the file
+    """
+    budget = max(1, max_bytes or DEFAULT_MAX_READ_BYTES)
+    index = get_line_index(path)
+    offsets = index.offsets
+    total = index.total_lines
+    if limit is not None and limit <= 0:
+        limit = None
+    if offset is not None and offset > max(total, 1):
+        raise ValueError(f"offset={offset} is past the end of the file ({total} lines)")
+    if byte_offset is not None and byte_offset > index.size:
+        raise ValueError(f"byte_offset={byte_offset} is past the end of the file ({index.size} bytes)")
+
+    if index.size == 0:
+        return FilePage("", 1, 0, 0, 0)
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if byte_offset is not None:
+            return _byte_page(mm, index, max(0, byte_offset), budget)
+
+        start = min(max(0, (offset or 1) - 1), total)
+        stop = total if limit is None else min(total, start + limit)
+        byte_start, byte_end = offsets[start], offsets[stop]
+
+        if byte_end - byte_start <= budget:
+            return FilePage(
+                content=_decode(mm[byte_start:byte_end]),
+                start_line=start + 1,
+                end_line=stop,
+                total_lines=total,
+                total_bytes=index.size,
+                next_offset=stop + 1 if stop < total else None,
+            )
+
+        if limit is not None:
+            return _truncated_page(mm, index, start, byte_start, budget)
+        return _elided_page(mm, index, start, stop, budget)
+
+
+def _decode(data: bytes) -> str:
+    return data.decode("utf-8", errors="ignore")
+
+
+def _fitting_stop(offsets: array, start: int, byte_start: int, budget: int) -> int:
+    """Largest line index ``stop`` such that lines ``start:stop`` fit in ``budget``."""
+    return max(start, bisect_right(offsets, byte_start + budget) - 1)
+
+
+def _truncated_page(mm: mmap.mmap, index: LineIndex, start: int, byte_start: int, budget: int) -> FilePage:
+    offsets = index.offsets
+    stop = _fitting_stop(offsets, start, byte_start, budget)
+    if stop == start:
+        # A single line longer than the budget: fall back to byte paging.
+        return _byte_page(mm, index, byte_start, budget)
+    return FilePage(
+        content=_decode(mm[byte_start:offsets[stop]]),
+        start_line=start + 1,
+        end_line=stop,
+        total_lines=index.total_lines,
+        total_bytes=index.size,
+        next_offset=stop + 1,
+    )
+
+
+def _elided_page(mm: mmap.mmap, index: LineIndex, start: int, stop: int, budget: int) -> FilePage:
+    offsets = index.offsets
+    head_budget = budget * 2 // 3
+    tail_budget = budget - head_budget
+
+    head_stop = _fitting_stop(offsets, start, offsets[start], head_budget)
+    tail_start = bisect_left(offsets, offsets[stop] - tail_budget)
+    tail_start = min(max(tail_start, head_stop), stop)
+    if head_stop == start:
+        return _byte_page(mm, index, offsets[start], budget)
+
+    elided = tail_start - head_stop
+    elided_bytes = offsets[tail_start] - offsets[head_stop]
+    head = _decode(mm[offsets[start]:offsets[head_stop]])
+    tail = _decode(mm[offsets[tail_start]:offsets[stop]])
+    marker = (
+        f"\n... [{elided} lines ({elided_bytes} bytes) elided: "
+        f"lines {head_stop + 1}-{tail_start}; read with offset={head_stop + 1} to see them] ...\n\n"
+    )
+    return FilePage(
+        content=head + marker + tail if elided else head + tail,
+        start_line=start + 1,
+        end_line=stop,
+        total_lines=index.total_lines,
+        total_bytes=index.size,
+        next_offset=head_stop + 1 if elided else None,
+        elided_lines=elided,
+    )
+
+
+def _is_continuation(mm: mmap.mmap, position: int) -> bool:
+    """Whether the byte at ``position`` continues a multi-byte UTF-8 character."""
+    return (mm[position] & 0xC0) == 0x80
+
+
+def _byte_page(mm: mmap.mmap, index: LineIndex, byte_offset: int, budget: int) -> FilePage:
+    size = index.size
+    byte_offset = min(byte_offset, size)
+    while byte_offset < size and _is_continuation(mm, byte_offset):
+        byte_offset += 1
+    # End the page on a character boundary, so a character straddling it is
+    # read whole by the next page instead of being dropped
+    byte_end = min(size, byte_offset + budget)
+    while byte_offset < byte_end < size and _is_continuation(mm, byte_end):
+        byte_end -= 1
+    if byte_end == byte_offset < size:
+        # Budget smaller than one character: take the whole character
+        byte_end += 1
+        while byte_end < size and _is_continuation(mm, byte_end):
+            byte_end += 1
+    return FilePage(
+        content=_decode(mm[byte_offset:byte_end]),
+        start_line=index.line_at(byte_offset) + 1,
+        end_line=index.line_at(max(byte_offset, byte_end - 1)) + 1,
+        total_lines=index.total_lines,
+        total_bytes=index.size,
+        next_byte_offset=byte_end if byte_end < size else None,
+    )
+
+
+def describe_page(page: FilePage) -> str:
+    """Footer telling the model which part of the file it received and how to continue."""
+    if page.is_complete and page.start_line <= 1:
+        return ""
+    parts = [f"[Lines {page.start_line}-{page.end_line} of {page.total_lines} ({page.total_bytes} bytes)."]
+    if page.elided_lines:
+        parts.append(f"{page.elided_lines} lines elided from the middle.")
+    if page.next_byte_offset is not None:
+        parts.append(f"Line is longer than the output budget; continue with byte_offset={page.next_byte_offset}]")
+    elif page.next_offset is not None:
+        parts.append(f"Continue with offset={page.next_offset}]")
+    else:
+        parts[-1] += "]"
+    return " ".join(parts)
+
+
+def clear_index_cache() -> None:
+    """Drop all cached line indexes (used by tests)."""
+    with _index_lock:
+        _index_cache.clear()
+
@@ -0,0 +1,93 @@
+"""Deferred construction of tool implementations.
+
+Importing the tool implementations pulls in HTTP clients, diff rendering and
+process utilities. Entry points that may never run a given tool wrap it in a
+``LazyTool`` instead: the registry's handlers hold the stand-in, and the
+implementation module is imported and the tool constructed the first time a
+handler touches it.
+"""
+
+from __future__ import annotations
+
+import threading
+from importlib import import_module
+from typing import Any, Iterable, Optional
+
+_IMPLEMENTATIONS = "swecli.core.context_engineering.tools.implementations"
+
+# ``build_suite`` keyword -> implementation class
+TOOL_CLASSES: dict[str, str] = {
+    "file_ops": "FileOperations",
+    "write_tool": "WriteTool",
+    "edit_tool": "EditTool",
+    "bash_tool": "BashTool",
+    "web_fetch_tool": "WebFetchTool",
+    "open_browser_tool": "OpenBrowserTool",
+    "vlm_tool": "VLMTool",
+    "web_screenshot_tool": "WebScreenshotTool",
+}
+
+_OWN_ATTRIBUTES = frozenset({"_class_name", "_args", "_kwargs", "_tool", "_lock"})
+
+
+class LazyTool:
+    """Stand-in that constructs a tool implementation on first attribute access."""
+
+    def __init__(self, class_name: str, *args: Any, **kwargs: Any) -> None:
+        """Initialize the stand-in.
+
+        Args:
+            class_name: Name exported by the implementations package (e.g. ``"BashTool"``)
+            *args: Positional constructor arguments
+            **kwargs: Keyword constructor arguments
+        """
+        self._class_name = class_name
+        self._args = args
+        self._kwargs = kwargs
+        self._tool: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the underlying tool has been constructed."""
+        return self._tool is not None
+
+    def resolve(self) -> Any:
+        """Return the underlying tool, constructing it if needed."""
+        if self._tool is None:
+            with self._lock:
+                if self._tool is None:
+                    tool_class = getattr(import_module(_IMPLEMENTATIONS), self._class_name)
+                    self._tool = tool_class(*self._args, **self._kwargs)
+        return self._tool
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes not defined on the stand-in itself
+        if name.startswith("__") or name in _OWN_ATTRIBUTES:
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "deferred"
+        return f"LazyTool({self._class_name}, {state})"
+
+
+def lazy_tools(config: Any, working_dir: Any, names: Optional[Iterable[str]] = None) -> dict[str, LazyTool]:
+    """Build deferred tools keyed by their ``RuntimeService.build_suite`` keyword.
+
+    Args:
+        config: Application config passed to each tool
+        working_dir: Working directory passed to each tool
+        names: Keywords to include (default: every tool in ``TOOL_CLASSES``)
+
+    Returns:
+        Mapping such as ``{"bash_tool": LazyTool(BashTool), ...}``
+    """
+    selected = TOOL_CLASSES if names is None else {name: TOOL_CLASSES[name] for name in names}
+    return {name: LazyTool(class_name, config, working_dir) for name, class_name in selected.items()}
+
+
+__all__ = ["LazyTool", "TOOL_CLASSES", "lazy_tools"]
@@ -43,6 +43,7 @@ from swecli.core.context_engineering.tools.lsp.lsp_protocol_handler.server impor
 )
 from swecli.core.context_engineering.tools.lsp.settings import SolidLSPSettings
 from swecli.core.context_engineering.tools.lsp.util.cache import load_cache, save_cache
+from swecli.core.utils.ignore_rules import get_ignore_engine
 
 GenericDocumentSymbol = Union[LSPTypes.DocumentSymbol, LSPTypes.SymbolInformation, ls_types.UnifiedSymbolInformation]
 log = logging.getLogger(__name__)
@@ -386,6 +387,10 @@ class SolidLanguageServer(ABC):
             if self.is_ignored_dirname(part):
                 return True
 
+        # Nested .gitignore files, compiled once per workspace and shared with search and autocomplete
+        if get_ignore_engine(self.repository_root_path).is_ignored(relative_path, is_dir=not is_file):
+            return True
+
         return match_path(relative_path, self.get_ignore_spec(), root_path=self.repository_root_path)
 
     def _shutdown(self, timeout: float = 5.0) -> None:
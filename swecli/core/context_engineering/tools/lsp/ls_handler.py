@@ -34,6 +34,7 @@ from swecli.core.context_engineering.tools.lsp.lsp_protocol_handler.server impor
     make_response,
 )
 from swecli.core.context_engineering.tools.lsp.util.subprocess_util import quote_arg, subprocess_kwargs
+from swecli.core.runtime.monitoring.tracing import LSP, get_tracer
 
 log = logging.getLogger(__name__)
 
@@ -471,10 +472,11 @@ class SolidLanguageServerHandler:
         with self._response_handlers_lock:
             self._pending_requests[request_id] = request
 
-        self._send_payload(make_request(method, request_id, params))
+        with get_tracer().span(method, LSP):
+            self._send_payload(make_request(method, request_id, params))
 
-        self._log(f"Waiting for response to request {method} with params:\n{params}")
-        result = request.get_result(timeout=self._request_timeout)
+            self._log(f"Waiting for response to request {method} with params:\n{params}")
+            result = request.get_result(timeout=self._request_timeout)
         log.debug("Completed: %s", request)
 
         self._log("Processing result")
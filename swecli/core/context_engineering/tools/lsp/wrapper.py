@@ -164,6 +164,31 @@ class LSPServerWrapper:
             return None
         return self.get_server(language)
 
+    def warm_document_symbols(self, file_path: str | Path) -> bool:
+        """Load a document's symbols into the server's cache without starting a server.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            True if a running server returned the document's symbols
+        """
+        path = Path(file_path).resolve()
+        language = get_language_from_path(path)
+        server = self._servers.get(language) if language is not None else None
+        if server is None or not server.is_running():
+            return False
+        try:
+            relative_path = path.relative_to(self._workspace_root)
+        except ValueError:
+            relative_path = path
+        try:
+            server.request_document_symbols(str(relative_path))
+        except Exception as e:
+            logger.debug(f"Failed to warm document symbols for {path}: {e}")
+            return False
+        return True
+
     def get_document_symbols(self, file_path: str | Path) -> list[Symbol]:
         """Get all symbols in a document.
 
@@ -463,6 +488,11 @@ def get_lsp_wrapper(workspace_root: str | Path | None = None) -> LSPServerWrappe
     return _wrapper
 
 
+def current_lsp_wrapper() -> LSPServerWrapper | None:
+    """Get the global LSP wrapper if one has been created, without creating it."""
+    return _wrapper
+
+
 def shutdown_lsp_wrapper() -> None:
     """Shutdown the global LSP wrapper."""
     global _wrapper
@@ -0,0 +1,204 @@
+"""Speculative prefetching of reads while the model is generating.
+
+An LLM call leaves the tool side idle for seconds. ``SpeculativePrefetcher``
+uses that time to guess what the model will read next, from the files and
+symbols named in the user query and the latest tool calls and results, and
+runs those reads in a background thread. Results go into the registry's
+``ToolReadCache`` (which also warms the file line index) and, where a language
+server is already running, into its document symbol cache. A follow-up
+``read_file``, ``search`` or ``find_symbol`` then returns without waiting.
+
+Prefetching is bounded by a call count, the bytes of output kept and the CPU
+time spent, and stops as soon as the LLM call returns or is interrupted.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional
+
+from swecli.core.context_engineering.retrieval.retriever import EntityExtractor
+
+if TYPE_CHECKING:
+    from swecli.core.context_engineering.tools.registry import ToolRegistry
+
+# snake_case or camelCase function names, so "print(" and "add(" are skipped
+_FUNCTION_NAME = re.compile(r"[a-z][a-z0-9]*(?:_[a-z0-9]+)+|[a-z]+(?:[A-Z][a-z0-9]*)+")
+
+# Characters of each recent tool result scanned for file and symbol names
+_RESULT_SCAN_CHARS = 4000
+
+
+@dataclass(frozen=True)
+class PrefetchBudget:
+    """Limits on one round of speculation."""
+
+    max_calls: int = 8
+    max_searches: int = 3
+    max_bytes: int = 4 * 1024 * 1024
+    max_file_bytes: int = 512 * 1024
+    cpu_seconds: float = 1.0
+
+
+@dataclass
+class PrefetchStats:
+    """What the last round of speculation did."""
+
+    calls: int = 0
+    stored: int = 0
+    bytes: int = 0
+    symbols: int = 0
+    cancelled: bool = False
+
+
+class SpeculativePrefetcher:
+    """Warms read caches with the reads the model is likely to ask for next."""
+
+    def __init__(
+        self,
+        registry: "ToolRegistry",
+        working_dir: Path,
+        budget: Optional[PrefetchBudget] = None,
+    ) -> None:
+        """Initialize the prefetcher.
+
+        Args:
+            registry: Registry whose read cache is warmed
+            working_dir: Directory relative file mentions are resolved against
+            budget: Limits per round (defaults to ``PrefetchBudget()``)
+        """
+        self.registry = registry
+        self.working_dir = Path(working_dir).resolve()
+        self.budget = budget or PrefetchBudget()
+        self.extractor = EntityExtractor()
+        self.last_stats = PrefetchStats()
+        self._thread: Optional[threading.Thread] = None
+
+    @contextmanager
+    def running(
+        self,
+        query: str,
+        messages: list[dict[str, Any]],
+        task_monitor: Any = None,
+    ) -> Iterator[PrefetchStats]:
+        """Prefetch in the background for the duration of the block (an LLM call)."""
+        stop = threading.Event()
+        should_interrupt = getattr(task_monitor, "should_interrupt", None)
+
+        def cancelled() -> bool:
+            return stop.is_set() or (callable(should_interrupt) and should_interrupt())
+
+        stats = PrefetchStats()
+        self.last_stats = stats
+        calls = self.predict(query, messages)
+        if calls:
+            self._thread = threading.Thread(
+                target=self.run, args=(calls, cancelled, stats), name="swecli-prefetch", daemon=True
+            )
+            self._thread.start()
+        try:
+            yield stats
+        finally:
+            # Never wait for an in-flight read: the tools are about to run
+            stop.set()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait for the current round to finish (used by tests and benchmarks)."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def predict(self, query: str, messages: list[dict[str, Any]]) -> list[tuple[str, dict[str, Any]]]:
+        """Tool calls worth running ahead of time, most likely first."""
+        text = "\n".join([query, *self._recent_context(messages)])
+        entities = self.extractor.extract_entities(text)
+
+        calls: list[tuple[str, dict[str, Any]]] = []
+        for mention in sorted(entities["files"], key=text.find):
+            path = self._resolve(mention)
+            if path is not None:
+                calls.append(("read_file", {"file_path": str(path)}))
+
+        query_functions = self.extractor.extract_entities(query)["functions"]
+        names = list(entities["classes"])
+        names += [name for name in query_functions if _FUNCTION_NAME.fullmatch(name)]
+        for name in sorted(set(names), key=text.find)[: self.budget.max_searches]:
+            calls.append(("search", {"pattern": name}))
+        return calls[: self.budget.max_calls]
+
+    def run(
+        self,
+        calls: list[tuple[str, dict[str, Any]]],
+        cancelled: Callable[[], bool],
+        stats: Optional[PrefetchStats] = None,
+    ) -> PrefetchStats:
+        """Execute ``calls`` in order until done, over budget or cancelled."""
+        stats = stats or PrefetchStats()
+        cpu_start = time.thread_time()
+        for tool_name, arguments in calls:
+            if cancelled():
+                stats.cancelled = True
+                break
+            if time.thread_time() - cpu_start > self.budget.cpu_seconds:
+                break
+            remaining = self.budget.max_bytes - stats.bytes
+            if remaining <= 0:
+                break
+            stats.calls += 1
+            size = self.registry.warm_read_cache(tool_name, arguments, max_chars=remaining)
+            if size:
+                stats.stored += 1
+                stats.bytes += size
+            if tool_name == "read_file" and not cancelled() and self._warm_symbols(arguments["file_path"]):
+                stats.symbols += 1
+        return stats
+
+    # --- Internals -----------------------------------------------------------
+
+    @staticmethod
+    def _recent_context(messages: list[dict[str, Any]]) -> list[str]:
+        """Arguments and (truncated) results of the latest round of tool calls."""
+        context: list[str] = []
+        for message in reversed(messages):
+            role = message.get("role")
+            if role == "tool":
+                context.append(str(message.get("content") or "")[:_RESULT_SCAN_CHARS])
+            elif role == "assistant":
+                for tool_call in message.get("tool_calls") or []:
+                    arguments = (tool_call.get("function") or {}).get("arguments") or ""
+                    context.append(arguments if isinstance(arguments, str) else json.dumps(arguments))
+                break
+            elif role == "user":
+                break
+        return context
+
+    def _resolve(self, mention: str) -> Optional[Path]:
+        """File inside the working directory that ``mention`` refers to, within budget."""
+        candidate = Path(mention).expanduser()
+        if not candidate.is_absolute():
+            candidate = self.working_dir / candidate
+        try:
+            path = candidate.resolve()
+            path.relative_to(self.working_dir)
+            size = path.stat().st_size if path.is_file() else None
+        except (OSError, ValueError):
+            return None
+        if size is None or size > self.budget.max_file_bytes:
+            return None
+        return path
+
+    @staticmethod
+    def _warm_symbols(file_path: str) -> bool:
+        # Only use language servers that are already running; starting one is not speculative work
+        wrapper_module = sys.modules.get("swecli.core.context_engineering.tools.lsp.wrapper")
+        wrapper = wrapper_module.current_lsp_wrapper() if wrapper_module is not None else None
+        return wrapper is not None and wrapper.warm_document_symbols(file_path)
+
+
+__all__ = ["PrefetchBudget", "PrefetchStats", "SpeculativePrefetcher"]
@@ -0,0 +1,182 @@
+"""Per-turn cache for read-only tool calls.
+
+Within one user turn the agent frequently re-reads the same file or repeats the
+same search. ``ToolReadCache`` remembers successful ``read_file``,
+``list_files`` and ``search`` results keyed by the tool name, its normalized
+arguments and (for ``read_file``) the file's mtime and size. Any tool that can
+change the workspace clears the cache, so a stale entry is never served after
+a write.
+
+Entries can also be stored ahead of time by the speculative prefetcher. The
+model has not seen those results yet, so the first lookup of a prefetched
+entry returns it in full rather than as a reference to an earlier call.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Optional
+
+CACHEABLE_TOOLS = frozenset({"read_file", "list_files", "search"})
+
+# Tools that may modify files on disk; any call to them invalidates the cache.
+INVALIDATING_TOOLS = frozenset({
+    "write_file",
+    "edit_file",
+    "run_command",
+    "kill_process",
+    "insert_before_symbol",
+    "insert_after_symbol",
+    "replace_symbol_body",
+    "rename_symbol",
+    "spawn_subagent",
+    "spawn_subagents",
+})
+
+# Repeats whose output is shorter than this are returned in full; a reference
+# would not save anything.
+MIN_REFERENCE_CHARS = 200
+
+
+class PrefetchTicket(NamedTuple):
+    """Cache slot reserved for a result computed ahead of time."""
+
+    key: str
+    generation: int
+
+
+class ToolReadCache:
+    """Read-through cache for read-only tools, reset at every user turn."""
+
+    def __init__(self, resolve_path: Optional[Callable[[str], Path]] = None):
+        """Initialize the cache.
+
+        Args:
+            resolve_path: Maps a ``read_file`` path argument to the file on disk,
+                used to fingerprint the file by mtime and size
+        """
+        self._resolve_path = resolve_path or (lambda raw: Path(raw).expanduser().resolve())
+        self._entries: dict[str, dict[str, Any]] = {}
+        # Keys stored by the prefetcher that the model has not received yet
+        self._prefetched: set[str] = set()
+        # Bumped on every clear, so a prefetch started before a write is discarded
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.prefetch_hits = 0
+
+    def begin_turn(self) -> None:
+        """Forget everything cached for the previous turn."""
+        self._clear()
+
+    def invalidate(self) -> None:
+        """Drop all entries after a tool that may have changed the workspace."""
+        self._clear()
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._prefetched.clear()
+            self._generation += 1
+
+    def lookup(self, tool_name: str, arguments: dict[str, Any]) -> Optional[dict[str, Any]]:
+        """Return the result to send for a repeated call, or None on a miss."""
+        key = self._key(tool_name, arguments)
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if key in self._prefetched:
+                self._prefetched.discard(key)
+                self.prefetch_hits += 1
+                return {**entry, "prefetched": True}
+            self.hits += 1
+            return _repeat_result(tool_name, arguments, entry)
+
+    def store(self, tool_name: str, arguments: dict[str, Any], result: dict[str, Any]) -> None:
+        """Remember a successful result for the rest of the turn."""
+        if not result.get("success"):
+            return
+        key = self._key(tool_name, arguments)
+        if key is None:
+            return
+        with self._lock:
+            self._entries[key] = dict(result)
+            self._prefetched.discard(key)
+
+    def reserve(self, tool_name: str, arguments: dict[str, Any]) -> Optional[PrefetchTicket]:
+        """Claim a slot for a prefetched result, or None if the call is cached or uncacheable.
+
+        The key (including the file fingerprint) is taken before the tool runs,
+        so a file modified while it is being read is never served stale.
+        """
+        key = self._key(tool_name, arguments)
+        if key is None:
+            return None
+        with self._lock:
+            if key in self._entries:
+                return None
+            return PrefetchTicket(key, self._generation)
+
+    def store_prefetched(self, ticket: PrefetchTicket, result: dict[str, Any]) -> bool:
+        """Store a prefetched result unless the workspace changed since ``reserve``."""
+        if not result.get("success"):
+            return False
+        with self._lock:
+            if ticket.generation != self._generation or ticket.key in self._entries:
+                return False
+            self._entries[ticket.key] = dict(result)
+            self._prefetched.add(ticket.key)
+            return True
+
+    def _key(self, tool_name: str, arguments: dict[str, Any]) -> Optional[str]:
+        if tool_name not in CACHEABLE_TOOLS:
+            return None
+
+        fingerprint = ""
+        if tool_name == "read_file":
+            raw_path = arguments.get("file_path")
+            if not raw_path:
+                return None
+            try:
+                path = self._resolve_path(str(raw_path))
+                stat = path.stat()
+            except (OSError, ValueError):
+                return None
+            fingerprint = f"{stat.st_mtime_ns}:{stat.st_size}"
+            # Relative and absolute spellings of the same file share an entry
+            arguments = {**arguments, "file_path": str(path)}
+        elif tool_name == "search":
+            arguments = {"path": ".", "type": "text", **arguments}
+
+        try:
+            normalized = json.dumps(arguments, sort_keys=True, separators=(",", ":"), default=str)
+        except (TypeError, ValueError):
+            return None
+        return f"{tool_name}\0{normalized}\0{fingerprint}"
+
+
+def _repeat_result(tool_name: str, arguments: dict[str, Any], cached: dict[str, Any]) -> dict[str, Any]:
+    result = dict(cached)
+    result["cached"] = True
+    output = result.get("output")
+    if not isinstance(output, str) or len(output) < MIN_REFERENCE_CHARS:
+        return result
+
+    if tool_name == "read_file":
+        subject = f"{arguments.get('file_path')} has not changed"
+    elif tool_name == "search":
+        subject = f"no files have been modified since search for {arguments.get('pattern')!r}"
+    else:
+        subject = f"no files have been modified since listing {arguments.get('path') or '.'}"
+    result["output"] = (
+        f"[Unchanged since the earlier {tool_name} call in this turn: "
+        f"{subject}. Refer to that result instead of reading it again.]"
+    )
+    return result
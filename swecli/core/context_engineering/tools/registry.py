@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, Union
+import json
+from pathlib import Path
+from typing import Any, ContextManager, Union
 
 from swecli.core.runtime import OperationMode
+from swecli.core.runtime.monitoring.tracing import MCP, TOOL, Span, get_tracer
 from swecli.core.context_engineering.tools.context import ToolExecutionContext
 from swecli.core.context_engineering.tools.handlers.file_handlers import FileToolHandler
 from swecli.core.context_engineering.mcp.handler import McpToolHandler
@@ -12,14 +15,15 @@ from swecli.core.context_engineering.tools.handlers.process_handlers import Proc
 from swecli.core.context_engineering.tools.handlers.web_handlers import WebToolHandler
 from swecli.core.context_engineering.tools.handlers.screenshot_handler import ScreenshotToolHandler
 from swecli.core.context_engineering.tools.handlers.todo_handler import TodoHandler
-from swecli.core.context_engineering.tools.symbol_tools import (
-    handle_find_symbol,
-    handle_find_referencing_symbols,
-    handle_insert_before_symbol,
-    handle_insert_after_symbol,
-    handle_replace_symbol_body,
-    handle_rename_symbol,
-)
+from swecli.core.context_engineering.tools.path_utils import sanitize_path
+from swecli.core.context_engineering.tools.read_cache import CACHEABLE_TOOLS, INVALIDATING_TOOLS, ToolReadCache
+
+def _symbol_tool(name: str) -> Any:
+    """Resolve an LSP symbol tool handler, importing the LSP stack on first use."""
+    from swecli.core.context_engineering.tools import symbol_tools
+
+    return getattr(symbol_tools, name)
+
 
 _PLAN_READ_ONLY_TOOLS = {
     "read_file",
@@ -35,6 +39,9 @@ _PLAN_READ_ONLY_TOOLS = {
     "find_referencing_symbols",
     # Subagent spawning allowed in plan mode (subagents handle their own restrictions)
     "spawn_subagent",
+    "spawn_subagents",
+    # Tool schema pruning meta-tool (only changes which schemas are sent)
+    "load_tools",
 }
 
 
@@ -69,6 +76,8 @@ class ToolRegistry:
         self._screenshot_handler = ScreenshotToolHandler()
         self.todo_handler = TodoHandler()
         self._subagent_manager: Union[Any, None] = None
+        self.read_cache = ToolReadCache(self._resolve_read_path)
+        self._prefetcher: Union[Any, None] = None
         self.set_mcp_manager(mcp_manager)
 
         self._handlers: dict[str, Any] = {
@@ -94,17 +103,122 @@ class ToolRegistry:
             "update_todo": self._update_todo,
             "complete_todo": self._complete_todo,
             "list_todos": lambda args, ctx=None: self.todo_handler.list_todos(),
-            # Symbol tools (LSP-based)
-            "find_symbol": lambda args: handle_find_symbol(args),
-            "find_referencing_symbols": lambda args: handle_find_referencing_symbols(args),
-            "insert_before_symbol": lambda args: handle_insert_before_symbol(args),
-            "insert_after_symbol": lambda args: handle_insert_after_symbol(args),
-            "replace_symbol_body": lambda args: handle_replace_symbol_body(args),
-            "rename_symbol": lambda args: handle_rename_symbol(args),
+            # Symbol tools (LSP-based, imported on first call)
+            "find_symbol": lambda args: self._run_symbol_tool("handle_find_symbol", args),
+            "find_referencing_symbols": lambda args: self._run_symbol_tool("handle_find_referencing_symbols", args),
+            "insert_before_symbol": lambda args: self._run_symbol_tool("handle_insert_before_symbol", args),
+            "insert_after_symbol": lambda args: self._run_symbol_tool("handle_insert_after_symbol", args),
+            "replace_symbol_body": lambda args: self._run_symbol_tool("handle_replace_symbol_body", args),
+            "rename_symbol": lambda args: self._run_symbol_tool("handle_rename_symbol", args),
             # Subagent spawning tool
             "spawn_subagent": self._execute_spawn_subagent,
+            "spawn_subagents": self._execute_spawn_subagents,
+            # Tool schema pruning meta-tool
+            "load_tools": self._load_tools,
         }
 
+    def begin_turn(self) -> None:
+        """Start a new user turn, discarding reads cached during the previous one."""
+        self.read_cache.begin_turn()
+
+    def prefetch_tool_calls(self, tool_calls: list[dict[str, Any]]) -> int:
+        """Start the leading read-only MCP calls among ``tool_calls`` concurrently.
+
+        Called with one LLM response's tool calls before they are executed in
+        order; ``execute_tool`` then picks up the in-flight results. Nothing
+        after the first call that may have side effects is started early.
+
+        Args:
+            tool_calls: Tool calls in OpenAI format
+
+        Returns:
+            Number of MCP calls started early
+        """
+        calls = []
+        for tool_call in tool_calls:
+            function = tool_call.get("function") or {}
+            name = function.get("name") or ""
+            if not name.startswith("mcp__"):
+                if name in CACHEABLE_TOOLS:
+                    continue
+                break
+            arguments = function.get("arguments") or {}
+            if isinstance(arguments, str):
+                try:
+                    arguments = json.loads(arguments)
+                except json.JSONDecodeError:
+                    continue
+            calls.append((name, arguments))
+        return self._mcp_handler.prefetch(calls)
+
+    def speculate(
+        self,
+        query: str,
+        messages: list[dict[str, Any]],
+        task_monitor: Union[Any, None] = None,
+    ) -> ContextManager[Any]:
+        """Prefetch likely next reads in the background while the block runs.
+
+        Wrap an LLM call with this; prefetching stops when the block exits or
+        ``task_monitor`` is interrupted.
+
+        Args:
+            query: The user's query for this turn
+            messages: Conversation so far, including the latest tool results
+            task_monitor: Monitor of the LLM call
+
+        Returns:
+            Context manager yielding the round's ``PrefetchStats``
+        """
+        if self._prefetcher is None:
+            from swecli.core.context_engineering.tools.prefetch import SpeculativePrefetcher
+
+            self._prefetcher = SpeculativePrefetcher(self, self._working_dir())
+        return self._prefetcher.running(query, messages, task_monitor)
+
+    def warm_read_cache(self, tool_name: str, arguments: dict[str, Any], *, max_chars: int) -> int:
+        """Run a read-only tool ahead of time and cache its result for the model's next call.
+
+        Args:
+            tool_name: One of the cacheable read tools
+            arguments: Arguments the model is expected to pass
+            max_chars: Largest output worth keeping
+
+        Returns:
+            Characters of output cached (0 if nothing was stored)
+        """
+        if tool_name not in CACHEABLE_TOOLS:
+            return 0
+        ticket = self.read_cache.reserve(tool_name, arguments)
+        if ticket is None:
+            return 0
+        with get_tracer().span(f"prefetch.{tool_name}", TOOL) as span:
+            result = self._dispatch(tool_name, arguments, ToolExecutionContext())
+            output = result.get("output")
+            size = len(output) if isinstance(output, str) else 0
+            stored = size <= max_chars and self.read_cache.store_prefetched(ticket, result)
+            span.set(stored=stored)
+        return size if stored else 0
+
+    def _working_dir(self) -> Path:
+        return Path(getattr(self.file_ops, "working_dir", None) or Path.cwd())
+
+    def _run_symbol_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Run an LSP symbol tool with paths resolved against this registry's working directory."""
+        arguments = dict(arguments)
+        if arguments.get("file_path"):
+            path = Path(sanitize_path(arguments["file_path"])).expanduser()
+            arguments["file_path"] = str(path if path.is_absolute() else self._working_dir() / path)
+        if name == "handle_find_symbol":
+            return _symbol_tool(name)(arguments, working_dir=self._working_dir())
+        return _symbol_tool(name)(arguments)
+
+    def _resolve_read_path(self, raw_path: str) -> Path:
+        resolver = getattr(self.file_ops, "_resolve_path", None)
+        if callable(resolver):
+            return resolver(sanitize_path(raw_path))
+        return Path(sanitize_path(raw_path)).expanduser().resolve()
+
     def set_subagent_manager(self, manager: Any) -> None:
         """Set the subagent manager for task tool execution.
 
@@ -186,6 +300,121 @@ class ToolRegistry:
                 "output": None,
             }
 
+    def _execute_spawn_subagents(self, arguments: dict[str, Any], context: Any = None) -> dict[str, Any]:
+        """Execute the spawn_subagents tool: run independent subagent tasks in parallel.
+
+        Args:
+            arguments: Tool arguments with 'tasks' (list of description/subagent_type
+                objects) and optional 'max_concurrency'
+            context: Tool execution context
+
+        Returns:
+            Aggregated results, one section per task in the original order
+        """
+        if not self._subagent_manager:
+            return {
+                "success": False,
+                "error": "SubAgentManager not configured. spawn_subagents tool unavailable.",
+                "output": None,
+            }
+
+        tasks = []
+        for item in arguments.get("tasks") or []:
+            if not isinstance(item, dict) or not item.get("description"):
+                return {
+                    "success": False,
+                    "error": "Each spawn_subagents task needs a 'description'",
+                    "output": None,
+                }
+            tasks.append((item.get("subagent_type", "general-purpose"), item["description"]))
+        if not tasks:
+            return {
+                "success": False,
+                "error": "spawn_subagents requires a non-empty 'tasks' list",
+                "output": None,
+            }
+
+        from swecli.core.agents.subagents.manager import SubAgentDeps
+
+        deps = SubAgentDeps(
+            mode_manager=context.mode_manager if context else None,
+            approval_manager=context.approval_manager if context else None,
+            undo_manager=context.undo_manager if context else None,
+        )
+        results = self._subagent_manager.execute_batch(
+            tasks,
+            deps,
+            ui_callback=context.ui_callback if context else None,
+            max_concurrency=arguments.get("max_concurrency"),
+        )
+
+        sections = []
+        failures = 0
+        for index, ((subagent_type, _), result) in enumerate(zip(tasks, results), start=1):
+            if result.get("success"):
+                body = result.get("content") or "(no output)"
+            else:
+                failures += 1
+                body = f"Task failed: {result.get('error') or result.get('content') or 'Unknown error'}"
+            sections.append(f"## [{subagent_type} #{index}]\n{body}")
+
+        return {
+            "success": failures < len(tasks),
+            "output": None,
+            "separate_response": "\n\n".join(sections),
+            "subagent_type": f"{len(tasks)} subagents",
+            "error": "All subagent tasks failed" if failures == len(tasks) else None,
+            "failed_tasks": failures,
+        }
+
+    def _load_tools(self, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Execute the load_tools meta-tool.
+
+        The schemas themselves are added by the agent's tool selector, which
+        reads load_tools calls from the conversation; this only validates names.
+
+        Args:
+            arguments: Tool arguments with 'names' (group or tool names)
+
+        Returns:
+            Result listing what was loaded
+        """
+        from swecli.core.agents.components.tool_selector import (
+            TOOL_GROUPS,
+            parse_load_tools_arguments,
+            tool_group,
+        )
+
+        names = parse_load_tools_arguments(arguments)
+        if not names:
+            return {"success": False, "error": "load_tools requires a non-empty 'names' list", "output": None}
+
+        mcp_tools = []
+        if self.mcp_manager is not None:
+            mcp_tools = [tool.get("name", "") for tool in self.mcp_manager.get_all_tools()]
+        loaded: list[str] = []
+        unknown: list[str] = []
+        for name in names:
+            if name in TOOL_GROUPS:
+                loaded.extend(TOOL_GROUPS[name])
+            elif name.startswith("mcp__") and any(tool_group(tool) == name for tool in mcp_tools):
+                loaded.extend(tool for tool in mcp_tools if tool_group(tool) == name)
+            elif name in self._handlers or name in mcp_tools:
+                loaded.append(name)
+            else:
+                unknown.append(name)
+
+        if not loaded:
+            return {
+                "success": False,
+                "error": f"Unknown tools or groups: {', '.join(unknown)}. Groups: {', '.join(TOOL_GROUPS)}",
+                "output": None,
+            }
+        output = f"Loaded {len(loaded)} tools: {', '.join(loaded)}. They are available from your next step."
+        if unknown:
+            output += f" Unknown (ignored): {', '.join(unknown)}"
+        return {"success": True, "output": output, "loaded_tools": loaded}
+
     def get_schemas(self) -> list[dict[str, Any]]:
         """Compatibility hook (schemas generated elsewhere)."""
         return []
@@ -205,27 +434,66 @@ class ToolRegistry:
     ) -> dict[str, Any]:
         """Execute a tool by delegating to registered handlers."""
         if tool_name.startswith("mcp__"):
-            return self._mcp_handler.execute(tool_name, arguments)
-
+            with get_tracer().span(tool_name, MCP) as span:
+                result = self._mcp_handler.execute(tool_name, arguments)
+                span.set(success=bool(result.get("success")))
+            return result
+
+        with get_tracer().span(tool_name, TOOL) as span:
+            result = self._execute_local_tool(
+                tool_name,
+                arguments,
+                ToolExecutionContext(
+                    mode_manager=mode_manager,
+                    approval_manager=approval_manager,
+                    undo_manager=undo_manager,
+                    task_monitor=task_monitor,
+                    session_manager=session_manager,
+                    ui_callback=ui_callback,
+                    is_subagent=is_subagent,
+                ),
+                span,
+            )
+            span.set(success=bool(result.get("success")))
+        return result
+
+    def _execute_local_tool(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+        context: ToolExecutionContext,
+        span: Span,
+    ) -> dict[str, Any]:
         if tool_name not in self._handlers:
             return {"success": False, "error": f"Unknown tool: {tool_name}", "output": None}
 
-        context = ToolExecutionContext(
-            mode_manager=mode_manager,
-            approval_manager=approval_manager,
-            undo_manager=undo_manager,
-            task_monitor=task_monitor,
-            session_manager=session_manager,
-            ui_callback=ui_callback,
-            is_subagent=is_subagent,
-        )
-
         if self._is_plan_blocked(tool_name, context):
             return self._plan_blocked_result(tool_name, arguments)
 
+        # Subagents run with their own context window, so they always read fresh.
+        use_cache = not context.is_subagent
+        if use_cache:
+            cached = self.read_cache.lookup(tool_name, arguments)
+            if cached is not None:
+                span.set(cached=True)
+                return cached
+        if tool_name in INVALIDATING_TOOLS:
+            self.read_cache.invalidate()
+
+        result = self._dispatch(tool_name, arguments, context)
+        if use_cache:
+            self.read_cache.store(tool_name, arguments, result)
+        return result
+
+    def _dispatch(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+        context: ToolExecutionContext,
+    ) -> dict[str, Any]:
         handler = self._handlers[tool_name]
         try:
-            if tool_name in {"write_file", "edit_file", "run_command", "spawn_subagent"}:
+            if tool_name in {"write_file", "edit_file", "run_command", "spawn_subagent", "spawn_subagents"}:
                 # Handlers requiring context
                 return handler(arguments, context)
 
@@ -11,13 +11,17 @@ from typing import Any
 from swecli.core.context_engineering.tools.lsp import SymbolRetriever
 
 
-def handle_find_symbol(arguments: dict[str, Any]) -> dict[str, Any]:
+def handle_find_symbol(
+    arguments: dict[str, Any],
+    working_dir: str | Path | None = None,
+) -> dict[str, Any]:
     """Handle the find_symbol tool call.
 
     Args:
         arguments: Tool arguments containing:
             - symbol_name: Name path pattern (e.g., "MyClass.method", "my_func", "My*")
             - file_path: Optional file to search in. If None, searches workspace.
+        working_dir: Workspace searched without a file_path (default: current directory)
 
     Returns:
         Tool result with success status and found symbols
@@ -33,7 +37,7 @@ def handle_find_symbol(arguments: dict[str, Any]) -> dict[str, Any]:
         }
 
     try:
-        return _find_symbol(symbol_name, file_path)
+        return _find_symbol(symbol_name, file_path, working_dir)
     except Exception as e:
         return {
             "success": False,
@@ -45,14 +49,15 @@ def handle_find_symbol(arguments: dict[str, Any]) -> dict[str, Any]:
 def _find_symbol(
     symbol_name: str,
     file_path: str | None,
+    working_dir: str | Path | None = None,
 ) -> dict[str, Any]:
     """Implementation of find_symbol."""
-    # Get workspace root from file path or current directory
+    # Get workspace root from file path or the working directory
     workspace_root = None
     if file_path:
         workspace_root = Path(file_path).parent
     else:
-        workspace_root = Path.cwd()
+        workspace_root = Path(working_dir) if working_dir else Path.cwd()
 
     retriever = SymbolRetriever(workspace_root=workspace_root)
 
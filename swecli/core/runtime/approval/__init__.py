@@ -1,14 +1,17 @@
 """Approval system components for SWE-CLI."""
 
 from .manager import ApprovalChoice, ApprovalManager, ApprovalResult
+from .policy import APPROVAL_POLICIES, PolicyApprovalManager
 from .rules import ApprovalRule, ApprovalRulesManager, CommandHistory, RuleAction, RuleType
 
 __all__ = [
+    "APPROVAL_POLICIES",
     "ApprovalChoice",
     "ApprovalManager",
     "ApprovalResult",
     "ApprovalRule",
     "ApprovalRulesManager",
+    "PolicyApprovalManager",
     "CommandHistory",
     "RuleAction",
     "RuleType",
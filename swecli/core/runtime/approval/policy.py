@@ -0,0 +1,96 @@
+"""Non-interactive approval for headless runs (batch mode, CI).
+
+``PolicyApprovalManager`` answers approval requests from a fixed policy
+instead of prompting, so unattended agents never block on a menu.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Iterable, Optional
+
+from swecli.core.runtime.approval.manager import ApprovalChoice, ApprovalResult
+from swecli.core.runtime.approval.rules import ApprovalRulesManager, RuleAction
+from swecli.models.operation import Operation
+
+APPROVAL_POLICIES = ("auto", "safe", "deny")
+
+# Shell syntax that chains or substitutes commands; an allow-listed prefix
+# says nothing about what follows it
+_SHELL_CONTROL = re.compile(r"[;&|`\n\r]|\$\(")
+
+
+class PolicyApprovalManager:
+    """Approves or denies operations according to a policy, without prompting.
+
+    Policies:
+        auto: approve every operation
+        safe: approve unless a command matches a danger rule (``rm -rf /``, ...)
+        deny: deny every operation that needs approval
+    A command whose first words are one of ``allow_commands`` is approved
+    under every policy, unless it chains or substitutes other commands
+    (``;``, ``&&``, ``|``, backticks, ``$(``, newlines). Under ``safe`` the
+    danger rules are checked first.
+    """
+
+    def __init__(self, policy: str = "safe", allow_commands: Iterable[str] = ()) -> None:
+        """Initialize the manager.
+
+        Args:
+            policy: One of ``APPROVAL_POLICIES``
+            allow_commands: Command prefixes approved regardless of policy
+        """
+        if policy not in APPROVAL_POLICIES:
+            raise ValueError(f"Unknown approval policy '{policy}' (expected one of {', '.join(APPROVAL_POLICIES)})")
+        self.policy = policy
+        self.allow_commands = tuple(allow_commands)
+        self.rules = ApprovalRulesManager()
+        self.auto_approve_remaining = policy == "auto"
+        self.pre_approved_commands: set[str] = set()
+        self.denied: list[str] = []
+
+    def request_approval(
+        self,
+        operation: Operation,
+        preview: str,
+        *,
+        command: Optional[str] = None,
+        working_dir: Optional[str] = None,
+        allow_edit: bool = True,
+        timeout: Optional[Any] = None,
+        force_prompt: bool = False,
+    ) -> ApprovalResult:
+        if self._allows(command):
+            return ApprovalResult(True, ApprovalChoice.APPROVE)
+        self.denied.append(command or preview)
+        return ApprovalResult(False, ApprovalChoice.DENY)
+
+    def _allows(self, command: Optional[str]) -> bool:
+        if self.policy == "auto":
+            return True
+        if not command:
+            return self.policy == "safe"
+        if self.policy == "safe":
+            rule = self.rules.evaluate_command(command)
+            if rule is not None and rule.action != RuleAction.AUTO_APPROVE:
+                return False
+        return self.policy == "safe" or self._allow_listed(command)
+
+    def _allow_listed(self, command: str) -> bool:
+        """Whether ``command`` is a single command starting with an allowed prefix."""
+        command = command.strip()
+        if _SHELL_CONTROL.search(command):
+            return False
+        for prefix in self.allow_commands:
+            prefix = prefix.strip()
+            if prefix and command.startswith(prefix) and (
+                len(command) == len(prefix) or command[len(prefix)].isspace()
+            ):
+                return True
+        return False
+
+    def reset_auto_approve(self) -> None:
+        self.auto_approve_remaining = self.policy == "auto"
+
+
+__all__ = ["APPROVAL_POLICIES", "PolicyApprovalManager"]
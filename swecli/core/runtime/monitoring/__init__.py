@@ -1,10 +1,35 @@
-"""Monitoring utilities for SWE-CLI runtime."""
+"""Monitoring utilities for SWE-CLI runtime.
 
-from .error_handler import ErrorAction, ErrorHandler
-from .task_monitor import TaskMonitor
+``ErrorHandler`` pulls in prompt_toolkit, so exports are imported on first
+access; the tracing hooks on hot paths stay cheap to import.
+"""
+
+from importlib import import_module
+from typing import Dict, Tuple
 
 __all__ = [
     "ErrorHandler",
     "ErrorAction",
     "TaskMonitor",
+    "Span",
+    "Tracer",
+    "get_tracer",
 ]
+
+_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "ErrorHandler": ("swecli.core.runtime.monitoring.error_handler", "ErrorHandler"),
+    "ErrorAction": ("swecli.core.runtime.monitoring.error_handler", "ErrorAction"),
+    "TaskMonitor": ("swecli.core.runtime.monitoring.task_monitor", "TaskMonitor"),
+    "Span": ("swecli.core.runtime.monitoring.tracing", "Span"),
+    "Tracer": ("swecli.core.runtime.monitoring.tracing", "Tracer"),
+    "get_tracer": ("swecli.core.runtime.monitoring.tracing", "get_tracer"),
+}
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'swecli.core.runtime.monitoring' has no attribute '{name}'")
+    module_path, attr_name = _EXPORTS[name]
+    attr = getattr(import_module(module_path), attr_name)
+    globals()[name] = attr
+    return attr
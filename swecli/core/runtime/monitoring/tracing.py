@@ -0,0 +1,315 @@
+"""Lightweight in-process tracing of where a turn spends its time.
+
+Spans wrap LLM requests, tool executions, MCP calls, LSP requests, approval
+waits, session saves, queueing and UI rendering. Finished spans go into a
+bounded ring buffer, so tracing is always on at a fixed memory cost.
+``Tracer.stats`` summarizes latency percentiles per span; the buffer can be
+exported as Chrome trace JSON (open in ``chrome://tracing`` or Perfetto) or
+as OpenTelemetry-style JSONL.
+
+Set ``SWECLI_TRACE_FILE`` to export the buffer when the process exits; a
+``.jsonl`` suffix selects the OpenTelemetry format, anything else Chrome.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextvars
+import itertools
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+DEFAULT_CAPACITY = 10_000
+
+# Span categories used by the built-in instrumentation
+LLM = "llm"
+TOOL = "tool"
+MCP = "mcp"
+LSP = "lsp"
+APPROVAL = "approval"
+SESSION = "session"
+QUEUE = "queue"
+UI = "ui"
+
+_ids = itertools.count(1)
+_current: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("swecli_span", default=None)
+
+
+@dataclass(slots=True)
+class Span:
+    """One timed operation."""
+
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int = 0
+    span_id: int = 0
+    parent_id: Optional[int] = None
+    thread_id: int = 0
+    thread_name: str = ""
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration_ns / 1_000_000
+
+    def set(self, **attributes: Any) -> None:
+        """Attach attributes (e.g. token counts) to the span."""
+        self.attributes.update(attributes)
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(fraction * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class Tracer:
+    """Records finished spans into a ring buffer."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, enabled: bool = True) -> None:
+        """Initialize the tracer.
+
+        Args:
+            capacity: Finished spans kept (oldest are dropped first)
+            enabled: Record spans (a disabled tracer makes ``span`` a no-op)
+        """
+        self.enabled = enabled
+        self._spans: deque[Span] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        # Wall-clock anchor so exported timestamps are absolute
+        self._epoch_offset_ns = time.time_ns() - time.perf_counter_ns()
+
+    @contextmanager
+    def span(self, name: str, category: str, **attributes: Any) -> Iterator[Span]:
+        """Time the enclosed block as a span nested under the current one."""
+        if not self.enabled:
+            yield Span(name, category, 0)
+            return
+        parent = _current.get()
+        thread = threading.current_thread()
+        span = Span(
+            name=name,
+            category=category,
+            start_ns=time.perf_counter_ns(),
+            span_id=next(_ids),
+            parent_id=parent.span_id if parent else None,
+            thread_id=thread.ident or 0,
+            thread_name=thread.name,
+            attributes=attributes,
+        )
+        token = _current.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            _current.reset(token)
+            span.duration_ns = time.perf_counter_ns() - span.start_ns
+            with self._lock:
+                self._spans.append(span)
+
+    def record(self, name: str, category: str, start_ns: int, end_ns: int, **attributes: Any) -> None:
+        """Record a span measured elsewhere (``time.perf_counter_ns`` timestamps)."""
+        if not self.enabled:
+            return
+        thread = threading.current_thread()
+        span = Span(
+            name=name,
+            category=category,
+            start_ns=start_ns,
+            duration_ns=max(end_ns - start_ns, 0),
+            span_id=next(_ids),
+            thread_id=thread.ident or 0,
+            thread_name=thread.name,
+            attributes=attributes,
+        )
+        with self._lock:
+            self._spans.append(span)
+
+    def spans(self) -> list[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+    def stats(self, group_by_name: bool = False) -> list[dict[str, Any]]:
+        """Latency summary per category (or per ``category/name``), slowest total first."""
+        groups: dict[str, list[Span]] = {}
+        for span in self.spans():
+            key = f"{span.category}/{span.name}" if group_by_name else span.category
+            groups.setdefault(key, []).append(span)
+
+        rows = []
+        for key, spans in groups.items():
+            durations = sorted(span.duration_ms for span in spans)
+            rows.append(
+                {
+                    "span": key,
+                    "count": len(durations),
+                    "errors": sum(1 for span in spans if span.error),
+                    "total_ms": round(sum(durations), 3),
+                    "p50_ms": round(percentile(durations, 0.50), 3),
+                    "p95_ms": round(percentile(durations, 0.95), 3),
+                    "max_ms": round(durations[-1], 3),
+                }
+            )
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows
+
+    # --- Export --------------------------------------------------------------
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Chrome trace-event format (complete ``X`` events, microseconds)."""
+        pid = os.getpid()
+        events: list[dict[str, Any]] = []
+        threads: dict[int, str] = {}
+        for span in self.spans():
+            threads.setdefault(span.thread_id, span.thread_name)
+            args = dict(span.attributes)
+            if span.error:
+                args["error"] = span.error
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": (span.start_ns + self._epoch_offset_ns) / 1000,
+                    "dur": span.duration_ns / 1000,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": _jsonable(args),
+                }
+            )
+        for tid, name in threads.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def iter_otel_records(self, service_name: str = "swecli") -> Iterator[dict[str, Any]]:
+        """One OpenTelemetry-style span record per line (``trace_id`` per process)."""
+        trace_id = f"{os.getpid():016x}{self._epoch_offset_ns & 0xFFFFFFFFFFFFFFFF:016x}"
+        for span in self.spans():
+            start = span.start_ns + self._epoch_offset_ns
+            yield {
+                "resource": {"service.name": service_name},
+                "trace_id": trace_id,
+                "span_id": f"{span.span_id:016x}",
+                "parent_span_id": f"{span.parent_id:016x}" if span.parent_id else None,
+                "name": span.name,
+                "kind": "INTERNAL",
+                "start_time_unix_nano": start,
+                "end_time_unix_nano": start + span.duration_ns,
+                "attributes": _jsonable({"swecli.category": span.category, **span.attributes}),
+                "status": {"code": "ERROR", "message": span.error} if span.error else {"code": "OK"},
+            }
+
+    def export(self, path: Path, fmt: Optional[str] = None) -> Path:
+        """Write the buffer to ``path`` as ``"chrome"`` JSON or ``"otel"`` JSONL.
+
+        The format defaults to OpenTelemetry JSONL for ``.jsonl`` paths and
+        Chrome trace JSON otherwise.
+        """
+        fmt = fmt or ("otel" if path.suffix == ".jsonl" else "chrome")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if fmt == "otel":
+            with path.open("w", encoding="utf-8") as handle:
+                for record in self.iter_otel_records():
+                    handle.write(json.dumps(record) + "\n")
+        elif fmt == "chrome":
+            path.write_text(json.dumps(self.to_chrome_trace()), encoding="utf-8")
+        else:
+            raise ValueError(f"Unknown trace format '{fmt}' (expected 'chrome' or 'otel')")
+        return path
+
+
+def _jsonable(values: dict[str, Any]) -> dict[str, Any]:
+    return {key: value if isinstance(value, (str, int, float, bool, type(None))) else str(value) for key, value in values.items()}
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Process-wide tracer used by the built-in instrumentation."""
+    return _tracer
+
+
+def span(name: str, category: str, **attributes: Any):
+    """Shortcut for ``get_tracer().span(...)``."""
+    return _tracer.span(name, category, **attributes)
+
+
+def traced(category: str, name: Optional[str] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator timing every call of a function as a span."""
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with _tracer.span(span_name, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def format_stats(rows: list[dict[str, Any]]) -> str:
+    """Plain-text table of ``Tracer.stats`` rows."""
+    if not rows:
+        return "No spans recorded yet."
+    width = max(len("span"), *(len(row["span"]) for row in rows))
+    lines = [f"{'span':<{width}}  {'count':>6}  {'p50 ms':>9}  {'p95 ms':>9}  {'max ms':>9}  {'total ms':>10}"]
+    for row in rows:
+        lines.append(
+            f"{row['span']:<{width}}  {row['count']:>6}  {row['p50_ms']:>9.1f}  {row['p95_ms']:>9.1f}  "
+            f"{row['max_ms']:>9.1f}  {row['total_ms']:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def _export_on_exit() -> None:
+    target = os.getenv("SWECLI_TRACE_FILE")
+    if target and _tracer.spans():
+        try:
+            _tracer.export(Path(target).expanduser())
+        except (OSError, ValueError):
+            pass
+
+
+atexit.register(_export_on_exit)
+
+
+__all__ = [
+    "APPROVAL",
+    "LLM",
+    "LSP",
+    "MCP",
+    "QUEUE",
+    "SESSION",
+    "TOOL",
+    "UI",
+    "Span",
+    "Tracer",
+    "format_stats",
+    "get_tracer",
+    "percentile",
+    "span",
+    "traced",
+]
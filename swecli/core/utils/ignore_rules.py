@@ -0,0 +1,280 @@
+"""Compiled ignore rules shared by everything that walks a workspace.
+
+Search, autocomplete, the web file browser, the codebase indexer and the
+language servers all decide which paths to skip. ``get_ignore_engine``
+returns one ``IgnoreEngine`` per workspace and exclude set:
+
+- Nested ``.gitignore`` files are loaded lazily into a trie keyed by
+  directory, shared by every engine of the workspace. Each file's patterns
+  are compiled into one alternation, so the common "no rule applies" answer
+  costs a single regex match per ancestor ``.gitignore``.
+- Default excludes become a name set plus one combined glob regex.
+- Directory decisions are memoized, so walkers prune a whole subtree with
+  one dictionary lookup (``skip_dir``).
+
+Loaded ``.gitignore`` files are re-checked at most every
+``REVALIDATE_INTERVAL`` seconds; when any of them changed, appeared or was
+removed, all compiled rules and memoized decisions are dropped.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple, Union
+
+import pathspec
+
+# Seconds between checks of the loaded .gitignore files for changes
+REVALIDATE_INTERVAL = 1.0
+# Memoized directory decisions kept per engine before the memo is reset
+MAX_MEMOIZED_DIRS = 100_000
+
+_GROUP_NAME = re.compile(r"\(\?P<[^>]+>")
+
+PathLike = Union[str, os.PathLike]
+
+
+@dataclass
+class _Node:
+    """Rules of one directory's ``.gitignore`` and its loaded subdirectories."""
+
+    mtime_ns: Optional[int] = None
+    # Patterns as (compiled regex, True to ignore / False for "!" negations)
+    patterns: List[Tuple[Pattern[str], bool]] = field(default_factory=list)
+    any_pattern: Optional[Pattern[str]] = None
+    children: Dict[str, "_Node"] = field(default_factory=dict)
+
+    def decide(self, relative: str) -> Optional[bool]:
+        """Whether the last matching pattern ignores ``relative``; None if none match."""
+        if self.any_pattern is None or self.any_pattern.match(relative) is None:
+            return None
+        for regex, include in reversed(self.patterns):
+            if regex.match(relative) is not None:
+                return include
+        return None
+
+
+def _gitignore_mtime(directory: str) -> Optional[int]:
+    try:
+        return os.stat(os.path.join(directory, ".gitignore")).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _load_node(directory: str) -> _Node:
+    node = _Node(mtime_ns=_gitignore_mtime(directory))
+    if node.mtime_ns is None:
+        return node
+    try:
+        with open(os.path.join(directory, ".gitignore"), encoding="utf-8", errors="ignore") as handle:
+            lines = [line.strip() for line in handle]
+    except OSError:
+        return node
+    lines = [line for line in lines if line and not line.startswith("#")]
+    for pattern in pathspec.PathSpec.from_lines(pathspec.patterns.GitWildMatchPattern, lines).patterns:
+        if pattern.include is not None and pattern.regex is not None:
+            node.patterns.append((pattern.regex, pattern.include))
+    if node.patterns:
+        node.any_pattern = re.compile(
+            "|".join(f"(?:{_GROUP_NAME.sub('(?:', regex.pattern)})" for regex, _ in node.patterns)
+        )
+    return node
+
+
+class GitignoreTrie:
+    """Lazily loaded ``.gitignore`` rules of one workspace, keyed by directory."""
+
+    def __init__(self, root: Path) -> None:
+        """Create an empty trie; directories are loaded when first matched under.
+
+        Args:
+            root: Workspace root (resolved)
+        """
+        self.root = root
+        self.generation = 0
+        self._root_str = str(root)
+        self._root_node: Optional[_Node] = None
+        self._lock = threading.RLock()
+        self._checked_at = time.monotonic()
+
+    def decide(self, parts: Tuple[str, ...], is_dir: bool) -> Optional[bool]:
+        """Gitignore decision for a path below the root; the deepest deciding file wins."""
+        with self._lock:
+            if self._root_node is None:
+                self._root_node = _load_node(self._root_str)
+            node = self._root_node
+            nodes = [node]
+            directory = self._root_str
+            for part in parts[:-1]:
+                directory = os.path.join(directory, part)
+                child = node.children.get(part)
+                if child is None:
+                    child = node.children[part] = _load_node(directory)
+                node = child
+                nodes.append(node)
+
+        suffix = "/" if is_dir else ""
+        for depth in range(len(nodes) - 1, -1, -1):
+            decision = nodes[depth].decide("/".join(parts[depth:]) + suffix)
+            if decision is not None:
+                return decision
+        return None
+
+    def revalidate(self, interval: float = REVALIDATE_INTERVAL) -> bool:
+        """Drop every loaded rule if any ``.gitignore`` changed; True when dropped."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._checked_at < interval:
+                return False
+            self._checked_at = now
+            if self._root_node is None:
+                return False
+            stack = [(self._root_str, self._root_node)]
+            while stack:
+                directory, node = stack.pop()
+                if _gitignore_mtime(directory) != node.mtime_ns:
+                    self._root_node = None
+                    self.generation += 1
+                    return True
+                stack.extend((os.path.join(directory, name), child) for name, child in node.children.items())
+            return False
+
+
+class IgnoreEngine:
+    """Ignore decisions for one workspace: nested ``.gitignore`` files plus default excludes."""
+
+    def __init__(self, trie: GitignoreTrie, excludes: Iterable[str] = ()) -> None:
+        """Compile the default excludes.
+
+        Args:
+            trie: Shared ``.gitignore`` rules of the workspace
+            excludes: Names ignored anywhere in a path (``"node_modules"``) and
+                glob patterns matched against file and directory names (``"*.pyc"``)
+        """
+        self.trie = trie
+        self.root = trie.root
+        excludes = list(excludes)
+        self.excluded_names = frozenset(name for name in excludes if not _is_glob(name))
+        globs = [name for name in excludes if _is_glob(name)]
+        self._excluded_glob = re.compile("|".join(fnmatch.translate(glob) for glob in globs)) if globs else None
+        self._dir_memo: Dict[str, bool] = {}
+        self._generation = trie.generation
+
+    def is_excluded_name(self, name: str) -> bool:
+        """Whether a file or directory name is one of the default excludes."""
+        if name in self.excluded_names:
+            return True
+        return self._excluded_glob is not None and self._excluded_glob.match(name) is not None
+
+    def is_ignored(self, path: PathLike, is_dir: Optional[bool] = None) -> bool:
+        """Whether ``path`` (absolute or relative to the root) is ignored.
+
+        Args:
+            path: Path to check
+            is_dir: Whether ``path`` is a directory (looked up when omitted)
+
+        Returns:
+            True if the path or one of its parent directories is ignored.
+            Paths outside the workspace are never ignored.
+        """
+        parts = self._relative_parts(path)
+        if not parts:
+            return False
+        if is_dir is None:
+            is_dir = os.path.isdir(os.path.join(self.root, *parts))
+        if is_dir:
+            return self._dir_ignored(parts)
+        if len(parts) > 1 and self._dir_ignored(parts[:-1]):
+            return True
+        return self.is_excluded_name(parts[-1]) or bool(self.trie.decide(parts, False))
+
+    def skip_dir(self, path: PathLike) -> bool:
+        """Whether a walk should prune the directory at ``path`` and everything below it."""
+        parts = self._relative_parts(path)
+        return bool(parts) and self._dir_ignored(parts)
+
+    def filter_paths(self, paths: Iterable[PathLike]) -> List[PathLike]:
+        """``paths`` without the ignored ones."""
+        return [path for path in paths if not self.is_ignored(path)]
+
+    # --- Internals -----------------------------------------------------------
+
+    def _relative_parts(self, path: PathLike) -> Tuple[str, ...]:
+        path = Path(path)
+        if not path.is_absolute():
+            return tuple(part for part in path.parts if part not in ("", "."))
+        try:
+            return path.relative_to(self.root).parts
+        except ValueError:
+            pass
+        try:
+            return path.resolve().relative_to(self.root).parts
+        except (OSError, ValueError):
+            return ()
+
+    def _dir_ignored(self, parts: Tuple[str, ...]) -> bool:
+        if self._generation != self.trie.generation:
+            self._dir_memo.clear()
+            self._generation = self.trie.generation
+        key = "/".join(parts)
+        cached = self._dir_memo.get(key)
+        if cached is None:
+            cached = (
+                (len(parts) > 1 and self._dir_ignored(parts[:-1]))
+                or self.is_excluded_name(parts[-1])
+                or bool(self.trie.decide(parts, True))
+            )
+            if len(self._dir_memo) >= MAX_MEMOIZED_DIRS:
+                self._dir_memo.clear()
+            self._dir_memo[key] = cached
+        return cached
+
+
+def _is_glob(pattern: str) -> bool:
+    return any(char in pattern for char in "*?[")
+
+
+_engines_lock = threading.Lock()
+_tries: Dict[Path, GitignoreTrie] = {}
+_engines: Dict[Tuple[Path, frozenset], IgnoreEngine] = {}
+# Roots as passed by callers -> resolved roots, so repeat lookups skip resolve()
+_resolved_roots: Dict[str, Path] = {}
+
+
+def get_ignore_engine(root: PathLike, excludes: Iterable[str] = ()) -> IgnoreEngine:
+    """Shared ignore engine for a workspace and set of default excludes.
+
+    Engines of the same workspace share one ``GitignoreTrie``, which is
+    revalidated (at most every ``REVALIDATE_INTERVAL`` seconds) on each call.
+
+    Args:
+        root: Workspace root
+        excludes: Default excludes applied on top of the ``.gitignore`` files
+
+    Returns:
+        The workspace's ``IgnoreEngine`` for these excludes
+    """
+    root_key = os.fspath(root)
+    resolved = _resolved_roots.get(root_key)
+    if resolved is None:
+        resolved = _resolved_roots[root_key] = Path(root).resolve()
+    root = resolved
+    key = (root, frozenset(excludes))
+    with _engines_lock:
+        trie = _tries.get(root)
+        if trie is None:
+            trie = _tries[root] = GitignoreTrie(root)
+        engine = _engines.get(key)
+        if engine is None:
+            engine = _engines[key] = IgnoreEngine(trie, key[1])
+    trie.revalidate()
+    return engine
+
+
+__all__ = ["REVALIDATE_INTERVAL", "GitignoreTrie", "IgnoreEngine", "get_ignore_engine"]
@@ -34,6 +34,7 @@ DEFAULT_SLASH_COMMANDS = [
     # Advanced
     SlashCommand("init", "initialize codebase with AGENTS.md"),
     SlashCommand("mcp", "manage MCP servers and tools"),
+    SlashCommand("perf", "show latency stats and export traces"),
 ]
 
 
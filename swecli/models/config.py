@@ -90,7 +90,7 @@ class PlaybookConfig(BaseModel):
 
     max_strategies: int = Field(default=30, ge=1)
     use_selection: bool = True
-    embedding_model: str = "text-embedding-3-small"
+    embedding_model: str = "text-embedding-3-small"  # "local" = offline hashed n-gram embedder
     embedding_provider: str = "openai"
     scoring_weights: PlaybookScoringWeights = Field(default_factory=PlaybookScoringWeights)
     cache_embeddings: bool = True  # Phase 4: Enable embedding persistence
@@ -139,6 +139,9 @@ class AppConfig(BaseModel):
     auto_mode: AutoModeConfig = Field(default_factory=AutoModeConfig)
     operation: OperationConfig = Field(default_factory=OperationConfig)
     max_undo_history: int = 50  # Maximum operations to track for undo
+    max_parallel_subagents: int = Field(default=4, ge=1)  # Concurrency cap for spawn_subagents
+    tool_schema_pruning: bool = True  # Send core tools plus query-relevant ones instead of every schema
+    speculative_prefetch: bool = False  # Read likely-needed files and symbols while the model is generating
 
     # ACE Playbook settings
     playbook: PlaybookConfig = Field(default_factory=PlaybookConfig)
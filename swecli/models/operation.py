@@ -83,6 +83,8 @@ class EditResult(BaseModel):
     lines_added: int
     lines_removed: int
     backup_path: Optional[str] = None
+    before_snapshot: Optional[str] = None  # Undo store digest of the original content
+    after_snapshot: Optional[str] = None  # Undo store digest of the edited content
     error: Optional[str] = None
     operation_id: Optional[str] = None
     diff: Optional[str] = None  # Diff preview for the edit
@@ -57,6 +57,12 @@ class HelpCommand(CommandHandler):
 - `/mcp reload` - Reload MCP configuration
 - `/mcp debug` - Show debug info (tools in agent)
 
+## Performance
+- `/perf` - Show p50/p95 latency per span type (LLM, tools, MCP, ...)
+- `/perf all` - Break latency down by individual span name
+- `/perf export [path]` - Write the trace (Chrome JSON, or OpenTelemetry for `.jsonl`)
+- `/perf clear` - Clear the trace buffer
+
 ## General
 - `/help` - Show this help message
 - `/exit` - Exit SWE-CLI
@@ -262,6 +262,17 @@ class MCPCommands(CommandHandler):
                 mcp_tools = sum(1 for t in self.agent.tool_schemas if 'mcp__' in t.get('function', {}).get('name', ''))
                 self.console.print(f"Agent tools: {total_tools} total ({mcp_tools} MCP tools)")
 
+                from swecli.core.agents.components.tool_selector import get_tool_selector
+
+                selector = get_tool_selector(self.agent.tool_schemas)
+                if selector is not None and selector.requests:
+                    stats = selector.savings()
+                    self.console.print(
+                        f"Tool schema pruning: ~{stats['sent_tokens'] // stats['requests']} of "
+                        f"~{stats['full_tokens'] // stats['requests']} tokens per request "
+                        f"({stats['saved_ratio']:.0%} saved over {stats['requests']} requests)"
+                    )
+
                 if mcp_tools > 0:
                     self.console.print("\nMCP tools in agent:")
                     shown = 0
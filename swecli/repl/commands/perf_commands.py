@@ -0,0 +1,87 @@
+"""Performance trace commands for REPL."""
+
+from datetime import datetime
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from swecli.core.runtime.monitoring.tracing import Tracer, get_tracer
+from swecli.repl.commands.base import CommandHandler, CommandResult
+
+
+class PerfCommands(CommandHandler):
+    """Handler for /perf: latency summary and trace export."""
+
+    def __init__(self, console: Console, tracer: Tracer | None = None):
+        """Initialize perf commands handler.
+
+        Args:
+            console: Rich console for output
+            tracer: Tracer to report on (defaults to the process-wide one)
+        """
+        super().__init__(console)
+        self.tracer = tracer or get_tracer()
+
+    def handle(self, args: str) -> CommandResult:
+        """Handle /perf with an optional subcommand.
+
+        Args:
+            args: ``""``/``"all"`` (summary), ``"export [path]"`` or ``"clear"``
+
+        Returns:
+            CommandResult from subcommand execution
+        """
+        parts = args.split(maxsplit=1)
+        subcmd = parts[0].lower() if parts else ""
+        subcmd_args = parts[1].strip() if len(parts) > 1 else ""
+
+        if subcmd in ("", "all"):
+            return self.show_stats(group_by_name=subcmd == "all")
+        if subcmd == "export":
+            return self.export(subcmd_args)
+        if subcmd == "clear":
+            self.tracer.clear()
+            self.print_success("Trace buffer cleared")
+            return CommandResult(success=True)
+
+        self.print_error(f"Unknown subcommand: {subcmd}")
+        self.console.print("Usage: /perf [all | export [path] | clear]")
+        return CommandResult(success=False, message=f"Unknown subcommand: {subcmd}")
+
+    def show_stats(self, group_by_name: bool = False) -> CommandResult:
+        """Print p50/p95 latency per span type (or per individual span name)."""
+        rows = self.tracer.stats(group_by_name=group_by_name)
+        if not rows:
+            self.print_info("No spans recorded yet.")
+            return CommandResult(success=True, data=rows)
+
+        table = Table(title="Latency by span", show_header=True, header_style="bold")
+        table.add_column("Span")
+        for column in ("Count", "p50 ms", "p95 ms", "Max ms", "Total ms"):
+            table.add_column(column, justify="right")
+        for row in rows:
+            table.add_row(
+                row["span"],
+                str(row["count"]),
+                f"{row['p50_ms']:.1f}",
+                f"{row['p95_ms']:.1f}",
+                f"{row['max_ms']:.1f}",
+                f"{row['total_ms']:.1f}",
+            )
+        self.console.print(table)
+        return CommandResult(success=True, data=rows)
+
+    def export(self, target: str) -> CommandResult:
+        """Write the trace buffer; ``.jsonl`` paths get OpenTelemetry JSONL, others Chrome JSON."""
+        if target:
+            path = Path(target).expanduser()
+        else:
+            path = Path.home() / ".swecli" / "traces" / f"trace-{datetime.now():%Y%m%d-%H%M%S}.json"
+        try:
+            written = self.tracer.export(path)
+        except OSError as exc:
+            self.print_error(f"Could not write trace: {exc}")
+            return CommandResult(success=False, message=str(exc))
+        self.print_success(f"Trace written to {written} ({len(self.tracer.spans())} spans)")
+        return CommandResult(success=True, data=written)
@@ -1,10 +1,9 @@
 """Query processing for REPL."""
 
 import json
-import os
 import random
-from datetime import datetime
-from typing import TYPE_CHECKING, Iterable
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, ContextManager, Iterable
 
 from swecli.core.context_engineering.memory import (
     Playbook,
@@ -13,6 +12,8 @@ from swecli.core.context_engineering.memory import (
     Curator,
     ReflectorOutput,
     CuratorOutput,
+    LearningRecord,
+    LearningWorker,
 )
 from swecli.ui_textual.utils.tool_display import format_tool_call
 
@@ -191,6 +192,7 @@ class QueryProcessor:
         self._ace_reflector: Optional[Reflector] = None
         self._ace_curator: Optional[Curator] = None
         self._last_agent_response: Optional[AgentResponse] = None
+        self._learning_worker: Optional[LearningWorker] = None
         self._execution_count = 0
 
     def set_notification_center(self, notification_center):
@@ -225,6 +227,13 @@ class QueryProcessor:
 
             self._ace_curator = Curator(agent.client)
 
+        if self._learning_worker is None:
+            self._learning_worker = LearningWorker(
+                self._ace_reflector,
+                self._ace_curator,
+                debug_log_path=self.PLAYBOOK_DEBUG_PATH,
+            )
+
     def enhance_query(self, query: str) -> str:
         """Enhance query with file contents if referenced.
 
@@ -382,6 +391,12 @@ class QueryProcessor:
             # Clear current monitor
             self._current_task_monitor = None
 
+    def _speculate(self, tool_registry, query: str, messages: list, task_monitor) -> ContextManager:
+        """Prefetch likely next reads during the LLM call, if enabled in config."""
+        if getattr(self.config, "speculative_prefetch", False) and hasattr(tool_registry, "speculate"):
+            return tool_registry.speculate(query, messages, task_monitor)
+        return nullcontext()
+
     def _record_tool_learnings(
         self,
         query: str,
@@ -389,12 +404,10 @@ class QueryProcessor:
         outcome: str,
         agent,
     ) -> None:
-        """Use ACE Reflector and Curator to evolve playbook from tool execution.
+        """Queue tool execution for ACE learning on the background worker.
 
-        This implements the full ACE workflow:
-        1. Reflector analyzes what happened (LLM-powered)
-        2. Curator decides playbook changes (delta operations)
-        3. Apply deltas to evolve playbook
+        The Reflector/Curator round-trips and delta application happen on the
+        ``LearningWorker`` thread, so this returns immediately.
 
         Args:
             query: User's query
@@ -415,67 +428,20 @@ class QueryProcessor:
             return
 
         try:
-            # Initialize ACE components if needed
             self._init_ace_components(agent)
-
-            playbook = session.get_playbook()
-
-            # Format tool feedback for reflector
-            feedback = self._format_tool_feedback(tool_calls, outcome)
-
-            # STEP 1: Reflect on execution using ACE Reflector
-            reflection = self._ace_reflector.reflect(
-                question=query,
-                agent_response=self._last_agent_response,
-                playbook=playbook,
-                ground_truth=None,
-                feedback=feedback
-            )
-
-            # STEP 2: Apply bullet tags from reflection
-            for bullet_tag in reflection.bullet_tags:
-                try:
-                    playbook.tag_bullet(bullet_tag.id, bullet_tag.tag)
-                except (ValueError, KeyError):
-                    continue
-
-            # STEP 3: Curate playbook updates using ACE Curator
             self._execution_count += 1
-            curator_output = self._ace_curator.curate(
-                reflection=reflection,
-                playbook=playbook,
-                question_context=query,
-                progress=f"Query #{self._execution_count}"
+            self._learning_worker.submit(
+                LearningRecord(
+                    session=session,
+                    query=query,
+                    agent_response=self._last_agent_response,
+                    feedback=self._format_tool_feedback(tool_calls, outcome),
+                    outcome=outcome,
+                )
             )
-
-            # STEP 4: Apply delta operations
-            bullets_before = len(playbook.bullets())
-            playbook.apply_delta(curator_output.delta)
-            bullets_after = len(playbook.bullets())
-
-            # Save updated playbook
-            session.update_playbook(playbook)
-
-            # Debug logging
-            if bullets_after != bullets_before or curator_output.delta.operations:
-                debug_dir = os.path.dirname(self.PLAYBOOK_DEBUG_PATH)
-                os.makedirs(debug_dir, exist_ok=True)
-                with open(self.PLAYBOOK_DEBUG_PATH, "a", encoding="utf-8") as log:
-                    timestamp = datetime.now().isoformat()
-                    log.write(f"\n{'=' * 60}\n")
-                    log.write(f"🧠 ACE PLAYBOOK EVOLUTION - {timestamp}\n")
-                    log.write(f"{'=' * 60}\n")
-                    log.write(f"Query: {query}\n")
-                    log.write(f"Outcome: {outcome}\n")
-                    log.write(f"Bullets: {bullets_before} -> {bullets_after}\n")
-                    log.write(f"Delta Operations: {len(curator_output.delta.operations)}\n")
-                    for op in curator_output.delta.operations:
-                        log.write(f"  - {op.type}: {op.section} - {op.content[:80] if op.content else op.bullet_id}\n")
-                    log.write(f"Reflection Key Insight: {reflection.key_insight}\n")
-                    log.write(f"Curator Reasoning: {curator_output.delta.reasoning[:200]}\n")
-
         except Exception as e:  # pragma: no cover
             # Log error but don't break query processing
+            import os
             import traceback
             debug_dir = os.path.dirname(self.PLAYBOOK_DEBUG_PATH)
             os.makedirs(debug_dir, exist_ok=True)
@@ -484,6 +450,11 @@ class QueryProcessor:
                 log.write(f"❌ ACE ERROR: {str(e)}\n")
                 log.write(traceback.format_exc())
 
+    def shutdown_learning(self, timeout: float = 5.0) -> None:
+        """Give queued ACE learning a chance to finish before exit."""
+        if self._learning_worker is not None:
+            self._learning_worker.close(timeout)
+
     def _format_tool_feedback(self, tool_calls: list, outcome: str) -> str:
         """Format tool execution results as feedback string for ACE Reflector.
 
@@ -667,6 +638,10 @@ class QueryProcessor:
         # Prepare messages for API
         messages = self._prepare_messages(query, enhanced_query, agent)
 
+        # Reads cached during the previous query may be stale now
+        if hasattr(tool_registry, "begin_turn"):
+            tool_registry.begin_turn()
+
         try:
             # ReAct loop: Reasoning → Acting → Observing
             consecutive_reads = 0
@@ -678,7 +653,8 @@ class QueryProcessor:
 
                 # Call LLM
                 task_monitor = TaskMonitor()
-                response, latency_ms = self._call_llm_with_progress(agent, messages, task_monitor)
+                with self._speculate(tool_registry, query, messages, task_monitor):
+                    response, latency_ms = self._call_llm_with_progress(agent, messages, task_monitor)
                 self._last_latency_ms = latency_ms
 
                 if not response["success"]:
@@ -742,6 +718,10 @@ class QueryProcessor:
                 all_reads = all(tc["function"]["name"] in READ_OPERATIONS for tc in tool_calls)
                 consecutive_reads = consecutive_reads + 1 if all_reads else 0
 
+                # Start independent MCP calls concurrently; results are consumed in order below
+                if hasattr(tool_registry, "prefetch_tool_calls"):
+                    tool_registry.prefetch_tool_calls(tool_calls)
+
                 # Execute tool calls
                 for tool_call in tool_calls:
                     result = self._execute_tool_call(tool_call, tool_registry, approval_manager, undo_manager)
@@ -862,6 +842,10 @@ class QueryProcessor:
         # Prepare messages for API
         messages = self._prepare_messages(query, enhanced_query, agent)
 
+        # Reads cached during the previous query may be stale now
+        if hasattr(tool_registry, "begin_turn"):
+            tool_registry.begin_turn()
+
         try:
             # ReAct loop: Reasoning → Acting → Observing
             consecutive_reads = 0
@@ -881,7 +865,8 @@ class QueryProcessor:
 
                 # Call LLM
                 task_monitor = TaskMonitor()
-                response, latency_ms = self._call_llm_with_progress(agent, messages, task_monitor)
+                with self._speculate(tool_registry, query, messages, task_monitor):
+                    response, latency_ms = self._call_llm_with_progress(agent, messages, task_monitor)
                 self._last_latency_ms = latency_ms
 
                 # Debug: LLM response
@@ -956,6 +941,10 @@ class QueryProcessor:
                 all_reads = all(tc["function"]["name"] in READ_OPERATIONS for tc in tool_calls)
                 consecutive_reads = consecutive_reads + 1 if all_reads else 0
 
+                # Start independent MCP calls concurrently; results are consumed in order below
+                if hasattr(tool_registry, "prefetch_tool_calls"):
+                    tool_registry.prefetch_tool_calls(tool_calls)
+
                 # Execute tool calls with real-time display
                 operation_cancelled = False
                 for tool_call in tool_calls:
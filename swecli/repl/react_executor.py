@@ -1,7 +1,8 @@
 """ReAct loop execution with SOLID principles."""
 
 import json
-from typing import TYPE_CHECKING, Optional
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, ContextManager, Optional
 
 from swecli.models.message import ChatMessage, Role, ToolCall as ToolCallModel
 from swecli.core.runtime.monitoring import TaskMonitor
@@ -123,7 +124,7 @@ class MessagePersister:
             role=Role.ASSISTANT,
             content=content,
             metadata=metadata,
-            tool_calls=tool_calls or None,
+            tool_calls=tool_calls or [],
         )
         self.session_manager.add_message(assistant_msg, self.config.auto_save_interval)
 
@@ -307,8 +308,9 @@ class ReActExecutor:
         Returns:
             Tuple of (should_break, operation_cancelled)
         """
-        # Call LLM
-        response, latency_ms = self._call_llm(agent, messages, ui_callback)
+        # Call LLM, prefetching likely next reads meanwhile if enabled
+        with self._speculate(tool_registry, query, messages):
+            response, latency_ms = self._call_llm(agent, messages, ui_callback)
         self._last_latency_ms = latency_ms
 
         # Handle LLM errors
@@ -371,6 +373,12 @@ class ReActExecutor:
 
         return (False, operation_cancelled)
 
+    def _speculate(self, tool_registry, query: str, messages: list) -> ContextManager:
+        """Prefetch likely next reads during the LLM call, if enabled in config."""
+        if getattr(self.config, "speculative_prefetch", False) and hasattr(tool_registry, "speculate"):
+            return tool_registry.speculate(query, messages)
+        return nullcontext()
+
     def _call_llm(self, agent, messages: list, ui_callback) -> tuple:
         """Call LLM with progress display.
 
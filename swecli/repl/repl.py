@@ -23,12 +23,7 @@ from swecli.core.runtime.services import RuntimeService
 from swecli.models.message import ChatMessage, Role
 from swecli.models.operation import Operation, OperationType
 from swecli.models.agent_deps import AgentDependencies
-from swecli.core.context_engineering.tools.implementations import (
-    FileOperations,
-    WriteTool,
-    EditTool,
-    BashTool,
-)
+from swecli.core.context_engineering.tools.lazy import lazy_tools
 from swecli.ui_textual.components.console_animations import Spinner
 from swecli.ui_textual.components import StatusLine, NotificationCenter
 from swecli.ui_textual.autocomplete import SwecliCompleter
@@ -41,6 +36,7 @@ from swecli.repl.commands import (
     MCPCommands,
     HelpCommand,
     ConfigCommands,
+    PerfCommands,
 )
 
 # UI components
@@ -89,23 +85,18 @@ class REPL:
         self.running = True
 
     def _init_tools(self):
-        """Initialize file operation and command tools."""
-        from swecli.core.context_engineering.tools.implementations import (
-            WebFetchTool,
-            OpenBrowserTool,
-            VLMTool,
-            WebScreenshotTool,
-        )
+        """Initialize file operation and command tools (constructed on first use)."""
         from swecli.core.context_engineering.mcp.manager import MCPManager
 
-        self.file_ops = FileOperations(self.config, self.config_manager.working_dir)
-        self.write_tool = WriteTool(self.config, self.config_manager.working_dir)
-        self.edit_tool = EditTool(self.config, self.config_manager.working_dir)
-        self.bash_tool = BashTool(self.config, self.config_manager.working_dir)
-        self.web_fetch_tool = WebFetchTool(self.config, self.config_manager.working_dir)
-        self.open_browser_tool = OpenBrowserTool(self.config, self.config_manager.working_dir)
-        self.vlm_tool = VLMTool(self.config, self.config_manager.working_dir)
-        self.web_screenshot_tool = WebScreenshotTool(self.config, self.config_manager.working_dir)
+        tools = lazy_tools(self.config, self.config_manager.working_dir)
+        self.file_ops = tools["file_ops"]
+        self.write_tool = tools["write_tool"]
+        self.edit_tool = tools["edit_tool"]
+        self.bash_tool = tools["bash_tool"]
+        self.web_fetch_tool = tools["web_fetch_tool"]
+        self.open_browser_tool = tools["open_browser_tool"]
+        self.vlm_tool = tools["vlm_tool"]
+        self.web_screenshot_tool = tools["web_screenshot_tool"]
         self.mcp_manager = MCPManager(working_dir=self.config_manager.working_dir)
 
     def _init_managers(self):
@@ -222,6 +213,8 @@ class REPL:
             agent=self.agent,
         )
 
+        self.perf_commands = PerfCommands(self.console)
+
         self.help_command = HelpCommand(
             self.console,
             self.mode_manager,
@@ -488,6 +481,8 @@ class REPL:
             self.config_commands.show_model_selector()
         elif cmd == "/mcp":
             self.mcp_commands.handle(args)
+        elif cmd == "/perf":
+            self.perf_commands.handle(args)
         elif cmd == "/init":
             self._init_codebase(command)
         elif cmd == "/run":
@@ -620,9 +615,14 @@ class REPL:
 
         def connect_in_background():
             """Background thread to connect to MCP servers."""
+            def on_server_ready(server_name: str, success: bool) -> None:
+                # Tools become usable as each server comes up
+                if success:
+                    self._refresh_runtime_tooling()
+
             try:
                 # Get connection results using synchronous wrapper
-                results = self.mcp_manager.connect_enabled_servers_sync()
+                results = self.mcp_manager.connect_enabled_servers_sync(on_server_ready=on_server_ready)
 
                 if results:
                     # Silently connect - no messages
@@ -631,6 +631,13 @@ class REPL:
                 # Silently fail - user can check with /mcp list
                 pass
 
+        # Expose cached tool schemas of the starting servers right away
+        try:
+            self.mcp_manager.begin_startup()
+            self._refresh_runtime_tooling()
+        except Exception:
+            pass
+
         # Start connection in background thread - silently
         thread = threading.Thread(target=connect_in_background, daemon=True)
         thread.start()
@@ -643,6 +650,9 @@ class REPL:
         except Exception as e:
             self.console.print(f"[yellow]Warning: Error disconnecting MCP servers: {e}[/yellow]")
 
+        # Let queued playbook learning land before the session is saved
+        self.query_processor.shutdown_learning()
+
         # Save current session
         if self.session_manager.current_session:
             self.session_manager.save_session()
@@ -75,3 +75,4 @@ BUILTIN_COMMANDS.register(SlashCommand("mode", "switch between NORMAL and PLAN m
 # Advanced commands
 BUILTIN_COMMANDS.register(SlashCommand("init", "analyze codebase and generate AGENTS.md"))
 BUILTIN_COMMANDS.register(SlashCommand("mcp", "manage MCP servers and tools"))
+BUILTIN_COMMANDS.register(SlashCommand("perf", "show latency stats and export traces"))
@@ -1,19 +1,16 @@
 """GitIgnore parser utility for autocomplete filtering."""
 
-import os
 from pathlib import Path
 from typing import Optional
 
-import pathspec
-from pathspec import PathSpec
+from swecli.core.utils.ignore_rules import get_ignore_engine
 
 
 class GitIgnoreParser:
     """Parser for .gitignore files that supports nested gitignore files.
 
-    This class loads and parses .gitignore files from a root directory
-    and all its subdirectories, providing methods to check if paths
-    should be ignored based on gitignore patterns.
+    Checks paths against the .gitignore files of a root directory and all
+    its subdirectories, using the workspace's shared ``IgnoreEngine``.
     """
 
     # Always ignore these directories regardless of .gitignore
@@ -65,125 +62,21 @@ class GitIgnoreParser:
             root_dir: Root directory to start parsing from
         """
         self.root_dir = root_dir.resolve()
-        # List of (directory, PathSpec) tuples - directory is where the .gitignore lives
-        self._specs: list[tuple[Path, PathSpec]] = []
-        self._load_gitignore_files()
-
-    def _load_gitignore_files(self) -> None:
-        """Find and parse all .gitignore files in the directory tree."""
-        # First, load root .gitignore if it exists
-        root_gitignore = self.root_dir / ".gitignore"
-        if root_gitignore.exists():
-            spec = self._parse_gitignore(root_gitignore)
-            if spec:
-                self._specs.append((self.root_dir, spec))
-
-        # Walk directory tree to find nested .gitignore files
-        # We need to be careful not to descend into always-ignored directories
-        try:
-            for root, dirs, files in os.walk(self.root_dir):
-                # Skip always-ignored directories
-                dirs[:] = [d for d in dirs if d not in self.ALWAYS_IGNORE_DIRS]
-
-                root_path = Path(root)
-
-                # Skip the root directory since we already processed it
-                if root_path == self.root_dir:
-                    continue
-
-                # Check for .gitignore in this directory
-                gitignore_path = root_path / ".gitignore"
-                if gitignore_path.exists():
-                    spec = self._parse_gitignore(gitignore_path)
-                    if spec:
-                        self._specs.append((root_path, spec))
-        except (PermissionError, OSError):
-            pass
-
-    def _parse_gitignore(self, gitignore_path: Path) -> Optional[PathSpec]:
-        """Parse a single .gitignore file.
+        # Nested .gitignore files are compiled lazily and shared with search,
+        # the web file browser and the language servers
+        self._engine = get_ignore_engine(self.root_dir, self.ALWAYS_IGNORE_DIRS)
 
-        Args:
-            gitignore_path: Path to the .gitignore file
-
-        Returns:
-            PathSpec object or None if parsing fails
-        """
-        try:
-            with open(gitignore_path, "r", encoding="utf-8", errors="ignore") as f:
-                lines = f.readlines()
-
-            # Filter out comments and empty lines, normalize patterns
-            patterns = []
-            for line in lines:
-                line = line.strip()
-                # Skip empty lines and comments
-                if not line or line.startswith("#"):
-                    continue
-                patterns.append(line)
-
-            if patterns:
-                return pathspec.PathSpec.from_lines(
-                    pathspec.patterns.GitWildMatchPattern, patterns
-                )
-        except (IOError, OSError):
-            pass
-
-        return None
-
-    def is_ignored(self, path: Path) -> bool:
+    def is_ignored(self, path: Path, is_dir: Optional[bool] = None) -> bool:
         """Check if a path should be ignored based on gitignore patterns.
 
         Args:
             path: Absolute or relative path to check
+            is_dir: Whether the path is a directory (looked up when omitted)
 
         Returns:
             True if the path matches any gitignore pattern
         """
-        # Ensure we have an absolute path
-        if not path.is_absolute():
-            path = self.root_dir / path
-
-        path = path.resolve()
-
-        # Check if path is under root
-        try:
-            rel_path = path.relative_to(self.root_dir)
-        except ValueError:
-            return False
-
-        # Check against always-ignored directories
-        for part in rel_path.parts:
-            if part in self.ALWAYS_IGNORE_DIRS:
-                return True
-
-        # Check against each applicable gitignore spec
-        for spec_dir, spec in self._specs:
-            # Only apply specs that are in the path's ancestor chain
-            try:
-                # Check if path is under spec_dir
-                path.relative_to(spec_dir)
-            except ValueError:
-                # Path is not under this spec's directory
-                continue
-
-            # Get path relative to spec's directory for matching
-            try:
-                match_path = path.relative_to(spec_dir)
-            except ValueError:
-                continue
-
-            # Normalize path for matching
-            match_str = str(match_path).replace(os.sep, "/")
-
-            # Add trailing slash for directories
-            if path.is_dir() and not match_str.endswith("/"):
-                match_str += "/"
-
-            if spec.match_file(match_str):
-                return True
-
-        return False
+        return self._engine.is_ignored(path, is_dir=is_dir)
 
     def should_skip_dir(self, dir_path: Path) -> bool:
         """Check if a directory should be skipped during traversal.
@@ -197,13 +90,9 @@ class GitIgnoreParser:
         Returns:
             True if the directory should be skipped
         """
-        dir_name = dir_path.name
-
-        # Always skip these directories
-        if dir_name in self.ALWAYS_IGNORE_DIRS:
+        if dir_path.name in self.ALWAYS_IGNORE_DIRS:
             return True
-
-        return self.is_ignored(dir_path)
+        return self._engine.skip_dir(dir_path)
 
     def filter_paths(self, paths: list[Path]) -> list[Path]:
         """Filter a list of paths, removing ignored ones.
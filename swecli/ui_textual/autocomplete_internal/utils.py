@@ -141,14 +141,14 @@ class FileFinder:
         """
         parser = self._get_gitignore_parser()
         if parser:
-            return parser.is_ignored(file_path)
+            return parser.is_ignored(file_path, is_dir=False)
         return False
 
     def _build_cache(self) -> None:
         """Build the file cache by walking the directory tree once."""
         cache: List[tuple[str, Path]] = []
 
-        # Reset gitignore parser when rebuilding cache (it may have changed)
+        # Re-check for a root .gitignore; the shared rules revalidate themselves
         self._gitignore_loaded = False
         self._gitignore_parser = None
 
@@ -0,0 +1,237 @@
+"""Lazy replay of a resumed session into the conversation log.
+
+Resuming a long session used to re-render every stored message (markdown,
+code blocks, tool summaries) before the log settled. ``HistoryHydrator``
+renders only the last couple of screens up front and materializes older
+messages in chunks as the user scrolls back. Rendered lines are cached on
+disk per session, keyed by a hash of the message and the render width, so a
+later resume of the same session skips rendering entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from rich.segment import Segment
+from rich.style import Style
+from textual.strip import Strip
+
+from swecli.models.message import ChatMessage, Role
+
+# Bump when the conversation log's rendering of stored messages changes
+RENDER_CACHE_VERSION = 1
+TAIL_SCREENS = 2
+OLDER_CHUNK_MESSAGES = 20
+
+
+def get_render_cache_dir() -> Path:
+    """Directory holding per-session rendered-history caches."""
+    return Path.home() / ".swecli" / "cache" / "render"
+
+
+def message_fingerprint(message: ChatMessage) -> str:
+    """Stable hash of everything that affects how ``message`` is replayed."""
+    tool_calls = [
+        {
+            "name": call.name,
+            "parameters": call.parameters,
+            "summary": call.result_summary,
+            "error": call.error,
+            "result": None if call.result_summary else str(call.result),
+        }
+        for call in message.tool_calls or []
+    ]
+    payload = json.dumps(
+        [message.role.value, message.content, tool_calls],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def has_visible_content(message: ChatMessage) -> bool:
+    """Whether replaying ``message`` writes anything to the log."""
+    if (message.content or "").strip():
+        return message.role in (Role.USER, Role.ASSISTANT, Role.SYSTEM)
+    return message.role == Role.ASSISTANT and bool(message.tool_calls)
+
+
+@lru_cache(maxsize=1024)
+def _parse_style(style: str) -> Style:
+    return Style.parse(style)
+
+
+class RenderCache:
+    """Rendered lines per message, stored as one JSON file per session."""
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: Cache file, or None to keep entries in memory only
+        """
+        self.path = path
+        self._entries: dict[str, list] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if path is not None:
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = None
+            if isinstance(data, dict) and data.get("version") == RENDER_CACHE_VERSION:
+                self._entries = data.get("entries") or {}
+
+    @classmethod
+    def for_session(cls, session_id: Optional[str]) -> "RenderCache":
+        if not session_id:
+            return cls()
+        return cls(get_render_cache_dir() / f"{session_id}.json")
+
+    @staticmethod
+    def key(message: ChatMessage, width: int) -> str:
+        return f"{message_fingerprint(message)}:{width}"
+
+    def get(self, key: str) -> Optional[list[Strip]]:
+        encoded = self._entries.get(key)
+        if encoded is None:
+            return None
+        return [
+            Strip([Segment(text, _parse_style(style) if style else None) for text, style in line])
+            for line in encoded
+        ]
+
+    def put(self, key: str, strips: list[Strip]) -> None:
+        encoded = [
+            [[segment.text, str(segment.style) if segment.style else None] for segment in strip if not segment.control]
+            for strip in strips
+        ]
+        with self._lock:
+            self._entries[key] = encoded
+            self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def save(self) -> None:
+        """Write the cache file if entries were added (atomic replace)."""
+        if self.path is None or not self._dirty:
+            return
+        with self._lock:
+            self._dirty = False
+            payload = {"version": RENDER_CACHE_VERSION, "entries": dict(self._entries)}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".render.", suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(payload, handle, separators=(",", ":"))
+                os.replace(tmp_path, self.path)
+            except OSError:
+                pass
+
+
+class HistoryHydrator:
+    """Replays stored messages into a ``ConversationLog``, newest screens first."""
+
+    def __init__(
+        self,
+        conversation: Any,
+        messages: list[ChatMessage],
+        render_message: Callable[[Any, ChatMessage], None],
+        cache: Optional[RenderCache] = None,
+        save_in_background: bool = True,
+    ) -> None:
+        """Initialize the hydrator.
+
+        Args:
+            conversation: ConversationLog to fill
+            messages: Stored session messages, oldest first
+            render_message: Writes one message into the conversation log
+            cache: Rendered-line cache (default: in-memory only)
+            save_in_background: Persist the cache from a worker thread
+        """
+        self.conversation = conversation
+        self.messages = [message for message in messages if has_visible_content(message)]
+        self.render_message = render_message
+        self.cache = cache if cache is not None else RenderCache()
+        self.save_in_background = save_in_background
+        # Messages before this index have not been rendered yet
+        self._next = len(self.messages)
+        self.rendered = 0
+        self.cache_hits = 0
+
+    @property
+    def remaining(self) -> int:
+        return self._next
+
+    def start(self) -> None:
+        """Clear the log and render the most recent screens of history."""
+        conversation = self.conversation
+        conversation.clear()
+        height = max(getattr(conversation.size, "height", 0), 24)
+        strips = self._render_back(min_lines=height * TAIL_SCREENS, max_messages=len(self.messages))
+        conversation.append_lines(strips)
+
+        last_assistant = next(
+            (m.content for m in reversed(self.messages) if m.role == Role.ASSISTANT and (m.content or "").strip()),
+            None,
+        )
+        if last_assistant:
+            conversation._last_assistant_rendered = conversation._normalize_text(last_assistant.strip())
+
+        if self._next:
+            conversation.set_history_loader(self.load_older)
+        self._save()
+
+    def load_older(self) -> int:
+        """Prepend the next chunk of older messages; returns the lines added (0 when done)."""
+        if not self._next:
+            return 0
+        height = max(getattr(self.conversation.size, "height", 0), 24)
+        strips = self._render_back(min_lines=height, max_messages=OLDER_CHUNK_MESSAGES)
+        self.conversation.prepend_lines(strips)
+        self._save()
+        return len(strips) if self._next else 0
+
+    def _render_back(self, *, min_lines: int, max_messages: int) -> list[Strip]:
+        """Render messages backwards from ``_next`` until enough lines exist."""
+        chunks: list[list[Strip]] = []
+        total = 0
+        width = self._width()
+        while self._next and total < min_lines and len(chunks) < max_messages:
+            self._next -= 1
+            strips = self._render(self.messages[self._next], width)
+            chunks.append(strips)
+            total += len(strips)
+        return [strip for chunk in reversed(chunks) for strip in chunk]
+
+    def _render(self, message: ChatMessage, width: int) -> list[Strip]:
+        key = RenderCache.key(message, width)
+        strips = self.cache.get(key)
+        if strips is not None:
+            self.cache_hits += 1
+            return strips
+        strips = self.conversation.render_detached(lambda: self.render_message(self.conversation, message))
+        self.cache.put(key, strips)
+        self.rendered += 1
+        return strips
+
+    def _width(self) -> int:
+        region = getattr(self.conversation, "scrollable_content_region", None)
+        return getattr(region, "width", 0) or 0
+
+    def _save(self) -> None:
+        if self.save_in_background:
+            threading.Thread(target=self.cache.save, daemon=True).start()
+        else:
+            self.cache.save()
+
+
+__all__ = ["HistoryHydrator", "RenderCache", "get_render_cache_dir", "message_fingerprint"]
@@ -147,3 +147,55 @@ class NestedUICallback:
             parent_context=child_context,
             depth=self._depth + 1,
         )
+
+
+class GroupedNestedUICallback(NestedUICallback):
+    """Nested callback that holds a subagent's events until it finishes.
+
+    Used when several subagents run concurrently: each run records its tool
+    events and ``flush`` replays them as one contiguous block, so the output
+    of parallel subagents is grouped per subagent instead of interleaved.
+    """
+
+    def __init__(
+        self,
+        parent_callback: Any,
+        parent_context: str,
+        depth: int = 1,
+        replay_lock: Any = None,
+    ) -> None:
+        """Initialize the grouped callback.
+
+        Args:
+            parent_callback: The parent UI callback to forward events to
+            parent_context: Name/identifier of the subagent run (e.g., "Explore #2")
+            depth: Nesting depth level (1 = direct child of main agent)
+            replay_lock: Lock shared by sibling runs so replays never overlap
+        """
+        super().__init__(parent_callback, parent_context, depth)
+        self._events: list[tuple[str, tuple[Any, ...]]] = []
+        self._replay_lock = replay_lock
+
+    def on_tool_call(self, tool_name: str, tool_args: Dict[str, Any]) -> None:
+        self._events.append(("on_tool_call", (tool_name, tool_args)))
+
+    def on_tool_result(
+        self,
+        tool_name: str,
+        tool_args: Dict[str, Any],
+        result: Dict[str, Any],
+    ) -> None:
+        self._events.append(("on_tool_result", (tool_name, tool_args, result)))
+
+    def flush(self) -> None:
+        """Replay buffered events to the parent in the order they happened."""
+        events, self._events = self._events, []
+        if self._replay_lock is not None:
+            with self._replay_lock:
+                self._replay(events)
+        else:
+            self._replay(events)
+
+    def _replay(self, events: list[tuple[str, tuple[Any, ...]]]) -> None:
+        for method, args in events:
+            getattr(NestedUICallback, method)(self, *args)
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from .markdown import render_markdown_text_segment
+from .markdown import IncrementalMarkdownRenderer, render_markdown_message, render_markdown_text_segment
 from .welcome_panel import render_welcome_panel
 
-__all__ = ["render_markdown_text_segment", "render_welcome_panel"]
+__all__ = [
+    "IncrementalMarkdownRenderer",
+    "render_markdown_message",
+    "render_markdown_text_segment",
+    "render_welcome_panel",
+]
@@ -3,11 +3,35 @@
 from __future__ import annotations
 
 import re
-from typing import List, Tuple
+from dataclasses import dataclass, replace
+from typing import List, Optional, Tuple
 
 from rich.console import RenderableType
+from rich.panel import Panel
+from rich.syntax import Syntax
 from rich.text import Text
 
+CODE_FENCE_PATTERN = re.compile(r"```(\w+)?\n?(.*?)```", re.DOTALL)
+_HR_PATTERN = re.compile(r"^[\-\*_]{3,}$")
+_HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.*)")
+_BULLET_PATTERN = re.compile(r"^(\s*)[-*+]\s+(.*)")
+_ORDERED_PATTERN = re.compile(r"^(\s*)(\d+)\.\s+(.*)")
+_BULLET_PROBE = re.compile(r"^\s*[-*+]\s+")
+_ORDERED_PROBE = re.compile(r"^\s*\d+\.\s+")
+_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_INLINE_PATTERN = re.compile(r"(\*\*[^*]+\*\*|__[^_]+__|\*[^*]+\*|_[^_]+_|`[^`]+`)")
+# End of a whitespace-only line that is itself terminated by a newline
+_BLANK_LINE_END = re.compile(r"\n[^\S\n]*\n")
+
+
+@dataclass
+class _SegmentState:
+    """Rendering state carried from one line to the next within a text segment."""
+
+    leading: bool
+    leading_consumed: bool
+    wrote_any: bool = False
+
 
 def render_markdown_text_segment(content: str, *, leading: bool = False) -> Tuple[List[RenderableType], bool]:
     """Convert markdown text into Rich renderables.
@@ -20,45 +44,61 @@ def render_markdown_text_segment(content: str, *, leading: bool = False) -> Tupl
         A tuple of (renderables, wrote_any) where ``wrote_any`` indicates whether
         any non-empty content was emitted (used to manage leading bullets).
     """
-
-    lines = content.splitlines()
+    state = _SegmentState(leading=leading, leading_consumed=not leading)
+    renderables: List[RenderableType] = []
+    _render_lines(content.splitlines(), state, renderables)
+    return renderables, state.wrote_any
+
+
+def _emit(
+    renderable: RenderableType,
+    state: _SegmentState,
+    renderables: List[RenderableType],
+    allow_leading: bool = True,
+) -> None:
+    if isinstance(renderable, str):
+        renderable = Text(renderable)
+    if state.leading and not state.leading_consumed and allow_leading and getattr(renderable, "plain", str(renderable)).strip():
+        bullet = Text("⏺ ")
+        bullet.append_text(renderable if isinstance(renderable, Text) else Text(str(renderable)))
+        renderables.append(bullet)
+        state.leading_consumed = True
+    else:
+        renderables.append(renderable)
+        if state.leading and allow_leading and not state.leading_consumed:
+            text_value = getattr(renderable, "plain", str(renderable))
+            if text_value.strip():
+                state.leading_consumed = True
+    text_plain = getattr(renderable, "plain", str(renderable))
+    if text_plain.strip():
+        state.wrote_any = True
+
+
+def _render_lines(lines: List[str], state: _SegmentState, renderables: List[RenderableType]) -> None:
+    """Render markdown ``lines`` into ``renderables``, updating ``state``.
+
+    No block construct spans a blank line, so a segment may be rendered in
+    pieces split after blank lines with the same state and produce the same
+    output as rendering it whole.
+    """
     total_lines = len(lines)
     index = 0
-    renderables: List[RenderableType] = []
-    wrote_any = False
-    leading_consumed = not leading
 
     def emit(renderable: RenderableType, allow_leading: bool = True) -> None:
-        nonlocal wrote_any, leading_consumed
-        if isinstance(renderable, str):
-            renderable = Text(renderable)
-        if leading and not leading_consumed and allow_leading and getattr(renderable, "plain", str(renderable)).strip():
-            bullet = Text("⏺ ")
-            bullet.append_text(renderable if isinstance(renderable, Text) else Text(str(renderable)))
-            renderables.append(bullet)
-            leading_consumed = True
-        else:
-            renderables.append(renderable)
-            if leading and allow_leading and not leading_consumed:
-                text_value = getattr(renderable, "plain", str(renderable))
-                if text_value.strip():
-                    leading_consumed = True
-        text_plain = getattr(renderable, "plain", str(renderable))
-        if text_plain.strip():
-            wrote_any = True
+        _emit(renderable, state, renderables, allow_leading)
 
     def blank_line() -> None:
-        if wrote_any:
+        if state.wrote_any:
             emit(Text(""), allow_leading=False)
 
     def is_heading(line: str) -> bool:
-        return bool(re.match(r"^(#{1,6})\s+", line.strip()))
+        return bool(_HEADING_PATTERN.match(line.strip()))
 
     def is_bullet(line: str) -> bool:
-        return bool(re.match(r"^\s*[-*+]\s+", line))
+        return bool(_BULLET_PROBE.match(line))
 
     def is_ordered(line: str) -> bool:
-        return bool(re.match(r"^\s*\d+\.\s+", line))
+        return bool(_ORDERED_PROBE.match(line))
 
     while index < total_lines:
         raw_line = lines[index]
@@ -69,13 +109,13 @@ def render_markdown_text_segment(content: str, *, leading: bool = False) -> Tupl
             index += 1
             continue
 
-        if re.fullmatch(r"^[\-\*_]{3,}$", stripped):
+        if _HR_PATTERN.fullmatch(stripped):
             hr = Text("─" * 40, style="dim")
             emit(hr, allow_leading=False)
             index += 1
             continue
 
-        heading_match = re.match(r"^(#{1,6})\s+(.*)", stripped)
+        heading_match = _HEADING_PATTERN.match(stripped)
         if heading_match:
             level = len(heading_match.group(1))
             title = heading_match.group(2).strip()
@@ -98,7 +138,7 @@ def render_markdown_text_segment(content: str, *, leading: bool = False) -> Tupl
                 emit(quote_line, allow_leading=False)
             continue
 
-        bullet_match = re.match(r"^(\s*)[-*+]\s+(.*)", raw_line)
+        bullet_match = _BULLET_PATTERN.match(raw_line)
         if bullet_match:
             indent = bullet_match.group(1) or ""
             bullet_text = bullet_match.group(2).strip()
@@ -112,7 +152,7 @@ def render_markdown_text_segment(content: str, *, leading: bool = False) -> Tupl
             index += 1
             continue
 
-        ordered_match = re.match(r"^(\s*)(\d+)\.\s+(.*)", raw_line)
+        ordered_match = _ORDERED_PATTERN.match(raw_line)
         if ordered_match:
             indent = ordered_match.group(1) or ""
             number = ordered_match.group(2)
@@ -155,19 +195,15 @@ def render_markdown_text_segment(content: str, *, leading: bool = False) -> Tupl
             blank_line()
             index += 1
 
-    return renderables, wrote_any
-
 
 def _render_inline_markdown(text: str) -> Text:
     """Render inline markdown markers within a single line."""
 
     result = Text()
-    link_pattern = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
-    inline_pattern = re.compile(r"(\*\*[^*]+\*\*|__[^_]+__|\*[^*]+\*|_[^_]+_|`[^`]+`)")
 
     def append_with_style(fragment: str) -> None:
         cursor = 0
-        for token_match in inline_pattern.finditer(fragment):
+        for token_match in _INLINE_PATTERN.finditer(fragment):
             if token_match.start() > cursor:
                 result.append(fragment[cursor : token_match.start()])
             token = token_match.group(0)
@@ -185,7 +221,7 @@ def _render_inline_markdown(text: str) -> Text:
             result.append(fragment[cursor:])
 
     cursor = 0
-    for match in link_pattern.finditer(text):
+    for match in _LINK_PATTERN.finditer(text):
         if match.start() > cursor:
             append_with_style(text[cursor : match.start()])
         label, url = match.group(1), match.group(2)
@@ -201,3 +237,134 @@ def _render_inline_markdown(text: str) -> Text:
         append_with_style(text)
 
     return result
+
+
+def split_code_blocks(message: str) -> list[dict[str, str]]:
+    """Split a message into text segments and fenced code blocks."""
+    segments: list[dict[str, str]] = []
+    last_end = 0
+
+    for match in CODE_FENCE_PATTERN.finditer(message):
+        start, end = match.span()
+        if start > last_end:
+            segments.append({"type": "text", "content": message[last_end:start]})
+
+        language = match.group(1) or ""
+        code = match.group(2) or ""
+        segments.append({"type": "code", "language": language, "content": code})
+        last_end = end
+
+    if last_end < len(message):
+        segments.append({"type": "text", "content": message[last_end:]})
+
+    if not segments:
+        segments.append({"type": "text", "content": message})
+
+    return segments
+
+
+def render_code_block(code: str, language: str = "") -> Optional[RenderableType]:
+    """Syntax-highlighted panel for a fenced code block (None when empty)."""
+    code = code.strip("\n")
+    if not code:
+        return None
+    language = language or "text"
+    syntax = Syntax(
+        code,
+        language,
+        theme="monokai",
+        line_numbers=bool(code.count("\n") > 0),
+    )
+    title = f"Code ({language})" if language and language != "text" else "Code"
+    return Panel(syntax, title=title, border_style="bright_blue")
+
+
+class IncrementalMarkdownRenderer:
+    """Renders a growing assistant message, re-parsing only its open block.
+
+    Text is fed in deltas. Closed code fences and markdown up to the last
+    blank line are rendered once and kept as finished renderables; only the
+    text after that point (the open block) is parsed again on each update.
+    The output matches rendering the complete message in one pass.
+    """
+
+    def __init__(self) -> None:
+        self._text = ""
+        self._finished: List[RenderableType] = []
+        self._taken = 0
+        # Start of the text segment after the last closed code fence
+        self._segment_start = 0
+        # Text before this offset has been rendered into _finished
+        self._committed = 0
+        self._state = _SegmentState(leading=True, leading_consumed=False)
+        self._text_output = False
+
+    @property
+    def text(self) -> str:
+        return self._text
+
+    def feed(self, delta: str) -> None:
+        """Append streamed text."""
+        if not delta:
+            return
+        self._text += delta
+
+        while True:
+            match = CODE_FENCE_PATTERN.search(self._text, self._segment_start)
+            if match is None:
+                break
+            self._commit(match.start())
+            self._end_segment()
+            block = render_code_block(match.group(2) or "", match.group(1) or "")
+            if block is not None:
+                self._finished.append(block)
+            self._segment_start = self._committed = match.end()
+
+        # A possible (still unclosed) fence may turn the rest into code
+        limit = self._text.find("```", self._segment_start)
+        if limit == -1:
+            limit = len(self._text)
+        boundary = None
+        for match in _BLANK_LINE_END.finditer(self._text, self._committed, limit):
+            boundary = match.end()
+        if boundary is not None:
+            self._commit(boundary)
+
+    def finished(self) -> List[RenderableType]:
+        """Renderables that will not change as more text arrives."""
+        return list(self._finished)
+
+    def take_finished(self) -> List[RenderableType]:
+        """Finished renderables not returned by a previous call."""
+        new = self._finished[self._taken :]
+        self._taken = len(self._finished)
+        return new
+
+    def pending(self) -> List[RenderableType]:
+        """Renderables for the open block (re-rendered on every call)."""
+        renderables: List[RenderableType] = []
+        tail = self._text[self._committed :]
+        if tail:
+            _render_lines(tail.splitlines(), replace(self._state), renderables)
+        return renderables
+
+    def renderables(self) -> List[RenderableType]:
+        """Everything rendered so far: finished blocks followed by the open block."""
+        return self._finished + self.pending()
+
+    def _commit(self, end: int) -> None:
+        if end > self._committed:
+            _render_lines(self._text[self._committed : end].splitlines(), self._state, self._finished)
+            self._committed = end
+
+    def _end_segment(self) -> None:
+        self._text_output = self._text_output or self._state.wrote_any
+        leading = not self._text_output
+        self._state = _SegmentState(leading=leading, leading_consumed=not leading)
+
+
+def render_markdown_message(message: str) -> List[RenderableType]:
+    """Render a complete assistant message (text and fenced code blocks)."""
+    renderer = IncrementalMarkdownRenderer()
+    renderer.feed(message)
+    return renderer.renderables()
@@ -7,6 +7,7 @@ import contextlib
 import os
 import queue
 import threading
+import time
 from pathlib import Path
 from typing import Any, Callable, Optional
 
@@ -15,10 +16,12 @@ from rich.text import Text
 
 from swecli.core.agents.components import extract_plan_from_response
 from swecli.core.runtime import ConfigManager, OperationMode
+from swecli.core.runtime.monitoring.tracing import QUEUE, UI, get_tracer, traced
 from swecli.core.context_engineering.history import SessionManager
 from swecli.models.message import ChatMessage, Role
 from swecli.repl.repl import REPL
 from swecli.ui_textual.managers.approval_manager import ChatApprovalManager
+from swecli.ui_textual.managers.history_hydrator import HistoryHydrator, RenderCache
 from swecli.ui_textual.chat_app import create_chat_app
 from swecli.ui_textual.constants import TOOL_ERROR_SENTINEL
 from swecli.ui_textual.utils import build_tool_call_text
@@ -47,6 +50,7 @@ class TextualRunner:
         self.working_dir = Path(working_dir or Path.cwd()).resolve()
         self._initial_messages: list[ChatMessage] = []
         self._history_restored = False
+        self._history_hydrator: HistoryHydrator | None = None
 
         if repl is not None:
             self.repl = repl
@@ -128,7 +132,8 @@ class TextualRunner:
         # Queue holds tuples of (message, needs_display)
         # needs_display=True means the message wasn't shown yet (was queued while processing)
         # Using queue.Queue (thread-safe) instead of asyncio.Queue for cross-thread access
-        self._pending: queue.Queue[tuple[str, bool]] = queue.Queue()
+        # (text, needs_display, perf_counter_ns at enqueue)
+        self._pending: queue.Queue[tuple[str, bool, int]] = queue.Queue()
         self._processor_thread: threading.Thread | None = None
         self._processor_stop = threading.Event()
         self._console_queue: asyncio.Queue[str] = asyncio.Queue()
@@ -170,67 +175,57 @@ class TextualRunner:
         return _callback
 
     def _start_async_history_hydration(self) -> None:
-        """Start hydrating conversation history in background batches."""
+        """Render the tail of the resumed session now and older history on scroll-back."""
         if self._history_restored or not self._initial_messages:
             self._history_restored = True
             return
 
-        # Run hydration in a worker to not block the UI thread
-        import threading
-
-        def hydrate_in_batches():
-            conversation = getattr(self.app, "conversation", None)
-            if conversation is None:
-                self._history_restored = True
-                return
+        conversation = getattr(self.app, "conversation", None)
+        if conversation is None:
+            self._history_restored = True
+            return
 
-            # Clear and prepare - do this on UI thread
-            self.app.call_from_thread(conversation.clear)
-
-            history = getattr(self.app, "_history", None)
-            record_assistant = getattr(self.app, "record_assistant_message", None)
-
-            # Process messages in batches to keep UI responsive
-            BATCH_SIZE = 5
-            messages = self._initial_messages
-
-            for i in range(0, len(messages), BATCH_SIZE):
-                batch = messages[i:i + BATCH_SIZE]
-
-                # Process batch on UI thread
-                def process_batch(batch_messages=batch):
-                    for message in batch_messages:
-                        content = (message.content or "").strip()
-                        if message.role == Role.USER:
-                            if not content:
-                                continue
-                            conversation.add_user_message(content)
-                            if history is not None and hasattr(history, "record"):
-                                history.record(content)
-                        elif message.role == Role.ASSISTANT:
-                            if content:
-                                conversation.add_assistant_message(content)
-                                if callable(record_assistant):
-                                    record_assistant(content)
-                            if getattr(message, "tool_calls", None):
-                                self._render_stored_tool_calls(conversation, message.tool_calls)
-                            elif not content:
-                                continue
-                        elif message.role == Role.SYSTEM:
-                            if not content:
-                                continue
-                            conversation.add_system_message(content)
-
-                self.app.call_from_thread(process_batch)
-
-                # Small delay between batches to let UI breathe
-                import time
-                time.sleep(0.01)
+        # Input history and assistant dedupe state cover the whole session up front;
+        # only the (expensive) log rendering is lazy.
+        self._record_stored_messages(self._initial_messages)
 
-            self._history_restored = True
+        session = self.session_manager.get_current_session() if self.session_manager else None
+        self._history_hydrator = HistoryHydrator(
+            conversation,
+            self._initial_messages,
+            self._replay_stored_message,
+            cache=RenderCache.for_session(getattr(session, "id", None)),
+        )
+        self._history_hydrator.start()
+        self._history_restored = True
 
-        thread = threading.Thread(target=hydrate_in_batches, daemon=True)
-        thread.start()
+    def _record_stored_messages(self, messages: list[ChatMessage]) -> None:
+        """Feed stored user/assistant messages into the app's input and reply history."""
+        history = getattr(self.app, "_history", None)
+        record_assistant = getattr(self.app, "record_assistant_message", None)
+        for message in messages:
+            content = (message.content or "").strip()
+            if not content:
+                continue
+            if message.role == Role.USER and history is not None and hasattr(history, "record"):
+                history.record(content)
+            elif message.role == Role.ASSISTANT and callable(record_assistant):
+                record_assistant(content)
+
+    def _replay_stored_message(self, conversation, message: ChatMessage) -> None:
+        """Write one stored message into the conversation log."""
+        content = (message.content or "").strip()
+        if message.role == Role.USER:
+            if content:
+                conversation.add_user_message(content)
+        elif message.role == Role.ASSISTANT:
+            if content:
+                conversation.add_assistant_message(content)
+            if getattr(message, "tool_calls", None):
+                self._render_stored_tool_calls(conversation, message.tool_calls)
+        elif message.role == Role.SYSTEM:
+            if content:
+                conversation.add_system_message(content)
 
     def _build_model_slots(self) -> dict[str, tuple[str, str]]:
         """Prepare formatted model slot information for the footer."""
@@ -294,30 +289,9 @@ class TextualRunner:
             return
 
         conversation.clear()
-        history = getattr(self.app, "_history", None)
-        record_assistant = getattr(self.app, "record_assistant_message", None)
-
+        self._record_stored_messages(self._initial_messages)
         for message in self._initial_messages:
-            content = (message.content or "").strip()
-            if message.role == Role.USER:
-                if not content:
-                    continue
-                conversation.add_user_message(content)
-                if history is not None and hasattr(history, "record"):
-                    history.record(content)
-            elif message.role == Role.ASSISTANT:
-                if content:
-                    conversation.add_assistant_message(content)
-                    if callable(record_assistant):
-                        record_assistant(content)
-                if getattr(message, "tool_calls", None):
-                    self._render_stored_tool_calls(conversation, message.tool_calls)
-                elif not content:
-                    continue
-            elif message.role == Role.SYSTEM:
-                if not content:
-                    continue
-                conversation.add_system_message(content)
+            self._replay_stored_message(conversation, message)
 
         self._history_restored = True
 
@@ -508,7 +482,7 @@ class TextualRunner:
                           when it starts processing (because it was queued while
                           another message was being processed)
         """
-        item = (text, needs_display)
+        item = (text, needs_display, time.perf_counter_ns())
         # queue.Queue is thread-safe, can be called from any thread
         self._pending.put_nowait(item)
 
@@ -523,9 +497,10 @@ class TextualRunner:
                 try:
                     # Use timeout to allow checking stop event periodically
                     try:
-                        message, needs_display = self._pending.get(timeout=0.5)
+                        message, needs_display, enqueued_ns = self._pending.get(timeout=0.5)
                     except queue.Empty:
                         continue
+                    get_tracer().record("queue_wait", QUEUE, enqueued_ns, time.perf_counter_ns())
 
                     # Update queue indicator immediately after dequeuing
                     # This ensures the count shows only messages WAITING to be processed,
@@ -1007,6 +982,7 @@ Work through each implementation step in order. Mark each todo item as 'in_progr
 
         return new_mode.value
 
+    @traced(UI, "render_responses")
     def _render_responses(self, messages: list[ChatMessage]) -> None:
         """Render new session messages inside the Textual conversation log."""
 
@@ -1258,8 +1234,23 @@ Work through each implementation step in order. Mark each todo item as 'in_progr
 
             self._loop.call_soon_threadsafe(finalize)
 
+        def refresh_tooling() -> None:
+            refresh_cb = getattr(self.repl, "_refresh_runtime_tooling", None)
+            if callable(refresh_cb):
+                refresh_cb()
+
+        def handle_server_ready(server_name: str, success: bool) -> None:
+            # Tools become usable as each server comes up
+            if success:
+                self._loop.call_soon_threadsafe(refresh_tooling)
+
         try:
-            manager.connect_enabled_servers_background(on_complete=handle_completion)
+            manager.connect_enabled_servers_background(
+                on_complete=handle_completion,
+                on_server_ready=handle_server_ready,
+            )
+            # Cached schemas of starting servers are already visible
+            refresh_tooling()
         except Exception as exc:  # pragma: no cover - defensive
             self._connect_inflight = False
             self._enqueue_console_text(
@@ -38,6 +38,8 @@ _TOOL_DISPLAY_PARTS: dict[str, tuple[str, str]] = {
     "complete_todo": ("Complete", "todo"),
     "list_todos": ("List", "todos"),
     "spawn_subagent": ("Spawn", "subagent"),
+    "spawn_subagents": ("Spawn", "subagents"),
+    "load_tools": ("Load", "tools"),
 }
 
 _PATH_HINT_KEYS = {"file_path", "path", "directory", "dir", "image_path", "working_dir", "target"}
@@ -277,6 +279,11 @@ def format_tool_call(tool_name: str, tool_args: Mapping[str, Any]) -> str:
             return f"Spawn[{subagent_type}]({description})"
         return f"Spawn[{subagent_type}]"
 
+    elif tool_name == "spawn_subagents" and tool_args:
+        tasks = tool_args.get("tasks") or []
+        types = sorted({task.get("subagent_type", "general-purpose") for task in tasks if isinstance(task, dict)})
+        return f"Spawn[{', '.join(types) or 'subagents'}]({len(tasks)} tasks in parallel)"
+
     # Enhanced formatting for update_todo tool - show todo-N format
     elif tool_name == "update_todo" and tool_args:
         todo_id = tool_args.get("id", "?")
@@ -4,18 +4,26 @@ from __future__ import annotations
 
 import re
 import time
-from typing import Any, List, Tuple
+from typing import Any, Callable, List, Tuple
 
-from rich.console import Group
+from rich.console import Console, Group, RenderableType
+from rich.measure import measure_renderables
 from rich.panel import Panel
-from rich.syntax import Syntax
+from rich.segment import Segment
 from rich.text import Text
 from textual.geometry import Size
+from textual.strip import Strip
 from textual.timer import Timer
 from textual.widgets import RichLog
 
-from swecli.ui_textual.renderers import render_markdown_text_segment
+from swecli.ui_textual.renderers.markdown import (
+    IncrementalMarkdownRenderer,
+    render_code_block,
+    render_markdown_message,
+    split_code_blocks,
+)
 from swecli.ui_textual.constants import TOOL_ERROR_SENTINEL
+from swecli.ui_textual.widgets.line_store import LineStore, ProtectedLines
 
 
 class ConversationLog(RichLog):
@@ -23,15 +31,33 @@ class ConversationLog(RichLog):
 
     can_focus = True
     ALLOW_SELECT = True
+    MAX_LINES = 10000
+    # Per-log state that render_detached() isolates from the visible log
+    _DETACHED_STATE = (
+        "_spinner_start",
+        "_spinner_line_count",
+        "_spinner_active",
+        "_spinner_index",
+        "_tool_spinner_timer",
+        "_tool_call_start",
+        "_tool_display",
+        "_tool_timer_start",
+        "_tool_last_elapsed",
+        "_approval_start",
+        "_nested_tool_line",
+        "_last_assistant_rendered",
+    )
 
     def __init__(self, **kwargs):
+        # Line trimming is done here rather than by RichLog (max_lines) so the
+        # line store, protected lines and tracked line indices stay in sync.
         super().__init__(
             **kwargs,
             wrap=True,
             highlight=True,
             markup=True,
             auto_scroll=True,
-            max_lines=10000,
+            max_lines=None,
         )
         self._user_scrolled = False
         self._last_assistant_rendered: str | None = None
@@ -47,7 +73,7 @@ class ConversationLog(RichLog):
         self._tool_timer_start: float | None = None
         self._tool_last_elapsed: int | None = None
         self._debug_enabled = True  # Enable debug messages by default
-        self._protected_lines: set[int] = set()  # Lines that should not be truncated
+        self._protected_lines = ProtectedLines()  # Lines that should not be truncated
         self.MAX_PROTECTED_LINES = 200
         # Nested tool call pulsing animation state
         self._nested_tool_line: int | None = None  # Line index of last nested tool call
@@ -55,6 +81,204 @@ class ConversationLog(RichLog):
         self._nested_tool_depth: int = 1  # Depth for indentation
         self._nested_pulse_bright = True  # Toggle for dim/bright pulsing
         self._nested_pulse_counter = 0  # Counter to slow down pulse rate
+        self._inline_console: Console | None = None
+        # Materializes older history when the user scrolls near the top (lazy resume)
+        self._history_loader: Callable[[], int] | None = None
+        self._loading_history = False
+        # Assistant message being streamed into the log tail
+        self._stream: IncrementalMarkdownRenderer | None = None
+        self._stream_tail_start = 0
+
+    # --- Line storage ----------------------------------------------------
+
+    @property
+    def lines(self) -> LineStore:
+        """Rendered lines, with the widest line width tracked incrementally."""
+        return self._lines
+
+    @lines.setter
+    def lines(self, value) -> None:
+        self._lines = value if isinstance(value, LineStore) else LineStore(value)
+
+    @property
+    def _protected_lines(self) -> ProtectedLines:
+        return self._protected
+
+    @_protected_lines.setter
+    def _protected_lines(self, value) -> None:
+        self._protected = value if isinstance(value, ProtectedLines) else ProtectedLines(value)
+
+    def write(
+        self,
+        content: RenderableType | object,
+        width: int | None = None,
+        expand: bool = False,
+        shrink: bool = True,
+        scroll_end: bool | None = None,
+        animate: bool = False,
+    ) -> "ConversationLog":
+        super().write(content, width=width, expand=expand, shrink=shrink, scroll_end=scroll_end, animate=animate)
+        self._trim_to_max_lines()
+        self._sync_virtual_size()
+        return self
+
+    def _sync_virtual_size(self) -> None:
+        self._widest_line_width = self.lines.max_width
+        self.virtual_size = Size(self._widest_line_width, len(self.lines))
+
+    def _trim_to_max_lines(self) -> None:
+        """Drop the oldest lines beyond MAX_LINES, keeping tracked indices aligned."""
+        excess = len(self.lines) - self.MAX_LINES
+        if excess <= 0:
+            return
+        del self.lines[:excess]
+        self._start_line += excess
+        self._protected_lines.shift(-excess)
+        for attr in ("_spinner_start", "_tool_call_start", "_approval_start", "_nested_tool_line"):
+            index = getattr(self, attr)
+            if index is not None:
+                # A tracked line that scrolled out of the log is gone for good
+                setattr(self, attr, index - excess if index >= excess else None)
+        self._stream_tail_start = max(self._stream_tail_start - excess, 0)
+        # Older history would no longer be adjacent to the first line
+        self._history_loader = None
+        self.refresh()
+
+    def _render_line(self, y: int, scroll_x: int, width: int) -> Strip:
+        # Cache entries remember the stored line they were cropped from, so
+        # replacing or removing lines never requires clearing the cache.
+        if y >= len(self.lines):
+            return Strip.blank(width, self.rich_style)
+
+        source = self.lines[y]
+        key = (y + self._start_line, scroll_x, width, self._widest_line_width)
+        cached = self._line_cache.get(key)
+        if cached is not None and cached[0] is source:
+            return cached[1]
+
+        line = source.crop_extend(scroll_x, scroll_x + width, self.rich_style)
+        self._line_cache[key] = (source, line)
+        return line
+
+    def _render_strips(self, content: RenderableType | object) -> list[Strip] | None:
+        """Render content into strips exactly as ``write`` would, without appending.
+
+        Returns None until the widget size is known (writes are deferred then).
+        """
+        if not self._size_known:
+            return None
+
+        renderable = self._make_renderable(content)
+        console = self.app.console
+        options = console.options
+        render_width = measure_renderables(console, options, [renderable]).maximum
+        render_width = min(render_width, self.scrollable_content_region.width)
+        render_width = max(render_width, self.min_width)
+
+        lines = list(Segment.split_lines(console.render(renderable, options.update_width(render_width))))
+        if not lines:
+            return [Strip.blank(render_width)]
+        strips = Strip.from_lines(lines)
+        for strip in strips:
+            strip.adjust_cell_length(render_width)
+        return strips
+
+    def _replace_line(self, index: int, strip: Strip) -> None:
+        self.lines[index] = strip
+        self._sync_virtual_size()
+        self.refresh()
+
+    def _delete_unprotected_from(self, index: int) -> int:
+        """Delete every unprotected line from ``index`` on.
+
+        Protected lines in that range move up to sit directly after ``index``.
+
+        Returns:
+            Number of lines deleted
+        """
+        count = len(self.lines)
+        if index >= count:
+            return 0
+        if not self._protected_lines.has_from(index):
+            del self.lines[index:]
+            return count - index
+
+        kept = self._protected_lines.collapse_from(index, count)
+        if len(kept) == count - index:
+            return 0  # All lines after index are protected
+        self.lines[index:] = [self.lines[i] for i in kept]
+        return count - index - len(kept)
+
+    # --- Lazy history ----------------------------------------------------
+
+    def render_detached(self, render: Callable[[], None]) -> list[Strip]:
+        """Run ``render`` against an empty scratch log and return the lines it wrote.
+
+        The visible log, its tracked indices and any running spinner are left
+        untouched, so history can be rendered while a query is in progress.
+        """
+        saved = {attr: getattr(self, attr) for attr in self._DETACHED_STATE}
+        saved_lines, saved_protected = self.lines, self._protected_lines
+        self.lines, self._protected_lines = LineStore(), ProtectedLines()
+        for attr in self._DETACHED_STATE:
+            setattr(self, attr, None)
+        try:
+            render()
+            return list(self.lines)
+        finally:
+            self.lines, self._protected_lines = saved_lines, saved_protected
+            for attr, value in saved.items():
+                setattr(self, attr, value)
+            self._sync_virtual_size()
+
+    def append_lines(self, strips: list[Strip]) -> None:
+        """Append pre-rendered lines."""
+        self.lines.extend(strips)
+        self._trim_to_max_lines()
+        self._sync_virtual_size()
+        if self.auto_scroll:
+            self.scroll_end(animate=False, immediate=False, x_axis=False)
+        self.refresh()
+
+    def prepend_lines(self, strips: list[Strip]) -> None:
+        """Insert pre-rendered lines above the current first line, keeping the viewport in place."""
+        count = len(strips)
+        if not count:
+            return
+        self.lines[0:0] = strips
+        self._protected_lines.shift(count)
+        for attr in ("_spinner_start", "_tool_call_start", "_approval_start", "_nested_tool_line"):
+            index = getattr(self, attr)
+            if index is not None:
+                setattr(self, attr, index + count)
+        self._stream_tail_start += count
+        self._sync_virtual_size()
+        self.scroll_to(y=self.scroll_offset.y + count, animate=False, immediate=True)
+        self.refresh()
+
+    def set_history_loader(self, loader: Callable[[], int] | None) -> None:
+        """Register a callback that prepends older history and returns the lines added."""
+        self._history_loader = loader
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if self._history_loader is not None and new_value < max(self.size.height, 1):
+            self._request_older_history()
+
+    def _request_older_history(self) -> None:
+        if self._loading_history:
+            return
+        self._loading_history = True
+
+        def load() -> None:
+            loader = self._history_loader
+            try:
+                if loader is not None and not loader():
+                    self._history_loader = None
+            finally:
+                self._loading_history = False
+
+        self.call_later(load)
 
     def on_mount(self) -> None:
         return
@@ -91,11 +315,11 @@ class ConversationLog(RichLog):
 
     def _prune_old_protected_lines(self) -> None:
         """Remove oldest protected line indices if we exceed MAX_PROTECTED_LINES."""
-        if len(self._protected_lines) > self.MAX_PROTECTED_LINES:
-            sorted_lines = sorted(self._protected_lines)
-            to_remove = len(self._protected_lines) - self.MAX_PROTECTED_LINES
-            for idx in sorted_lines[:to_remove]:
-                self._protected_lines.discard(idx)
+        self._protected_lines.prune_oldest(self.MAX_PROTECTED_LINES)
+
+    def _cleanup_protected_lines(self) -> None:
+        """Forget protected indices that no longer refer to a line."""
+        self._protected_lines.discard_from(len(self.lines))
 
     def on_key(self, event) -> None:
         """Detect manual scrolling via keyboard to disable auto-scroll."""
@@ -145,28 +369,55 @@ class ConversationLog(RichLog):
             return
 
         self._last_assistant_rendered = normalized
-        segments = self._split_code_blocks(message)
-        text_output = False
-        leading_used = False
+        for renderable in render_markdown_message(message):
+            self.write(renderable)
 
-        for _, segment in enumerate(segments):
-            if segment["type"] == "code":
-                self._write_code_block(segment)
-            else:
-                content = segment["content"]
-                if not content:
-                    continue
-                renderables, wrote = render_markdown_text_segment(
-                    content,
-                    leading=(not text_output and not leading_used),
-                )
-                for renderable in renderables:
-                    self.write(renderable)
-                if wrote:
-                    text_output = True
-                    leading_used = True
+        self.write(Text(""))
+
+    # --- Streaming assistant output ----------------------------------------
+
+    def start_assistant_stream(self) -> None:
+        """Begin an assistant message whose text arrives in deltas.
+
+        The stream owns the tail of the log until ``finish_assistant_stream``.
+        """
+        self._stream = IncrementalMarkdownRenderer()
+        self._stream_tail_start = len(self.lines)
+
+    def append_assistant_stream(self, delta: str) -> None:
+        """Render newly streamed text, re-rendering only the open markdown block."""
+        if self._stream is None:
+            self.start_assistant_stream()
+        stream = self._stream
+        stream.feed(delta)
+
+        pending = [self._render_strips(renderable) for renderable in stream.pending()]
+        if any(strips is None for strips in pending):
+            return  # Size not known yet; everything is written on finish
+
+        # Finished blocks are written once; the open block replaces the live tail
+        self._delete_unprotected_from(self._stream_tail_start)
+        for renderable in stream.take_finished():
+            self.write(renderable, scroll_end=False)
+        self._stream_tail_start = len(self.lines)
+        self.lines.extend(strip for strips in pending for strip in strips)
+        self._sync_virtual_size()
+        if self.auto_scroll:
+            self.scroll_end(animate=False, immediate=False, x_axis=False)
+        self.refresh()
 
+    def finish_assistant_stream(self) -> None:
+        """Write the final rendering of the streamed message."""
+        stream = self._stream
+        if stream is None:
+            return
+        self._stream = None
+        self._delete_unprotected_from(self._stream_tail_start)
+        for renderable in stream.take_finished() + stream.pending():
+            self.write(renderable)
         self.write(Text(""))
+        self._last_assistant_rendered = self._normalize_text(stream.text)
+        self._sync_virtual_size()
 
     def add_system_message(self, message: str) -> None:
         self.write(Text(message, style="dim italic"))
@@ -470,19 +721,9 @@ class ConversationLog(RichLog):
     # --- Private helpers -------------------------------------------------
 
     def _write_code_block(self, segment: dict[str, str]) -> None:
-        code = segment["content"].strip("\n")
-        if not code:
-            return
-        language = segment.get("language") or "text"
-        syntax = Syntax(
-            code,
-            language,
-            theme="monokai",
-            line_numbers=bool(code.count("\n") > 0),
-        )
-        title = f"Code ({language})" if language and language != "text" else "Code"
-        panel = Panel(syntax, title=title, border_style="bright_blue")
-        self.write(panel)
+        panel = render_code_block(segment["content"], segment.get("language") or "")
+        if panel is not None:
+            self.write(panel)
 
     def _write_generic_tool_result(self, text: str) -> None:
         lines = text.rstrip("\n").splitlines() or [text]
@@ -581,8 +822,23 @@ class ConversationLog(RichLog):
             self.start_spinner(message)
             return
 
-        self._remove_spinner_lines(preserve_index=True)
-        self._append_spinner(message)
+        # The spinner is the live tail of the log: replace it in place
+        start = self._spinner_start
+        text = message if isinstance(message, Text) else Text(message, style="bright_cyan")
+        strips = None
+        if start <= len(self.lines) and not self._protected_lines.has_from(start):
+            strips = self._render_strips(text)
+        if strips is None:
+            self._remove_spinner_lines(preserve_index=True)
+            self._append_spinner(message)
+            return
+
+        self.lines[start:] = strips
+        self._spinner_line_count = len(strips)
+        self._sync_virtual_size()
+        if self.auto_scroll:
+            self.scroll_end(animate=False, immediate=False, x_axis=False)
+        self.refresh()
 
     def stop_spinner(self) -> None:
         """Remove the spinner message entirely."""
@@ -606,29 +862,8 @@ class ConversationLog(RichLog):
         start = min(self._spinner_start, len(self.lines))
         if start < len(self.lines):
             # Only delete non-protected lines
-            to_delete = [i for i in range(start, len(self.lines)) if i not in self._protected_lines]
-            for i in sorted(to_delete, reverse=True):
-                if i < len(self.lines):
-                    del self.lines[i]
-
-            # Update protected line indices
-            new_protected = set()
-            for p in self._protected_lines:
-                if p < start:
-                    new_protected.add(p)
-                else:
-                    # Count deleted lines before this protected line
-                    deleted_before = len([i for i in to_delete if i < p])
-                    new_protected.add(p - deleted_before)
-            self._protected_lines = new_protected
-
-            self._line_cache.clear()
-            widths: List[int] = []
-            for strip in self.lines:
-                cell_length = getattr(strip, "cell_length", None)
-                widths.append(cell_length() if callable(cell_length) else cell_length or 0)
-            self._widest_line_width = max(widths, default=0)
-            self.virtual_size = Size(self._widest_line_width, len(self.lines))
+            self._delete_unprotected_from(start)
+            self._sync_virtual_size()
             if self.auto_scroll:
                 self.scroll_end(animate=False)
         else:
@@ -674,26 +909,15 @@ class ConversationLog(RichLog):
         if timer is not None:
             formatted.append_text(timer)
 
-        # Convert Text to Strip for in-place storage in RichLog
-        from rich.console import Console
-        from textual.strip import Strip
-
-        # Use very large width and no_wrap to prevent text wrapping that causes corruption
-        # The actual display will handle truncation at render time
-        console = Console(width=1000, force_terminal=True, no_color=False)
-        # Render with explicit options to avoid wrapping
-        with console.capture() as capture:
-            console.print(formatted, end="", overflow="ignore", no_wrap=True)
+        # Convert Text to Strip for in-place storage in RichLog.
+        # Use a very large width so the line never wraps; the display crops it.
+        if self._inline_console is None:
+            self._inline_console = Console(width=1000, force_terminal=True, no_color=False)
         # Get segments directly from the Text object instead of console render
-        segments = list(formatted.render(console))
-        strip = Strip(segments)
+        segments = list(formatted.render(self._inline_console))
 
         # Update the line at the original position (in-place)
-        self.lines[self._tool_call_start] = strip
-
-        # Clear cache and refresh display
-        self._line_cache.clear()
-        self.refresh()
+        self._replace_line(self._tool_call_start, Strip(segments))
 
     def _write_tool_call_line(self, prefix: str) -> None:
         formatted = Text()
@@ -765,60 +989,18 @@ class ConversationLog(RichLog):
         formatted.append_text(self._nested_tool_text.copy())
 
         # Convert Text to Strip for in-place storage in RichLog
-        from rich.console import Console
-        from textual.strip import Strip
-
         console = Console(width=max(self.size.width or 200, 200), force_terminal=True)
         segments = list(console.render(formatted))
-        strip = Strip(segments)
 
         # Update the line at the tracked position (in-place)
-        self.lines[self._nested_tool_line] = strip
-
-        # Clear cache and refresh display
-        self._line_cache.clear()
-        self.refresh()
+        self._replace_line(self._nested_tool_line, Strip(segments))
 
     def _truncate_from(self, index: int) -> None:
-        if index >= len(self.lines):
+        # Protected lines survive and move up to sit directly after index
+        if not self._delete_unprotected_from(index):
             return
 
-        # Check if any protected lines would be affected
-        protected_in_range = [i for i in self._protected_lines if i >= index]
-        if protected_in_range:
-            # Don't truncate protected lines - find the first non-protected line after index
-            # or skip truncation entirely if all lines after index are protected
-            non_protected = [i for i in range(index, len(self.lines)) if i not in self._protected_lines]
-            if not non_protected:
-                return  # All lines after index are protected, skip truncation
-            # Only delete non-protected lines
-            for i in sorted(non_protected, reverse=True):
-                if i < len(self.lines):
-                    del self.lines[i]
-        else:
-            del self.lines[index:]
-
-        self._line_cache.clear()
-
-        # Update protected line indices after deletion
-        new_protected = set()
-        for p in self._protected_lines:
-            if p < index:
-                new_protected.add(p)
-            elif p in protected_in_range:
-                # Recalculate position - count how many non-protected lines before this were deleted
-                deleted_before = len([i for i in range(index, p) if i not in self._protected_lines])
-                new_protected.add(p - deleted_before)
-        self._protected_lines = new_protected
-
-        widths: List[int] = []
-        for strip in self.lines:
-            cell_length = getattr(strip, "cell_length", None)
-            widths.append(cell_length() if callable(cell_length) else cell_length or 0)
-
-        self._widest_line_width = max(widths, default=0)
-        self._start_line = max(0, min(self._start_line, len(self.lines)))
-        self.virtual_size = Size(self._widest_line_width, len(self.lines))
+        self._sync_virtual_size()
 
         if self.auto_scroll:
             self.scroll_end(animate=False)
@@ -828,27 +1010,7 @@ class ConversationLog(RichLog):
     # --- Markdown helpers ------------------------------------------------
 
     def _split_code_blocks(self, message: str) -> list[dict[str, str]]:
-        pattern = re.compile(r"```(\w+)?\n?(.*?)```", re.DOTALL)
-        segments: list[dict[str, str]] = []
-        last_end = 0
-
-        for match in pattern.finditer(message):
-            start, end = match.span()
-            if start > last_end:
-                segments.append({"type": "text", "content": message[last_end:start]})
-
-            language = match.group(1) or ""
-            code = match.group(2) or ""
-            segments.append({"type": "code", "language": language, "content": code})
-            last_end = end
-
-        if last_end < len(message):
-            segments.append({"type": "text", "content": message[last_end:]})
-
-        if not segments:
-            segments.append({"type": "text", "content": message})
-
-        return segments
+        return split_code_blocks(message)
 
     @staticmethod
     def _normalize_text(message: str) -> str:
@@ -0,0 +1,261 @@
+"""Indexed line storage for the conversation log.
+
+``RichLog`` keeps its rendered lines in a plain list and recomputes the widest
+line by scanning every line whenever lines are removed. In long sessions the
+log holds thousands of lines and spinner/tool-line updates remove lines several
+times per second, so those scans dominate. ``LineStore`` keeps a count of lines
+per cell width as lines are added and removed, making the widest width available
+without a scan. ``ProtectedLines`` stores protected line indices as sorted
+intervals so truncation only touches the protected lines after the cut.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Any, Iterable, Iterator, List
+
+
+def line_width(line: Any) -> int:
+    """Cell width of a stored line (``Strip`` or ``Text``)."""
+    cell_length = getattr(line, "cell_length", None)
+    if callable(cell_length):
+        return cell_length()
+    return cell_length or 0
+
+
+class LineStore(list):
+    """List of rendered lines that tracks the widest line incrementally."""
+
+    def __init__(self, lines: Iterable[Any] = ()) -> None:
+        super().__init__(lines)
+        self._width_counts: dict[int, int] = {}
+        self._max_width = 0
+        for line in self:
+            self._track(line)
+
+    @property
+    def max_width(self) -> int:
+        """Cell width of the widest stored line."""
+        return self._max_width
+
+    # --- Width bookkeeping -----------------------------------------------
+
+    def _track(self, line: Any) -> None:
+        width = line_width(line)
+        self._width_counts[width] = self._width_counts.get(width, 0) + 1
+        if width > self._max_width:
+            self._max_width = width
+
+    def _untrack(self, line: Any) -> None:
+        width = line_width(line)
+        count = self._width_counts.get(width, 0) - 1
+        if count > 0:
+            self._width_counts[width] = count
+            return
+        self._width_counts.pop(width, None)
+        if width == self._max_width:
+            # Distinct widths are bounded by the terminal width, not the line count
+            self._max_width = max(self._width_counts, default=0)
+
+    # --- list mutators ---------------------------------------------------
+
+    def append(self, line: Any) -> None:
+        super().append(line)
+        self._track(line)
+
+    def extend(self, lines: Iterable[Any]) -> None:
+        lines = list(lines)
+        super().extend(lines)
+        for line in lines:
+            self._track(line)
+
+    def __iadd__(self, lines: Iterable[Any]) -> "LineStore":
+        self.extend(lines)
+        return self
+
+    def insert(self, index: int, line: Any) -> None:
+        super().insert(index, line)
+        self._track(line)
+
+    def pop(self, index: int = -1) -> Any:
+        line = super().pop(index)
+        self._untrack(line)
+        return line
+
+    def remove(self, line: Any) -> None:
+        super().remove(line)
+        self._untrack(line)
+
+    def clear(self) -> None:
+        super().clear()
+        self._width_counts.clear()
+        self._max_width = 0
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            value = list(value)
+            for line in super().__getitem__(index):
+                self._untrack(line)
+            super().__setitem__(index, value)
+            for line in value:
+                self._track(line)
+            return
+        self._untrack(super().__getitem__(index))
+        super().__setitem__(index, value)
+        self._track(value)
+
+    def __delitem__(self, index) -> None:
+        removed = super().__getitem__(index)
+        super().__delitem__(index)
+        for line in removed if isinstance(index, slice) else (removed,):
+            self._untrack(line)
+
+
+class ProtectedLines:
+    """Set of protected line indices stored as sorted, disjoint ``[start, end)`` runs.
+
+    Debug lines are protected one at a time but usually arrive in runs, so the
+    number of intervals stays small even when many lines are protected.
+    """
+
+    def __init__(self, indices: Iterable[int] = ()) -> None:
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._count = 0
+        for index in indices:
+            self.add(index)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __iter__(self) -> Iterator[int]:
+        for start, end in zip(self._starts, self._ends):
+            yield from range(start, end)
+
+    def __contains__(self, index: object) -> bool:
+        if not isinstance(index, int):
+            return False
+        pos = bisect_right(self._starts, index) - 1
+        return pos >= 0 and index < self._ends[pos]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ProtectedLines):
+            return self._starts == other._starts and self._ends == other._ends
+        if isinstance(other, (set, frozenset)):
+            return len(other) == self._count and all(index in self for index in other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        runs = ", ".join(f"{start}-{end - 1}" for start, end in zip(self._starts, self._ends))
+        return f"ProtectedLines({runs})"
+
+    def ranges(self) -> list[tuple[int, int]]:
+        """Protected ``(start, end)`` intervals, end exclusive."""
+        return list(zip(self._starts, self._ends))
+
+    def add(self, index: int) -> None:
+        pos = bisect_right(self._starts, index) - 1
+        if pos >= 0 and index < self._ends[pos]:
+            return
+        self._count += 1
+        joins_left = pos >= 0 and self._ends[pos] == index
+        joins_right = pos + 1 < len(self._starts) and self._starts[pos + 1] == index + 1
+        if joins_left and joins_right:
+            self._ends[pos] = self._ends[pos + 1]
+            del self._starts[pos + 1], self._ends[pos + 1]
+        elif joins_left:
+            self._ends[pos] = index + 1
+        elif joins_right:
+            self._starts[pos + 1] = index
+        else:
+            self._starts.insert(pos + 1, index)
+            self._ends.insert(pos + 1, index + 1)
+
+    def discard(self, index: int) -> None:
+        pos = bisect_right(self._starts, index) - 1
+        if pos < 0 or index >= self._ends[pos]:
+            return
+        self._count -= 1
+        start, end = self._starts[pos], self._ends[pos]
+        if start == index and end == index + 1:
+            del self._starts[pos], self._ends[pos]
+        elif start == index:
+            self._starts[pos] = index + 1
+        elif end == index + 1:
+            self._ends[pos] = index
+        else:
+            self._ends[pos] = index
+            self._starts.insert(pos + 1, index + 1)
+            self._ends.insert(pos + 1, end)
+
+    def has_from(self, index: int) -> bool:
+        """Whether any protected line is at or after ``index``."""
+        return bool(self._ends) and self._ends[-1] > index
+
+    def collapse_from(self, index: int, limit: int) -> list[int]:
+        """Remove protected indices in ``[index, limit)`` and re-protect them packed at ``index``.
+
+        Used when every unprotected line from ``index`` on is deleted: the
+        surviving protected lines move up to sit directly after the cut.
+        Indices at or past ``limit`` no longer refer to a line and are dropped.
+
+        Returns:
+            The original protected indices in ``[index, limit)``, ascending
+        """
+        pos = bisect_right(self._ends, index)
+        tail = list(zip(self._starts[pos:], self._ends[pos:]))
+        del self._starts[pos:], self._ends[pos:]
+        self._count -= sum(end - start for start, end in tail)
+
+        kept: list[int] = []
+        for start, end in tail:
+            if start < index:
+                # Keep the part of a run that straddles the cut
+                self._starts.append(start)
+                self._ends.append(index)
+                self._count += index - start
+                start = index
+            kept.extend(range(start, min(end, limit)))
+
+        if kept:
+            if self._ends and self._ends[-1] == index:
+                self._ends[-1] = index + len(kept)
+            else:
+                self._starts.append(index)
+                self._ends.append(index + len(kept))
+            self._count += len(kept)
+        return kept
+
+    def prune_oldest(self, keep: int) -> None:
+        """Drop the lowest indices until at most ``keep`` remain."""
+        excess = self._count - keep
+        while excess > 0 and self._starts:
+            run = self._ends[0] - self._starts[0]
+            if run <= excess:
+                del self._starts[0], self._ends[0]
+                self._count -= run
+                excess -= run
+            else:
+                self._starts[0] += excess
+                self._count -= excess
+                excess = 0
+
+    def discard_from(self, limit: int) -> None:
+        """Drop indices at or past ``limit`` (lines that no longer exist)."""
+        self.collapse_from(limit, limit)
+
+    def shift(self, delta: int) -> None:
+        """Move every index by ``delta``, dropping indices that become negative."""
+        starts: List[int] = []
+        ends: List[int] = []
+        count = 0
+        for start, end in zip(self._starts, self._ends):
+            start, end = max(start + delta, 0), end + delta
+            if end > start:
+                starts.append(start)
+                ends.append(end)
+                count += end - start
+        self._starts, self._ends, self._count = starts, ends, count
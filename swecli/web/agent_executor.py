@@ -10,6 +10,7 @@ from typing import Any, Dict, Tuple
 
 from swecli.web.state import WebState
 from swecli.web.logging_config import logger
+from swecli.web.ws_outbound import schedule_broadcast
 from swecli.models.message import ChatMessage, Role
 from swecli.models.agent_deps import AgentDependencies
 from swecli.core.runtime import ConfigManager
@@ -210,17 +211,13 @@ class AgentExecutor:
                 content = result.get("content", "")
                 logger.info(f"Broadcasting message_chunk with content length: {len(str(content))}")
                 try:
-                    # Schedule the broadcast coroutine in the event loop
-                    future = asyncio.run_coroutine_threadsafe(
-                        ws_manager.broadcast({
-                            "type": "message_chunk",
-                            "data": {"content": str(content)}
-                        }),
-                        loop
+                    # Queued ahead of message_complete; delivery happens in the
+                    # per-client writers, so the agent thread does not wait
+                    schedule_broadcast(
+                        ws_manager,
+                        {"type": "message_chunk", "data": {"content": str(content)}},
+                        loop,
                     )
-                    # Wait for it to complete
-                    future.result(timeout=5)
-                    logger.info("message_chunk broadcasted successfully")
                 except Exception as e:
                     logger.error(f"Failed to broadcast message_chunk: {e}")
             else:
@@ -73,6 +73,18 @@ def get_command_list() -> List[Dict[str, Any]]:
                 },
             ],
         },
+        {
+            "category": "Performance",
+            "commands": [
+                {"name": "/perf", "args": "", "description": "Show p50/p95 latency per span type"},
+                {
+                    "name": "/perf export",
+                    "args": "[path]",
+                    "description": "Write the trace as Chrome JSON (or OpenTelemetry JSONL for .jsonl)",
+                },
+                {"name": "/perf clear", "args": "", "description": "Clear the trace buffer"},
+            ],
+        },
         {
             "category": "General",
             "commands": [
@@ -0,0 +1,57 @@
+"""Performance trace API endpoints."""
+
+import json
+from typing import Any, Dict
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from swecli.core.agents.components.llm_scheduler import get_llm_scheduler
+from swecli.core.runtime.monitoring.tracing import get_tracer
+
+router = APIRouter(prefix="/api/perf", tags=["perf"])
+
+
+@router.get("")
+async def get_perf_stats(by_name: bool = False) -> Dict[str, Any]:
+    """Get p50/p95 latency per span type.
+
+    Args:
+        by_name: Break the summary down by individual span name
+
+    Returns:
+        Summary rows, slowest total first, the number of buffered spans, and
+        LLM scheduler counters (retries, rate limits, admission waits)
+    """
+    tracer = get_tracer()
+    return {
+        "spans": len(tracer.spans()),
+        "stats": tracer.stats(group_by_name=by_name),
+        "llm_scheduler": get_llm_scheduler().metrics(),
+    }
+
+
+@router.get("/trace")
+async def export_trace(format: str = "chrome") -> Any:
+    """Export the trace buffer.
+
+    Args:
+        format: ``chrome`` (trace-event JSON) or ``otel`` (OpenTelemetry JSONL)
+
+    Raises:
+        HTTPException: For an unknown format
+    """
+    tracer = get_tracer()
+    if format == "chrome":
+        return JSONResponse(tracer.to_chrome_trace())
+    if format == "otel":
+        body = "".join(json.dumps(record) + "\n" for record in tracer.iter_otel_records())
+        return PlainTextResponse(body, media_type="application/x-ndjson")
+    raise HTTPException(status_code=400, detail=f"Unknown trace format '{format}' (expected 'chrome' or 'otel')")
+
+
+@router.delete("")
+async def clear_trace() -> Dict[str, bool]:
+    """Clear the trace buffer."""
+    get_tracer().clear()
+    return {"success": True}
@@ -459,7 +459,7 @@ async def list_files(query: str = "") -> Dict[str, Any]:
         def should_skip_file(file_path: Path) -> bool:
             """Check if a file should be skipped."""
             if gitignore_parser:
-                return gitignore_parser.is_ignored(file_path)
+                return gitignore_parser.is_ignored(file_path, is_dir=False)
             return False
 
         files = []
@@ -13,7 +13,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
 
-from swecli.web.routes import chat_router, sessions_router, config_router, commands_router, mcp_router
+from swecli.web.routes import chat_router, sessions_router, config_router, commands_router, mcp_router, perf_router
 from swecli.web.websocket import websocket_endpoint
 from swecli.web.state import init_state
 from swecli.core.runtime import ConfigManager, ModeManager
@@ -51,6 +51,7 @@ def create_app() -> FastAPI:
     app.include_router(config_router)
     app.include_router(commands_router)
     app.include_router(mcp_router)
+    app.include_router(perf_router)
 
     # WebSocket endpoint
     app.add_websocket_route("/ws", websocket_endpoint)
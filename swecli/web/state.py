@@ -234,14 +234,6 @@ async def broadcast_to_all_clients(message: Dict[str, Any]) -> None:
     Args:
         message: Message to broadcast (will be JSON-serialized)
     """
-    state = get_state()
-    clients = state.get_ws_clients()
+    from swecli.web.websocket import ws_manager
 
-    import json
-
-    for client in clients:
-        try:
-            await client.send_text(json.dumps(message))
-        except Exception:
-            # Client disconnected, will be cleaned up by WebSocket handler
-            pass
+    await ws_manager.broadcast(message)
@@ -2,74 +2,101 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from fastapi import WebSocket, WebSocketDisconnect
 
 from swecli.web.state import get_state
 from swecli.web.logging_config import logger
+from swecli.web.ws_outbound import (
+    DEFAULT_MAX_QUEUE,
+    LAGGING_CLOSE_CODE,
+    ClientChannel,
+    encode_message,
+)
 from swecli.models.message import ChatMessage, Role
 
 
 class WebSocketManager:
-    """Manages WebSocket connections and message broadcasting."""
+    """Manages WebSocket connections and message broadcasting.
 
-    def __init__(self):
+    Every client gets its own bounded outbound queue (see ``ws_outbound``), so
+    broadcasting never waits on the slowest connection.
+    """
+
+    def __init__(self, max_queue: int = DEFAULT_MAX_QUEUE):
         self.active_connections: list[WebSocket] = []
+        self.max_queue = max_queue
+        self._channels: Dict[WebSocket, ClientChannel] = {}
 
     async def connect(self, websocket: WebSocket):
         """Accept a new WebSocket connection."""
         await websocket.accept()
+        self.register(websocket)
+
+    def register(self, websocket: WebSocket) -> ClientChannel:
+        """Track an accepted connection and start its writer task."""
+        channel = ClientChannel(
+            websocket,
+            max_queue=self.max_queue,
+            on_failure=self.disconnect,
+        )
+        self._channels[websocket] = channel
         self.active_connections.append(websocket)
+        channel.start()
         state = get_state()
         state.add_ws_client(websocket)
+        return channel
 
     def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection."""
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
+        channel = self._channels.pop(websocket, None)
+        if channel is not None:
+            channel.close()
         state = get_state()
         state.remove_ws_client(websocket)
 
+    def get_channel(self, websocket: WebSocket) -> Optional[ClientChannel]:
+        """Return the outbound channel for a connection, if it is still registered."""
+        return self._channels.get(websocket)
+
     async def send_message(self, websocket: WebSocket, message: Dict[str, Any]):
         """Send a message to a specific client."""
-        try:
-            await websocket.send_json(message)
-        except Exception as e:
-            logger.error(f"Failed to send WebSocket message: {e}")
-            logger.error(f"Message type: {message.get('type')}")
-            self.disconnect(websocket)
+        channel = self._channels.get(websocket)
+        if channel is None:
+            return
+        if not channel.offer(encode_message(message)):
+            logger.error(f"Dropping lagging WebSocket client (message type: {message.get('type')})")
+            await self._drop_lagging(websocket)
 
     async def broadcast(self, message: Dict[str, Any]):
-        """Broadcast a message to all connected clients."""
-        # Validate message is JSON-serializable before broadcasting
+        """Broadcast a message to all connected clients.
+
+        The message is serialized once and queued for every client; delivery
+        happens concurrently in each client's writer task.
+        """
+        outbound = encode_message(message)
+        logger.debug(f"Broadcasting: {outbound.type}")
+
+        lagging = [
+            websocket
+            for websocket, channel in list(self._channels.items())
+            if not channel.offer(outbound)
+        ]
+
+        for websocket in lagging:
+            logger.error(f"Dropping lagging WebSocket client (message type: {outbound.type})")
+            await self._drop_lagging(websocket)
+
+    async def _drop_lagging(self, websocket: WebSocket) -> None:
+        """Disconnect a client whose outbound queue is full of undroppable messages."""
+        self.disconnect(websocket)
         try:
-            import json
-            json.dumps(message)
-            logger.debug(f"Broadcasting: {message.get('type')}")
-        except (TypeError, ValueError) as e:
-            logger.error(f"❌ Message is not JSON-serializable: {e}")
-            logger.error(f"Message type: {message.get('type')}")
-            logger.error(f"Message keys: {list(message.keys())}")
-            # Try to send error message instead
-            error_message = {
-                "type": "error",
-                "data": {"message": f"Internal serialization error: {str(e)}"}
-            }
-            message = error_message
-
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Failed to broadcast to connection: {e}")
-                logger.error(f"Message type: {message.get('type')}")
-                disconnected.append(connection)
-
-        # Clean up disconnected clients
-        for conn in disconnected:
-            self.disconnect(conn)
+            await websocket.close(code=LAGGING_CLOSE_CODE)
+        except Exception:  # noqa: BLE001
+            pass
 
     async def handle_message(self, websocket: WebSocket, data: Dict[str, Any]):
         """Handle incoming WebSocket message."""
@@ -0,0 +1,247 @@
+"""Per-client outbound queues for WebSocket broadcasting.
+
+Each connected client owns a :class:`ClientChannel` with a bounded queue and a
+dedicated writer task, so a slow browser tab only delays its own stream. A
+broadcast serializes the message once and hands the same text frame to every
+channel. High-frequency events are coalesced while they wait in a queue.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Optional
+
+from swecli.web.logging_config import logger
+
+# Only the most recent event of these types matters; a queued one is replaced.
+COALESCE_LATEST_TYPES = frozenset({
+    "mcp:status_changed",
+    "mcp:servers_updated",
+})
+
+# Assistant text chunks are merged by concatenating ``data.content``; the web UI
+# appends every chunk to the current assistant message.
+COALESCE_APPEND_TYPES = frozenset({
+    "message_chunk",
+})
+
+# Event types that may be discarded outright when a client falls behind.
+DROPPABLE_TYPES = frozenset({"pong", "mcp:status_changed", "mcp:servers_updated"})
+
+DEFAULT_MAX_QUEUE = 256
+
+# "Try Again Later" close code, sent to clients that cannot keep up.
+LAGGING_CLOSE_CODE = 1013
+
+
+@dataclass
+class OutboundMessage:
+    """A message serialized once and shared by every client queue."""
+
+    type: str
+    payload: Dict[str, Any]
+    text: str
+    key: Optional[str] = None
+
+
+def encode_message(message: Dict[str, Any]) -> OutboundMessage:
+    """Serialize a message for broadcast, replacing it with an error if it cannot be encoded."""
+    try:
+        text = json.dumps(message)
+    except (TypeError, ValueError) as e:
+        logger.error(f"❌ Message is not JSON-serializable: {e}")
+        logger.error(f"Message type: {message.get('type')}")
+        logger.error(f"Message keys: {list(message.keys())}")
+        message = {
+            "type": "error",
+            "data": {"message": f"Internal serialization error: {str(e)}"},
+        }
+        text = json.dumps(message)
+
+    msg_type = str(message.get("type", ""))
+    return OutboundMessage(
+        type=msg_type,
+        payload=message,
+        text=text,
+        key=_coalesce_key(msg_type, message),
+    )
+
+
+def _coalesce_key(msg_type: str, message: Dict[str, Any]) -> Optional[str]:
+    """Return the key under which queued copies of this message may be merged."""
+    if msg_type not in COALESCE_LATEST_TYPES and msg_type not in COALESCE_APPEND_TYPES:
+        return None
+    data = message.get("data")
+    scope = ""
+    if isinstance(data, dict):
+        scope = str(data.get("server_name") or data.get("messageId") or data.get("id") or "")
+    return f"{msg_type}:{scope}"
+
+
+def schedule_broadcast(ws_manager: Any, message: Dict[str, Any], loop: asyncio.AbstractEventLoop) -> Future:
+    """Broadcast from a worker thread without waiting for delivery.
+
+    ``broadcast`` only enqueues onto per-client queues, and coroutines
+    scheduled from one thread run in submission order, so the caller never
+    waits on a slow client and its events keep their order.
+    """
+    future = asyncio.run_coroutine_threadsafe(ws_manager.broadcast(message), loop)
+    future.add_done_callback(_log_broadcast_failure)
+    return future
+
+
+def _log_broadcast_failure(future: Future) -> None:
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        logger.error(f"❌ Broadcast failed: {error}")
+
+
+def _merge_append(older: OutboundMessage, newer: OutboundMessage) -> OutboundMessage:
+    """Concatenate two streaming deltas into a single message."""
+    old_data = older.payload.get("data") or {}
+    new_data = newer.payload.get("data") or {}
+    merged_data = dict(new_data)
+    merged_data["content"] = f"{old_data.get('content', '')}{new_data.get('content', '')}"
+    merged = dict(newer.payload)
+    merged["data"] = merged_data
+    return OutboundMessage(
+        type=newer.type,
+        payload=merged,
+        text=json.dumps(merged),
+        key=newer.key,
+    )
+
+
+class ClientChannel:
+    """Bounded outbound queue and writer task for a single WebSocket client."""
+
+    def __init__(
+        self,
+        websocket: Any,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        on_failure: Optional[Callable[[Any], None]] = None,
+    ):
+        """Initialize the channel.
+
+        Args:
+            websocket: Client connection exposing ``send_text``/``close``
+            max_queue: Maximum number of queued messages before back-pressure applies
+            on_failure: Called with the websocket when the writer gives up on it
+        """
+        self.websocket = websocket
+        self.max_queue = max_queue
+        self._on_failure = on_failure
+        self._queue: Deque[OutboundMessage] = deque()
+        self._pending: Dict[str, OutboundMessage] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self.dropped = 0
+        self.coalesced = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def start(self) -> None:
+        """Start the writer task on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._writer())
+
+    def offer(self, message: OutboundMessage) -> bool:
+        """Queue a message without waiting.
+
+        Returns:
+            False if the client is lagging and should be disconnected
+        """
+        if self._closed:
+            return False
+
+        if message.key is not None:
+            queued = self._pending.get(message.key)
+            # Appended chunks are only merged into the queue's tail, so text never
+            # jumps ahead of a tool call queued between two chunks
+            if queued is not None and (message.type not in COALESCE_APPEND_TYPES or self._queue[-1] is queued):
+                self._replace(queued, message)
+                self.coalesced += 1
+                return True
+
+        if len(self._queue) >= self.max_queue and not self._evict_droppable():
+            return False
+
+        self._queue.append(message)
+        if message.key is not None:
+            self._pending[message.key] = message
+        self._wakeup.set()
+        return True
+
+    def close(self) -> None:
+        """Stop the writer task and discard anything still queued."""
+        self._closed = True
+        self._queue.clear()
+        self._pending.clear()
+        self._wakeup.set()
+        if self._task is not None and self._task is not asyncio.current_task():
+            self._task.cancel()
+
+    async def drain(self) -> None:
+        """Wait until the queue is empty (used by tests and shutdown)."""
+        while self._queue and not self._closed:
+            await asyncio.sleep(0)
+
+    def _replace(self, queued: OutboundMessage, message: OutboundMessage) -> None:
+        """Swap an already-queued entry for its coalesced successor.
+
+        Queued messages are shared with other channels, so the entry is
+        replaced in this queue rather than mutated.
+        """
+        if message.type in COALESCE_APPEND_TYPES:
+            message = _merge_append(queued, message)
+        for index, entry in enumerate(self._queue):
+            if entry is queued:
+                self._queue[index] = message
+                break
+        self._pending[message.key] = message
+
+    def _evict_droppable(self) -> bool:
+        """Drop the oldest low-value message to make room; False if none exists."""
+        for index, queued in enumerate(self._queue):
+            if queued.type in DROPPABLE_TYPES:
+                del self._queue[index]
+                if queued.key is not None:
+                    self._pending.pop(queued.key, None)
+                self.dropped += 1
+                return True
+        return False
+
+    async def _writer(self) -> None:
+        try:
+            while not self._closed:
+                if not self._queue:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+
+                message = self._queue.popleft()
+                if message.key is not None and self._pending.get(message.key) is message:
+                    del self._pending[message.key]
+
+                # A stalled send backs up this queue only; once it is full of
+                # undroppable messages the manager disconnects the client.
+                await self.websocket.send_text(message.text)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # noqa: BLE001
+            logger.error(f"Failed to send WebSocket message: {e}")
+            self._closed = True
+            if self._on_failure is not None:
+                self._on_failure(self.websocket)
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from swecli.web.logging_config import logger
+from swecli.web.ws_outbound import schedule_broadcast
 from swecli.core.utils.tool_result_summarizer import summarize_tool_result
 from swecli.ui_textual.utils.tool_display import summarize_tool_arguments
 
@@ -95,12 +96,8 @@ class WebSocketToolBroadcaster:
                     "description": f"Calling {tool_name}",
                 }
             })
-            future = asyncio.run_coroutine_threadsafe(
-                self.ws_manager.broadcast(payload),
-                self.loop,
-            )
-            future.result(timeout=2)
-            logger.info(f"✓ Broadcasted tool_call: {tool_name}")
+            self._schedule_broadcast(payload)
+            logger.info(f"✓ Queued tool_call broadcast: {tool_name}")
         except Exception as e:  # noqa: BLE001
             logger.error(f"❌ Failed to broadcast tool call: {e}")
             logger.error(f"Tool: {tool_name}, Args: {arguments}")
@@ -112,16 +109,16 @@ class WebSocketToolBroadcaster:
                 "type": "tool_result",
                 "data": payload,
             })
-            future = asyncio.run_coroutine_threadsafe(
-                self.ws_manager.broadcast(safe_payload),
-                self.loop,
-            )
-            future.result(timeout=2)
-            logger.info(f"✓ Broadcasted tool_result: {payload.get('tool_name')}")
+            self._schedule_broadcast(safe_payload)
+            logger.info(f"✓ Queued tool_result broadcast: {payload.get('tool_name')}")
         except Exception as e:  # noqa: BLE001
             logger.error(f"❌ Failed to broadcast tool result: {e}")
             logger.error(f"Payload: {payload.get('tool_name')}")
 
+    def _schedule_broadcast(self, payload: Dict[str, Any]) -> None:
+        """Hand a payload to the event loop without waiting for delivery."""
+        schedule_broadcast(self.ws_manager, payload, self.loop)
+
     def _build_result_payload(
         self,
         call_id: str,
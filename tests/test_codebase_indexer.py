@@ -0,0 +1,112 @@
+"""Tests for the cached, gitignore-aware codebase indexer."""
+
+import os
+
+import pytest
+
+from swecli.core.context_engineering.retrieval import indexer as indexer_module
+from swecli.core.context_engineering.retrieval.indexer import CodebaseIndexer
+
+
+def _count_tokens(text):
+    return len(text) // 4
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "src" / "pkg").mkdir(parents=True)
+    (tmp_path / "src" / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "src" / "pkg" / "main.py").write_text("print('hi')\n")
+    (tmp_path / "src" / "pkg" / "secret.key").write_text("x\n")
+    (tmp_path / "src" / ".gitignore").write_text("*.key\n")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_main.py").write_text("")
+    (tmp_path / "node_modules" / "dep").mkdir(parents=True)
+    (tmp_path / "node_modules" / "dep" / "index.js").write_text("")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "out.txt").write_text("")
+    (tmp_path / ".gitignore").write_text("build/\n")
+    (tmp_path / "README.md").write_text("A small demo project.\n\nMore details.\n")
+    (tmp_path / "requirements.txt").write_text("requests\n# comment\nrich\n")
+    return tmp_path
+
+
+def _count_scandir(monkeypatch):
+    listed = []
+    original = os.scandir
+
+    def counting(path="."):
+        listed.append(os.fspath(path))
+        return original(path)
+
+    monkeypatch.setattr(indexer_module.os, "scandir", counting)
+    return listed
+
+
+def test_index_respects_nested_gitignores(project):
+    index = CodebaseIndexer(project, token_counter=_count_tokens).generate_index()
+
+    # README.md, requirements.txt, .gitignore, src/.gitignore, __init__.py, main.py, test_main.py
+    assert "**Total Files:** 7" in index
+    assert "A small demo project." in index
+    assert "**Type:** Python" in index
+    assert "secret.key" not in index
+    assert "node_modules" not in index and "build" not in index
+    assert "- `src/pkg/main.py`" in index
+    assert "- `tests`" in index
+    assert "### Python\n- requests\n- rich" in index
+
+
+def test_structure_is_rendered_as_a_tree(project):
+    index = CodebaseIndexer(project, token_counter=_count_tokens).generate_index()
+
+    assert "├── src\n│   ├── .gitignore\n│   └── pkg\n" in index
+    assert "└── tests\n" in index
+    # Two levels deep: the contents of src/pkg are not listed
+    assert "── main.py" not in index.split("## Structure")[1].split("```")[1]
+    assert "3 directories, 5 files" in index
+
+
+def test_repeat_index_only_relists_changed_directories(project, monkeypatch):
+    first = CodebaseIndexer(project, token_counter=_count_tokens).generate_index()
+    listed = _count_scandir(monkeypatch)
+
+    assert CodebaseIndexer(project, token_counter=_count_tokens).generate_index() == first
+    assert listed == []
+
+    (project / "tests" / "test_extra.py").write_text("")
+    second = CodebaseIndexer(project, token_counter=_count_tokens).generate_index()
+
+    assert listed == [str(project / "tests")]
+    assert "**Total Files:** 8" in second
+
+
+def test_gitignore_edit_invalidates_index(project):
+    indexer = CodebaseIndexer(project, token_counter=_count_tokens)
+    assert "tests" in indexer.generate_index()
+
+    gitignore = project / ".gitignore"
+    gitignore.write_text("build/\ntests/\n")
+    stat = gitignore.stat()
+    os.utime(gitignore, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    index = indexer.generate_index()
+
+    assert "tests" not in index
+    assert "**Total Files:** 6" in index
+
+
+def test_compression_stops_at_budget(tmp_path):
+    counted = []
+
+    def counter(text):
+        counted.append(text)
+        return len(text)
+
+    indexer = CodebaseIndexer(tmp_path, token_counter=counter)
+    content = "\n\n".join(f"paragraph {number}" for number in range(100))
+
+    compressed = indexer._compress_content(content, max_tokens=40)
+
+    assert compressed == "paragraph 0\n\nparagraph 1\n\nparagraph 2\n\nparagraph 3"
+    # Each paragraph is counted once; the growing prefix is never re-counted
+    assert all(len(text) <= len("paragraph 10") for text in counted)
@@ -0,0 +1,95 @@
+"""Tests for the tool schema / system prompt compile cache."""
+
+import copy
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from swecli.core.agents.components import (
+    CompiledTools,
+    PlanningToolSchemaBuilder,
+    SystemPromptBuilder,
+    ToolSchemaBuilder,
+    get_compile_cache,
+)
+from swecli.core.agents.components.anthropic_adapter import AnthropicAdapter
+from swecli.core.agents.components.compile_cache import encode_request_body
+
+
+def _registry(mcp_tools=None):
+    registry = MagicMock(spec=["mcp_manager", "_subagent_manager"])
+    registry._subagent_manager = None
+    if mcp_tools is None:
+        registry.mcp_manager = None
+    else:
+        registry.mcp_manager = MagicMock()
+        registry.mcp_manager.get_all_tools.return_value = mcp_tools
+    return registry
+
+
+def _mcp_tool(name):
+    return {"name": name, "description": f"{name} tool", "input_schema": {"type": "object"}}
+
+
+def test_schemas_are_compiled_once_per_fingerprint():
+    registry = _registry([_mcp_tool("mcp__docs__search")])
+
+    first = ToolSchemaBuilder(registry).build()
+    second = ToolSchemaBuilder(registry).build()
+
+    assert first is second
+    assert "mcp__docs__search" in first.names
+    assert first.token_count == len(first.json_bytes.decode("utf-8")) // 4
+
+
+def test_mcp_tool_change_recompiles():
+    before = ToolSchemaBuilder(_registry([_mcp_tool("mcp__a__one")])).build()
+    after = ToolSchemaBuilder(_registry([_mcp_tool("mcp__a__one"), _mcp_tool("mcp__a__two")])).build()
+
+    assert before is not after
+    assert len(after) == len(before) + 1
+
+
+def test_compiled_schemas_are_read_only():
+    schemas = PlanningToolSchemaBuilder().build()
+
+    with pytest.raises(TypeError):
+        schemas[0]["function"]["name"] = "changed"
+
+    mutable = copy.deepcopy(schemas)
+    mutable[0]["function"]["name"] = "changed"
+    assert isinstance(mutable, list)
+    assert schemas[0]["function"]["name"] != "changed"
+
+
+def test_request_body_matches_plain_encoding():
+    tools = CompiledTools([{"type": "function", "function": {"name": "read_file", "parameters": {}}}])
+    payload = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "tools": tools}
+
+    body = encode_request_body(payload)
+
+    assert tools.json_bytes in body
+    assert json.loads(body) == json.loads(json.dumps({**payload, "tools": copy.deepcopy(tools)}))
+
+
+def test_system_prompt_is_cached_per_working_dir():
+    cache = get_compile_cache()
+    prompt = SystemPromptBuilder(None, "/work/a").build()
+    hits = cache.hits
+
+    assert SystemPromptBuilder(None, "/work/a").build() == prompt
+    assert cache.hits == hits + 1
+    other = SystemPromptBuilder(None, "/work/b").build()
+    assert "/work/b" in other and "/work/a" not in other
+
+
+def test_anthropic_adapter_converts_compiled_tools_once():
+    adapter = AnthropicAdapter("key")
+    tools = PlanningToolSchemaBuilder().build()
+
+    first = adapter.convert_request({"model": "m", "messages": [], "tools": tools})["tools"]
+    second = adapter.convert_request({"model": "m", "messages": [], "tools": tools})["tools"]
+
+    assert first is second
+    assert first[0]["name"] == tools[0]["function"]["name"]
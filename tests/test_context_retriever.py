@@ -0,0 +1,123 @@
+"""Tests for batched context retrieval (multi-pattern search and file-name index)."""
+
+import shutil
+import subprocess
+
+import pytest
+
+from swecli.core.context_engineering.retrieval import batch_search
+from swecli.core.context_engineering.retrieval.batch_search import (
+    FileNameIndex,
+    LiteralMatcher,
+    find_files_containing,
+    get_filename_index,
+)
+from swecli.core.context_engineering.retrieval.retriever import ContextRetriever, EntityExtractor
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    (tmp_path / "src" / "auth").mkdir(parents=True)
+    (tmp_path / "src" / "auth" / "login.py").write_text("class UserManager:\n    def authenticate_user(self): ...\n")
+    (tmp_path / "src" / "user.py").write_text("from auth.login import UserManager\nUser = UserManager\n")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "login.py").write_text("def test_login(): ...\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "login.py").write_text("UserManager\n")
+    return tmp_path
+
+
+@pytest.fixture(params=["ripgrep", "python"])
+def search_mode(request, monkeypatch):
+    if request.param == "ripgrep":
+        if shutil.which("rg") is None:
+            pytest.skip("ripgrep not installed")
+    else:
+        monkeypatch.setattr(batch_search.shutil, "which", lambda name: None)
+    return request.param
+
+
+def test_literal_matcher_credits_contained_patterns():
+    matcher = LiteralMatcher(["User", "UserManager", "login"])
+
+    assert matcher.search("x = UserManager()") == {"User", "UserManager"}
+    assert matcher.expand("UserManager") == ["UserManager", "User"]
+    assert LiteralMatcher([]).search("anything") == set()
+
+
+def test_find_files_containing_attributes_each_pattern(workspace, search_mode):
+    results = find_files_containing(workspace, ["UserManager", "authenticate_user", "missing_name"])
+
+    assert sorted(results["UserManager"]) == [
+        str(workspace / "src" / "auth" / "login.py"),
+        str(workspace / "src" / "user.py"),
+    ]
+    assert results["authenticate_user"] == [str(workspace / "src" / "auth" / "login.py")]
+    assert results["missing_name"] == []
+
+
+def test_overlapping_patterns_are_all_found(tmp_path, search_mode):
+    (tmp_path / "app.py").write_text("manager = getUserManager()\n")
+
+    assert LiteralMatcher(["getUser", "UserManager"]).search("getUserManager()") == {"getUser", "UserManager"}
+    results = find_files_containing(tmp_path, ["getUser", "UserManager"])
+    assert results == {"getUser": [str(tmp_path / "app.py")], "UserManager": [str(tmp_path / "app.py")]}
+
+
+def test_many_entities_use_one_process(workspace, monkeypatch):
+    if shutil.which("rg") is None:
+        pytest.skip("ripgrep not installed")
+    started = []
+    original = subprocess.Popen
+
+    def counting(*args, **kwargs):
+        started.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(batch_search.subprocess, "Popen", counting)
+    retriever = ContextRetriever(workspace)
+
+    context = retriever.retrieve_context("Fix UserManager, SessionHandler and authenticate_user() in login.py")
+
+    assert len(started) == 1
+    reasons = {(item["reason"], item["entity"]) for item in context["files_found"]}
+    assert ("contains_entity", "authenticate_user") in reasons
+    assert not context["budget_exhausted"]
+
+
+def test_filename_index_prefers_matching_path(workspace):
+    index = FileNameIndex(workspace)
+
+    assert index.complete
+    assert index.find("auth/login.py") == workspace / "src" / "auth" / "login.py"
+    # Equal suffix: the shallower path wins; skipped directories are never indexed
+    assert index.find("login.py") == workspace / "tests" / "login.py"
+    assert index.find("absent.py") is None
+
+
+def test_filename_index_is_shared_until_stale(workspace):
+    first = get_filename_index(workspace)
+    assert get_filename_index(workspace) is first
+    assert get_filename_index(workspace, max_age=0) is not first
+
+
+def test_class_extraction_ignores_prose():
+    classes = EntityExtractor().extract_entities("Please check The UserManager and HTTPClient in README")["classes"]
+
+    assert sorted(classes) == ["HTTPClient", "UserManager"]
+
+
+def test_ripgrep_output_is_parsed_and_stopped_early(tmp_path, monkeypatch):
+    # Stand-in for rg that prints "path\0match" lines, as `rg --null --only-matching` does
+    fake = tmp_path / "rg"
+    fake.write_text(
+        "#!/bin/sh\n"
+        "printf 'a.py\\0UserManager\\na.py\\0login\\nb.py\\0login\\n'\n"
+        "exec sleep 5\n"
+    )
+    fake.chmod(0o755)
+    monkeypatch.setattr(batch_search.shutil, "which", lambda name: str(fake))
+
+    results = find_files_containing(tmp_path, ["User", "UserManager", "login"], limit=1)
+
+    assert results == {"UserManager": ["a.py"], "User": ["a.py"], "login": ["a.py"]}
@@ -0,0 +1,122 @@
+"""Tests for lazy session history hydration in the Textual UI."""
+
+import pytest
+from textual.app import App, ComposeResult
+
+from swecli.models.message import ChatMessage, Role, ToolCall
+from swecli.ui_textual.managers.history_hydrator import HistoryHydrator, RenderCache
+from swecli.ui_textual.widgets.conversation_log import ConversationLog
+
+
+def _messages(count):
+    messages = []
+    for i in range(count):
+        messages.append(ChatMessage(role=Role.USER, content=f"question {i}"))
+        messages.append(
+            ChatMessage(
+                role=Role.ASSISTANT,
+                content=f"**Answer {i}**\n\n- first point\n- second point",
+                tool_calls=[ToolCall(id=f"t{i}", name="read_file", parameters={"path": f"f{i}.py"}, result_summary="ok")],
+            )
+        )
+    return messages
+
+
+def _replay(conversation, message):
+    if message.role == Role.USER:
+        conversation.add_user_message(message.content)
+    else:
+        conversation.add_assistant_message(message.content)
+        for call in message.tool_calls:
+            conversation.add_tool_call(f"{call.name}({call.parameters['path']})")
+            conversation.stop_tool_execution()
+            conversation.add_tool_result(call.result_summary)
+
+
+class _LogApp(App):
+    def compose(self) -> ComposeResult:
+        yield ConversationLog()
+
+
+def _plain(conversation):
+    return [strip.text.rstrip() for strip in conversation.lines]
+
+
+@pytest.mark.asyncio
+async def test_only_recent_history_is_rendered_up_front(tmp_path):
+    app = _LogApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        log = app.query_one(ConversationLog)
+        await pilot.pause()
+        hydrator = HistoryHydrator(log, _messages(300), _replay, save_in_background=False)
+
+        hydrator.start()
+
+        assert hydrator.rendered < 40
+        assert hydrator.remaining == 600 - hydrator.rendered
+        assert "question 299" in "\n".join(_plain(log))
+        assert "question 0" not in "\n".join(_plain(log))
+        assert log._history_loader is not None
+
+
+@pytest.mark.asyncio
+async def test_scroll_back_prepends_older_messages_in_place():
+    app = _LogApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        log = app.query_one(ConversationLog)
+        await pilot.pause()
+        hydrator = HistoryHydrator(log, _messages(50), _replay, save_in_background=False)
+        hydrator.start()
+        tail = _plain(log)
+
+        added = log._history_loader()
+
+        assert added > 0
+        assert _plain(log)[added:] == tail
+        assert log.scroll_offset.y >= min(added, log.max_scroll_y)
+
+        while log._history_loader():
+            pass
+        plain = "\n".join(_plain(log))
+        assert plain.index("question 0") < plain.index("question 1") < plain.index("question 49")
+
+
+@pytest.mark.asyncio
+async def test_render_cache_skips_rendering_on_next_resume(tmp_path):
+    messages = _messages(30)
+    app = _LogApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        log = app.query_one(ConversationLog)
+        await pilot.pause()
+        first = HistoryHydrator(log, messages, _replay, cache=RenderCache(tmp_path / "s.json"), save_in_background=False)
+        first.start()
+        expected = _plain(log)
+        log.clear()
+        await pilot.pause()
+
+        second = HistoryHydrator(log, messages, _replay, cache=RenderCache(tmp_path / "s.json"), save_in_background=False)
+        second.start()
+
+        assert first.rendered > 0
+        assert second.rendered == 0
+        assert second.cache_hits == first.rendered
+        assert _plain(log) == expected
+
+
+@pytest.mark.asyncio
+async def test_detached_render_leaves_live_tool_line_alone():
+    app = _LogApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        log = app.query_one(ConversationLog)
+        await pilot.pause()
+        log.add_tool_call("bash(make test)")
+        log.start_tool_execution()
+        live_index = log._tool_call_start
+
+        strips = log.render_detached(lambda: _replay(log, _messages(1)[1]))
+
+        assert strips
+        assert log._tool_call_start == live_index
+        assert log._spinner_active
+        assert len(log.lines) == live_index + 1
+        log.stop_tool_execution()
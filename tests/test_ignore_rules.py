@@ -0,0 +1,120 @@
+"""Tests for the shared, compiled workspace ignore rules."""
+
+import os
+
+import pytest
+
+from swecli.core.context_engineering.tools.implementations.file_ops import FileOperations
+from swecli.core.utils import ignore_rules
+from swecli.core.utils.ignore_rules import get_ignore_engine
+from swecli.models.config import AppConfig
+from swecli.ui_textual.autocomplete_internal.gitignore import GitIgnoreParser
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    (tmp_path / ".gitignore").write_text("*.log\nbuild/\n/secret.txt\n")
+    (tmp_path / "pkg" / "build").mkdir(parents=True)
+    (tmp_path / "pkg" / ".gitignore").write_text("!keep.log\ngenerated/\n")
+    (tmp_path / "pkg" / "generated").mkdir()
+    (tmp_path / "pkg" / "generated" / "a.py").write_text("")
+    (tmp_path / "pkg" / "keep.log").write_text("")
+    (tmp_path / "pkg" / "other.log").write_text("")
+    (tmp_path / "pkg" / "secret.txt").write_text("")
+    (tmp_path / "secret.txt").write_text("")
+    (tmp_path / "node_modules").mkdir()
+    return tmp_path
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_nested_gitignores_and_default_excludes(workspace):
+    engine = get_ignore_engine(workspace, ["node_modules", "*.min.js"])
+
+    assert engine.is_ignored("debug.log")
+    assert engine.is_ignored("pkg/other.log")
+    # The deeper .gitignore re-includes keep.log
+    assert not engine.is_ignored("pkg/keep.log")
+    # Anchored patterns only apply next to their .gitignore
+    assert engine.is_ignored("secret.txt")
+    assert not engine.is_ignored("pkg/secret.txt")
+    # Directory-only patterns, and everything below an ignored directory
+    assert engine.skip_dir("pkg/build")
+    assert engine.is_ignored(workspace / "pkg" / "generated" / "a.py")
+    assert engine.skip_dir("node_modules")
+    assert engine.is_ignored("src/app.min.js", is_dir=False)
+    assert not engine.is_ignored("src/app.js", is_dir=False)
+    # Paths outside the workspace are never ignored
+    assert not engine.is_ignored(workspace.parent / "debug.log")
+
+
+def test_engines_are_shared_per_workspace(workspace):
+    engine = get_ignore_engine(workspace, ["node_modules"])
+
+    assert get_ignore_engine(str(workspace), ["node_modules"]) is engine
+    assert get_ignore_engine(workspace).trie is engine.trie
+    assert GitIgnoreParser(workspace)._engine.trie is engine.trie
+
+
+def test_directory_decisions_are_memoized(workspace, monkeypatch):
+    engine = get_ignore_engine(workspace)
+    assert engine.skip_dir("pkg/build")
+
+    def fail(*args):
+        raise AssertionError("directory decision was recomputed")
+
+    monkeypatch.setattr(engine.trie, "decide", fail)
+    assert engine.skip_dir("pkg/build")
+    assert engine.is_ignored("pkg/build/output.txt", is_dir=False)
+
+
+def test_gitignore_changes_invalidate_rules(workspace):
+    (workspace / "pkg" / "sub").mkdir()
+    engine = get_ignore_engine(workspace)
+    assert not engine.is_ignored("notes.md", is_dir=False)
+
+    gitignore = workspace / ".gitignore"
+    gitignore.write_text("*.md\n")
+    _bump_mtime(gitignore)
+    # Throttled: nothing is re-checked within the interval
+    assert not engine.trie.revalidate()
+    assert engine.trie.revalidate(interval=0)
+    assert engine.is_ignored("notes.md", is_dir=False)
+
+    # A .gitignore appearing in an already loaded directory is picked up too
+    assert not engine.is_ignored("pkg/sub/data.csv", is_dir=False)
+    (workspace / "pkg" / "sub" / ".gitignore").write_text("*.csv\n")
+    assert engine.trie.revalidate(interval=0)
+    assert engine.is_ignored("pkg/sub/data.csv", is_dir=False)
+
+
+def test_revalidation_is_throttled_per_interval(workspace, monkeypatch):
+    engine = get_ignore_engine(workspace)
+    engine.is_ignored("debug.log", is_dir=False)
+    now = [ignore_rules.time.monotonic() + 1000.0]
+    monkeypatch.setattr(ignore_rules.time, "monotonic", lambda: now[0])
+    engine.trie.revalidate(interval=0)
+
+    (workspace / ".gitignore").write_text("")
+    _bump_mtime(workspace / ".gitignore")
+    now[0] += ignore_rules.REVALIDATE_INTERVAL / 2
+    get_ignore_engine(workspace)
+    assert engine.is_ignored("debug.log", is_dir=False)
+
+    now[0] += ignore_rules.REVALIDATE_INTERVAL
+    get_ignore_engine(workspace)
+    assert not engine.is_ignored("debug.log", is_dir=False)
+
+
+def test_search_exclusions_honour_gitignore(workspace):
+    file_ops = FileOperations(AppConfig(), workspace)
+
+    assert file_ops._is_excluded_path(str(workspace / "pkg" / "other.log"))
+    assert file_ops._is_excluded_path("pkg/generated/a.py")
+    assert not file_ops._is_excluded_path("pkg/keep.log")
+    # Outside the workspace only the default excludes apply
+    assert file_ops._is_excluded_path("/elsewhere/node_modules/x.js")
+    assert not file_ops._is_excluded_path("/elsewhere/debug.log")
@@ -0,0 +1,125 @@
+"""Tests for incremental (streamed) markdown rendering."""
+
+import random
+
+import pytest
+from rich.panel import Panel
+from rich.text import Text
+from textual.app import App, ComposeResult
+
+from swecli.ui_textual.renderers import markdown
+from swecli.ui_textual.renderers.markdown import (
+    IncrementalMarkdownRenderer,
+    render_markdown_message,
+    render_markdown_text_segment,
+    split_code_blocks,
+)
+from swecli.ui_textual.widgets.conversation_log import ConversationLog
+
+MESSAGE = """# Plan
+
+I'll fix the parser first. It **fails** on `nested` input
+when the list is empty.
+
+- read the grammar
+  - check `parse_list`
+1. write a test
+> The docs say [this](https://example.com) is allowed.
+
+```python
+def parse(tokens):
+
+    return []
+```
+
+---
+Then run the suite:
+
+```bash
+pytest -q
+```
+Done. Unclosed ``` fence stays text
+"""
+
+
+def _plain(renderables):
+    return [r.plain if isinstance(r, Text) else f"<{type(r).__name__}>" for r in renderables]
+
+
+def _reference(message):
+    """Rendering of a whole message as add_assistant_message did before streaming."""
+    output, text_output = [], False
+    for segment in split_code_blocks(message):
+        if segment["type"] == "code":
+            block = markdown.render_code_block(segment["content"], segment["language"])
+            if block is not None:
+                output.append(block)
+        elif segment["content"]:
+            renderables, wrote = render_markdown_text_segment(segment["content"], leading=not text_output)
+            output.extend(renderables)
+            text_output = text_output or wrote
+    return output
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_streamed_rendering_matches_full_render(seed):
+    rng = random.Random(seed)
+    renderer = IncrementalMarkdownRenderer()
+    position = 0
+    while position < len(MESSAGE):
+        step = rng.randint(1, 12)
+        renderer.feed(MESSAGE[position : position + step])
+        position += step
+        assert _plain(renderer.renderables()) == _plain(_reference(MESSAGE[:position]))
+
+    assert _plain(render_markdown_message(MESSAGE)) == _plain(_reference(MESSAGE))
+
+
+def test_only_open_block_is_reparsed(monkeypatch):
+    parsed = []
+    original = markdown._render_lines
+    monkeypatch.setattr(markdown, "_render_lines", lambda lines, *args: parsed.append(len(lines)) or original(lines, *args))
+
+    renderer = IncrementalMarkdownRenderer()
+    for index in range(200):
+        renderer.feed(f"Paragraph {index} has some words.\n\n")
+        renderer.pending()
+
+    # Each paragraph is parsed once when finished, never again
+    assert sum(parsed) < 3 * 200
+    assert len(renderer.finished()) == 200 * 2
+
+
+def test_finished_blocks_are_kept():
+    renderer = IncrementalMarkdownRenderer()
+    renderer.feed("intro\n\n```py\nx = 1\n```\n")
+    first = renderer.take_finished()
+
+    renderer.feed("more text")
+
+    assert isinstance(first[-1], Panel)
+    assert renderer.take_finished() == []
+    assert renderer.finished()[: len(first)] == first
+
+
+class _LogApp(App):
+    def compose(self) -> ComposeResult:
+        yield ConversationLog()
+
+
+@pytest.mark.asyncio
+async def test_streamed_message_matches_one_shot_message():
+    app = _LogApp()
+    async with app.run_test(size=(80, 40)) as pilot:
+        log = app.query_one(ConversationLog)
+        await pilot.pause()
+        log.add_assistant_message(MESSAGE)
+        expected = [strip.text for strip in log.lines]
+        log.clear()
+
+        log.start_assistant_stream()
+        for start in range(0, len(MESSAGE), 7):
+            log.append_assistant_stream(MESSAGE[start : start + 7])
+        log.finish_assistant_stream()
+
+        assert [strip.text for strip in log.lines] == expected
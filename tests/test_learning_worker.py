@@ -0,0 +1,135 @@
+"""Tests for the background ACE learning worker."""
+
+import json
+import threading
+
+from swecli.core.context_engineering.memory import (
+    AgentResponse,
+    Curator,
+    LearningRecord,
+    LearningWorker,
+    Reflector,
+)
+from swecli.models.session import Session
+
+
+class ScriptedClient:
+    """LLM client returning a reflection or curation depending on the prompt."""
+
+    def __init__(self, gate: threading.Event = None):
+        self.gate = gate
+        self.prompts = []
+
+    def chat_completion(self, messages):
+        if self.gate is not None:
+            self.gate.wait(5)
+        prompt = messages[0]["content"]
+        self.prompts.append(prompt)
+        if "curating a playbook" in prompt:
+            payload = {
+                "reasoning": "capture the lesson",
+                "operations": [
+                    {"type": "ADD", "section": "file_operations", "content": f"Lesson {len(self.prompts)}"}
+                ],
+            }
+        else:
+            payload = {"reasoning": "ok", "key_insight": "list before read", "bullet_tags": []}
+        return {"content": json.dumps(payload)}
+
+
+def _record(session, query, outcome="success"):
+    return LearningRecord(
+        session=session,
+        query=query,
+        agent_response=AgentResponse(content=f"answer to {query}", tool_calls=[{"function": {"name": "read_file"}}]),
+        feedback=f"Outcome: {outcome}",
+        outcome=outcome,
+    )
+
+
+def _worker(client, **kwargs):
+    return LearningWorker(Reflector(client), Curator(client), **kwargs)
+
+
+def test_submit_returns_without_waiting_for_llm():
+    gate = threading.Event()
+    client = ScriptedClient(gate)
+    worker = _worker(client)
+    session = Session()
+
+    worker.submit(_record(session, "first"))
+    assert worker.flush(timeout=0.05) is False
+
+    gate.set()
+    assert worker.flush(timeout=5)
+    assert len(session.get_playbook().bullets()) == 1
+    worker.close()
+
+
+def test_backlog_is_reflected_in_one_batch():
+    gate = threading.Event()
+    client = ScriptedClient(gate)
+    worker = _worker(client, batch_size=4)
+    session = Session()
+
+    # Occupy the worker so the following records accumulate.
+    worker.submit(_record(session, "busy"))
+    while worker.pending:
+        pass
+    for index in range(4):
+        worker.submit(_record(session, f"query {index}"))
+    gate.set()
+    assert worker.flush(timeout=5)
+
+    reflections = [p for p in client.prompts if "curating a playbook" not in p]
+    assert len(reflections) == 2
+    assert "Turn 4: query 3" in reflections[-1]
+    assert len(session.get_playbook().bullets()) == 2
+    worker.close()
+
+
+def test_full_queue_merges_same_query_and_drops_oldest():
+    gate = threading.Event()
+    worker = _worker(ScriptedClient(gate), max_pending=2)
+    session = Session()
+
+    # Occupy the worker so the following records stay queued.
+    worker.submit(_record(session, "busy"))
+    while worker.pending:
+        pass
+
+    worker.submit(_record(session, "a"))
+    worker.submit(_record(session, "b"))
+    worker.submit(_record(session, "b", outcome="error"))
+    worker.submit(_record(session, "c"))
+
+    assert worker.merged == 1
+    assert worker.dropped == 1
+    queued = list(worker._pending)
+    assert [record.query for record in queued] == ["b", "c"]
+    assert queued[0].outcome == "error"
+    assert queued[0].merged == 2
+
+    gate.set()
+    worker.close()
+
+
+def test_failures_do_not_stop_the_worker():
+    class FlakyClient(ScriptedClient):
+        def chat_completion(self, messages):
+            if not self.prompts:
+                self.prompts.append("boom")
+                raise RuntimeError("network down")
+            return super().chat_completion(messages)
+
+    worker = _worker(FlakyClient())
+    session = Session()
+
+    worker.submit(_record(session, "first"))
+    assert worker.flush(timeout=5)
+    worker.submit(_record(session, "second"))
+    assert worker.flush(timeout=5)
+
+    assert worker.processed == 2
+    assert len(session.get_playbook().bullets()) == 1
+    worker.close()
@@ -0,0 +1,90 @@
+"""Tests for the line diff engine behind edit previews and stats."""
+
+import difflib
+import random
+
+from swecli.core.context_engineering.tools.implementations.diff_preview import Diff
+from swecli.core.context_engineering.tools.implementations.edit_tool import EditTool
+from swecli.core.context_engineering.tools.implementations.line_diff import (
+    compute_opcodes,
+    edit_span,
+    opcode_stats,
+)
+from swecli.models.config import AppConfig
+
+
+def _apply(a, b, opcodes):
+    out = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            assert a[i1:i2] == b[j1:j2]
+            out.extend(a[i1:i2])
+        else:
+            out.extend(b[j1:j2])
+    return out
+
+
+def test_opcodes_reconstruct_target_and_are_minimal():
+    rng = random.Random(7)
+    for _ in range(500):
+        a = [rng.choice("abcde") + "\n" for _ in range(rng.randint(0, 25))]
+        b = list(a)
+        for _ in range(rng.randint(0, 4)):
+            pos = rng.randint(0, len(b))
+            if rng.random() < 0.5:
+                b.insert(pos, rng.choice("axyz") + "\n")
+            elif b:
+                del b[min(pos, len(b) - 1)]
+
+        opcodes = compute_opcodes(a, b)
+        assert _apply(a, b, opcodes) == b
+
+        reference = difflib.SequenceMatcher(None, a, b, autojunk=False).get_opcodes()
+        assert opcode_stats(opcodes)["lines_changed"] <= opcode_stats(reference)["lines_changed"]
+
+
+def test_unified_diff_matches_difflib_for_single_edit():
+    original = "".join(f"line {i}\n" for i in range(200))
+    modified = original.replace("line 100\n", "line one hundred\nextra\n")
+
+    diff = Diff("file.py", original, modified)
+    expected = "\n".join(
+        difflib.unified_diff(
+            original.splitlines(keepends=True),
+            modified.splitlines(keepends=True),
+            fromfile="a/file.py",
+            tofile="b/file.py",
+            lineterm="",
+            n=3,
+        )
+    )
+
+    assert diff.generate_unified_diff() == expected
+    assert diff.get_stats() == {"lines_added": 2, "lines_removed": 1, "lines_changed": 3}
+
+
+def test_edit_span_limits_window_to_replaced_lines():
+    original = "a\nb\nc\nd\n"
+    offset = original.find("b\nc")
+    modified = original[:offset] + "B\nX\nC" + original[offset + 3:]
+
+    span = edit_span(original, modified, offset, 3, 5)
+    assert span == (1, 3, 1, 4)
+
+    opcodes = compute_opcodes(original.splitlines(True), modified.splitlines(True), span)
+    assert opcode_stats(opcodes) == {"lines_added": 3, "lines_removed": 2, "lines_changed": 5}
+
+
+def test_edit_file_reports_stats_and_diff(tmp_path):
+    target = tmp_path / "module.py"
+    target.write_text("".join(f"value_{i} = {i}\n" for i in range(1000)))
+    tool = EditTool(AppConfig(), tmp_path)
+
+    result = tool.edit_file(str(target), "value_500 = 500\n", "value_500 = 5000\n", dry_run=True)
+
+    assert result.success
+    assert result.lines_added == 1
+    assert result.lines_removed == 1
+    assert "-value_500 = 500" in result.diff
+    assert "+value_500 = 5000" in result.diff
+    assert "@@ -498,7 +498,7 @@" in result.diff
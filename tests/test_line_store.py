@@ -0,0 +1,121 @@
+"""Tests for the conversation log line store and protected-line intervals."""
+
+import pytest
+from rich.segment import Segment
+from rich.text import Text
+from textual.app import App, ComposeResult
+from textual.strip import Strip
+
+from swecli.ui_textual.widgets.conversation_log import ConversationLog
+from swecli.ui_textual.widgets.line_store import LineStore, ProtectedLines
+
+
+def _strip(text):
+    return Strip([Segment(text)])
+
+
+def test_line_store_tracks_widest_line():
+    store = LineStore([_strip("ab"), _strip("abcdef"), _strip("abcd")])
+    assert store.max_width == 6
+
+    del store[1]
+    assert store.max_width == 4
+
+    store[0] = _strip("a" * 10)
+    store.extend([_strip("a" * 3)])
+    assert store.max_width == 10
+
+    store[1:] = [_strip("z")]
+    assert store.max_width == 10
+    store.pop(0)
+    assert store.max_width == 1
+    store.clear()
+    assert store.max_width == 0
+
+
+def test_protected_lines_are_stored_as_runs():
+    protected = ProtectedLines([4, 2, 3, 9])
+    assert protected.ranges() == [(2, 5), (9, 10)]
+    assert protected == {2, 3, 4, 9}
+
+    protected.discard(3)
+    assert protected.ranges() == [(2, 3), (4, 5), (9, 10)]
+
+    protected.prune_oldest(2)
+    assert protected == {4, 9}
+
+
+def test_collapse_packs_protected_lines_after_cut():
+    protected = ProtectedLines([1, 5, 6, 8, 20])
+
+    kept = protected.collapse_from(3, limit=10)
+
+    assert kept == [5, 6, 8]
+    assert protected == {1, 3, 4, 5}
+
+    straddling = ProtectedLines(range(2, 8))
+    assert straddling.collapse_from(5, limit=8) == [5, 6, 7]
+    assert straddling.ranges() == [(2, 8)]
+
+
+def test_truncation_does_not_rescan_line_widths(monkeypatch):
+    log = ConversationLog()
+    log.lines = [_strip(f"line {i}") for i in range(1000)]
+    log._protected_lines = {990}
+
+    measured = []
+    original = Strip.cell_length.fget
+    monkeypatch.setattr(Strip, "cell_length", property(lambda self: measured.append(1) or original(self)))
+
+    log._truncate_from(980)
+
+    assert len(log.lines) == 981
+    assert log._protected_lines == {980}
+    assert len(measured) < 50  # proportional to the 20-line tail, not the 1000-line log
+
+
+class _LogApp(App):
+    def compose(self) -> ComposeResult:
+        yield ConversationLog()
+
+
+@pytest.mark.asyncio
+async def test_spinner_updates_replace_tail_in_place():
+    app = _LogApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        log = app.query_one(ConversationLog)
+        log.write(Text("hello"))
+        await pilot.pause()
+
+        log.start_spinner("Thinking")
+        spinner_line = len(log.lines) - 1
+        for tick in range(5):
+            log.update_spinner(f"Thinking {tick}")
+
+        assert len(log.lines) == spinner_line + 1
+        assert log.lines[spinner_line].text == "Thinking 4"
+        log.stop_spinner()
+        assert len(log.lines) == spinner_line
+
+
+@pytest.mark.asyncio
+async def test_trimming_keeps_tracked_indices_aligned():
+    app = _LogApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        log = app.query_one(ConversationLog)
+        log.MAX_LINES = 10
+        await pilot.pause()
+
+        for i in range(8):
+            log.write(Text(f"line {i}"))
+        log._protected_lines.add(6)
+        log._tool_call_start = 7
+
+        for i in range(8, 12):
+            log.write(Text(f"line {i}"))
+
+        assert len(log.lines) == 10
+        assert log.lines[0].text == "line 2"
+        assert log._protected_lines == {4}
+        assert log._tool_call_start == 5
+        assert log.virtual_size.height == 10
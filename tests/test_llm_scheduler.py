@@ -0,0 +1,202 @@
+"""Tests for LLM request scheduling: rate-limit budgets, retries and priorities."""
+
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from swecli.core.agents.components.http_client import HttpResult
+from swecli.core.agents.components.llm_scheduler import (
+    LLMScheduler,
+    Priority,
+    RetryPolicy,
+    TokenBucket,
+    current_priority,
+    llm_priority,
+    parse_rate_limit_headers,
+)
+from swecli.core.runtime.monitoring.tracing import QUEUE, get_tracer
+
+LANE = ("api.example.com", "model")
+FAST = RetryPolicy(max_retries=3, base_delay=0.001, max_delay=0.002)
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+
+
+def replies(*results):
+    """``send`` callable returning ``results`` in turn, counting calls."""
+    queue = list(results)
+    calls = []
+
+    def send():
+        calls.append(time.monotonic())
+        result = queue.pop(0)
+        if isinstance(result, BaseException):
+            return HttpResult(success=False, error=str(result), exception=result)
+        return HttpResult(success=True, response=result)
+
+    return send, calls
+
+
+def test_parse_rate_limit_headers():
+    openai = parse_rate_limit_headers(
+        CaseInsensitiveDict(
+            {
+                "x-ratelimit-limit-requests": "60",
+                "x-ratelimit-remaining-requests": "59",
+                "x-ratelimit-reset-requests": "1s",
+                "x-ratelimit-limit-tokens": "150000",
+                "x-ratelimit-remaining-tokens": "149984",
+                "x-ratelimit-reset-tokens": "6m0s",
+                "retry-after-ms": "250",
+            }
+        )
+    )
+    assert (openai.requests_limit, openai.requests_remaining, openai.requests_reset) == (60, 59, 1.0)
+    assert openai.tokens_reset == 360.0 and openai.retry_after == 0.25
+
+    anthropic = parse_rate_limit_headers(
+        CaseInsensitiveDict(
+            {
+                "anthropic-ratelimit-requests-limit": "50",
+                "anthropic-ratelimit-requests-remaining": "0",
+                "anthropic-ratelimit-requests-reset": "2000-01-01T00:00:00Z",
+                "retry-after": "3",
+            }
+        )
+    )
+    assert anthropic.requests_limit == 50 and anthropic.requests_remaining == 0
+    assert anthropic.requests_reset == 0.0 and anthropic.retry_after == 3.0
+    assert parse_rate_limit_headers(CaseInsensitiveDict()).requests_limit is None
+
+
+def test_token_bucket():
+    bucket = TokenBucket(capacity=2, rate=1.0, now=0.0)
+    assert bucket.wait_time(1, 0.0) == 0
+    bucket.take(2, 0.0)
+    assert bucket.wait_time(1, 0.0) == 1.0
+    assert bucket.wait_time(1, 0.5) == 0.5
+    # Requests larger than the bucket wait for a full bucket, not forever
+    assert bucket.wait_time(10, 0.5) == 1.5
+    bucket.observe(limit=120, remaining=0, now=1.0)
+    assert bucket.capacity == 120 and bucket.wait_time(1, 1.0) == 0.5
+
+
+def test_retries_transient_failures_then_succeeds():
+    scheduler = LLMScheduler(FAST, seed=0)
+    send, calls = replies(FakeResponse(503), requests.ConnectionError("reset"), FakeResponse(200))
+
+    result = scheduler.submit(LANE, send)
+
+    assert result.response.status_code == 200
+    assert result.attempts == 3 and len(calls) == 3
+    assert scheduler.metrics()["retries"] == 2
+
+
+def test_gives_up_and_returns_last_error_response():
+    scheduler = LLMScheduler(FAST, seed=0)
+    send, calls = replies(*[FakeResponse(500)] * 4)
+
+    result = scheduler.submit(LANE, send)
+
+    assert result.success and result.response.status_code == 500
+    assert len(calls) == 4
+    assert scheduler.metrics()["failures"] == 1
+
+
+def test_does_not_retry_client_errors_or_other_exceptions():
+    scheduler = LLMScheduler(FAST)
+    send, calls = replies(FakeResponse(400))
+    assert scheduler.submit(LANE, send).response.status_code == 400
+
+    send, calls = replies(ValueError("bad payload"))
+    result = scheduler.submit(LANE, send)
+    assert not result.success and len(calls) == 1
+
+
+def test_rate_limit_honors_retry_after_for_whole_lane():
+    scheduler = LLMScheduler(FAST)
+    send, calls = replies(FakeResponse(429, {"retry-after-ms": "150"}), FakeResponse(200))
+
+    result = scheduler.submit(LANE, send)
+
+    assert result.response.status_code == 200
+    assert calls[1] - calls[0] >= 0.15
+    assert scheduler.metrics()["rate_limited"] == 1
+
+
+def test_learned_budget_delays_next_request():
+    scheduler = LLMScheduler(FAST)
+    # 600 requests/min refill one request every 0.1 s
+    exhausted = FakeResponse(
+        200, {"x-ratelimit-limit-requests": "600", "x-ratelimit-remaining-requests": "0"}
+    )
+    send, calls = replies(exhausted, FakeResponse(200))
+
+    scheduler.submit(LANE, send)
+    scheduler.submit(LANE, send)
+
+    assert calls[1] - calls[0] >= 0.09
+    assert scheduler.metrics()["lanes"]["api.example.com/model"]["requests_per_minute"] == 600
+
+
+def test_interactive_requests_are_admitted_first():
+    scheduler = LLMScheduler(FAST)
+    scheduler.configure_limits(LANE, requests_per_minute=600)
+    order = []
+    lock = threading.Lock()
+
+    # Drain the bucket so every following request has to queue
+    scheduler._lanes[LANE].requests.tokens = 0
+
+    def run(name, priority):
+        def send():
+            with lock:
+                order.append(name)
+            return HttpResult(success=True, response=FakeResponse(200))
+
+        scheduler.submit(LANE, send, priority=priority)
+
+    threads = [threading.Thread(target=run, args=(f"background-{i}", Priority.BACKGROUND)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.02)
+    threads.append(threading.Thread(target=run, args=("interactive", Priority.INTERACTIVE)))
+    threads[-1].start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert order[0] == "interactive"
+    assert scheduler.metrics()["wait_ms"]["background"]["count"] == 3
+
+
+def test_cancelled_while_queued():
+    scheduler = LLMScheduler(FAST)
+    scheduler.configure_limits(LANE, requests_per_minute=1)
+    scheduler._lanes[LANE].requests.tokens = 0
+    send, calls = replies(FakeResponse(200))
+
+    result = scheduler.submit(LANE, send, cancelled=lambda: True)
+
+    assert result.interrupted and not calls
+
+
+def test_priority_context_and_admission_spans():
+    assert current_priority() is Priority.INTERACTIVE
+    with llm_priority(Priority.SUBAGENT):
+        assert current_priority() is Priority.SUBAGENT
+    assert current_priority() is Priority.INTERACTIVE
+
+    tracer = get_tracer()
+    tracer.clear()
+    send, _ = replies(FakeResponse(200))
+    with llm_priority(Priority.BACKGROUND):
+        LLMScheduler(FAST).submit(LANE, send)
+
+    (span,) = [span for span in tracer.spans() if span.category == QUEUE]
+    assert span.name == "llm_admission" and span.attributes["priority"] == "background"
@@ -0,0 +1,105 @@
+"""Tests for the offline playbook embedder."""
+
+import numpy as np
+import pytest
+
+from swecli.core.context_engineering.memory import embeddings as embeddings_module
+from swecli.core.context_engineering.memory.embeddings import EmbeddingCache, get_embedding_generator
+from swecli.core.context_engineering.memory.local_embedder import (
+    LocalEmbedder,
+    get_local_embedder,
+    is_local_model,
+)
+from swecli.core.context_engineering.memory import selector as selector_module
+from swecli.core.context_engineering.memory.playbook import Bullet, Playbook
+from swecli.core.context_engineering.memory.selector import BulletSelector, get_bullet_selector
+
+
+def _cosine(a, b):
+    return float(np.dot(a, b))
+
+
+def test_embeddings_are_deterministic_and_normalized():
+    first = LocalEmbedder().embed("Read the file before editing it")
+    second = LocalEmbedder().embed("Read the file before editing it")
+
+    assert np.array_equal(first, second)
+    assert np.linalg.norm(first) == pytest.approx(1.0, abs=1e-5)
+    assert not LocalEmbedder().embed("").any()
+
+
+def test_related_text_scores_higher_than_unrelated():
+    embedder = LocalEmbedder()
+    query = embedder.embed("tests are failing after editing files")
+    related = embedder.embed("Run the test suite after every file edit")
+    unrelated = embedder.embed("Take a screenshot of the browser window")
+
+    assert _cosine(query, related) > _cosine(query, unrelated)
+
+
+def test_generator_interface_works_with_cache():
+    cache = EmbeddingCache(model="local")
+    generator = get_embedding_generator("local")
+
+    vectors = cache.batch_get_or_generate(["alpha beta", "gamma"], generator=generator)
+
+    assert len(vectors) == 2
+    assert len(vectors[0]) == 384
+    assert cache.size() == 2
+
+
+def test_model_names():
+    assert is_local_model("local")
+    assert is_local_model("local-128")
+    assert not is_local_model("text-embedding-3-small")
+    assert get_local_embedder("local-128").dim == 128
+
+
+def test_remote_failure_falls_back_to_local(monkeypatch):
+    def unavailable(texts, model="text-embedding-3-small", provider="openai"):
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(embeddings_module, "generate_embeddings", unavailable)
+    selector = BulletSelector(weights={"effectiveness": 0.0, "recency": 0.0, "semantic": 1.0})
+    bullets = [
+        Bullet(id="css", section="ui", content="Optimize CSS styling for the landing page"),
+        Bullet(id="auth", section="api", content="Refresh the API token on authentication failures"),
+    ]
+
+    selected = selector.select(bullets, max_count=1, query="authentication token expired")
+
+    assert [bullet.id for bullet in selected] == ["auth"]
+    assert selector._active_model == "local"
+
+
+def test_local_selector_skips_disk_cache(tmp_path):
+    cache_file = tmp_path / "embeddings.json"
+    selector = BulletSelector(embedding_model="local", cache_file=str(cache_file))
+    bullets = [Bullet(id=f"b{i}", section="s", content=f"strategy {i}") for i in range(3)]
+
+    selector.select(bullets, max_count=1, query="strategy 2")
+
+    assert not cache_file.exists()
+
+
+def test_as_context_reuses_one_selector_per_configuration(monkeypatch):
+    created = []
+    original_init = BulletSelector.__init__
+
+    def counting_init(self, *args, **kwargs):
+        created.append(self)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(selector_module.BulletSelector, "__init__", counting_init)
+    selector_module._shared_selector.cache_clear()
+    playbook = Playbook()
+    for number in range(3):
+        playbook.add_bullet(section="s", content=f"strategy {number}")
+    weights = {"effectiveness": 0.5, "recency": 0.3, "semantic": 0.2}
+
+    for query in ("strategy 1", "strategy 2"):
+        playbook.as_context(query=query, max_strategies=1, weights=weights, embedding_model="local")
+
+    assert len(created) == 1
+    assert get_bullet_selector(dict(weights), "local") is created[0]
+    assert get_bullet_selector(weights, "local-128") is not created[0]
@@ -0,0 +1,168 @@
+"""Tests for concurrent MCP tool calls and result aggregation."""
+
+import asyncio
+import os
+import time
+from types import SimpleNamespace
+
+from swecli.core.context_engineering.mcp.handler import McpToolHandler
+from swecli.core.context_engineering.mcp.manager import MCPManager
+from swecli.core.context_engineering.mcp.models import MCPConfig, MCPServerConfig
+from swecli.core.context_engineering.mcp import results as results_module
+from swecli.core.context_engineering.mcp.results import ResultAggregator, aggregate_result
+
+
+def _text(text):
+    return SimpleNamespace(type="text", text=text)
+
+
+def _manager(tmp_path, read_only=(), delay=0.1):
+    manager = MCPManager(working_dir=tmp_path)
+    manager._config = MCPConfig(
+        mcp_servers={name: MCPServerConfig(command="npx") for name in ("alpha", "beta")}
+    )
+    for server in ("alpha", "beta"):
+        manager.clients[server] = object()
+        manager.server_tools[server] = [
+            {"name": f"mcp__{server}__{tool}", "mcp_tool_name": tool, "read_only": tool in read_only}
+            for tool in ("read", "write")
+        ]
+    log = []
+
+    async def fake_call(server_name, tool_name, arguments):
+        log.append(("start", server_name, tool_name, arguments.get("n")))
+        await asyncio.sleep(delay)
+        log.append(("end", server_name, tool_name, arguments.get("n")))
+        return {"success": True, "output": f"{server_name}:{tool_name}:{arguments.get('n')}"}
+
+    manager._call_tool_internal = fake_call
+    return manager, log
+
+
+def test_all_content_blocks_are_rendered():
+    result = SimpleNamespace(
+        content=[
+            _text("first"),
+            _text("second"),
+            SimpleNamespace(type="image", data="A" * 400, mimeType="image/png"),
+            SimpleNamespace(type="resource", resource=SimpleNamespace(text="embedded", uri="file:///x")),
+        ]
+    )
+
+    output = aggregate_result(result)
+
+    assert output.splitlines() == ["first", "second", "[image content: image/png, ~300 bytes]", "embedded"]
+    assert aggregate_result(SimpleNamespace(content=[], structured_content={"rows": 2})) == '{\n  "rows": 2\n}'
+
+
+def test_oversized_result_spills_to_file(tmp_path):
+    aggregator = ResultAggregator(max_chars=100, spill_dir=tmp_path, label="db-query")
+    for index in range(50):
+        aggregator.add_text(f"row {index:03d}")
+
+    output = aggregator.finish()
+
+    assert output.startswith("row 000\nrow 001")
+    assert f"Full result saved to {aggregator.spill_path}" in output
+    assert aggregator.spill_path.parent == tmp_path
+    full = aggregator.spill_path.read_text(encoding="utf-8")
+    assert len(full) == aggregator.total_chars
+    assert full.endswith("row 049")
+
+
+def test_spill_files_live_in_a_per_session_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(results_module, "get_spill_root", lambda: tmp_path)
+    monkeypatch.setattr(results_module, "_spill_dir", None)
+    monkeypatch.setattr(results_module.atexit, "register", lambda func: func)
+    stale = tmp_path / "1234-deadbeef"
+    stale.mkdir()
+    old = time.time() - results_module.STALE_SPILL_SECONDS - 60
+    os.utime(stale, (old, old))
+
+    aggregator = ResultAggregator(max_chars=10, label="big")
+    aggregator.add_text("x" * 100)
+    aggregator.finish()
+
+    session_dir = aggregator.spill_path.parent
+    assert session_dir.parent == tmp_path
+    assert not stale.exists()
+    results_module.remove_spill_dir()
+    assert not session_dir.exists()
+
+
+def test_calls_to_different_servers_overlap(tmp_path):
+    manager, _ = _manager(tmp_path, delay=0.2)
+
+    start = time.perf_counter()
+    results = manager.call_tools_sync([("alpha", "write", {"n": 1}), ("beta", "write", {"n": 2})])
+
+    assert [result["output"] for result in results] == ["alpha:write:1", "beta:write:2"]
+    assert time.perf_counter() - start < 0.35
+
+
+def test_same_server_writes_keep_order_and_reads_overlap(tmp_path):
+    manager, log = _manager(tmp_path, read_only=("read",))
+
+    manager.call_tools_sync(
+        [("alpha", "write", {"n": 1}), ("alpha", "read", {"n": 2}), ("alpha", "write", {"n": 3})]
+    )
+
+    # The read started alongside the first write; the second write waited for the first
+    assert log.index(("start", "alpha", "read", 2)) < log.index(("end", "alpha", "write", 1))
+    assert log.index(("end", "alpha", "write", 1)) < log.index(("start", "alpha", "write", 3))
+
+
+def test_only_leading_read_only_calls_are_prefetched(tmp_path):
+    manager, log = _manager(tmp_path, read_only=("read",))
+    handler = McpToolHandler(manager)
+
+    started = handler.prefetch(
+        [
+            ("mcp__alpha__read", {"n": 1}),
+            ("mcp__beta__read", {"n": 2}),
+            ("mcp__alpha__write", {"n": 3}),
+            ("mcp__beta__read", {"n": 4}),
+        ]
+    )
+    handler.execute("mcp__alpha__read", {"n": 1})
+    handler.execute("mcp__beta__read", {"n": 2})
+
+    assert started == 2
+    assert ("start", "alpha", "write", 3) not in log
+    assert ("start", "beta", "read", 4) not in log
+    assert handler.prefetch([("mcp__alpha__write", {"n": 1}), ("mcp__beta__write", {"n": 2})]) == 0
+
+
+def test_call_timeout_is_per_server(tmp_path):
+    manager = MCPManager(working_dir=tmp_path)
+    manager._config = MCPConfig(mcp_servers={"slow": MCPServerConfig(command="npx", call_timeout=0.1)})
+
+    class HungClient:
+        async def call_tool(self, name, arguments):
+            await asyncio.sleep(5)
+
+    manager.clients["slow"] = HungClient()
+
+    start = time.perf_counter()
+    result = manager.call_tool_sync("slow", "search", {})
+
+    assert result["success"] is False
+    assert "timed out after 0.1s" in result["error"]
+    assert time.perf_counter() - start < 1.0
+
+
+def test_handler_consumes_prefetched_results(tmp_path):
+    manager, log = _manager(tmp_path, read_only=("read",), delay=0.2)
+    manager.call_tool_sync = lambda *args: (_ for _ in ()).throw(AssertionError("call issued twice"))
+    handler = McpToolHandler(manager)
+
+    start = time.perf_counter()
+    started = handler.prefetch([("mcp__alpha__read", {"n": 1}), ("mcp__beta__read", {"n": 2})])
+    first = handler.execute("mcp__alpha__read", {"n": 1})
+    second = handler.execute("mcp__beta__read", {"n": 2})
+
+    assert started == 2
+    assert first["output"] == "alpha:read:1"
+    assert second["output"] == "beta:read:2"
+    assert time.perf_counter() - start < 0.35
+    assert len(log) == 4
@@ -0,0 +1,139 @@
+"""Tests for concurrent MCP server start-up and the tool schema cache."""
+
+import asyncio
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+from swecli.core.context_engineering.mcp.handler import McpToolHandler
+from swecli.core.context_engineering.mcp.manager import MCPManager
+from swecli.core.context_engineering.mcp.models import MCPConfig, MCPServerConfig
+from swecli.core.context_engineering.mcp.schema_cache import MCPSchemaCache
+
+
+def _tool(server, name):
+    return {"name": f"mcp__{server}__{name}", "description": name, "input_schema": {}}
+
+
+def _manager(tmp_path, delays, timeout=60.0):
+    manager = MCPManager(working_dir=tmp_path, schema_cache=MCPSchemaCache(tmp_path / "mcp_tools.json"))
+    manager._config = MCPConfig(
+        mcp_servers={
+            name: MCPServerConfig(command="npx", args=[f"@example/{name}"], startup_timeout=timeout)
+            for name in delays
+        }
+    )
+
+    async def fake_connect(server_name):
+        await asyncio.sleep(delays[server_name])
+        manager.clients[server_name] = object()
+        manager.server_tools[server_name] = [_tool(server_name, "live")]
+        manager.schema_cache.put(server_name, manager._config.mcp_servers[server_name], manager.server_tools[server_name])
+        return True
+
+    manager._connect_internal = fake_connect
+    return manager
+
+
+def test_servers_start_concurrently_with_progressive_readiness(tmp_path):
+    manager = _manager(tmp_path, {"slow": 0.3, "fast": 0.05, "medium": 0.15})
+    ready = []
+
+    start = time.perf_counter()
+    results = manager.connect_enabled_servers_sync(on_server_ready=lambda name, ok: ready.append(name))
+    elapsed = time.perf_counter() - start
+
+    assert results == {"slow": True, "fast": True, "medium": True}
+    assert ready == ["fast", "medium", "slow"]
+    assert elapsed < 0.5
+
+
+def test_slow_server_times_out_without_blocking_others(tmp_path):
+    manager = _manager(tmp_path, {"hung": 5.0, "ok": 0.01}, timeout=0.2)
+
+    start = time.perf_counter()
+    results = manager.connect_enabled_servers_sync()
+
+    assert results == {"hung": False, "ok": True}
+    assert time.perf_counter() - start < 1.0
+    assert not manager.is_starting("hung")
+
+
+def test_cached_schemas_served_until_server_is_up(tmp_path):
+    first = _manager(tmp_path, {"docs": 0.01})
+    first.connect_enabled_servers_sync()
+
+    second = _manager(tmp_path, {"docs": 0.3})
+    second.schema_cache = MCPSchemaCache(tmp_path / "mcp_tools.json")
+    second.begin_startup()
+
+    assert second.is_starting("docs")
+    assert [tool["name"] for tool in second.get_all_tools()] == ["mcp__docs__live"]
+
+    second.connect_enabled_servers_sync()
+    assert not second.is_starting("docs")
+    assert [tool["name"] for tool in second.get_all_tools()] == ["mcp__docs__live"]
+
+
+def test_changed_launch_config_invalidates_cache(tmp_path):
+    cache = MCPSchemaCache(tmp_path / "mcp_tools.json")
+    config = MCPServerConfig(command="npx", args=["@example/docs@1.0.0"])
+    cache.put("docs", config, [_tool("docs", "search")], version="1.0.0")
+
+    reloaded = MCPSchemaCache(tmp_path / "mcp_tools.json")
+    assert reloaded.get("docs", config) == [_tool("docs", "search")]
+    assert reloaded.get("docs", MCPServerConfig(command="npx", args=["@example/docs@2.0.0"])) is None
+
+
+def test_server_version_is_part_of_the_fingerprint(tmp_path):
+    cache = MCPSchemaCache(tmp_path / "mcp_tools.json")
+    config = MCPServerConfig(command="npx", args=["@example/docs"])
+    cache.put("docs", config, [_tool("docs", "search")], version="1.0.0")
+
+    # Before the server is up the recorded version is assumed
+    assert cache.get("docs", config) == [_tool("docs", "search")]
+    assert cache.get("docs", config, version="1.0.0") == [_tool("docs", "search")]
+    assert cache.get("docs", config, version="1.1.0") is None
+
+
+def test_timed_out_server_is_closed_and_not_registered(tmp_path, monkeypatch):
+    closed = []
+
+    class HangingClient:
+        def __init__(self, transport):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            closed.append(self)
+
+        async def list_tools(self):
+            await asyncio.sleep(5.0)
+
+    monkeypatch.setitem(sys.modules, "fastmcp", SimpleNamespace(Client=HangingClient))
+    manager = MCPManager(working_dir=tmp_path, schema_cache=MCPSchemaCache(tmp_path / "mcp_tools.json"))
+    manager._config = MCPConfig(
+        mcp_servers={"hung": MCPServerConfig(command="npx", args=["@example/hung"], startup_timeout=0.1)}
+    )
+    manager._create_transport = lambda command, args, env: None
+
+    assert manager.connect_enabled_servers_sync() == {"hung": False}
+    assert "hung" not in manager.clients
+    assert "hung" not in manager.server_tools
+    assert len(closed) == 1
+
+
+def test_tool_call_waits_for_starting_server(tmp_path):
+    manager = _manager(tmp_path, {"docs": 0.2})
+    manager.begin_startup()
+    manager.call_tool_sync = lambda server, tool, args: {"success": True, "output": f"{server}:{tool}"}
+    thread = threading.Thread(target=manager.connect_enabled_servers_sync)
+    thread.start()
+
+    result = McpToolHandler(manager).execute("mcp__docs__live", {})
+    thread.join()
+
+    assert result == {"success": True, "output": "docs:live"}
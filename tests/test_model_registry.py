@@ -0,0 +1,149 @@
+"""Tests for background Models.dev loading and the converted catalog cache."""
+
+import json
+import threading
+
+import pytest
+
+from swecli.config import models as models_module
+from swecli.config.catalog_cache import CatalogCache
+from swecli.config.models import ModelRegistry
+
+CATALOG = {
+    "acme": {
+        "name": "Acme AI",
+        "env": ["ACME_API_KEY"],
+        "api": "https://api.acme.test/v1",
+        "models": {
+            "acme-large": {
+                "id": "acme-large",
+                "name": "Acme Large",
+                "limit": {"context": 200000},
+                "modalities": {"input": ["text", "image"], "output": ["text"]},
+                "cost": {"input": 1, "output": 2},
+            },
+            "acme-embed": {
+                "id": "acme-embed",
+                "limit": {"context": 8000},
+                "modalities": {"input": ["audio"], "output": ["text"]},
+            },
+        },
+    },
+    # Same display name as the bundled provider: bundled wins
+    "local-dup": {
+        "name": "Local",
+        "models": {"other": {"id": "other", "limit": {"context": 1000}}},
+    },
+}
+
+
+@pytest.fixture
+def providers_dir(tmp_path):
+    directory = tmp_path / "providers"
+    directory.mkdir()
+    (directory / "local.json").write_text(
+        json.dumps(
+            {
+                "id": "local",
+                "name": "Local",
+                "description": "Bundled provider",
+                "api_key_env": "LOCAL_API_KEY",
+                "api_base_url": "https://local.test",
+                "models": {
+                    "small": {
+                        "id": "local-small",
+                        "name": "Local Small",
+                        "provider": "Local",
+                        "pricing": {"input": 0.1, "output": 0.2, "unit": "per million tokens"},
+                        "context_length": 32000,
+                        "capabilities": ["text"],
+                    }
+                },
+            }
+        )
+    )
+    return directory
+
+
+def test_construction_does_not_wait_for_catalog(monkeypatch, tmp_path, providers_dir):
+    release = threading.Event()
+
+    def slow_catalog():
+        release.wait(5)
+        return CATALOG
+
+    monkeypatch.delenv("SWECLI_MODELS_DEV_PATH", raising=False)
+    monkeypatch.setattr(models_module, "load_models_dev_catalog", slow_catalog)
+
+    registry = ModelRegistry(providers_dir, catalog_cache_dir=tmp_path / "cache")
+
+    assert set(registry.providers) == {"local"}
+    assert registry.find_model_by_id("local-small")[0] == "local"
+
+    release.set()
+    assert registry.wait_for_catalog(5)
+    assert set(registry.providers) == {"local", "acme"}
+    provider_id, model_key, model = registry.find_model_by_id("acme-large")
+    assert (provider_id, model_key) == ("acme", "acme-large")
+    assert model.capabilities == ["text", "vision"]
+    assert registry.find_model_by_id("acme-embed") is None
+
+
+def test_lookup_miss_waits_for_first_catalog_load(monkeypatch, tmp_path, providers_dir):
+    release = threading.Event()
+
+    def slow_catalog():
+        release.wait(5)
+        return CATALOG
+
+    monkeypatch.delenv("SWECLI_MODELS_DEV_PATH", raising=False)
+    monkeypatch.setattr(models_module, "load_models_dev_catalog", slow_catalog)
+    registry = ModelRegistry(providers_dir, catalog_cache_dir=tmp_path / "cache")
+
+    threading.Timer(0.05, release.set).start()
+
+    assert registry.find_model_by_id("acme-large") is not None
+
+
+def test_warm_start_uses_converted_cache(monkeypatch, tmp_path, providers_dir):
+    monkeypatch.delenv("SWECLI_MODELS_DEV_PATH", raising=False)
+    monkeypatch.setattr(models_module, "load_models_dev_catalog", lambda: CATALOG)
+    ModelRegistry(providers_dir, catalog_cache_dir=tmp_path / "cache", background=False)
+    assert CatalogCache(tmp_path / "cache").load() is not None
+
+    def fail():
+        raise AssertionError("fresh cache must not reload the catalog")
+
+    monkeypatch.setattr(models_module, "load_models_dev_catalog", fail)
+    registry = ModelRegistry(providers_dir, catalog_cache_dir=tmp_path / "cache")
+
+    assert registry.wait_for_catalog(0)
+    assert registry.find_model_by_id("acme-large")[0] == "acme"
+
+
+def test_stale_cache_is_served_while_refreshing(monkeypatch, tmp_path, providers_dir):
+    monkeypatch.delenv("SWECLI_MODELS_DEV_PATH", raising=False)
+    monkeypatch.setattr(models_module, "load_models_dev_catalog", lambda: CATALOG)
+    ModelRegistry(providers_dir, catalog_cache_dir=tmp_path / "cache", background=False)
+    cache = CatalogCache(tmp_path / "cache")
+    snapshot = cache.load()
+    snapshot.built_at -= models_module.DEFAULT_CACHE_TTL + 1
+    cache.save(snapshot)
+
+    refreshed = threading.Event()
+    release = threading.Event()
+
+    def refresh():
+        release.wait(5)
+        refreshed.set()
+        return CATALOG
+
+    monkeypatch.setattr(models_module, "load_models_dev_catalog", refresh)
+    registry = ModelRegistry(providers_dir, catalog_cache_dir=tmp_path / "cache")
+
+    assert registry.find_model_by_id("acme-large") is not None
+    assert not refreshed.is_set()
+    release.set()
+    registry._refresh_thread.join(5)
+    assert refreshed.is_set()
+    assert cache.load().age() < 60
@@ -0,0 +1,131 @@
+"""Tests for paged read_file backed by the line-offset index."""
+
+import os
+
+import pytest
+
+from swecli.core.context_engineering.tools.handlers.file_handlers import FileToolHandler
+from swecli.core.context_engineering.tools.implementations.file_ops import FileOperations
+from swecli.core.context_engineering.tools.implementations.paged_reader import (
+    clear_index_cache,
+    get_line_index,
+    read_page,
+)
+from swecli.models.config import AppConfig
+
+
+def _write_lines(path, count):
+    path.write_text("".join(f"line {i}\n" for i in range(1, count + 1)))
+
+
+def test_small_file_is_returned_whole(tmp_path):
+    target = tmp_path / "small.txt"
+    _write_lines(target, 3)
+
+    page = read_page(target)
+    assert page.content == "line 1\nline 2\nline 3\n"
+    assert page.is_complete
+    assert page.total_lines == 3
+
+
+def test_offset_and_limit_page_through_file(tmp_path):
+    target = tmp_path / "log.txt"
+    _write_lines(target, 1000)
+
+    page = read_page(target, offset=500, limit=3)
+    assert page.content == "line 500\nline 501\nline 502\n"
+    assert page.next_offset == 503
+
+    last = read_page(target, offset=999, limit=10)
+    assert last.content == "line 999\nline 1000\n"
+    assert last.next_offset is None
+
+
+def test_whole_file_read_elides_middle_within_budget(tmp_path):
+    target = tmp_path / "big.log"
+    _write_lines(target, 20000)
+
+    page = read_page(target, max_bytes=3000)
+    assert len(page.content.encode()) < 3300
+    assert page.content.startswith("line 1\n")
+    assert page.content.rstrip().endswith("line 20000")
+    assert page.elided_lines > 0
+    assert f"offset={page.next_offset}" in page.content
+
+
+def test_long_single_line_pages_by_bytes(tmp_path):
+    target = tmp_path / "bundle.min.js"
+    target.write_text("x" * 5000)
+
+    page = read_page(target, max_bytes=1000)
+    assert page.content == "x" * 1000
+    assert page.next_byte_offset == 1000
+
+    rest = read_page(target, byte_offset=4500, max_bytes=1000)
+    assert rest.content == "x" * 500
+    assert rest.next_byte_offset is None
+
+
+def test_byte_pages_keep_multibyte_characters_whole(tmp_path):
+    target = tmp_path / "euro.txt"
+    target.write_text("€" * 60000, encoding="utf-8")
+
+    content = ""
+    byte_offset = None
+    while True:
+        page = read_page(target, byte_offset=byte_offset, max_bytes=100_000)
+        content += page.content
+        if page.next_byte_offset is None:
+            break
+        byte_offset = page.next_byte_offset
+
+    assert content == "€" * 60000
+    assert read_page(target, byte_offset=1, max_bytes=2).content == "€"
+
+
+def test_out_of_range_offsets_are_rejected(tmp_path):
+    target = tmp_path / "small.txt"
+    _write_lines(target, 3)
+
+    with pytest.raises(ValueError, match="past the end"):
+        read_page(target, offset=4)
+    with pytest.raises(ValueError, match="past the end"):
+        read_page(target, byte_offset=1000)
+
+    # A non-positive limit means "no limit" rather than an empty page
+    page = read_page(target, offset=2, limit=0)
+    assert page.content == "line 2\nline 3\n"
+    assert page.next_offset is None
+
+
+def test_index_is_cached_until_file_changes(tmp_path):
+    clear_index_cache()
+    target = tmp_path / "data.txt"
+    _write_lines(target, 10)
+
+    first = get_line_index(target)
+    assert get_line_index(target) is first
+
+    _write_lines(target, 20)
+    os.utime(target, ns=(0, 1))
+    assert get_line_index(target).total_lines == 20
+
+
+def test_read_file_handler_reports_cursor(tmp_path):
+    target = tmp_path / "module.py"
+    _write_lines(target, 100)
+    handler = FileToolHandler(FileOperations(AppConfig(), tmp_path), None, None)
+
+    result = handler.read_file({"file_path": str(target), "offset": 10, "limit": 5})
+    assert result["success"]
+    assert result["output"].startswith("line 10\nline 11\n")
+    assert "Continue with offset=15" in result["output"]
+    assert result["next_offset"] == 15
+
+
+def test_read_file_line_range_uses_index(tmp_path):
+    target = tmp_path / "module.py"
+    _write_lines(target, 50)
+    file_ops = FileOperations(AppConfig(), tmp_path)
+
+    assert file_ops.read_file(str(target), line_start=2, line_end=3) == "line 2\nline 3\n"
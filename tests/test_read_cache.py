@@ -0,0 +1,108 @@
+"""Tests for the per-turn read cache in ToolRegistry."""
+
+import pytest
+
+from swecli.core.context_engineering.tools.implementations.file_ops import FileOperations
+from swecli.core.context_engineering.tools.registry import ToolRegistry
+from swecli.models.config import AppConfig
+
+
+@pytest.fixture
+def registry(tmp_path):
+    file_ops = FileOperations(AppConfig(), tmp_path)
+    registry = ToolRegistry(file_ops=file_ops)
+    registry.begin_turn()
+    return registry
+
+
+def _count_reads(registry, monkeypatch):
+    calls = []
+    original = registry.file_ops.read_file_page
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(registry.file_ops, "read_file_page", counting)
+    return calls
+
+
+def test_repeated_read_is_served_from_cache(registry, tmp_path, monkeypatch):
+    (tmp_path / "big.py").write_text("x = 1\n" * 100)
+    calls = _count_reads(registry, monkeypatch)
+
+    first = registry.execute_tool("read_file", {"file_path": "big.py"})
+    second = registry.execute_tool("read_file", {"file_path": "big.py"})
+
+    assert len(calls) == 1
+    assert first["output"].startswith("x = 1")
+    assert second["success"] and second["cached"]
+    assert "Unchanged since the earlier read_file call" in second["output"]
+    assert second["total_lines"] == first["total_lines"]
+
+
+def test_small_repeated_output_is_returned_in_full(registry, tmp_path):
+    (tmp_path / "tiny.txt").write_text("hello\n")
+
+    registry.execute_tool("read_file", {"file_path": "tiny.txt"})
+    second = registry.execute_tool("read_file", {"file_path": "tiny.txt"})
+
+    assert second["cached"]
+    assert second["output"] == "hello\n"
+
+
+def test_external_modification_changes_the_key(registry, tmp_path, monkeypatch):
+    target = tmp_path / "notes.txt"
+    target.write_text("a" * 300)
+    calls = _count_reads(registry, monkeypatch)
+
+    registry.execute_tool("read_file", {"file_path": "notes.txt"})
+    target.write_text("b" * 301)
+    result = registry.execute_tool("read_file", {"file_path": "notes.txt"})
+
+    assert len(calls) == 2
+    assert result["output"].startswith("b")
+
+
+def test_write_invalidates_cached_reads(registry, tmp_path, monkeypatch):
+    (tmp_path / "a.txt").write_text("a" * 300)
+    calls = _count_reads(registry, monkeypatch)
+
+    registry.execute_tool("read_file", {"file_path": "a.txt"})
+    registry.execute_tool("run_command", {"command": "true"})
+    registry.execute_tool("read_file", {"file_path": "a.txt"})
+
+    assert len(calls) == 2
+
+
+def test_new_turn_and_subagents_bypass_cache(registry, tmp_path, monkeypatch):
+    (tmp_path / "a.txt").write_text("a" * 300)
+    calls = _count_reads(registry, monkeypatch)
+
+    registry.execute_tool("read_file", {"file_path": "a.txt"})
+    sub = registry.execute_tool("read_file", {"file_path": "a.txt"}, is_subagent=True)
+    registry.begin_turn()
+    registry.execute_tool("read_file", {"file_path": "a.txt"})
+
+    assert len(calls) == 3
+    assert "cached" not in sub
+
+
+def test_argument_order_does_not_matter(registry, tmp_path, monkeypatch):
+    (tmp_path / "a.txt").write_text("line\n" * 100)
+    calls = _count_reads(registry, monkeypatch)
+
+    registry.execute_tool("read_file", {"file_path": "a.txt", "offset": 2, "limit": 5})
+    registry.execute_tool("read_file", {"limit": 5, "offset": 2, "file_path": "a.txt"})
+    registry.execute_tool("read_file", {"file_path": "a.txt", "offset": 3, "limit": 5})
+
+    assert len(calls) == 2
+
+
+def test_failed_reads_are_not_cached(registry, tmp_path):
+    missing = registry.execute_tool("read_file", {"file_path": "missing.txt"})
+    (tmp_path / "missing.txt").write_text("now here\n")
+    found = registry.execute_tool("read_file", {"file_path": "missing.txt"})
+
+    assert not missing["success"]
+    assert found["success"] and found["output"] == "now here\n"
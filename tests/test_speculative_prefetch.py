@@ -0,0 +1,104 @@
+"""Tests for speculative prefetching of reads during LLM calls."""
+
+import threading
+
+import pytest
+
+from swecli.core.context_engineering.tools.implementations.file_ops import FileOperations
+from swecli.core.context_engineering.tools.prefetch import PrefetchBudget, SpeculativePrefetcher
+from swecli.core.context_engineering.tools.registry import ToolRegistry
+from swecli.models.config import AppConfig
+
+
+@pytest.fixture
+def registry(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "service.py").write_text("class PaymentService:\n    pass\n" * 20)
+    (tmp_path / "README.md").write_text("# Project\n")
+    registry = ToolRegistry(file_ops=FileOperations(AppConfig(), tmp_path))
+    registry.begin_turn()
+    return registry
+
+
+def _count_reads(registry, monkeypatch):
+    calls = []
+    original = registry.file_ops.read_file_page
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(registry.file_ops, "read_file_page", counting)
+    return calls
+
+
+def test_predicts_mentioned_files_and_symbols(registry, tmp_path):
+    prefetcher = SpeculativePrefetcher(registry, tmp_path)
+    messages = [
+        {"role": "user", "content": "ignored"},
+        {
+            "role": "assistant",
+            "content": "",
+            "tool_calls": [{"function": {"name": "read_file", "arguments": '{"file_path": "README.md"}'}}],
+        },
+        {"role": "tool", "content": "See src/service.py and missing.py"},
+    ]
+
+    calls = prefetcher.predict("Please fix PaymentService in src/service.py and check process_refund()", messages)
+
+    paths = [arguments["file_path"] for name, arguments in calls if name == "read_file"]
+    assert paths == [str(tmp_path / "src" / "service.py"), str(tmp_path / "README.md")]
+    patterns = {arguments["pattern"] for name, arguments in calls if name == "search"}
+    assert patterns == {"PaymentService", "process_refund"}
+
+
+def test_prefetched_read_is_served_in_full_once(registry, monkeypatch):
+    calls = _count_reads(registry, monkeypatch)
+
+    with registry.speculate("look at src/service.py", []) as stats:
+        registry._prefetcher.join(timeout=5)
+    assert stats.stored == 1 and len(calls) == 1
+
+    first = registry.execute_tool("read_file", {"file_path": "src/service.py"})
+    second = registry.execute_tool("read_file", {"file_path": "src/service.py"})
+
+    assert len(calls) == 1
+    assert first["prefetched"] and first["output"].startswith("class PaymentService")
+    assert "Unchanged since the earlier read_file call" in second["output"]
+    assert registry.read_cache.prefetch_hits == 1
+
+
+def test_write_during_prefetch_discards_result(registry, tmp_path, monkeypatch):
+    started, release = threading.Event(), threading.Event()
+    original = registry.file_ops.read_file_page
+
+    def slow(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(registry.file_ops, "read_file_page", slow)
+    with registry.speculate("src/service.py", []):
+        started.wait(5)
+        registry.read_cache.invalidate()
+        release.set()
+        registry._prefetcher.join(timeout=5)
+
+    assert registry._prefetcher.last_stats.stored == 0
+    monkeypatch.setattr(registry.file_ops, "read_file_page", original)
+    assert "prefetched" not in registry.execute_tool("read_file", {"file_path": "src/service.py"})
+
+
+def test_budget_and_cancellation(registry, tmp_path):
+    prefetcher = SpeculativePrefetcher(registry, tmp_path, PrefetchBudget(max_bytes=10))
+    calls = [("read_file", {"file_path": "src/service.py"}), ("read_file", {"file_path": "README.md"})]
+
+    stats = prefetcher.run(calls, cancelled=lambda: False)
+    assert stats.stored == 1 and stats.bytes == len("# Project\n")
+
+    registry.begin_turn()
+    stats = prefetcher.run(calls, cancelled=lambda: True)
+    assert stats.cancelled and stats.calls == 0
+
+    too_small = SpeculativePrefetcher(registry, tmp_path, PrefetchBudget(max_file_bytes=10))
+    assert too_small.predict("src/service.py", []) == []
@@ -0,0 +1,52 @@
+"""Tests for the lazy-import startup path of the CLI entry point."""
+
+import json
+import subprocess
+import sys
+
+from swecli.core.context_engineering.tools.lazy import LazyTool, lazy_tools
+from swecli.core.context_engineering.tools.registry import ToolRegistry
+from swecli.models.config import AppConfig
+
+
+def _loaded_after(statement):
+    script = f"import json, sys\n{statement}\nprint(json.dumps(sorted(sys.modules)))"
+    proc = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return set(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+
+def test_cli_import_does_not_load_ui_or_tools():
+    loaded = _loaded_after("import swecli.cli")
+
+    assert "textual" not in loaded
+    assert "fastmcp" not in loaded
+    assert "swecli.ui_textual" not in loaded
+    assert "swecli.core.context_engineering.tools.implementations.bash_tool" not in loaded
+
+
+def test_mcp_config_does_not_load_client_stack():
+    loaded = _loaded_after("from swecli.core.context_engineering.mcp import MCPManager, MCPConfig")
+
+    assert "fastmcp" not in loaded
+
+
+def test_lazy_tool_is_built_on_first_handler_use(tmp_path):
+    (tmp_path / "notes.txt").write_text("hello\n")
+    tools = lazy_tools(AppConfig(), tmp_path)
+    registry = ToolRegistry(**tools)
+
+    assert not any(tool.loaded for tool in tools.values())
+
+    result = registry.execute_tool("read_file", {"file_path": str(tmp_path / "notes.txt")})
+
+    assert result["success"]
+    assert tools["file_ops"].loaded
+    assert not tools["bash_tool"].loaded
+
+
+def test_lazy_tool_forwards_attributes(tmp_path):
+    tool = LazyTool("WriteTool", AppConfig(), tmp_path)
+
+    assert bool(tool)
+    assert tool.working_dir == tmp_path
+    assert tool.loaded
@@ -754,3 +754,150 @@ class TestNestedUICallback:
             "[researcher] Found 5 files",
             "SEARCH"
         )
+
+
+class TestParallelSubagents:
+    """Tests for concurrent execution through spawn_subagents."""
+
+    class _SlowAgent:
+        """Registered agent whose forks sleep, record their thread and echo the task."""
+
+        def __init__(self, delay=0.2):
+            self.delay = delay
+            self.forks = []
+
+        def fork(self):
+            agent = TestParallelSubagents._SlowAgent(self.delay)
+            self.forks.append(agent)
+            return agent
+
+        def run_sync(self, message, deps, ui_callback=None, **kwargs):
+            import threading
+            import time
+
+            if ui_callback is not None:
+                ui_callback.on_tool_call("read_file", {"file_path": message})
+                time.sleep(self.delay)
+                ui_callback.on_tool_result("read_file", {"file_path": message}, {"success": True})
+            else:
+                time.sleep(self.delay)
+            self.thread = threading.current_thread().name
+            return {"success": True, "content": f"done: {message}"}
+
+    @pytest.fixture
+    def manager(self):
+        config = MagicMock()
+        config.max_parallel_subagents = 4
+        manager = SubAgentManager(
+            config=config,
+            tool_registry=MagicMock(),
+            mode_manager=MagicMock(),
+            working_dir="/tmp/test",
+        )
+        self.agent = self._SlowAgent()
+        manager._agents["Code-Explorer"] = CompiledSubAgent(
+            name="Code-Explorer", description="Explore", agent=self.agent, tool_names=[]
+        )
+        return manager
+
+    @pytest.fixture
+    def deps(self):
+        return SubAgentDeps(mode_manager=None, approval_manager=None, undo_manager=None)
+
+    def test_execute_batch_runs_concurrently_in_order(self, manager, deps):
+        import time
+
+        tasks = [("Code-Explorer", f"task {i}") for i in range(4)]
+        start = time.perf_counter()
+        results = manager.execute_batch(tasks, deps)
+        elapsed = time.perf_counter() - start
+
+        assert [r["content"] for r in results] == [f"done: task {i}" for i in range(4)]
+        assert elapsed < 0.6
+        assert len(self.agent.forks) == 4
+        assert len({fork.thread for fork in self.agent.forks}) == 4
+
+    def test_execute_batch_respects_concurrency_cap(self, manager, deps):
+        tasks = [("Code-Explorer", f"task {i}") for i in range(4)]
+        manager.execute_batch(tasks, deps, max_concurrency=1)
+
+        assert len({fork.thread for fork in self.agent.forks}) == 1
+
+    def test_execute_batch_reports_unknown_type_in_place(self, manager, deps):
+        results = manager.execute_batch(
+            [("Code-Explorer", "a"), ("missing", "b"), ("Code-Explorer", "c")], deps
+        )
+
+        assert [r["success"] for r in results] == [True, False, True]
+        assert "Unknown subagent type" in results[1]["error"]
+
+    def test_grouped_output_is_not_interleaved(self, manager, deps):
+        events = []
+        parent = MagicMock()
+        parent.on_nested_tool_call.side_effect = lambda name, args, depth, parent: events.append(parent)
+        parent.on_nested_tool_result.side_effect = (
+            lambda name, args, result, depth, parent: events.append(parent)
+        )
+
+        manager.execute_batch(
+            [("Code-Explorer", "a"), ("Code-Explorer", "b"), ("Code-Explorer", "c")],
+            deps,
+            ui_callback=parent,
+        )
+
+        assert len(events) == 6
+        for i in range(0, 6, 2):
+            assert events[i] == events[i + 1]
+        assert sorted(set(events)) == ["Code-Explorer #1", "Code-Explorer #2", "Code-Explorer #3"]
+
+    def test_spawn_subagents_tool_aggregates_results(self):
+        from swecli.core.context_engineering.tools.registry import ToolRegistry
+
+        registry = ToolRegistry()
+        mock_manager = MagicMock()
+        mock_manager.execute_batch.return_value = [
+            {"success": True, "content": "found it"},
+            {"success": False, "error": "boom", "content": ""},
+        ]
+        registry.set_subagent_manager(mock_manager)
+
+        result = registry.execute_tool(
+            "spawn_subagents",
+            {
+                "tasks": [
+                    {"description": "find a", "subagent_type": "Code-Explorer"},
+                    {"description": "find b", "subagent_type": "Code-Explorer"},
+                ]
+            },
+        )
+
+        assert result["success"] is True
+        assert result["failed_tasks"] == 1
+        assert "## [Code-Explorer #1]\nfound it" in result["separate_response"]
+        assert "## [Code-Explorer #2]\nTask failed: boom" in result["separate_response"]
+        tasks = mock_manager.execute_batch.call_args[0][0]
+        assert tasks == [("Code-Explorer", "find a"), ("Code-Explorer", "find b")]
+
+    def test_spawn_subagents_requires_tasks(self):
+        from swecli.core.context_engineering.tools.registry import ToolRegistry
+
+        registry = ToolRegistry()
+        registry.set_subagent_manager(MagicMock())
+
+        result = registry.execute_tool("spawn_subagents", {"tasks": []})
+
+        assert result["success"] is False
+        assert "tasks" in result["error"]
+
+    def test_batch_tool_schema(self):
+        from swecli.core.agents.subagents import BATCH_TASK_TOOL_NAME, create_batch_task_tool_schema
+
+        mock_manager = MagicMock()
+        mock_manager.get_available_types.return_value = ["Code-Explorer", "Planner"]
+        mock_manager.get_descriptions.return_value = {"Code-Explorer": "Explore", "Planner": "Plan"}
+
+        schema = create_batch_task_tool_schema(mock_manager)
+
+        assert schema["function"]["name"] == BATCH_TASK_TOOL_NAME == "spawn_subagents"
+        items = schema["function"]["parameters"]["properties"]["tasks"]["items"]
+        assert items["properties"]["subagent_type"]["enum"] == ["Code-Explorer", "Planner"]
@@ -0,0 +1,127 @@
+"""Tests for per-request tool schema pruning."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from swecli.core.agents.components import ToolSchemaBuilder
+from swecli.core.agents.components.tool_selector import (
+    CORE_TOOLS,
+    LOAD_TOOLS_NAME,
+    ToolSelector,
+    select_request_tools,
+)
+
+
+def _tools():
+    registry = MagicMock(spec=["mcp_manager", "_subagent_manager"])
+    registry._subagent_manager = None
+    registry.mcp_manager = MagicMock()
+    registry.mcp_manager.get_all_tools.return_value = [
+        {
+            "name": f"mcp__github__{verb}_issues",
+            "description": f"{verb.capitalize()} GitHub issues and pull requests",
+            "input_schema": {"type": "object"},
+        }
+        for verb in ("list", "create", "close")
+    ]
+    return ToolSchemaBuilder(registry).build()
+
+
+def _names(tools):
+    return {schema["function"]["name"] for schema in tools}
+
+
+def _user(text):
+    return {"role": "user", "content": text}
+
+
+def _tool_call(name, arguments=None):
+    return {
+        "role": "assistant",
+        "content": "",
+        "tool_calls": [{"id": "1", "type": "function", "function": {"name": name, "arguments": json.dumps(arguments or {})}}],
+    }
+
+
+def test_core_tools_always_sent_and_rest_deferred():
+    tools = _tools()
+    selected = ToolSelector(tools).select([_user("fix the failing test in parser.py")])
+
+    names = _names(selected)
+    assert CORE_TOOLS & _names(tools) <= names
+    assert "mcp__github__list_issues" not in names
+    assert LOAD_TOOLS_NAME in names
+    assert selected.token_count < tools.token_count
+
+
+def test_query_relevant_tools_are_added():
+    selector = ToolSelector(_tools())
+
+    names = _names(selector.select([_user("take a screenshot of the page")]))
+    assert "capture_screenshot" in names
+
+    names = _names(selector.select([_user("list the open github issues")]))
+    assert "mcp__github__list_issues" in names
+
+
+def test_selection_only_grows_during_a_conversation():
+    selector = ToolSelector(_tools())
+    messages = [_user("take a screenshot of the page")]
+    first = _names(selector.select(messages))
+
+    messages += [{"role": "assistant", "content": "done"}, _user("now fix the failing test in parser.py")]
+    second = _names(selector.select(messages))
+
+    assert "capture_screenshot" in first
+    assert first <= second
+
+
+def test_used_and_loaded_tools_stay_available():
+    selector = ToolSelector(_tools())
+    messages = [
+        _user("help me out"),
+        _tool_call("rename_symbol", {"symbol": "a"}),
+        {"role": "tool", "tool_call_id": "1", "content": "ok"},
+        _tool_call(LOAD_TOOLS_NAME, {"names": ["mcp__github", "fetch_url"]}),
+    ]
+
+    names = _names(selector.select(messages))
+
+    assert {"rename_symbol", "fetch_url", "mcp__github__create_issues", "mcp__github__close_issues"} <= names
+
+
+def test_selection_is_reused_and_savings_tracked():
+    tools = _tools()
+    selector = ToolSelector(tools)
+    messages = [_user("fix the failing test")]
+
+    assert selector.select(messages) is selector.select(messages)
+    stats = selector.savings()
+    assert stats["requests"] == 2
+    assert stats["full_tokens"] == 2 * tools.token_count
+    assert 0 < stats["saved_ratio"] < 1
+
+
+def test_pruning_follows_config():
+    tools = _tools()
+    messages = [_user("fix the failing test")]
+
+    assert select_request_tools(tools, messages, SimpleNamespace(tool_schema_pruning=False)) is tools
+    assert select_request_tools(tools, messages, MagicMock()) is tools
+    pruned = select_request_tools(tools, messages, SimpleNamespace(tool_schema_pruning=True))
+    assert len(pruned) < len(tools)
+
+
+def test_load_tools_handler_validates_names():
+    from swecli.core.context_engineering.tools.registry import ToolRegistry
+
+    registry = ToolRegistry()
+
+    result = registry.execute_tool(LOAD_TOOLS_NAME, {"names": ["browser", "nope"]})
+    assert result["success"] is True
+    assert "open_browser" in result["loaded_tools"]
+    assert "nope" in result["output"]
+
+    result = registry.execute_tool(LOAD_TOOLS_NAME, {"names": ["nope"]})
+    assert result["success"] is False
@@ -0,0 +1,100 @@
+"""Tests for span tracing, latency stats and trace export."""
+
+import io
+import json
+
+import pytest
+from rich.console import Console
+
+from swecli.core.context_engineering.tools.implementations.file_ops import FileOperations
+from swecli.core.context_engineering.tools.registry import ToolRegistry
+from swecli.core.runtime.monitoring.tracing import LLM, TOOL, Tracer, get_tracer, percentile
+from swecli.models.config import AppConfig
+from swecli.repl.commands import PerfCommands
+
+
+def test_spans_nest_and_record_errors():
+    tracer = Tracer()
+
+    with tracer.span("turn", LLM) as outer:
+        with tracer.span("read_file", TOOL, path="a.py") as inner:
+            inner.set(lines=3)
+    with pytest.raises(RuntimeError):
+        with tracer.span("boom", TOOL):
+            raise RuntimeError("bad")
+
+    spans = {span.name: span for span in tracer.spans()}
+    assert spans["read_file"].parent_id == outer.span_id
+    assert spans["read_file"].attributes == {"path": "a.py", "lines": 3}
+    assert spans["turn"].parent_id is None
+    assert spans["boom"].error == "RuntimeError: bad"
+    assert spans["turn"].duration_ns >= spans["read_file"].duration_ns
+
+
+def test_ring_buffer_and_stats():
+    tracer = Tracer(capacity=100)
+    for ms in range(1, 201):
+        tracer.record("call", TOOL, 0, ms * 1_000_000)
+
+    assert len(tracer.spans()) == 100
+    (row,) = tracer.stats()
+    assert row["span"] == "tool" and row["count"] == 100
+    assert row["p50_ms"] == 150 and row["p95_ms"] == 195 and row["max_ms"] == 200
+    assert percentile([], 0.5) == 0.0
+
+    tracer.record("other", TOOL, 0, 1)
+    assert {row["span"] for row in tracer.stats(group_by_name=True)} == {"tool/call", "tool/other"}
+
+
+def test_exports(tmp_path):
+    tracer = Tracer()
+    with tracer.span("chat.completions", LLM, model="m", payload={"nested": 1}):
+        pass
+
+    chrome = json.loads(tracer.export(tmp_path / "trace.json").read_text())
+    event = next(event for event in chrome["traceEvents"] if event["ph"] == "X")
+    assert event["cat"] == "llm" and event["args"]["model"] == "m"
+    assert event["args"]["payload"] == "{'nested': 1}"
+
+    (record,) = map(json.loads, tracer.export(tmp_path / "trace.jsonl").read_text().splitlines())
+    assert record["name"] == "chat.completions"
+    assert record["end_time_unix_nano"] >= record["start_time_unix_nano"]
+    assert record["status"] == {"code": "OK"}
+
+    with pytest.raises(ValueError):
+        tracer.export(tmp_path / "trace.out", fmt="xml")
+
+
+def test_tool_execution_is_traced(tmp_path):
+    (tmp_path / "a.txt").write_text("hello\n")
+    registry = ToolRegistry(file_ops=FileOperations(AppConfig(), tmp_path))
+    registry.begin_turn()
+    tracer = get_tracer()
+    tracer.clear()
+
+    registry.execute_tool("read_file", {"file_path": "a.txt"})
+    registry.execute_tool("read_file", {"file_path": "a.txt"})
+
+    spans = [span for span in tracer.spans() if span.category == TOOL]
+    assert [span.name for span in spans] == ["read_file", "read_file"]
+    assert spans[0].attributes == {"success": True}
+    assert spans[1].attributes.get("cached") is True
+
+
+def test_perf_command(tmp_path):
+    tracer = Tracer()
+    output = io.StringIO()
+    commands = PerfCommands(Console(file=output, width=120), tracer)
+
+    assert commands.handle("").data == []
+    tracer.record("read_file", TOOL, 0, 5_000_000)
+    result = commands.handle("")
+    assert result.data[0]["p95_ms"] == 5
+    assert "Latency by span" in output.getvalue()
+
+    target = tmp_path / "out.json"
+    assert commands.handle(f"export {target}").success
+    assert json.loads(target.read_text())["traceEvents"]
+    commands.handle("clear")
+    assert tracer.spans() == []
+    assert not commands.handle("bogus").success
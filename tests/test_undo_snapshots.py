@@ -0,0 +1,148 @@
+"""Tests for the content-addressed undo snapshot store."""
+
+from datetime import datetime
+
+from swecli.core.context_engineering.history import SnapshotStore, UndoManager
+from swecli.core.context_engineering.tools.implementations.edit_tool import EditTool
+from swecli.models.config import AppConfig
+from swecli.models.operation import Operation, OperationType
+
+
+def _edit(tool, manager, path, old, new):
+    result = tool.edit_file(str(path), old, new, snapshot_store=manager.snapshots)
+    assert result.success
+    operation = Operation(
+        type=OperationType.FILE_EDIT,
+        target=result.file_path,
+        parameters={
+            "before_snapshot": result.before_snapshot,
+            "after_snapshot": result.after_snapshot,
+        },
+        created_at=datetime.now(),
+    )
+    manager.record_operation(operation)
+    return result
+
+
+def test_identical_content_is_stored_once(tmp_path):
+    store = SnapshotStore(tmp_path / "undo")
+    first = store.put(b"same content\n" * 100)
+    second = store.put(b"same content\n" * 100)
+
+    assert first == second
+    assert len(list((tmp_path / "undo" / "objects").rglob("*"))) == 2  # one dir, one blob
+    assert store.get(first) == b"same content\n" * 100
+
+
+def test_reverse_delta_roundtrip_for_large_files(tmp_path):
+    store = SnapshotStore(tmp_path / "undo", delta_threshold=1024)
+    v1 = b"".join(b"line %d\n" % i for i in range(5000))
+    v2 = v1.replace(b"line 2500\n", b"line 2500 changed\n")
+    v3 = v2.replace(b"line 10\n", b"")
+
+    first, second = store.put_version(v1, v2)
+    _, third = store.put_version(v2, v3)
+
+    full_size = store._index[third]["size"]
+    assert store._index[first]["base"] == second
+    assert store._index[second]["base"] == third
+    assert store._index[first]["size"] < full_size
+    assert store.get(first) == v1
+    assert store.get(second) == v2
+    assert store.get(third) == v3
+
+
+def test_lru_eviction_keeps_store_bounded(tmp_path):
+    store = SnapshotStore(tmp_path / "undo", max_bytes=4000)
+    digests = [store.put(bytes(range(256)) * 8 + str(i).encode()) for i in range(20)]
+
+    assert store.total_bytes() <= 4000
+    assert digests[-1] in store
+    assert digests[0] not in store
+
+
+def test_walk_back_multiple_edits_to_same_file(tmp_path):
+    target = tmp_path / "app.py"
+    target.write_text("a = 1\nb = 2\n")
+    manager = UndoManager(session_id="test", store_root=tmp_path / "undo")
+    tool = EditTool(AppConfig(), tmp_path)
+
+    _edit(tool, manager, target, "a = 1", "a = 10")
+    _edit(tool, manager, target, "b = 2", "b = 20")
+    _edit(tool, manager, target, "a = 10", "a = 100")
+    assert target.read_text() == "a = 100\nb = 20\n"
+    assert not (tmp_path / "app.py.bak").exists()
+
+    assert manager.undo_last().success
+    assert target.read_text() == "a = 10\nb = 20\n"
+
+    result = manager.undo_file(str(target), steps=2)
+    assert result.success
+    assert target.read_text() == "a = 1\nb = 2\n"
+    assert manager.get_history_size() == 0
+
+
+def test_undo_file_rejects_non_positive_steps(tmp_path):
+    target = tmp_path / "app.py"
+    target.write_text("a = 1\n")
+    manager = UndoManager(session_id="test", store_root=tmp_path / "undo")
+    tool = EditTool(AppConfig(), tmp_path)
+    _edit(tool, manager, target, "a = 1", "a = 2")
+    _edit(tool, manager, target, "a = 2", "a = 3")
+
+    for steps in (0, -1):
+        result = manager.undo_file(str(target), steps=steps)
+        assert not result.success
+        assert "at least 1" in result.error
+    assert target.read_text() == "a = 3\n"
+    assert manager.get_history_size() == 2
+
+
+def test_oldest_version_survives_long_edit_chains(tmp_path):
+    store = SnapshotStore(tmp_path / "undo", delta_threshold=1024)
+    versions = [b"".join(b"line %d of the module\n" % i for i in range(1000))]
+    for edit in range(40):
+        versions.append(versions[-1].replace(b"line %d " % (edit * 20), b"line %d edited " % (edit * 20)))
+    digests = [store.put_version(previous, current)[0] for previous, current in zip(versions, versions[1:])]
+
+    assert store.get(digests[0]) == versions[0]
+    assert all(store.get(digest) == version for digest, version in zip(digests, versions))
+    keyframes = [digest for digest in digests if store._index[digest]["base"] is None]
+    assert 1 < len(keyframes) < len(digests)
+
+
+def test_index_writes_are_batched(tmp_path, monkeypatch):
+    store = SnapshotStore(tmp_path / "undo")
+    digest = store.put(b"content")
+    writes = []
+    original = store._save_index
+
+    def counting(force=False):
+        before = store._saved_at
+        original(force)
+        if store._saved_at != before:
+            writes.append(force)
+
+    monkeypatch.setattr(store, "_save_index", counting)
+    for number in range(20):
+        store.get(digest)
+        store.put(b"content %d" % number)
+    assert writes == []
+
+    store.flush()
+    assert writes == [True]
+
+
+def test_unnamed_session_store_is_removed_on_close(tmp_path):
+    manager = UndoManager(store_root=tmp_path / "undo")
+    manager.snapshots.put(b"content")
+    store_dir = tmp_path / "undo" / manager.session_id
+    assert store_dir.exists()
+
+    manager.close()
+    assert not store_dir.exists()
+
+    named = UndoManager(session_id="kept", store_root=tmp_path / "undo")
+    named.snapshots.put(b"content")
+    named.close()
+    assert (tmp_path / "undo" / "kept" / "index.json").exists()
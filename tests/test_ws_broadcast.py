@@ -0,0 +1,169 @@
+"""Tests for the queued, coalescing WebSocket broadcaster."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from swecli.web import websocket as websocket_module
+from swecli.web.websocket import WebSocketManager
+from swecli.web.ws_outbound import ClientChannel, encode_message, schedule_broadcast
+
+
+class FakeWebSocket:
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.sent = []
+        self.closed_with = None
+
+    async def accept(self):
+        return None
+
+    async def send_text(self, text):
+        if self.fail:
+            raise RuntimeError("connection reset")
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(text)
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(websocket_module, "get_state", lambda: MagicMock())
+    return WebSocketManager(max_queue=4)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_serializes_once_and_shares_text(manager):
+    first, second = FakeWebSocket(), FakeWebSocket()
+    await manager.connect(first)
+    await manager.connect(second)
+
+    await manager.broadcast({"type": "tool_call", "data": {"tool_name": "read_file"}})
+    await manager.get_channel(first).drain()
+    await manager.get_channel(second).drain()
+    await asyncio.sleep(0)
+
+    assert len(first.sent) == 1
+    assert first.sent[0] is second.sent[0]
+    assert json.loads(first.sent[0])["type"] == "tool_call"
+
+
+@pytest.mark.asyncio
+async def test_slow_client_does_not_block_fast_client(manager):
+    slow, fast = FakeWebSocket(delay=0.5), FakeWebSocket()
+    await manager.connect(slow)
+    await manager.connect(fast)
+
+    await manager.broadcast({"type": "tool_call", "data": {}})
+    await manager.broadcast({"type": "tool_result", "data": {}})
+    await asyncio.wait_for(manager.get_channel(fast).drain(), timeout=0.2)
+    await asyncio.sleep(0)
+
+    assert len(fast.sent) == 2
+    assert slow.sent == []
+
+
+def test_status_events_are_coalesced():
+    async def scenario():
+        channel = ClientChannel(FakeWebSocket(), max_queue=8)
+        for status in ("connecting", "connected", "failed", "connected"):
+            message = {"type": "mcp:status_changed", "data": {"server_name": "git", "status": status}}
+            assert channel.offer(encode_message(message))
+        return channel
+
+    channel = asyncio.run(scenario())
+    assert len(channel) == 1
+    assert channel.coalesced == 3
+    assert json.loads(channel._queue[0].text)["data"]["status"] == "connected"
+
+
+def test_stream_deltas_are_concatenated():
+    async def scenario():
+        channel = ClientChannel(FakeWebSocket(), max_queue=8)
+        channel.offer(encode_message({"type": "message_chunk", "data": {"content": "Hel"}}))
+        channel.offer(encode_message({"type": "message_chunk", "data": {"content": "lo"}}))
+        return channel
+
+    channel = asyncio.run(scenario())
+    assert len(channel) == 1
+    assert json.loads(channel._queue[0].text)["data"]["content"] == "Hello"
+
+
+def test_stream_chunks_keep_their_place_after_other_events():
+    async def scenario():
+        channel = ClientChannel(FakeWebSocket(), max_queue=8)
+        channel.offer(encode_message({"type": "message_chunk", "data": {"content": "Let me look."}}))
+        channel.offer(encode_message({"type": "tool_call", "data": {}}))
+        channel.offer(encode_message({"type": "message_chunk", "data": {"content": "Done."}}))
+        return channel
+
+    channel = asyncio.run(scenario())
+    assert [message.type for message in channel._queue] == ["message_chunk", "tool_call", "message_chunk"]
+
+
+@pytest.mark.asyncio
+async def test_schedule_broadcast_does_not_wait_for_delivery(manager):
+    slow = FakeWebSocket(delay=10)
+    await manager.connect(slow)
+    loop = asyncio.get_running_loop()
+
+    def from_worker_thread():
+        future = schedule_broadcast(manager, {"type": "message_chunk", "data": {"content": "hi"}}, loop)
+        return future.result(timeout=1)
+
+    await loop.run_in_executor(None, from_worker_thread)
+    # Queued for the slow client, whose writer is still sending
+    assert slow.sent == []
+
+
+@pytest.mark.asyncio
+async def test_lagging_client_is_disconnected(manager):
+    stuck, healthy = FakeWebSocket(delay=10), FakeWebSocket()
+    await manager.connect(stuck)
+    await manager.connect(healthy)
+
+    for index in range(8):
+        await manager.broadcast({"type": "tool_result", "data": {"index": index}})
+        await asyncio.sleep(0)
+
+    assert stuck not in manager.active_connections
+    assert stuck.closed_with == 1013
+    assert healthy in manager.active_connections
+
+
+@pytest.mark.asyncio
+async def test_failed_send_removes_client(manager):
+    broken = FakeWebSocket(fail=True)
+    await manager.connect(broken)
+
+    await manager.broadcast({"type": "tool_call", "data": {}})
+    await asyncio.sleep(0.01)
+
+    assert broken not in manager.active_connections
+
+
+def test_unserializable_message_becomes_error():
+    outbound = encode_message({"type": "tool_result", "data": {"value": object()}})
+    assert outbound.type == "error"
+    assert "serialization" in json.loads(outbound.text)["data"]["message"]
+
+
+def test_coalescing_does_not_leak_between_clients():
+    async def scenario():
+        first = ClientChannel(FakeWebSocket(), max_queue=8)
+        second = ClientChannel(FakeWebSocket(), max_queue=8)
+        for chunk in ("a", "b"):
+            outbound = encode_message({"type": "message_chunk", "data": {"content": chunk}})
+            first.offer(outbound)
+            second.offer(outbound)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert json.loads(first._queue[0].text)["data"]["content"] == "ab"
+    assert json.loads(second._queue[0].text)["data"]["content"] == "ab"